@@ -5,9 +5,12 @@ Analysis module for technical analysis and portfolio metrics.
 from .technical_analysis import TechnicalAnalysis
 from .portfolio_analyzer import PortfolioAnalyzer
 from .risk_manager import RiskManager
+from .streaming_indicators import StreamingIndicator, StreamingIndicatorEngine
 
 __all__ = [
     'TechnicalAnalysis',
     'PortfolioAnalyzer',
-    'RiskManager'
+    'RiskManager',
+    'StreamingIndicator',
+    'StreamingIndicatorEngine'
 ]
\ No newline at end of file
@@ -0,0 +1,408 @@
+"""
+Batch technical indicator kernels for many symbols at once.
+
+Prices are symbols x time matrices, one row per symbol and one column per
+bar, and every indicator is returned as a matrix of the same shape. The
+kernels follow ``vectorized_indicators`` but operate along the time axis of
+all rows in a single pass, which is what watchlist and universe scans need.
+
+Rows may have different history lengths: shorter histories are left-padded
+with NaN (see ``price_matrix``), so the most recent bars line up in the last
+column. Each row produces the same values as the one-dimensional kernel run
+on its own history, with NaN until that row has enough bars. A NaN inside a
+history makes every window containing it NaN (and every later EMA value),
+so gaps should be filled before calling these functions.
+"""
+
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .rolling_kernels import rolling_max, rolling_mean_var, rolling_min
+from .vectorized_indicators import lfilter, _check_period
+
+
+MatrixLike = Union[Sequence[Sequence[float]], np.ndarray]
+
+
+def price_matrix(series: Sequence[Sequence[float]], length: Optional[int] = None) -> np.ndarray:
+    """
+    Build a left-padded price matrix from histories of different lengths.
+
+    Args:
+        series: Price history of each symbol, oldest first
+        length: Number of columns (default: the longest history); longer
+            histories keep only their most recent values
+
+    Returns:
+        Float64 matrix with one row per symbol, aligned on the last column
+    """
+    if length is None:
+        length = max((len(values) for values in series), default=0)
+
+    matrix = np.full((len(series), length), np.nan)
+    for row, values in enumerate(series):
+        values = np.asarray(values, dtype=np.float64)[max(len(values) - length, 0):]
+        if len(values):
+            matrix[row, length - len(values):] = values
+    return matrix
+
+
+def as_price_matrix(prices: MatrixLike) -> np.ndarray:
+    """
+    Convert prices to a 2-D float64 matrix.
+
+    Args:
+        prices: Symbols x time matrix, or a sequence of equal-length rows
+
+    Returns:
+        Float64 matrix (the input itself if it already is one)
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError(f"Prices must be a symbols x time matrix, got shape {values.shape}")
+    return values
+
+
+def first_valid_index(values: np.ndarray) -> np.ndarray:
+    """
+    Get the column of the first non-NaN value of each row.
+
+    Args:
+        values: Symbols x time matrix
+
+    Returns:
+        Integer array, equal to the number of columns for rows without data
+    """
+    valid = ~np.isnan(values)
+    return np.where(valid.any(axis=1), valid.argmax(axis=1), values.shape[1])
+
+
+def rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Sum over trailing windows of each row, NaN for windows containing NaN.
+
+    Each row is offset by its first value before accumulating, like the
+    one-dimensional kernel, to limit cancellation error on long series.
+
+    Args:
+        values: Symbols x time matrix
+        period: Window length
+
+    Returns:
+        Matrix with values.shape[1] - period + 1 window sums per row
+    """
+    missing = np.isnan(values)
+    start = np.minimum(first_valid_index(values), values.shape[1] - 1)
+    offset = values[np.arange(len(values)), start]
+    offset = np.where(np.isnan(offset), 0.0, offset)[:, None]
+
+    totals = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(np.where(missing, 0.0, values - offset), axis=1, out=totals[:, 1:])
+    gaps = np.zeros_like(totals)
+    np.cumsum(missing, axis=1, out=gaps[:, 1:])
+
+    sums = totals[:, period:] - totals[:, :-period] + offset * period
+    sums[(gaps[:, period:] - gaps[:, :-period]) > 0] = np.nan
+    return sums
+
+
+def sma(prices: MatrixLike, period: int) -> np.ndarray:
+    """
+    Calculate the Simple Moving Average of each row.
+
+    Args:
+        prices: Symbols x time price matrix
+        period: Number of periods for the moving average
+
+    Returns:
+        SMA matrix
+    """
+    _check_period(period)
+    values = as_price_matrix(prices)
+    result = np.full(values.shape, np.nan)
+    if values.shape[1] < period:
+        return result
+
+    result[:, period - 1:] = rolling_sum(values, period) / period
+    return result
+
+
+def ema(prices: MatrixLike, period: int) -> np.ndarray:
+    """
+    Calculate the Exponential Moving Average of each row.
+
+    Each row is seeded with the SMA of its first period valid prices.
+
+    Args:
+        prices: Symbols x time price matrix
+        period: Number of periods for the moving average
+
+    Returns:
+        EMA matrix
+    """
+    _check_period(period)
+    values = as_price_matrix(prices)
+    columns = values.shape[1]
+    result = np.full(values.shape, np.nan)
+
+    seed_index = first_valid_index(values) + period - 1
+    ready = np.flatnonzero(seed_index < columns)
+    if len(ready) == 0:
+        return result
+
+    multiplier = 2 / (period + 1)
+    decay = 1 - multiplier
+    seeds = sma(values[ready], period)[np.arange(len(ready)), seed_index[ready]]
+
+    # Zero input before the seed keeps the filter state at zero; the input at
+    # the seed column is scaled so the output there equals the seed
+    columns_index = np.arange(columns)
+    inputs = np.where(columns_index > seed_index[ready, None], values[ready], 0.0)
+    inputs[np.arange(len(ready)), seed_index[ready]] = seeds / multiplier
+
+    if lfilter is not None:
+        # y[t] = multiplier * x[t] + decay * y[t - 1] along each row
+        filtered = lfilter([multiplier], [1.0, -decay], inputs, axis=1)
+    else:
+        filtered = np.empty_like(inputs)
+        previous = np.zeros(len(ready))
+        for column in range(columns):
+            previous = inputs[:, column] * multiplier + previous * decay
+            filtered[:, column] = previous
+
+    filtered[columns_index < seed_index[ready, None]] = np.nan
+    result[ready] = filtered
+    return result
+
+
+def rsi(prices: MatrixLike, period: int = 14) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index of each row from simple averages.
+
+    Args:
+        prices: Symbols x time price matrix
+        period: Number of price changes per window
+
+    Returns:
+        RSI matrix on a 0-100 scale
+    """
+    _check_period(period)
+    values = as_price_matrix(prices)
+    result = np.full(values.shape, np.nan)
+    if values.shape[1] < period + 1:
+        return result
+
+    changes = np.diff(values, axis=1)
+    missing = np.isnan(changes)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+
+    # Non-negative cumulative sums keep all-zero windows exactly zero
+    def window_totals(series: np.ndarray) -> np.ndarray:
+        totals = np.zeros((series.shape[0], series.shape[1] + 1))
+        np.cumsum(series, axis=1, out=totals[:, 1:])
+        return totals[:, period:] - totals[:, :-period]
+
+    avg_gain = window_totals(gains) / period
+    avg_loss = window_totals(losses) / period
+    incomplete = window_totals(missing.astype(np.float64)) > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values_rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    values_rsi = np.where(avg_loss == 0, 100.0, values_rsi)
+    values_rsi[incomplete] = np.nan
+    result[:, period:] = values_rsi
+    return result
+
+
+def macd(prices: MatrixLike,
+         fast_period: int = 12,
+         slow_period: int = 26,
+         signal_period: int = 9) -> Dict[str, np.ndarray]:
+    """
+    Calculate MACD for each row.
+
+    Args:
+        prices: Symbols x time price matrix
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Dictionary with 'macd', 'signal' and 'histogram' matrices
+    """
+    _check_period(signal_period, "Signal period")
+    values = as_price_matrix(prices)
+    macd_line = ema(values, fast_period) - ema(values, slow_period)
+    signal_line = ema(macd_line, signal_period)
+
+    return {
+        'macd': macd_line,
+        'signal': signal_line,
+        'histogram': macd_line - signal_line
+    }
+
+
+def _check_shapes(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> None:
+    if highs.shape != lows.shape or highs.shape != closes.shape:
+        raise ValueError("High, low, and close price matrices must have the same shape")
+
+
+def stochastic(highs: MatrixLike,
+               lows: MatrixLike,
+               closes: MatrixLike,
+               k_period: int = 14,
+               d_period: int = 3) -> Dict[str, np.ndarray]:
+    """
+    Calculate the Stochastic Oscillator for each row.
+
+    Args:
+        highs: High price matrix
+        lows: Low price matrix
+        closes: Closing price matrix
+        k_period: Period for %K
+        d_period: Period for the %D moving average of %K
+
+    Returns:
+        Dictionary with '%K' and '%D' matrices
+    """
+    _check_period(k_period)
+    _check_period(d_period)
+    highs, lows, closes = as_price_matrix(highs), as_price_matrix(lows), as_price_matrix(closes)
+    _check_shapes(highs, lows, closes)
+
+    k_values = np.full(closes.shape, np.nan)
+    if closes.shape[1] < k_period:
+        return {'%K': k_values, '%D': np.full(closes.shape, np.nan)}
+
+    # max/min propagate NaN, so windows reaching into the padding stay NaN
+    highest_high = rolling_max(highs, k_period)
+    lowest_low = rolling_min(lows, k_period)
+    price_range = highest_high - lowest_low
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_percent = (closes[:, k_period - 1:] - lowest_low) / price_range * 100
+    # A flat window has no range; report the midpoint
+    k_values[:, k_period - 1:] = np.where(price_range == 0, 50.0, k_percent)
+
+    return {'%K': k_values, '%D': sma(k_values, d_period)}
+
+
+def bollinger_bands(prices: MatrixLike, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
+    """
+    Calculate Bollinger Bands for each row.
+
+    Args:
+        prices: Symbols x time price matrix
+        period: Period for the moving average and standard deviation
+        std_dev: Number of standard deviations for the bands
+
+    Returns:
+        Dictionary with 'upper', 'middle' and 'lower' matrices
+    """
+    _check_period(period)
+    values = as_price_matrix(prices)
+    middle = sma(values, period)
+    upper = np.full(values.shape, np.nan)
+    lower = np.full(values.shape, np.nan)
+    if values.shape[1] < period:
+        return {'upper': upper, 'middle': middle, 'lower': lower}
+
+    # Population standard deviation, NaN for windows reaching into the padding
+    deviation = np.sqrt(rolling_mean_var(values, period)[1])
+    upper[:, period - 1:] = middle[:, period - 1:] + std_dev * deviation
+    lower[:, period - 1:] = middle[:, period - 1:] - std_dev * deviation
+
+    return {'upper': upper, 'middle': middle, 'lower': lower}
+
+
+def true_range(highs: MatrixLike, lows: MatrixLike, closes: MatrixLike) -> np.ndarray:
+    """
+    Calculate the True Range of each bar.
+
+    Args:
+        highs: High price matrix
+        lows: Low price matrix
+        closes: Closing price matrix
+
+    Returns:
+        True range matrix, NaN for each row's first bar
+    """
+    highs, lows, closes = as_price_matrix(highs), as_price_matrix(lows), as_price_matrix(closes)
+    _check_shapes(highs, lows, closes)
+
+    result = np.full(closes.shape, np.nan)
+    if closes.shape[1] < 2:
+        return result
+
+    previous_close = closes[:, :-1]
+    result[:, 1:] = np.maximum.reduce([
+        highs[:, 1:] - lows[:, 1:],
+        np.abs(highs[:, 1:] - previous_close),
+        np.abs(lows[:, 1:] - previous_close)
+    ])
+    return result
+
+
+def average_true_range(highs: MatrixLike, lows: MatrixLike, closes: MatrixLike, period: int = 14) -> np.ndarray:
+    """
+    Calculate the Average True Range of each row.
+
+    Args:
+        highs: High price matrix
+        lows: Low price matrix
+        closes: Closing price matrix
+        period: Number of true ranges per average
+
+    Returns:
+        ATR matrix
+    """
+    _check_period(period)
+    return sma(true_range(highs, lows, closes), period)
+
+
+def calculate_all_indicators(highs: MatrixLike, lows: MatrixLike, closes: MatrixLike) -> Dict[str, object]:
+    """
+    Calculate the indicators of ``TechnicalAnalysis.calculate_all_indicators`` for every row.
+
+    Args:
+        highs: High price matrix
+        lows: Low price matrix
+        closes: Closing price matrix
+
+    Returns:
+        Dictionary with the same keys as calculate_all_indicators, holding
+        matrices (or dictionaries of matrices) instead of lists
+    """
+    highs, lows, closes = as_price_matrix(highs), as_price_matrix(lows), as_price_matrix(closes)
+    _check_shapes(highs, lows, closes)
+
+    return {
+        'sma_20': sma(closes, 20),
+        'sma_50': sma(closes, 50),
+        'ema_12': ema(closes, 12),
+        'ema_26': ema(closes, 26),
+        'rsi': rsi(closes),
+        'macd': macd(closes),
+        'stochastic': stochastic(highs, lows, closes),
+        'bollinger_bands': bollinger_bands(closes),
+        'atr': average_true_range(highs, lows, closes)
+    }
+
+
+def latest_values(indicators: Dict[str, object]) -> Dict[str, object]:
+    """
+    Take the last column of every indicator matrix.
+
+    Args:
+        indicators: Result of calculate_all_indicators (or any nested
+            dictionary of matrices)
+
+    Returns:
+        The same structure with one value per symbol
+    """
+    return {
+        name: latest_values(value) if isinstance(value, dict) else value[:, -1]
+        for name, value in indicators.items()
+    }
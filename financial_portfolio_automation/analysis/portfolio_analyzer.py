@@ -112,18 +112,38 @@ class PortfolioAnalyzer:
             if len(portfolio_snapshots) < 2:
                 raise ValueError("Need at least 2 portfolio snapshots for risk calculations")
             
-            # Calculate portfolio returns
             portfolio_values = [float(snapshot.total_value) for snapshot in portfolio_snapshots]
-            portfolio_returns = []
+            return self.calculate_risk_metrics_from_values(portfolio_values, market_returns)
             
-            for i in range(1, len(portfolio_values)):
-                if portfolio_values[i - 1] > 0:
-                    return_pct = (portfolio_values[i] - portfolio_values[i - 1]) / portfolio_values[i - 1]
-                    portfolio_returns.append(return_pct)
-                else:
-                    portfolio_returns.append(0.0)
+        except Exception as e:
+            self.logger.error(f"Error calculating risk metrics: {e}")
+            raise
+    
+    def calculate_risk_metrics_from_values(self, portfolio_values: List[float],
+                                           market_returns: Optional[List[float]] = None) -> Dict[str, float]:
+        """
+        Calculate portfolio risk metrics from a series of portfolio values.
+        
+        Args:
+            portfolio_values: Portfolio total values over time (e.g. an equity curve)
+            market_returns: Optional list of market returns for beta calculation
             
-            if not portfolio_returns:
+        Returns:
+            Dictionary containing risk metrics
+        """
+        try:
+            if len(portfolio_values) < 2:
+                raise ValueError("Need at least 2 portfolio values for risk calculations")
+            
+            # Calculate portfolio returns
+            values = np.asarray(portfolio_values, dtype=float)
+            previous_values = values[:-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                portfolio_returns = np.where(
+                    previous_values > 0, (values[1:] - previous_values) / previous_values, 0.0
+                )
+            
+            if not len(portfolio_returns):
                 raise ValueError("Unable to calculate portfolio returns")
             
             # Calculate basic statistics
@@ -154,10 +174,10 @@ class PortfolioAnalyzer:
             var_95 = np.percentile(portfolio_returns, 5) if len(portfolio_returns) > 0 else 0
             
             # Calculate maximum drawdown
-            max_drawdown = self._calculate_max_drawdown(portfolio_values)
+            max_drawdown = self._calculate_max_drawdown(list(portfolio_values))
             
             # Calculate downside deviation
-            negative_returns = [r for r in portfolio_returns if r < 0]
+            negative_returns = portfolio_returns[portfolio_returns < 0]
             downside_deviation = np.std(negative_returns, ddof=1) if len(negative_returns) > 1 else 0
             annual_downside_deviation = downside_deviation * np.sqrt(252)
             
@@ -0,0 +1,434 @@
+"""
+Rolling-window statistics kernels.
+
+O(n) kernels for statistics over trailing windows, shared by the indicator
+and analytics modules. The array kernels work along the last axis of a 1-D
+series or a symbols x time matrix and return one value per full window, so
+the result is window - 1 points shorter than the input, like ``rolling_sum``:
+
+- ``rolling_max`` and ``rolling_min`` use the van Herk/Gil-Werman block scan:
+  running extrema from each block start and towards each block end, combined
+  pairwise, cost three comparisons per window whatever its length. Short
+  windows are reduced with one whole-array comparison per lag instead, which
+  moves less memory.
+- ``rolling_mean_var`` applies Welford's add/remove update to every window
+  at once.
+- ``rolling_max_drawdown`` combines (peak, trough, drawdown) summaries of
+  block prefixes and suffixes the same way ``rolling_max`` combines maxima.
+- ``rolling_quantile`` keeps the window sorted and updates it by bisection.
+
+``RollingExtremum`` (monotonic deque) and ``RollingMoments`` (Welford) give
+the same statistics one value at a time, for code that walks a series in
+Python rather than building arrays.
+"""
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Windows between exact re-computations of the sum of squared deviations
+_ANCHOR_SPACING = 256
+
+# Shortest window for which the block scan beats comparing lag by lag
+_BLOCK_SCAN_MIN_WINDOW = 40
+
+
+def _check_window(window: int, length: int) -> None:
+    if window <= 0:
+        raise ValueError("Window must be positive")
+    if length < window:
+        raise ValueError(f"Need at least {window} values, got {length}")
+
+
+def _as_rows(values: ArrayLike) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim not in (1, 2):
+        raise ValueError(f"Values must be one- or two-dimensional, got shape {array.shape}")
+    return np.atleast_2d(array)
+
+
+def _restore_shape(result: np.ndarray, values: ArrayLike) -> np.ndarray:
+    return result[0] if np.ndim(values) == 1 else result
+
+
+def _block_scans(rows: np.ndarray, window: int) -> np.ndarray:
+    # Split each row into blocks of window points; the last block is padded
+    # with the row's last value, which leaves every statistic here unchanged
+    length = rows.shape[1]
+    padded_length = -(-length // window) * window
+    padded = np.pad(rows, ((0, 0), (0, padded_length - length)), mode='edge')
+    return padded.reshape(len(rows), -1, window)
+
+
+def _prefix(ufunc: np.ufunc, blocks: np.ndarray) -> np.ndarray:
+    return ufunc.accumulate(blocks, axis=2).reshape(len(blocks), -1)
+
+
+def _suffix(ufunc: np.ufunc, blocks: np.ndarray) -> np.ndarray:
+    return ufunc.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(len(blocks), -1)
+
+
+def _window_extremum(ufunc: np.ufunc, values: ArrayLike, window: int) -> np.ndarray:
+    rows = _as_rows(values)
+    length = rows.shape[1]
+    _check_window(window, length)
+
+    count = length - window + 1
+    if window < _BLOCK_SCAN_MIN_WINDOW:
+        result = rows[:, :count].copy()
+        for lag in range(1, window):
+            ufunc(result, rows[:, lag:lag + count], out=result)
+    else:
+        blocks = _block_scans(rows, window)
+        # A window starting at i is the suffix of i's block plus the prefix
+        # of the next block up to i + window - 1
+        result = ufunc(_suffix(ufunc, blocks)[:, :count], _prefix(ufunc, blocks)[:, window - 1:length])
+    return _restore_shape(result, values)
+
+
+def rolling_max(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Maximum over trailing windows.
+
+    Args:
+        values: 1-D series or symbols x time matrix
+        window: Window length
+
+    Returns:
+        Window maxima along the last axis, NaN for windows containing NaN
+    """
+    return _window_extremum(np.maximum, values, window)
+
+
+def rolling_min(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Minimum over trailing windows.
+
+    Args:
+        values: 1-D series or symbols x time matrix
+        window: Window length
+
+    Returns:
+        Window minima along the last axis, NaN for windows containing NaN
+    """
+    return _window_extremum(np.minimum, values, window)
+
+
+def rolling_mean_var(values: ArrayLike, window: int, ddof: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and variance over trailing windows with Welford's sliding update.
+
+    Squared deviations are summed directly for every 256th window; each
+    window in between adds (x - y) * (x - mean + y - previous_mean) for the
+    value x entering and y leaving, which stays accurate when the variance is
+    small compared to the mean.
+
+    Args:
+        values: 1-D series or symbols x time matrix
+        window: Window length
+        ddof: Delta degrees of freedom (0 for population, 1 for sample variance)
+
+    Returns:
+        Tuple of window means and variances along the last axis, NaN for
+        windows containing NaN
+    """
+    rows = _as_rows(values)
+    length = rows.shape[1]
+    _check_window(window, length)
+    if window <= ddof:
+        raise ValueError("Window must be larger than ddof")
+
+    missing = np.isnan(rows)
+    gaps = None
+    if missing.any():
+        # Fill gaps with each row's first valid value so the update stays
+        # finite; windows containing a gap are reset to NaN below
+        first_valid = np.where(missing.all(axis=1), 0, missing.argmin(axis=1))
+        fill = np.nan_to_num(rows[np.arange(len(rows)), first_valid])
+        rows = np.where(missing, fill[:, None], rows)
+        gaps = np.zeros((len(rows), length + 1))
+        np.cumsum(missing, axis=1, out=gaps[:, 1:])
+
+    # Offset by the first value before accumulating to limit cancellation
+    offset = rows[:, :1]
+    totals = np.zeros((len(rows), length + 1))
+    np.cumsum(rows - offset, axis=1, out=totals[:, 1:])
+    means = (totals[:, window:] - totals[:, :-window]) / window + offset
+
+    # Sum squared deviations directly at every _ANCHOR_SPACING-th window and
+    # chain the sliding updates between them, so rounding cannot accumulate
+    count = means.shape[1]
+    anchors = np.arange(0, count, _ANCHOR_SPACING)
+    anchor_windows = sliding_window_view(rows, window, axis=1)[:, anchors]
+    anchor_squares = ((anchor_windows - means[:, anchors, None]) ** 2).sum(axis=2)
+
+    updates = np.zeros((len(rows), len(anchors) * _ANCHOR_SPACING))
+    entering = rows[:, window:]
+    leaving = rows[:, :length - window]
+    updates[:, 1:count] = (entering - leaving) * (entering - means[:, 1:] + leaving - means[:, :-1])
+    updates = updates.reshape(len(rows), len(anchors), _ANCHOR_SPACING)
+    updates[:, :, 0] = anchor_squares
+    squares = np.cumsum(updates, axis=2).reshape(len(rows), -1)[:, :count]
+    variances = np.maximum(squares, 0.0) / (window - ddof)
+
+    if gaps is not None:
+        has_gap = (gaps[:, window:] - gaps[:, :-window]) > 0
+        means[has_gap] = np.nan
+        variances[has_gap] = np.nan
+
+    return _restore_shape(means, values), _restore_shape(variances, values)
+
+
+def _drawdown(trough: np.ndarray, peak: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(peak > 0, 1 - trough / peak, 0.0)
+
+
+def rolling_max_drawdown(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Maximum drawdown within trailing windows.
+
+    The drawdown of a window is the largest fall from a peak to a later
+    trough inside it, as a fraction of the peak. Values are expected to be
+    positive (e.g. prices or portfolio values); non-positive peaks count as
+    no drawdown.
+
+    Args:
+        values: 1-D series or symbols x time matrix
+        window: Window length
+
+    Returns:
+        Window drawdowns between 0 and 1 along the last axis
+    """
+    rows = _as_rows(values)
+    length = rows.shape[1]
+    _check_window(window, length)
+
+    blocks = _block_scans(rows, window)
+    prefix_peak = _prefix(np.maximum, blocks)
+    prefix_trough = _prefix(np.minimum, blocks)
+    prefix_drawdown = np.maximum.accumulate(
+        _drawdown(blocks.reshape(len(rows), -1), prefix_peak).reshape(blocks.shape), axis=2
+    ).reshape(len(rows), -1)
+
+    suffix_peak = _suffix(np.maximum, blocks)
+    suffix_trough = _suffix(np.minimum, blocks)
+    # Worst fall from each point to the lowest value after it in its block
+    suffix_drawdown = _suffix(
+        np.maximum, _drawdown(suffix_trough, blocks.reshape(len(rows), -1)).reshape(blocks.shape)
+    )
+
+    count = length - window + 1
+    ends = slice(window - 1, length)
+    result = np.maximum.reduce([
+        suffix_drawdown[:, :count],
+        prefix_drawdown[:, ends],
+        _drawdown(prefix_trough[:, ends], suffix_peak[:, :count])
+    ])
+    # Windows aligned to a block are the block itself and need no combining
+    aligned = np.arange(count) % window == 0
+    result[:, aligned] = suffix_drawdown[:, :count][:, aligned]
+    return _restore_shape(result, values)
+
+
+def rolling_quantile(values: ArrayLike, window: int, q: float) -> np.ndarray:
+    """
+    Quantile over trailing windows, interpolated linearly like ``np.quantile``.
+
+    The window is kept sorted; each step removes the leaving value and
+    inserts the entering one by bisection.
+
+    Args:
+        values: 1-D series
+        window: Window length
+        q: Quantile between 0 and 1
+
+    Returns:
+        Window quantiles of the non-NaN values, NaN for windows without any
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("Quantile must be between 0 and 1")
+    series = np.asarray(values, dtype=np.float64)
+    if series.ndim != 1:
+        raise ValueError(f"Values must be one-dimensional, got shape {series.shape}")
+    _check_window(window, len(series))
+
+    points = series.tolist()
+    ordered = sorted(value for value in points[:window] if value == value)
+    result = np.empty(len(points) - window + 1)
+    for start in range(len(result)):
+        if start:
+            leaving, entering = points[start - 1], points[start + window - 1]
+            if leaving == leaving:
+                del ordered[bisect_left(ordered, leaving)]
+            if entering == entering:
+                insort(ordered, entering)
+
+        if not ordered:
+            result[start] = np.nan
+            continue
+        position = q * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        result[start] = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    return result
+
+
+class RollingExtremum:
+    """
+    Maximum or minimum of the last window values, kept in a monotonic deque.
+
+    The deque holds the values that can still become the extremum, in window
+    order, so each update is amortized O(1).
+    """
+
+    def __init__(self, window: int, maximum: bool = True):
+        """
+        Initialize the rolling extremum.
+
+        Args:
+            window: Number of most recent values to cover
+            maximum: Track the maximum (True) or the minimum (False)
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        self.window = window
+        self.maximum = maximum
+        self._candidates: deque = deque()
+        self._count = 0
+
+    def update(self, value: float) -> float:
+        """
+        Add a value and return the extremum of the current window.
+
+        Args:
+            value: New value
+
+        Returns:
+            Extremum of the last window values seen
+        """
+        candidates = self._candidates
+        if self.maximum:
+            while candidates and candidates[-1][1] <= value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= value:
+                candidates.pop()
+        candidates.append((self._count, value))
+        if candidates[0][0] <= self._count - self.window:
+            candidates.popleft()
+        self._count += 1
+        return candidates[0][1]
+
+    @property
+    def value(self) -> Optional[float]:
+        """Get the current extremum (None before the first value)."""
+        return self._candidates[0][1] if self._candidates else None
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if a full window has been seen."""
+        return self._count >= self.window
+
+
+class RollingMoments:
+    """
+    Mean and variance of the last window values with Welford's add/remove updates.
+
+    None marks a missing value: it takes a place in the window but is left
+    out of the statistics, so count can be lower than the window.
+    """
+
+    def __init__(self, window: int):
+        """
+        Initialize the rolling moments.
+
+        Args:
+            window: Number of most recent values to cover
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        self.window = window
+        self._values: deque = deque()
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0
+
+    def update(self, value: Optional[float]) -> None:
+        """
+        Add a value, dropping the oldest one once the window is full.
+
+        Args:
+            value: New value, or None for a missing value
+        """
+        if len(self._values) == self.window:
+            leaving = self._values.popleft()
+            if leaving is not None:
+                if value is not None:
+                    # Replace in one step: count is unchanged
+                    self._values.append(value)
+                    delta = value - leaving
+                    previous_mean = self.mean
+                    self.mean += delta / self.count
+                    self._squares = max(
+                        self._squares + delta * (value - self.mean + leaving - previous_mean), 0.0
+                    )
+                    return
+                self._remove(leaving)
+
+        self._values.append(value)
+        if value is not None:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._squares += delta * (value - self.mean)
+
+    @property
+    def values(self) -> List[Optional[float]]:
+        """Get the values in the window, oldest first."""
+        return list(self._values)
+
+    def _remove(self, value: float) -> None:
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self._squares = 0.0
+            return
+        previous_mean = self.mean
+        self.mean = (previous_mean * (self.count + 1) - value) / self.count
+        self._squares = max(self._squares - (value - previous_mean) * (value - self.mean), 0.0)
+
+    def variance(self, ddof: int = 0) -> Optional[float]:
+        """
+        Get the variance of the values in the window.
+
+        Args:
+            ddof: Delta degrees of freedom (0 for population, 1 for sample variance)
+
+        Returns:
+            Variance, or None if the window holds ddof values or fewer
+        """
+        if self.count <= ddof:
+            return None
+        return self._squares / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> Optional[float]:
+        """
+        Get the standard deviation of the values in the window.
+
+        Args:
+            ddof: Delta degrees of freedom (0 for population, 1 for sample)
+
+        Returns:
+            Standard deviation, or None if the window holds ddof values or fewer
+        """
+        variance = self.variance(ddof)
+        return None if variance is None else math.sqrt(variance)
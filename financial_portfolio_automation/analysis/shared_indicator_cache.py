@@ -0,0 +1,593 @@
+"""
+Process-wide cache of indicator series shared by strategies and tools.
+
+Strategies and MCP tools often compute the same indicators over the same
+bars of the same symbol. This cache keys each computed series by symbol,
+timeframe, indicator and parameters, and keeps the input prices and bar
+timestamps alongside it. A request is served from the cache only where its
+bars and prices match the stored ones, so resampled or corrected data and a
+still-forming last bar are recomputed, replacing the stored series.
+
+Requests whose bars lie within the stored ones are returned as views of the
+stored series. When the bars overlap the end of the stored ones and add new
+bars after it, as the sliding windows of a strategy stepping through bars
+do, the series is extended instead of recomputed: window-based indicators
+recompute only the trailing windows that include new bars, and EMA-based
+indicators continue the recurrence from their last values. A stored series
+is never replaced by a shorter one, and its oldest bars are dropped once it
+holds more than twice the longest window requested from it.
+
+Values are those of the whole stored series, so a window starting after the
+first stored bar gets values computed from the bars before it: windowed
+indicators are defined from its first bar, and EMA-based indicators continue
+from earlier bars instead of re-seeding at the start of the window. Callers
+needing values computed from the window alone (such as the backtester, for
+reproducible results) use compute_indicator(). Entries are evicted least
+recently used first once the total size of the stored arrays exceeds the
+memory budget.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from . import batch_indicators
+from . import vectorized_indicators
+
+
+logger = logging.getLogger(__name__)
+
+IndicatorResult = Union[np.ndarray, Dict[str, np.ndarray]]
+
+# Rough per-entry overhead of the entry object, key and dictionaries
+_ENTRY_OVERHEAD_BYTES = 512
+
+# Rough per-bar overhead of a stored timestamp and its index entry
+_BAR_OVERHEAD_BYTES = 64
+
+
+class _IndicatorSpec:
+    """How to compute and extend one indicator."""
+
+    def __init__(self,
+                 inputs: Tuple[str, ...],
+                 params: Tuple[Tuple[str, Any], ...],
+                 compute: Callable[..., Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]],
+                 lookback: Optional[Callable[..., int]] = None,
+                 extend: Optional[Callable[..., Tuple[Dict[str, np.ndarray], Dict[str, float]]]] = None):
+        # compute(matrices, **params) returns symbols x time outputs and the
+        # per-row state extend() needs. Window-based indicators give lookback
+        # (bars per value) and are extended by recomputing trailing windows;
+        # recursive ones give extend(new_inputs, last_outputs, state, **params).
+        self.inputs = inputs
+        self.params = params
+        self.compute = compute
+        self.lookback = lookback
+        self.extend = extend
+
+    def normalize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = set(params) - {name for name, _ in self.params}
+        if unknown:
+            raise ValueError(f"Unknown indicator parameters: {sorted(unknown)}")
+        values = {}
+        for name, default in self.params:
+            if name in params:
+                values[name] = params[name]
+            elif default is None:
+                raise ValueError(f"Missing indicator parameter: {name}")
+            else:
+                values[name] = default
+        return values
+
+
+def _single(compute: Callable[..., np.ndarray]):
+    def wrapper(matrices, **params):
+        return {'value': compute(*matrices, **params)}, {}
+    return wrapper
+
+
+def _compute_ema(matrices, period):
+    return {'value': batch_indicators.ema(matrices[0], period)}, {}
+
+
+def _extend_ema(new_inputs, last, state, period):
+    return {'value': vectorized_indicators.ema(new_inputs[0], period, previous=last['value'])}, {}
+
+
+def _compute_macd(matrices, fast_period, slow_period, signal_period):
+    fast = batch_indicators.ema(matrices[0], fast_period)
+    slow = batch_indicators.ema(matrices[0], slow_period)
+    macd_line = fast - slow
+    signal_line = batch_indicators.ema(macd_line, signal_period)
+    outputs = {'macd': macd_line, 'signal': signal_line, 'histogram': macd_line - signal_line}
+    return outputs, {'fast': fast[:, -1], 'slow': slow[:, -1]}
+
+
+def _extend_macd(new_inputs, last, state, fast_period, slow_period, signal_period):
+    fast = vectorized_indicators.ema(new_inputs[0], fast_period, previous=state['fast'])
+    slow = vectorized_indicators.ema(new_inputs[0], slow_period, previous=state['slow'])
+    macd_line = fast - slow
+    signal_line = vectorized_indicators.ema(macd_line, signal_period, previous=last['signal'])
+    outputs = {'macd': macd_line, 'signal': signal_line, 'histogram': macd_line - signal_line}
+    return outputs, {'fast': fast[-1], 'slow': slow[-1]}
+
+
+_SPECS: Dict[str, _IndicatorSpec] = {
+    'sma': _IndicatorSpec(
+        ('close',), (('period', None),),
+        _single(batch_indicators.sma), lookback=lambda period: period
+    ),
+    'ema': _IndicatorSpec(
+        ('close',), (('period', None),),
+        _compute_ema, extend=_extend_ema
+    ),
+    'rsi': _IndicatorSpec(
+        ('close',), (('period', 14),),
+        _single(batch_indicators.rsi), lookback=lambda period: period + 1
+    ),
+    'macd': _IndicatorSpec(
+        ('close',), (('fast_period', 12), ('slow_period', 26), ('signal_period', 9)),
+        _compute_macd, extend=_extend_macd
+    ),
+    'bollinger_bands': _IndicatorSpec(
+        ('close',), (('period', 20), ('std_dev', 2.0)),
+        lambda matrices, **params: (batch_indicators.bollinger_bands(*matrices, **params), {}),
+        lookback=lambda period, std_dev: period
+    ),
+    'stochastic': _IndicatorSpec(
+        ('high', 'low', 'close'), (('k_period', 14), ('d_period', 3)),
+        lambda matrices, **params: (batch_indicators.stochastic(*matrices, **params), {}),
+        lookback=lambda k_period, d_period: k_period + d_period - 1
+    ),
+    'atr': _IndicatorSpec(
+        ('high', 'low', 'close'), (('period', 14),),
+        _single(batch_indicators.average_true_range), lookback=lambda period: period + 1
+    ),
+}
+
+
+def compute_indicator(indicator: str,
+                      closes: Sequence[float],
+                      highs: Optional[Sequence[float]] = None,
+                      lows: Optional[Sequence[float]] = None,
+                      **params: Any) -> IndicatorResult:
+    """
+    Compute an indicator series for one symbol without caching it.
+
+    Args:
+        indicator: Indicator name (see SharedIndicatorCache.indicators())
+        closes: Closing prices, oldest first
+        highs: High prices (required by 'stochastic' and 'atr')
+        lows: Low prices (required by 'stochastic' and 'atr')
+        **params: Indicator parameters (e.g. period=14)
+
+    Returns:
+        Indicator array, or dictionary of arrays, with one value per bar
+    """
+    spec = _SPECS.get(indicator)
+    if spec is None:
+        raise ValueError(f"Unsupported indicator: {indicator}")
+    params = spec.normalize(params)
+    series = {'close': closes, 'high': highs, 'low': lows}
+    if any(series[name] is None for name in spec.inputs):
+        raise ValueError(f"Indicator {indicator} needs {', '.join(spec.inputs)} prices")
+
+    outputs, _ = spec.compute(
+        [np.asarray(series[name], dtype=np.float64)[None, :] for name in spec.inputs], **params
+    )
+    outputs = {name: values[0] for name, values in outputs.items()}
+    return outputs['value'] if 'value' in outputs else outputs
+
+
+class _CacheEntry:
+    """
+    Indicator series over a run of consecutive bars of one symbol.
+
+    The input prices are kept with the outputs so new bars can be checked
+    against, and extended from, the stored ones. Arrays grow geometrically
+    and are reallocated rather than modified in place when old bars are
+    dropped, because callers hold views of them.
+    """
+
+    __slots__ = ('timestamps', 'positions', 'offset', 'inputs', 'buffers', 'state',
+                 'length', 'span', 'nbytes')
+
+    def __init__(self,
+                 timestamps: Sequence[Hashable],
+                 inputs: List[np.ndarray],
+                 outputs: Dict[str, np.ndarray],
+                 state: Dict[str, float]):
+        self.timestamps = list(timestamps)
+        # Bar index by timestamp, counted from the first bar ever stored
+        self.positions = {timestamp: index for index, timestamp in enumerate(self.timestamps)}
+        self.offset = 0
+        self.inputs = [np.array(values, dtype=np.float64) for values in inputs]
+        self.buffers = {name: np.array(values, dtype=np.float64) for name, values in outputs.items()}
+        self.state = state
+        self.length = len(self.timestamps)
+        # Longest run of bars requested from this entry
+        self.span = self.length
+        self.nbytes = self._size()
+
+    def _size(self) -> int:
+        arrays = self.inputs + list(self.buffers.values())
+        return (sum(array.nbytes for array in arrays) + self.length * _BAR_OVERHEAD_BYTES
+                + _ENTRY_OVERHEAD_BYTES)
+
+    def find(self, timestamp: Hashable) -> Optional[int]:
+        """Get the index of a stored bar, or None if it is not stored."""
+        position = self.positions.get(timestamp)
+        return None if position is None else position - self.offset
+
+    def matches(self, start: int, bars: Sequence[Hashable], inputs: List[np.ndarray], count: int) -> bool:
+        """Check the count stored bars from start are the first count bars, with the same prices."""
+        if self.timestamps[start:start + count] != list(bars[:count]):
+            return False
+        return all(
+            np.array_equal(stored[start:start + count], values[:count], equal_nan=True)
+            for stored, values in zip(self.inputs, inputs)
+        )
+
+    def tail_inputs(self, count: int) -> List[np.ndarray]:
+        """Get the input prices of the last count stored bars."""
+        start = max(self.length - count, 0)
+        return [values[start:self.length] for values in self.inputs]
+
+    def last_values(self) -> Dict[str, float]:
+        return {name: float(buffer[self.length - 1]) for name, buffer in self.buffers.items()}
+
+    def append(self,
+               timestamps: Sequence[Hashable],
+               inputs: List[np.ndarray],
+               outputs: Dict[str, np.ndarray],
+               state: Dict[str, float]) -> None:
+        """Add new bars after the last stored one."""
+        end = self.length + len(timestamps)
+        self.inputs = [self._write(buffer, values, end) for buffer, values in zip(self.inputs, inputs)]
+        self.buffers = {
+            name: self._write(self.buffers[name], values, end) for name, values in outputs.items()
+        }
+        for index, timestamp in enumerate(timestamps, self.offset + self.length):
+            self.positions[timestamp] = index
+        self.timestamps.extend(timestamps)
+        self.state = state
+        self.length = end
+        self.nbytes = self._size()
+
+    def _write(self, buffer: np.ndarray, values: np.ndarray, end: int) -> np.ndarray:
+        if end > len(buffer):
+            grown = np.empty(max(end, 2 * len(buffer)))
+            grown[:self.length] = buffer[:self.length]
+            buffer = grown
+        buffer[self.length:end] = values
+        return buffer
+
+    def trim(self, start: int) -> None:
+        """Drop the stored bars before start."""
+        for timestamp in self.timestamps[:start]:
+            del self.positions[timestamp]
+        self.timestamps = self.timestamps[start:]
+        self.offset += start
+        self.inputs = [values[start:self.length].copy() for values in self.inputs]
+        self.buffers = {name: values[start:self.length].copy() for name, values in self.buffers.items()}
+        self.length -= start
+        self.nbytes = self._size()
+
+    def result(self, start: int, count: int) -> IndicatorResult:
+        views = {}
+        for name, buffer in self.buffers.items():
+            view = buffer[start:start + count]
+            # Cached series are shared between callers and must not be modified
+            view.setflags(write=False)
+            views[name] = view
+        return views['value'] if 'value' in views else views
+
+
+class SharedIndicatorCache:
+    """
+    Thread-safe LRU cache of indicator series with a memory budget.
+
+    Series are computed with the batch kernels and returned as read-only
+    float64 arrays (NaN where the indicator is not defined yet), or as
+    dictionaries of arrays for indicators with several lines.
+    """
+
+    def __init__(self, max_memory_mb: float = 64.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_memory_mb: Budget for the cached arrays in MB
+        """
+        if max_memory_mb <= 0:
+            raise ValueError("max_memory_mb must be positive")
+
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._entries: 'OrderedDict[Tuple, _CacheEntry]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._extensions = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def indicators() -> List[str]:
+        """Get the names of the supported indicators."""
+        return sorted(_SPECS)
+
+    def get(self,
+            symbol: str,
+            indicator: str,
+            timestamps: Sequence[Hashable],
+            closes: Sequence[float],
+            highs: Optional[Sequence[float]] = None,
+            lows: Optional[Sequence[float]] = None,
+            timeframe: Optional[str] = None,
+            **params: Any) -> IndicatorResult:
+        """
+        Get an indicator series for one symbol, computing or extending it as needed.
+
+        Args:
+            symbol: Symbol the bars belong to
+            indicator: Indicator name (see indicators())
+            timestamps: Timestamp of each bar, oldest first
+            closes: Closing prices
+            highs: High prices (required by 'stochastic' and 'atr')
+            lows: Low prices (required by 'stochastic' and 'atr')
+            timeframe: Bar timeframe, keeps e.g. daily and minute bars apart
+            **params: Indicator parameters (e.g. period=14)
+
+        Returns:
+            Read-only indicator array, or dictionary of arrays, with one value per bar
+        """
+        return self.get_many(
+            [symbol], indicator, [timestamps], [closes],
+            highs=[highs] if highs is not None else None,
+            lows=[lows] if lows is not None else None,
+            timeframe=timeframe, **params
+        )[0]
+
+    def get_many(self,
+                 symbols: Sequence[str],
+                 indicator: str,
+                 timestamps: Sequence[Sequence[Hashable]],
+                 closes: Sequence[Sequence[float]],
+                 highs: Optional[Sequence[Sequence[float]]] = None,
+                 lows: Optional[Sequence[Sequence[float]]] = None,
+                 timeframe: Optional[str] = None,
+                 **params: Any) -> List[IndicatorResult]:
+        """
+        Get an indicator series for several symbols.
+
+        Cached series are returned or extended per symbol, and the remaining
+        symbols are computed together in one batch.
+
+        Args:
+            symbols: Symbols
+            indicator: Indicator name (see indicators())
+            timestamps: Bar timestamps per symbol, oldest first
+            closes: Closing prices per symbol
+            highs: High prices per symbol (for 'stochastic' and 'atr')
+            lows: Low prices per symbol (for 'stochastic' and 'atr')
+            timeframe: Bar timeframe
+            **params: Indicator parameters
+
+        Returns:
+            Indicator series per symbol, in the order of symbols
+        """
+        spec = _SPECS.get(indicator)
+        if spec is None:
+            raise ValueError(f"Unsupported indicator: {indicator}")
+        params = spec.normalize(params)
+        series = {'close': closes, 'high': highs, 'low': lows}
+        for name in spec.inputs:
+            if series[name] is None or len(series[name]) != len(symbols):
+                raise ValueError(f"Indicator {indicator} needs {name} prices for every symbol")
+
+        param_key = tuple(params[name] for name, _ in spec.params)
+        results: List[Optional[IndicatorResult]] = [None] * len(symbols)
+        missing = []
+
+        for index, symbol in enumerate(symbols):
+            bars = timestamps[index]
+            inputs = [np.asarray(series[name][index], dtype=np.float64) for name in spec.inputs]
+            if len(bars) == 0 or any(len(values) != len(bars) for values in inputs):
+                raise ValueError(f"Prices and timestamps of {symbol} must be non-empty and the same length")
+
+            key = (symbol, timeframe, indicator, param_key)
+            replace = False
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    result, replace = self._reuse(spec, params, key, entry, bars, inputs)
+                    if result is not None:
+                        results[index] = result
+                        continue
+                self._misses += 1
+            missing.append((index, key, bars, inputs, replace))
+
+        if missing:
+            matrices = [
+                batch_indicators.price_matrix([inputs[position] for _, _, _, inputs, _ in missing])
+                for position in range(len(spec.inputs))
+            ]
+            outputs, state = spec.compute(matrices, **params)
+            width = matrices[0].shape[1]
+
+            for row, (index, key, bars, inputs, replace) in enumerate(missing):
+                start = width - len(bars)
+                entry = _CacheEntry(
+                    bars,
+                    inputs,
+                    {name: values[row, start:] for name, values in outputs.items()},
+                    {name: float(values[row]) for name, values in state.items()}
+                )
+                with self._lock:
+                    self._store(key, entry, replace)
+                    results[index] = entry.result(0, entry.length)
+
+        return results
+
+    def clear(self) -> None:
+        """Remove all cached series and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self._hits = 0
+            self._extensions = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/extension/miss counts, hit rate (hits and
+            extensions over all lookups), evictions, entries and memory use
+        """
+        with self._lock:
+            lookups = self._hits + self._extensions + self._misses
+            return {
+                'hits': self._hits,
+                'extensions': self._extensions,
+                'misses': self._misses,
+                'hit_rate': (self._hits + self._extensions) / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'memory_mb': self._memory_bytes / (1024 * 1024),
+                'max_memory_mb': self.max_memory_bytes / (1024 * 1024)
+            }
+
+    def _reuse(self,
+               spec: _IndicatorSpec,
+               params: Dict[str, Any],
+               key: Tuple,
+               entry: _CacheEntry,
+               bars: Sequence[Hashable],
+               inputs: List[np.ndarray]) -> Tuple[Optional[IndicatorResult], bool]:
+        """
+        Return or extend a cached series overlapping the bars (lock held).
+
+        Returns:
+            The series, or None if it must be computed, and whether the bars
+            conflict with the stored ones so the entry must be replaced
+        """
+        length = len(bars)
+        start = entry.find(bars[0])
+        if start is None:
+            return None, False
+
+        stored = entry.length - start
+        if length <= stored:
+            if not entry.matches(start, bars, inputs, length):
+                return None, True
+            self._hits += 1
+            entry.span = max(entry.span, length)
+            self._entries.move_to_end(key)
+            return entry.result(start, length), False
+
+        if not entry.matches(start, bars, inputs, stored):
+            return None, True
+
+        new_bars = list(bars[stored:])
+        if len(set(new_bars)) != len(new_bars) or any(timestamp in entry.positions for timestamp in new_bars):
+            # Repeated timestamps cannot be told apart; compute without caching
+            return None, False
+        new_inputs = [values[stored:] for values in inputs]
+        self._memory_bytes -= entry.nbytes
+        if spec.lookback is not None:
+            tail = entry.tail_inputs(spec.lookback(**params) - 1)
+            outputs, _ = spec.compute(
+                [np.concatenate([old, new])[None, :] for old, new in zip(tail, new_inputs)], **params
+            )
+            outputs = {name: values[0, -len(new_bars):] for name, values in outputs.items()}
+            entry.append(new_bars, new_inputs, outputs, {})
+        else:
+            last = entry.last_values()
+            if any(np.isnan(value) for value in last.values()):
+                # The recurrence has not started yet; recompute from the stored bars
+                combined = [
+                    np.concatenate([old, new]) for old, new in zip(entry.tail_inputs(entry.length), new_inputs)
+                ]
+                outputs, state = spec.compute([values[None, :] for values in combined], **params)
+                span = entry.span
+                entry = _CacheEntry(
+                    entry.timestamps + new_bars,
+                    combined,
+                    {name: values[0] for name, values in outputs.items()},
+                    {name: float(values[0]) for name, values in state.items()}
+                )
+                entry.span = span
+                self._entries[key] = entry
+            else:
+                outputs, state = spec.extend(new_inputs, last, entry.state, **params)
+                entry.append(new_bars, new_inputs, outputs, state)
+
+        entry.span = max(entry.span, length)
+        if entry.length > 2 * entry.span:
+            # Sliding windows never look back further than the longest one requested
+            entry.trim(entry.length - entry.span)
+        self._memory_bytes += entry.nbytes
+        self._extensions += 1
+        self._entries.move_to_end(key)
+        self._evict()
+        return entry.result(entry.length - length, length), False
+
+    def _store(self, key: Tuple, entry: _CacheEntry, replace: bool) -> None:
+        """
+        Add an entry and evict down to the budget (lock held).
+
+        A stored entry is only replaced by a longer one, or when the new
+        bars conflict with it (revised prices).
+        """
+        if len(entry.positions) != entry.length:
+            # Repeated timestamps cannot be told apart
+            return
+        previous = self._entries.get(key)
+        if previous is not None:
+            if not replace and previous.length >= entry.length:
+                return
+            del self._entries[key]
+            self._memory_bytes -= previous.nbytes
+        if entry.nbytes > self.max_memory_bytes:
+            return
+        self._entries[key] = entry
+        self._memory_bytes += entry.nbytes
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the budget is met (lock held)."""
+        while self._memory_bytes > self.max_memory_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._memory_bytes -= entry.nbytes
+            self._evictions += 1
+
+
+_shared_indicator_cache: Optional[SharedIndicatorCache] = None
+_shared_indicator_cache_lock = threading.Lock()
+
+
+def get_shared_indicator_cache() -> SharedIndicatorCache:
+    """
+    Get the process-wide indicator cache.
+
+    The memory budget is read from the INDICATOR_CACHE_MAX_MB environment
+    variable (64 MB by default).
+
+    Returns:
+        Shared indicator cache
+    """
+    global _shared_indicator_cache
+
+    with _shared_indicator_cache_lock:
+        if _shared_indicator_cache is None:
+            max_memory_mb = float(os.getenv('INDICATOR_CACHE_MAX_MB') or 64.0)
+            _shared_indicator_cache = SharedIndicatorCache(max_memory_mb)
+            logger.debug(f"Created shared indicator cache with a {max_memory_mb:g} MB budget")
+        return _shared_indicator_cache
@@ -0,0 +1,863 @@
+"""
+Incremental technical indicators for live data.
+
+The batch indicators in ``TechnicalAnalysis`` recompute whole series from the
+full lookback on every update. The classes here keep just enough state to
+update in O(1) per new bar or tick, can be seeded from history, and convert
+to plain dictionaries so their state can be persisted across restarts.
+
+``StreamingIndicatorEngine`` keeps one set of indicators per symbol. Its
+``on_quote`` and ``on_trade`` methods have the ``WebSocketHandler`` callback
+signatures, so it can be fed directly from the live stream.
+"""
+
+import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from .rolling_kernels import RollingMoments
+from ..models.core import Quote
+
+
+IndicatorValue = Union[None, float, Dict[str, Optional[float]]]
+
+
+class StreamingIndicator(ABC):
+    """
+    Base class for incremental indicators.
+
+    Subclasses implement ``update_bar``; indicators that only use closing
+    prices also accept a single price through ``update``. ``value`` is None
+    until enough data has been seen.
+    """
+
+    # Constructor arguments stored in to_dict() and passed back by from_dict()
+    _params: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.count = 0
+
+    @abstractmethod
+    def update_bar(self, high: float, low: float, close: float) -> IndicatorValue:
+        """
+        Add a bar.
+
+        Args:
+            high: Bar high
+            low: Bar low
+            close: Bar close
+
+        Returns:
+            Indicator value after the update
+        """
+        pass
+
+    def update(self, price: float) -> IndicatorValue:
+        """
+        Add a single price, treated as a bar with high = low = close.
+
+        Args:
+            price: New price
+
+        Returns:
+            Indicator value after the update
+        """
+        return self.update_bar(price, price, price)
+
+    @property
+    @abstractmethod
+    def value(self) -> IndicatorValue:
+        """Get the current indicator value (None until ready)."""
+        pass
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether the indicator has enough data for a value."""
+        return self.value is not None
+
+    def seed(self, history: Iterable[Union[float, Tuple[float, float, float]]]) -> IndicatorValue:
+        """
+        Feed historical data.
+
+        Args:
+            history: Prices, or (high, low, close) tuples, oldest first
+
+        Returns:
+            Indicator value after the last item
+        """
+        for item in history:
+            if isinstance(item, tuple):
+                self.update_bar(*item)
+            else:
+                self.update(item)
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the indicator's parameters and state as JSON-serializable data.
+
+        Returns:
+            Dictionary accepted by ``from_dict``
+        """
+        return {
+            'type': type(self).__name__,
+            'params': {name: getattr(self, name) for name in self._params},
+            'state': self._get_state()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StreamingIndicator':
+        """
+        Restore an indicator saved with ``to_dict``.
+
+        Args:
+            data: Saved indicator data
+
+        Returns:
+            Indicator of the saved type and state
+        """
+        indicator_class = _INDICATOR_TYPES.get(data['type'])
+        if indicator_class is None or (cls is not StreamingIndicator and indicator_class is not cls):
+            raise ValueError(f"Cannot restore indicator of type {data['type']!r} as {cls.__name__}")
+
+        indicator = indicator_class(**data['params'])
+        indicator._set_state(data['state'])
+        return indicator
+
+    @abstractmethod
+    def _get_state(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        pass
+
+
+def _check_period(period: int, name: str = "Period") -> None:
+    if period <= 0:
+        raise ValueError(f"{name} must be positive")
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average over the last ``period`` prices."""
+
+    _params = ('period',)
+
+    def __init__(self, period: int):
+        _check_period(period)
+        super().__init__()
+        self.period = period
+        self._window: deque = deque(maxlen=period)
+        self._total = 0.0
+        self._updates_since_resum = 0
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[float]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[float]:
+        window = self._window
+        if len(window) == self.period:
+            self._total -= window[0]
+        window.append(price)
+        self._total += price
+        self.count += 1
+
+        # Re-sum once per period so floating-point drift cannot accumulate
+        self._updates_since_resum += 1
+        if self._updates_since_resum >= self.period:
+            self._total = math.fsum(window)
+            self._updates_since_resum = 0
+
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._window) < self.period:
+            return None
+        return self._total / self.period
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {'count': self.count, 'window': list(self._window)}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._window = deque(state['window'], maxlen=self.period)
+        self._total = math.fsum(self._window)
+        self._updates_since_resum = 0
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average seeded with the SMA of the first ``period`` prices."""
+
+    _params = ('period',)
+
+    def __init__(self, period: int):
+        _check_period(period)
+        super().__init__()
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self._value: Optional[float] = None
+        self._seed_total = 0.0
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[float]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+        if self._value is not None:
+            self._value = price * self.multiplier + self._value * (1 - self.multiplier)
+        else:
+            self._seed_total += price
+            if self.count == self.period:
+                self._value = self._seed_total / self.period
+        return self._value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {'count': self.count, 'value': self._value, 'seed_total': self._seed_total}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._value = state['value']
+        self._seed_total = state['seed_total']
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Relative Strength Index with Wilder smoothing.
+
+    The first average gain and loss are simple averages over ``period``
+    changes; after that each new change is blended in with weight
+    1/period. This is the standard live RSI and differs from the
+    simple-average RSI of ``TechnicalAnalysis.relative_strength_index``.
+    """
+
+    _params = ('period',)
+
+    def __init__(self, period: int = 14):
+        _check_period(period)
+        super().__init__()
+        self.period = period
+        self._previous: Optional[float] = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._changes = 0
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[float]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+        previous = self._previous
+        self._previous = price
+        if previous is None:
+            return None
+
+        change = price - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        self._changes += 1
+
+        if self._changes <= self.period:
+            # Accumulate the initial simple averages
+            self._avg_gain += gain / self.period
+            self._avg_loss += loss / self.period
+        else:
+            self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._changes < self.period:
+            return None
+        if self._avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self._avg_gain / self._avg_loss)
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'previous': self._previous,
+            'avg_gain': self._avg_gain,
+            'avg_loss': self._avg_loss,
+            'changes': self._changes
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._previous = state['previous']
+        self._avg_gain = state['avg_gain']
+        self._avg_loss = state['avg_loss']
+        self._changes = state['changes']
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram, matching ``TechnicalAnalysis.macd``."""
+
+    _params = ('fast_period', 'slow_period', 'signal_period')
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        super().__init__()
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self._fast = StreamingEMA(fast_period)
+        self._slow = StreamingEMA(slow_period)
+        self._signal = StreamingEMA(signal_period)
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[Dict[str, Optional[float]]]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[Dict[str, Optional[float]]]:
+        self.count += 1
+        fast = self._fast.update(price)
+        slow = self._slow.update(price)
+        if fast is not None and slow is not None:
+            self._signal.update(fast - slow)
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict[str, Optional[float]]]:
+        fast, slow = self._fast.value, self._slow.value
+        if fast is None or slow is None:
+            return None
+        macd_value = fast - slow
+        signal = self._signal.value
+        return {
+            'macd': macd_value,
+            'signal': signal,
+            'histogram': macd_value - signal if signal is not None else None
+        }
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'fast': self._fast._get_state(),
+            'slow': self._slow._get_state(),
+            'signal': self._signal._get_state()
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._fast._set_state(state['fast'])
+        self._slow._set_state(state['slow'])
+        self._signal._set_state(state['signal'])
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Bollinger Bands from running sums over the last ``period`` prices."""
+
+    _params = ('period', 'std_dev')
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        _check_period(period)
+        super().__init__()
+        self.period = period
+        self.std_dev = std_dev
+        self._window: deque = deque(maxlen=period)
+        self._shift = 0.0
+        self._total = 0.0
+        self._total_squares = 0.0
+        self._updates_since_resum = 0
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[Dict[str, float]]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[Dict[str, float]]:
+        window = self._window
+        if not window:
+            # Sums are kept relative to the first price to limit cancellation
+            self._shift = price
+        if len(window) == self.period:
+            removed = window[0] - self._shift
+            self._total -= removed
+            self._total_squares -= removed * removed
+        window.append(price)
+        added = price - self._shift
+        self._total += added
+        self._total_squares += added * added
+        self.count += 1
+
+        self._updates_since_resum += 1
+        if self._updates_since_resum >= self.period:
+            self._resum()
+
+        return self.value
+
+    def _resum(self) -> None:
+        """Recompute the running sums around the current window mean."""
+        window = self._window
+        self._shift = math.fsum(window) / len(window)
+        deviations = [price - self._shift for price in window]
+        self._total = math.fsum(deviations)
+        self._total_squares = math.fsum(d * d for d in deviations)
+        self._updates_since_resum = 0
+
+    @property
+    def value(self) -> Optional[Dict[str, float]]:
+        if len(self._window) < self.period:
+            return None
+        mean = self._total / self.period
+        variance = max(self._total_squares / self.period - mean * mean, 0.0)
+        middle = self._shift + mean
+        width = self.std_dev * math.sqrt(variance)
+        return {'upper': middle + width, 'middle': middle, 'lower': middle - width}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {'count': self.count, 'window': list(self._window)}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._window = deque(state['window'], maxlen=self.period)
+        if self._window:
+            self._resum()
+
+
+class StreamingATR(StreamingIndicator):
+    """Average True Range as a simple average, matching ``TechnicalAnalysis.average_true_range``."""
+
+    _params = ('period',)
+
+    def __init__(self, period: int = 14):
+        _check_period(period)
+        super().__init__()
+        self.period = period
+        self._previous_close: Optional[float] = None
+        self._ranges = StreamingSMA(period)
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[float]:
+        self.count += 1
+        previous_close = self._previous_close
+        self._previous_close = close
+        if previous_close is None:
+            return None
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        return self._ranges.update(true_range)
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._ranges.value
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {'count': self.count, 'previous_close': self._previous_close, 'ranges': self._ranges._get_state()}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._previous_close = state['previous_close']
+        self._ranges._set_state(state['ranges'])
+
+
+class StreamingStochastic(StreamingIndicator):
+    """
+    Stochastic oscillator with %K over ``k_period`` bars and %D as its SMA.
+
+    The highest high and lowest low are tracked with monotonic deques, so
+    each update is amortized O(1).
+    """
+
+    _params = ('k_period', 'd_period')
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        _check_period(k_period)
+        super().__init__()
+        self.k_period = k_period
+        self.d_period = d_period
+        # (index, value) pairs with decreasing highs / increasing lows
+        self._highs: deque = deque()
+        self._lows: deque = deque()
+        self._k: Optional[float] = None
+        self._d = StreamingSMA(d_period)
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[Dict[str, Optional[float]]]:
+        index = self.count
+        self.count += 1
+
+        highs, lows = self._highs, self._lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((index, high))
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((index, low))
+
+        oldest = index - self.k_period + 1
+        if highs[0][0] < oldest:
+            highs.popleft()
+        if lows[0][0] < oldest:
+            lows.popleft()
+
+        if self.count >= self.k_period:
+            highest, lowest = highs[0][1], lows[0][1]
+            self._k = 50.0 if highest == lowest else (close - lowest) / (highest - lowest) * 100
+            self._d.update(self._k)
+
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict[str, Optional[float]]]:
+        if self._k is None:
+            return None
+        return {'%K': self._k, '%D': self._d.value}
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'highs': [list(item) for item in self._highs],
+            'lows': [list(item) for item in self._lows],
+            'k': self._k,
+            'd': self._d._get_state()
+        }
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._highs = deque(tuple(item) for item in state['highs'])
+        self._lows = deque(tuple(item) for item in state['lows'])
+        self._k = state['k']
+        self._d._set_state(state['d'])
+
+
+class StreamingVolatility(StreamingIndicator):
+    """
+    Annualized volatility from the sample deviation of the last ``period`` log returns.
+
+    Returns are tracked with Welford add/remove updates, so each update is
+    O(1). A non-positive price leaves a gap instead of a return.
+    """
+
+    _params = ('period', 'periods_per_year')
+
+    def __init__(self, period: int = 20, periods_per_year: float = 252):
+        _check_period(period)
+        if period < 2:
+            raise ValueError("Period must be at least 2")
+        super().__init__()
+        self.period = period
+        self.periods_per_year = periods_per_year
+        self._previous_price: Optional[float] = None
+        self._returns = RollingMoments(period)
+
+    def update_bar(self, high: float, low: float, close: float) -> Optional[float]:
+        return self.update(close)
+
+    def update(self, price: float) -> Optional[float]:
+        self.count += 1
+        previous_price = self._previous_price
+        self._previous_price = price
+        if previous_price is not None:
+            valid = previous_price > 0 and price > 0
+            self._returns.update(math.log(price / previous_price) if valid else None)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        # period returns need period + 1 prices
+        if self.count <= self.period:
+            return None
+        deviation = self._returns.std(ddof=1)
+        return None if deviation is None else deviation * math.sqrt(self.periods_per_year)
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {'count': self.count, 'previous_price': self._previous_price, 'returns': self._returns.values}
+
+    def _set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state['count']
+        self._previous_price = state['previous_price']
+        self._returns = RollingMoments(self.period)
+        for value in state['returns']:
+            self._returns.update(value)
+
+
+_INDICATOR_TYPES: Dict[str, Type[StreamingIndicator]] = {
+    cls.__name__: cls for cls in (
+        StreamingSMA, StreamingEMA, StreamingRSI, StreamingMACD,
+        StreamingBollingerBands, StreamingATR, StreamingStochastic,
+        StreamingVolatility
+    )
+}
+
+
+def default_indicator_factories() -> Dict[str, Callable[[], StreamingIndicator]]:
+    """
+    Get factories for the indicators of ``TechnicalAnalysis.calculate_all_indicators``.
+
+    Returns:
+        Indicator factories by name
+    """
+    return {
+        'sma_20': lambda: StreamingSMA(20),
+        'sma_50': lambda: StreamingSMA(50),
+        'ema_12': lambda: StreamingEMA(12),
+        'ema_26': lambda: StreamingEMA(26),
+        'rsi': lambda: StreamingRSI(14),
+        'macd': lambda: StreamingMACD(12, 26, 9),
+        'stochastic': lambda: StreamingStochastic(14, 3),
+        'bollinger_bands': lambda: StreamingBollingerBands(20, 2.0),
+        'atr': lambda: StreamingATR(14),
+    }
+
+
+class _BarBuilder:
+    """Accumulates ticks into the high, low and close of the current time bar."""
+
+    __slots__ = ('start', 'high', 'low', 'close')
+
+    def __init__(self, start: datetime, price: float):
+        self.start = start
+        self.high = price
+        self.low = price
+        self.close = price
+
+    def add(self, price: float) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+
+
+class StreamingIndicatorEngine:
+    """
+    Incremental indicators for a universe of symbols.
+
+    Every symbol gets its own instance of each configured indicator. Without
+    a ``bar_interval`` every tick updates the indicators directly. With a
+    ``bar_interval``, ticks are combined into time bars and the indicators
+    are updated when a bar completes, i.e. when the first tick of the next
+    interval arrives.
+    """
+
+    def __init__(self,
+                 indicator_factories: Optional[Dict[str, Callable[[], StreamingIndicator]]] = None,
+                 bar_interval: Optional[timedelta] = None,
+                 on_update: Optional[Callable[[str, Dict[str, IndicatorValue]], None]] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            indicator_factories: Factories creating each indicator by name
+                (defaults to the indicators of calculate_all_indicators)
+            bar_interval: Aggregate ticks into bars of this length (None to update per tick)
+            on_update: Called with (symbol, values) after a symbol's indicators update
+        """
+        if bar_interval is not None and bar_interval <= timedelta(0):
+            raise ValueError("bar_interval must be positive")
+
+        self.indicator_factories = indicator_factories or default_indicator_factories()
+        self.bar_interval = bar_interval
+        self.on_update = on_update
+        self._indicators: Dict[str, Dict[str, StreamingIndicator]] = {}
+        self._bars: Dict[str, _BarBuilder] = {}
+        self._lock = threading.Lock()
+        self.ticks_processed = 0
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get the symbols with indicator state."""
+        return list(self._indicators)
+
+    def _symbol_indicators(self, symbol: str) -> Dict[str, StreamingIndicator]:
+        indicators = self._indicators.get(symbol)
+        if indicators is None:
+            indicators = {name: factory() for name, factory in self.indicator_factories.items()}
+            self._indicators[symbol] = indicators
+        return indicators
+
+    def update_bar(self, symbol: str, high: float, low: float, close: float) -> Dict[str, IndicatorValue]:
+        """
+        Update a symbol's indicators with a completed bar.
+
+        Args:
+            symbol: Symbol of the bar
+            high: Bar high
+            low: Bar low
+            close: Bar close
+
+        Returns:
+            Indicator values by name after the update
+        """
+        with self._lock:
+            values = {
+                name: indicator.update_bar(high, low, close)
+                for name, indicator in self._symbol_indicators(symbol).items()
+            }
+
+        if self.on_update:
+            self.on_update(symbol, values)
+        return values
+
+    def update_price(self, symbol: str, price: float, timestamp: Optional[datetime] = None) -> Optional[Dict[str, IndicatorValue]]:
+        """
+        Add a tick.
+
+        Args:
+            symbol: Symbol of the tick
+            price: Tick price
+            timestamp: Tick time (required when aggregating into bars)
+
+        Returns:
+            Indicator values if they were updated, None if the tick only
+            extended the current bar
+        """
+        self.ticks_processed += 1
+
+        if self.bar_interval is None:
+            return self.update_bar(symbol, price, price, price)
+
+        if timestamp is None:
+            raise ValueError("Ticks need a timestamp when aggregating into bars")
+
+        start = self._bar_start(timestamp)
+        bar = self._bars.get(symbol)
+        if bar is None:
+            self._bars[symbol] = _BarBuilder(start, price)
+            return None
+        if start == bar.start:
+            bar.add(price)
+            return None
+
+        self._bars[symbol] = _BarBuilder(start, price)
+        return self.update_bar(symbol, bar.high, bar.low, bar.close)
+
+    def _bar_start(self, timestamp: datetime) -> datetime:
+        interval = self.bar_interval.total_seconds()
+        epoch = timestamp.timestamp()
+        return datetime.fromtimestamp(epoch - epoch % interval, tz=timestamp.tzinfo)
+
+    def on_quote(self, quote: Quote) -> None:
+        """
+        Quote callback for ``WebSocketHandler``; updates with the mid price.
+
+        Args:
+            quote: Live quote
+        """
+        if quote.bid is not None and quote.ask is not None and quote.bid > 0 and quote.ask > 0:
+            price = (float(quote.bid) + float(quote.ask)) / 2
+        elif quote.close is not None:
+            price = float(quote.close)
+        else:
+            return
+        self.update_price(quote.symbol, price, quote.timestamp)
+
+    def on_trade(self, trade: Dict[str, Any]) -> None:
+        """
+        Trade callback for ``WebSocketHandler``; updates with the trade price.
+
+        Args:
+            trade: Trade dictionary with 'symbol', 'price' and 'timestamp'
+        """
+        self.update_price(trade['symbol'], float(trade['price']), trade.get('timestamp'))
+
+    def seed(self, symbol: str, quotes: Sequence[Quote]) -> Dict[str, IndicatorValue]:
+        """
+        Seed a symbol's indicators from historical bars.
+
+        Quotes with OHLC data are used as bars; quotes with only bid/ask are
+        used as ticks at the mid price.
+
+        Args:
+            symbol: Symbol to seed
+            quotes: Historical quotes, oldest first
+
+        Returns:
+            Indicator values after seeding
+        """
+        values = self.get_values(symbol)
+        for quote in quotes:
+            if quote.close is not None:
+                close = float(quote.close)
+                high = float(quote.high) if quote.high is not None else close
+                low = float(quote.low) if quote.low is not None else close
+                values = self.update_bar(symbol, high, low, close)
+            elif quote.bid is not None and quote.ask is not None:
+                price = (float(quote.bid) + float(quote.ask)) / 2
+                values = self.update_bar(symbol, price, price, price)
+        return values
+
+    def get_values(self, symbol: str) -> Dict[str, IndicatorValue]:
+        """
+        Get a symbol's current indicator values.
+
+        Args:
+            symbol: Symbol to look up
+
+        Returns:
+            Indicator values by name (None for indicators that are not ready)
+        """
+        with self._lock:
+            indicators = self._indicators.get(symbol)
+            if indicators is None:
+                return {name: None for name in self.indicator_factories}
+            return {name: indicator.value for name, indicator in indicators.items()}
+
+    def get_indicator(self, symbol: str, name: str) -> StreamingIndicator:
+        """
+        Get a symbol's indicator object, creating the symbol's state if needed.
+
+        Args:
+            symbol: Symbol to look up
+            name: Indicator name
+
+        Returns:
+            Streaming indicator
+        """
+        with self._lock:
+            return self._symbol_indicators(symbol)[name]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the indicator state of all symbols as JSON-serializable data.
+
+        Partially built bars are not included.
+
+        Returns:
+            Dictionary accepted by ``load_dict``
+        """
+        with self._lock:
+            return {
+                symbol: {name: indicator.to_dict() for name, indicator in indicators.items()}
+                for symbol, indicators in self._indicators.items()
+            }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the engine's indicator state with saved state.
+
+        Args:
+            data: State from ``to_dict``
+        """
+        indicators = {
+            symbol: {name: StreamingIndicator.from_dict(saved) for name, saved in saved_indicators.items()}
+            for symbol, saved_indicators in data.items()
+        }
+        with self._lock:
+            self._indicators = indicators
+            self._bars.clear()
+
+    def save_state(self, path: str) -> None:
+        """
+        Save the indicator state to a JSON file.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    def load_state(self, path: str) -> None:
+        """
+        Load indicator state saved with ``save_state``.
+
+        Args:
+            path: State file path
+        """
+        with open(path) as f:
+            self.load_dict(json.load(f))
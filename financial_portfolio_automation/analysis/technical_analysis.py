@@ -4,10 +4,15 @@ Technical Analysis module for calculating various technical indicators.
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from datetime import timedelta
 from decimal import Decimal
 import logging
 
+from . import batch_indicators, vectorized_indicators
+from .vectorized_indicators import to_optional_list
+from .streaming_indicators import StreamingIndicator, StreamingIndicatorEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,18 +38,7 @@ class TechnicalAnalysis:
         Returns:
             List of SMA values (None for insufficient data points)
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-        
-        sma_values = []
-        for i in range(len(prices)):
-            if i < period - 1:
-                sma_values.append(None)
-            else:
-                sma = sum(prices[i - period + 1:i + 1]) / period
-                sma_values.append(sma)
-        
-        return sma_values
+        return to_optional_list(vectorized_indicators.sma(prices, period))
     
     def exponential_moving_average(self, prices: List[float], period: int) -> List[Optional[float]]:
         """
@@ -57,23 +51,7 @@ class TechnicalAnalysis:
         Returns:
             List of EMA values (None for insufficient data points)
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-        
-        multiplier = 2 / (period + 1)
-        ema_values = []
-        
-        # First EMA is SMA
-        first_sma = sum(prices[:period]) / period
-        ema_values.extend([None] * (period - 1))
-        ema_values.append(first_sma)
-        
-        # Calculate subsequent EMAs
-        for i in range(period, len(prices)):
-            ema = (prices[i] * multiplier) + (ema_values[i - 1] * (1 - multiplier))
-            ema_values.append(ema)
-        
-        return ema_values
+        return to_optional_list(vectorized_indicators.ema(prices, period))
     
     # Momentum Indicators
     def relative_strength_index(self, prices: List[float], period: int = 14) -> List[Optional[float]]:
@@ -87,37 +65,7 @@ class TechnicalAnalysis:
         Returns:
             List of RSI values (0-100 scale)
         """
-        if len(prices) < period + 1:
-            return [None] * len(prices)
-        
-        # Calculate price changes
-        price_changes = []
-        for i in range(1, len(prices)):
-            price_changes.append(prices[i] - prices[i - 1])
-        
-        rsi_values = [None]  # First value is always None
-        
-        for i in range(len(price_changes)):
-            if i < period - 1:
-                rsi_values.append(None)
-            else:
-                # Get gains and losses for the period
-                period_changes = price_changes[i - period + 1:i + 1]
-                gains = [change if change > 0 else 0 for change in period_changes]
-                losses = [-change if change < 0 else 0 for change in period_changes]
-                
-                avg_gain = sum(gains) / period
-                avg_loss = sum(losses) / period
-                
-                if avg_loss == 0:
-                    rsi = 100
-                else:
-                    rs = avg_gain / avg_loss
-                    rsi = 100 - (100 / (1 + rs))
-                
-                rsi_values.append(rsi)
-        
-        return rsi_values
+        return to_optional_list(vectorized_indicators.rsi(prices, period))
     
     def macd(self, prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, List[Optional[float]]]:
         """
@@ -132,45 +80,8 @@ class TechnicalAnalysis:
         Returns:
             Dictionary with 'macd', 'signal', and 'histogram' lists
         """
-        fast_ema = self.exponential_moving_average(prices, fast_period)
-        slow_ema = self.exponential_moving_average(prices, slow_period)
-        
-        # Calculate MACD line
-        macd_line = []
-        for i in range(len(prices)):
-            if fast_ema[i] is None or slow_ema[i] is None:
-                macd_line.append(None)
-            else:
-                macd_line.append(fast_ema[i] - slow_ema[i])
-        
-        # Calculate signal line (EMA of MACD line)
-        # Filter out None values for signal calculation
-        macd_values_for_signal = [val for val in macd_line if val is not None]
-        if len(macd_values_for_signal) >= signal_period:
-            signal_ema = self.exponential_moving_average(macd_values_for_signal, signal_period)
-            
-            # Align signal line with original data
-            signal_line = [None] * len(prices)
-            signal_start_idx = len(prices) - len(signal_ema)
-            for i, val in enumerate(signal_ema):
-                if signal_start_idx + i < len(prices):
-                    signal_line[signal_start_idx + i] = val
-        else:
-            signal_line = [None] * len(prices)
-        
-        # Calculate histogram
-        histogram = []
-        for i in range(len(prices)):
-            if macd_line[i] is None or signal_line[i] is None:
-                histogram.append(None)
-            else:
-                histogram.append(macd_line[i] - signal_line[i])
-        
-        return {
-            'macd': macd_line,
-            'signal': signal_line,
-            'histogram': histogram
-        }
+        result = vectorized_indicators.macd(prices, fast_period, slow_period, signal_period)
+        return {name: to_optional_list(values) for name, values in result.items()}
     
     def stochastic_oscillator(self, highs: List[float], lows: List[float], closes: List[float], 
                             k_period: int = 14, d_period: int = 3) -> Dict[str, List[Optional[float]]]:
@@ -187,46 +98,8 @@ class TechnicalAnalysis:
         Returns:
             Dictionary with '%K' and '%D' lists
         """
-        if len(highs) != len(lows) or len(highs) != len(closes):
-            raise ValueError("High, low, and close price lists must have the same length")
-        
-        if len(highs) < k_period:
-            return {'%K': [None] * len(highs), '%D': [None] * len(highs)}
-        
-        k_values = []
-        
-        for i in range(len(closes)):
-            if i < k_period - 1:
-                k_values.append(None)
-            else:
-                period_highs = highs[i - k_period + 1:i + 1]
-                period_lows = lows[i - k_period + 1:i + 1]
-                
-                highest_high = max(period_highs)
-                lowest_low = min(period_lows)
-                
-                if highest_high == lowest_low:
-                    k_percent = 50  # Avoid division by zero
-                else:
-                    k_percent = ((closes[i] - lowest_low) / (highest_high - lowest_low)) * 100
-                
-                k_values.append(k_percent)
-        
-        # Calculate %D (SMA of %K)
-        k_values_for_d = [val for val in k_values if val is not None]
-        if len(k_values_for_d) >= d_period:
-            d_values = self.simple_moving_average(k_values_for_d, d_period)
-            
-            # Align %D with original data
-            d_aligned = [None] * len(closes)
-            d_start_idx = len(closes) - len(d_values)
-            for i, val in enumerate(d_values):
-                if d_start_idx + i < len(closes) and val is not None:
-                    d_aligned[d_start_idx + i] = val
-        else:
-            d_aligned = [None] * len(closes)
-        
-        return {'%K': k_values, '%D': d_aligned}
+        result = vectorized_indicators.stochastic(highs, lows, closes, k_period, d_period)
+        return {name: to_optional_list(values) for name, values in result.items()}
     
     # Volatility Indicators
     def bollinger_bands(self, prices: List[float], period: int = 20, std_dev: float = 2.0) -> Dict[str, List[Optional[float]]]:
@@ -241,36 +114,8 @@ class TechnicalAnalysis:
         Returns:
             Dictionary with 'upper', 'middle', and 'lower' band lists
         """
-        if len(prices) < period:
-            return {
-                'upper': [None] * len(prices),
-                'middle': [None] * len(prices),
-                'lower': [None] * len(prices)
-            }
-        
-        middle_band = self.simple_moving_average(prices, period)
-        upper_band = []
-        lower_band = []
-        
-        for i in range(len(prices)):
-            if middle_band[i] is None:
-                upper_band.append(None)
-                lower_band.append(None)
-            else:
-                # Calculate standard deviation for the period
-                period_prices = prices[i - period + 1:i + 1]
-                mean_price = sum(period_prices) / len(period_prices)
-                variance = sum((price - mean_price) ** 2 for price in period_prices) / len(period_prices)
-                std_deviation = variance ** 0.5
-                
-                upper_band.append(middle_band[i] + (std_dev * std_deviation))
-                lower_band.append(middle_band[i] - (std_dev * std_deviation))
-        
-        return {
-            'upper': upper_band,
-            'middle': middle_band,
-            'lower': lower_band
-        }
+        result = vectorized_indicators.bollinger_bands(prices, period, std_dev)
+        return {name: to_optional_list(values) for name, values in result.items()}
     
     def average_true_range(self, highs: List[float], lows: List[float], closes: List[float], 
                           period: int = 14) -> List[Optional[float]]:
@@ -286,37 +131,7 @@ class TechnicalAnalysis:
         Returns:
             List of ATR values
         """
-        if len(highs) != len(lows) or len(highs) != len(closes):
-            raise ValueError("High, low, and close price lists must have the same length")
-        
-        if len(highs) < period + 1:
-            return [None] * len(highs)
-        
-        true_ranges = [None]  # First value is None (no previous close)
-        
-        # Calculate True Range for each period
-        for i in range(1, len(closes)):
-            tr1 = highs[i] - lows[i]  # High - Low
-            tr2 = abs(highs[i] - closes[i - 1])  # High - Previous Close
-            tr3 = abs(lows[i] - closes[i - 1])  # Low - Previous Close
-            
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
-        
-        # Calculate ATR using SMA of True Ranges
-        atr_values = []
-        for i in range(len(true_ranges)):
-            if i < period:
-                atr_values.append(None)
-            else:
-                period_trs = [tr for tr in true_ranges[i - period + 1:i + 1] if tr is not None]
-                if len(period_trs) == period:
-                    atr = sum(period_trs) / period
-                    atr_values.append(atr)
-                else:
-                    atr_values.append(None)
-        
-        return atr_values
+        return to_optional_list(vectorized_indicators.average_true_range(highs, lows, closes, period))
     
     def calculate_all_indicators(self, highs: List[float], lows: List[float], closes: List[float]) -> Dict[str, any]:
         """
@@ -355,6 +170,58 @@ class TechnicalAnalysis:
             self.logger.error(f"Error calculating technical indicators: {e}")
             raise
     
+    def calculate_all_indicators_batch(self, highs, lows, closes) -> Dict[str, any]:
+        """
+        Calculate all technical indicators for many symbols in one vectorized pass.
+        
+        Accepts symbols x time matrices, or one price list per symbol; lists of
+        different lengths are aligned on their most recent price and left-padded
+        with NaN. Row i of every result belongs to symbol i and matches
+        calculate_all_indicators on that symbol's prices, with NaN instead of None.
+        
+        Args:
+            highs: High prices per symbol
+            lows: Low prices per symbol
+            closes: Closing prices per symbol
+            
+        Returns:
+            Dictionary with the keys of calculate_all_indicators holding matrices
+        """
+        try:
+            matrices = [
+                prices if isinstance(prices, np.ndarray) else batch_indicators.price_matrix(prices)
+                for prices in (highs, lows, closes)
+            ]
+            indicators = batch_indicators.calculate_all_indicators(*matrices)
+            
+            self.logger.info(f"Successfully calculated technical indicators for {len(matrices[2])} symbols")
+            return indicators
+            
+        except Exception as e:
+            self.logger.error(f"Error calculating batch technical indicators: {e}")
+            raise
+    
+    def create_streaming_engine(self,
+                                indicator_factories: Optional[Dict[str, Callable[[], StreamingIndicator]]] = None,
+                                bar_interval: Optional[timedelta] = None,
+                                on_update: Optional[Callable] = None) -> StreamingIndicatorEngine:
+        """
+        Create an engine that updates indicators incrementally from live data.
+        
+        By default the engine tracks the same indicators as calculate_all_indicators,
+        except that RSI uses Wilder smoothing. Pass its on_quote/on_trade methods to
+        WebSocketHandler, or the engine itself as indicator_engine.
+        
+        Args:
+            indicator_factories: Factories creating each indicator by name
+            bar_interval: Aggregate ticks into bars of this length (None to update per tick)
+            on_update: Called with (symbol, values) after a symbol's indicators update
+            
+        Returns:
+            StreamingIndicatorEngine
+        """
+        return StreamingIndicatorEngine(indicator_factories, bar_interval, on_update)
+    
     # Alias methods for backward compatibility with strategy classes
     def calculate_rsi(self, prices: List[float], period: int = 14) -> List[Optional[float]]:
         """Alias for relative_strength_index method."""
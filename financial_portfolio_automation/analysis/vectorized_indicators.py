@@ -0,0 +1,338 @@
+"""
+Vectorized technical indicator kernels.
+
+NumPy implementations of the indicators in ``TechnicalAnalysis``. Every
+function accepts a sequence or ndarray of prices and returns float64 ndarrays
+of the same length, with NaN where the indicator is not defined yet. Rolling
+sums use cumulative sums, rolling extrema and deviations use the O(n)
+kernels in ``rolling_kernels``, and exponential averages run the EMA
+recurrence as a linear filter.
+
+``TechnicalAnalysis`` wraps these kernels and converts NaN back to ``None``
+for its list-based API.
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+from .rolling_kernels import rolling_max, rolling_mean_var, rolling_min
+
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+def as_price_array(prices: ArrayLike) -> np.ndarray:
+    """
+    Convert prices to a 1-D float64 array.
+
+    Args:
+        prices: Sequence or array of prices
+
+    Returns:
+        Float64 array (the input itself if it already is one)
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError(f"Prices must be one-dimensional, got shape {values.shape}")
+    return values
+
+
+def to_optional_list(values: np.ndarray) -> List[Optional[float]]:
+    """
+    Convert an indicator array to a list with None in place of NaN.
+
+    Args:
+        values: Indicator values
+
+    Returns:
+        List of floats and None
+    """
+    return [None if value != value else value for value in values.tolist()]
+
+
+def _check_period(period: int, name: str = "Period") -> None:
+    if period <= 0:
+        raise ValueError(f"{name} must be positive")
+
+
+def rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Sum over trailing windows using cumulative sums.
+
+    The first value is subtracted before accumulating, which keeps the
+    running total small and limits cancellation error on long series.
+
+    Args:
+        values: Input values
+        period: Window length
+
+    Returns:
+        Array of len(values) - period + 1 window sums
+    """
+    offset = values[0]
+    totals = np.empty(len(values) + 1)
+    totals[0] = 0.0
+    np.cumsum(values - offset, out=totals[1:])
+    return totals[period:] - totals[:-period] + offset * period
+
+
+def sma(prices: ArrayLike, period: int) -> np.ndarray:
+    """
+    Calculate the Simple Moving Average.
+
+    Args:
+        prices: Price values
+        period: Number of periods for the moving average
+
+    Returns:
+        SMA values, NaN for the first period - 1 points
+    """
+    _check_period(period)
+    values = as_price_array(prices)
+    result = np.full(len(values), np.nan)
+    if len(values) < period:
+        return result
+
+    result[period - 1:] = rolling_sum(values, period) / period
+    return result
+
+
+def ema(prices: ArrayLike, period: int, previous: Optional[float] = None) -> np.ndarray:
+    """
+    Calculate the Exponential Moving Average, seeded with the SMA of the first period.
+
+    Args:
+        prices: Price values
+        period: Number of periods for the moving average
+        previous: EMA value just before the first price; when given, the EMA
+            continues from it instead of being seeded, so every point is defined
+
+    Returns:
+        EMA values, NaN for the first period - 1 points
+    """
+    _check_period(period)
+    values = as_price_array(prices)
+    result = np.full(len(values), np.nan)
+
+    multiplier = 2 / (period + 1)
+    decay = 1 - multiplier
+    if previous is not None:
+        seed, start = float(previous), 0
+    elif len(values) < period:
+        return result
+    else:
+        seed, start = values[:period].sum() / period, period
+        result[period - 1] = seed
+
+    tail = values[start:]
+    if len(tail) == 0:
+        return result
+
+    if lfilter is not None:
+        # y[t] = multiplier * x[t] + decay * y[t - 1], starting from the seed
+        result[start:], _ = lfilter([multiplier], [1.0, -decay], tail, zi=[decay * seed])
+    else:
+        out = result[start:]
+        for i, price in enumerate(tail.tolist()):
+            seed = price * multiplier + seed * decay
+            out[i] = seed
+
+    return result
+
+
+def rsi(prices: ArrayLike, period: int = 14) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index from simple averages of gains and losses.
+
+    Args:
+        prices: Price values
+        period: Number of price changes per window
+
+    Returns:
+        RSI values on a 0-100 scale, NaN for the first period points
+    """
+    _check_period(period)
+    values = as_price_array(prices)
+    result = np.full(len(values), np.nan)
+    if len(values) < period + 1:
+        return result
+
+    changes = np.diff(values)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+
+    # Gains and losses are non-negative, so plain cumulative sums are monotonic
+    # and all-zero windows produce exactly zero
+    gain_totals = np.concatenate(([0.0], np.cumsum(gains)))
+    loss_totals = np.concatenate(([0.0], np.cumsum(losses)))
+    avg_gain = (gain_totals[period:] - gain_totals[:-period]) / period
+    avg_loss = (loss_totals[period:] - loss_totals[:-period]) / period
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values_rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    result[period:] = np.where(avg_loss == 0, 100.0, values_rsi)
+    return result
+
+
+def macd(prices: ArrayLike,
+         fast_period: int = 12,
+         slow_period: int = 26,
+         signal_period: int = 9) -> Dict[str, np.ndarray]:
+    """
+    Calculate MACD (Moving Average Convergence Divergence).
+
+    Args:
+        prices: Price values
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Dictionary with 'macd', 'signal' and 'histogram' arrays
+    """
+    _check_period(signal_period, "Signal period")
+    values = as_price_array(prices)
+    macd_line = ema(values, fast_period) - ema(values, slow_period)
+
+    signal_line = np.full(len(values), np.nan)
+    start = max(fast_period, slow_period) - 1
+    if len(values) - start >= signal_period:
+        signal_line[start:] = ema(macd_line[start:], signal_period)
+
+    return {
+        'macd': macd_line,
+        'signal': signal_line,
+        'histogram': macd_line - signal_line
+    }
+
+
+def _check_lengths(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> None:
+    if len(highs) != len(lows) or len(highs) != len(closes):
+        raise ValueError("High, low, and close price lists must have the same length")
+
+
+def stochastic(highs: ArrayLike,
+               lows: ArrayLike,
+               closes: ArrayLike,
+               k_period: int = 14,
+               d_period: int = 3) -> Dict[str, np.ndarray]:
+    """
+    Calculate the Stochastic Oscillator.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        closes: Closing prices
+        k_period: Period for %K
+        d_period: Period for the %D moving average of %K
+
+    Returns:
+        Dictionary with '%K' and '%D' arrays
+    """
+    _check_period(k_period)
+    _check_period(d_period)
+    highs, lows, closes = as_price_array(highs), as_price_array(lows), as_price_array(closes)
+    _check_lengths(highs, lows, closes)
+
+    k_values = np.full(len(closes), np.nan)
+    d_values = np.full(len(closes), np.nan)
+    if len(closes) < k_period:
+        return {'%K': k_values, '%D': d_values}
+
+    highest_high = rolling_max(highs, k_period)
+    lowest_low = rolling_min(lows, k_period)
+    price_range = highest_high - lowest_low
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_percent = (closes[k_period - 1:] - lowest_low) / price_range * 100
+    # A flat window has no range; report the midpoint
+    k_values[k_period - 1:] = np.where(price_range == 0, 50.0, k_percent)
+
+    if len(closes) - k_period + 1 >= d_period:
+        d_values[k_period - 1:] = sma(k_values[k_period - 1:], d_period)
+
+    return {'%K': k_values, '%D': d_values}
+
+
+def bollinger_bands(prices: ArrayLike, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
+    """
+    Calculate Bollinger Bands with the population standard deviation of each window.
+
+    Args:
+        prices: Price values
+        period: Period for the moving average and standard deviation
+        std_dev: Number of standard deviations for the bands
+
+    Returns:
+        Dictionary with 'upper', 'middle' and 'lower' arrays
+    """
+    _check_period(period)
+    values = as_price_array(prices)
+    middle = sma(values, period)
+    upper = np.full(len(values), np.nan)
+    lower = np.full(len(values), np.nan)
+    if len(values) < period:
+        return {'upper': upper, 'middle': middle, 'lower': lower}
+
+    deviation = np.sqrt(rolling_mean_var(values, period)[1])
+    upper[period - 1:] = middle[period - 1:] + std_dev * deviation
+    lower[period - 1:] = middle[period - 1:] - std_dev * deviation
+
+    return {'upper': upper, 'middle': middle, 'lower': lower}
+
+
+def true_range(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike) -> np.ndarray:
+    """
+    Calculate the True Range of each bar.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        closes: Closing prices
+
+    Returns:
+        True ranges, NaN for the first bar (no previous close)
+    """
+    highs, lows, closes = as_price_array(highs), as_price_array(lows), as_price_array(closes)
+    _check_lengths(highs, lows, closes)
+
+    result = np.full(len(closes), np.nan)
+    if len(closes) < 2:
+        return result
+
+    previous_close = closes[:-1]
+    result[1:] = np.maximum.reduce([
+        highs[1:] - lows[1:],
+        np.abs(highs[1:] - previous_close),
+        np.abs(lows[1:] - previous_close)
+    ])
+    return result
+
+
+def average_true_range(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike, period: int = 14) -> np.ndarray:
+    """
+    Calculate the Average True Range as a simple average of true ranges.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        closes: Closing prices
+        period: Number of true ranges per average
+
+    Returns:
+        ATR values, NaN for the first period points
+    """
+    _check_period(period)
+    ranges = true_range(highs, lows, closes)
+    result = np.full(len(ranges), np.nan)
+    if len(ranges) < period + 1:
+        return result
+
+    result[1:] = sma(ranges[1:], period)
+    return result
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
+from ..analysis.rolling_kernels import RollingMoments, rolling_max_drawdown, rolling_quantile
 from ..models.core import PortfolioSnapshot
 from ..data.store import DataStore
 
@@ -479,27 +480,17 @@ class DataAggregator:
         rolling_returns = []
         rolling_volatilities = []
         
-        for i in range(window_size, len(aggregated_data)):
-            window_data = aggregated_data[i-window_size:i]
-            
-            # Calculate returns for window
-            window_returns = []
-            for j in range(1, len(window_data)):
-                prev_close = window_data[j-1]['close_value']
-                curr_close = window_data[j]['close_value']
-                
-                if prev_close > 0:
-                    ret = (curr_close - prev_close) / prev_close
-                    window_returns.append(ret)
-            
-            if window_returns:
-                avg_return = sum(window_returns) / len(window_returns)
-                rolling_returns.append(avg_return)
+        # Each window of window_size periods holds window_size - 1 returns
+        if window_size > 1:
+            moments = RollingMoments(window_size - 1)
+            for i, ret in enumerate(self._period_returns(aggregated_data)[:-1], 1):
+                moments.update(ret)
                 
-                if len(window_returns) > 1:
-                    variance = sum((r - avg_return) ** 2 for r in window_returns) / (len(window_returns) - 1)
-                    volatility = variance ** 0.5
-                    rolling_volatilities.append(volatility)
+                if i >= window_size - 1 and moments.count:
+                    rolling_returns.append(moments.mean)
+                    
+                    if moments.count > 1:
+                        rolling_volatilities.append(moments.std(ddof=1))
         
         return {
             'rolling_returns': rolling_returns,
@@ -520,35 +511,26 @@ class DataAggregator:
         rolling_var_99 = []
         rolling_max_dd = []
         
-        for i in range(window_size, len(aggregated_data)):
-            window_data = aggregated_data[i-window_size:i]
-            
-            # Calculate returns for window
-            window_returns = []
-            for j in range(1, len(window_data)):
-                prev_close = window_data[j-1]['close_value']
-                curr_close = window_data[j]['close_value']
-                
-                if prev_close > 0:
-                    ret = (curr_close - prev_close) / prev_close
-                    window_returns.append(ret)
+        if 1 < window_size < len(aggregated_data):
+            # Windows cover window_size periods ending before the latest one,
+            # and window_size - 1 returns each (NaN where a return is undefined)
+            returns = [
+                ret if ret is not None else float('nan')
+                for ret in self._period_returns(aggregated_data)[:-1]
+            ]
+            closes = [dp['close_value'] for dp in aggregated_data[:-1]]
             
-            if window_returns:
-                # Calculate VaR
-                sorted_returns = sorted(window_returns)
-                
-                var_95_idx = int(0.05 * len(sorted_returns))
-                var_99_idx = int(0.01 * len(sorted_returns))
-                
-                if var_95_idx < len(sorted_returns):
-                    rolling_var_95.append(sorted_returns[var_95_idx] * 100)
-                
-                if var_99_idx < len(sorted_returns):
-                    rolling_var_99.append(sorted_returns[var_99_idx] * 100)
-                
-                # Calculate max drawdown for window
-                window_max_dd = self._calculate_max_drawdown_from_data(window_data)
-                rolling_max_dd.append(window_max_dd)
+            windows = zip(
+                rolling_quantile(returns, window_size - 1, 0.05),
+                rolling_quantile(returns, window_size - 1, 0.01),
+                rolling_max_drawdown(closes, window_size)
+            )
+            for var_95, var_99, max_dd in windows:
+                # Skip windows without any defined return
+                if var_95 == var_95:
+                    rolling_var_95.append(float(var_95) * 100)
+                    rolling_var_99.append(float(var_99) * 100)
+                    rolling_max_dd.append(float(max_dd) * 100)
         
         return {
             'rolling_var_95': rolling_var_95,
@@ -557,6 +539,15 @@ class DataAggregator:
             'window_size': window_size
         }
     
+    def _period_returns(self, aggregated_data: List[Dict[str, Any]]) -> List[Optional[float]]:
+        """Calculate period-over-period returns, None where the previous close is not positive."""
+        returns = []
+        for i in range(1, len(aggregated_data)):
+            prev_close = aggregated_data[i-1]['close_value']
+            curr_close = aggregated_data[i]['close_value']
+            returns.append((curr_close - prev_close) / prev_close if prev_close > 0 else None)
+        return returns
+    
     def _calculate_max_drawdown_from_data(
         self, 
         aggregated_data: List[Dict[str, Any]]
@@ -12,6 +12,7 @@ import math
 import logging
 from statistics import mean, stdev
 
+from ..analysis.rolling_kernels import RollingMoments
 from ..models.core import PortfolioSnapshot
 
 
@@ -182,24 +183,19 @@ class TrendAnalyzer:
         if len(snapshots) < 10:  # Need minimum data for volatility analysis
             return {}
         
-        # Calculate rolling volatility (10-day windows)
+        # Calculate rolling volatility (10-day windows); each window of
+        # window_size snapshots holds window_size - 1 returns
         window_size = min(10, len(snapshots) // 3)
+        moments = RollingMoments(window_size - 1)
         rolling_volatilities = []
         
-        for i in range(window_size, len(snapshots)):
-            window_snapshots = snapshots[i-window_size:i]
-            window_returns = []
+        for i in range(1, len(snapshots) - 1):
+            prev_val = float(snapshots[i-1].total_value)
+            curr_val = float(snapshots[i].total_value)
+            moments.update((curr_val - prev_val) / prev_val if prev_val > 0 else None)
             
-            for j in range(1, len(window_snapshots)):
-                prev_val = float(window_snapshots[j-1].total_value)
-                curr_val = float(window_snapshots[j].total_value)
-                
-                if prev_val > 0:
-                    ret = (curr_val - prev_val) / prev_val
-                    window_returns.append(ret)
-            
-            if len(window_returns) > 1:
-                window_vol = stdev(window_returns) * math.sqrt(252) * 100
+            if i >= window_size - 1 and moments.count > 1:
+                window_vol = moments.std(ddof=1) * math.sqrt(252) * 100
                 rolling_volatilities.append(window_vol)
         
         if not rolling_volatilities:
@@ -11,9 +11,10 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+import asyncio
 import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from financial_portfolio_automation.api.auth import get_current_user, AuthUser
 from financial_portfolio_automation.api.middleware import (
@@ -62,6 +63,34 @@ app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(RateLimitMiddleware)
 
+# Data store shared by the endpoints; opened on first use, closed on shutdown
+_data_store: Optional[Any] = None
+_data_store_lock = asyncio.Lock()
+
+
+async def _get_data_store():
+    """Get the shared data store, opening it off the event loop on first use."""
+    global _data_store
+    
+    async with _data_store_lock:
+        if _data_store is None:
+            from financial_portfolio_automation.data.async_store import AsyncDataStore
+            from financial_portfolio_automation.data.store import DataStore
+            # Opening the store creates the schema and runs migrations
+            _data_store = AsyncDataStore(await asyncio.to_thread(DataStore))
+        return _data_store
+
+
+async def _close_data_store() -> None:
+    """Close the shared data store, if it was opened."""
+    global _data_store
+    
+    async with _data_store_lock:
+        if _data_store is not None:
+            await _data_store.close()
+            await asyncio.to_thread(_data_store.data_store.close)
+            _data_store = None
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -81,8 +110,7 @@ async def health_check():
     """Health check endpoint."""
     try:
         # Test database connectivity
-        from financial_portfolio_automation.data.store import DataStore
-        data_store = DataStore()
+        await _get_data_store()
         
         # Test MCP tools availability
         from financial_portfolio_automation.mcp.portfolio_tools import PortfolioTools
@@ -245,8 +273,7 @@ async def startup_event():
     # Initialize services
     try:
         # Test database connection
-        from financial_portfolio_automation.data.store import DataStore
-        data_store = DataStore()
+        await _get_data_store()
         logger.info("Database connection established")
         
         # Initialize MCP tools
@@ -271,7 +298,7 @@ async def shutdown_event():
     # Cleanup resources
     try:
         # Close database connections
-        # Close any open connections, cleanup resources
+        await _close_data_store()
         logger.info("Resources cleaned up successfully")
     except Exception as e:
         logger.error(f"Shutdown cleanup failed: {e}")
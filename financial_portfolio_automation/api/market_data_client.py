@@ -6,6 +6,7 @@ Alpaca Markets, including real-time quotes, historical data, and market status.
 """
 
 import logging
+import math
 from typing import Optional, Dict, Any, List, Union
 from datetime import datetime, timedelta, timezone
 import time
@@ -15,6 +16,7 @@ from alpaca_trade_api.rest import APIError as AlpacaAPIError, TimeFrame
 
 from ..models.config import AlpacaConfig, DataFeed
 from ..models.core import Quote
+from ..models.quote_frame import BarArray, datetime_to_ns
 from ..exceptions import (
     APIError, AuthenticationError, RateLimitError, NetworkError,
     DataError, ValidationError
@@ -240,7 +242,8 @@ class MarketDataClient:
                 raise APIError(error_msg, status_code=getattr(e, 'status_code', None))
     
     def get_historical_bars(self, symbol: str, timeframe: str, start: datetime, 
-                           end: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+                           end: Optional[datetime] = None, limit: Optional[int] = None,
+                           as_frame: bool = False) -> Union[List[Dict[str, Any]], BarArray]:
         """
         Get historical price bars for a symbol.
         
@@ -250,9 +253,10 @@ class MarketDataClient:
             start: Start date for historical data
             end: End date for historical data (defaults to now)
             limit: Maximum number of bars to return
+            as_frame: Return the bars as a columnar BarArray instead of dictionaries
             
         Returns:
-            List of historical bar data
+            List of historical bar data, or a BarArray if as_frame is set
             
         Raises:
             APIError: If API request fails
@@ -297,7 +301,21 @@ class MarketDataClient:
             
             if bars is None or len(bars) == 0:
                 logger.warning(f"No historical data available for {symbol}")
-                return []
+                return BarArray(symbol, []) if as_frame else []
+            
+            if as_frame:
+                # Missing prices are NaN and missing sizes -1, as in BarArray.from_quotes
+                columns = {
+                    name: [math.nan if getattr(bar, name) is None else float(getattr(bar, name)) for bar in bars]
+                    for name in ('open', 'high', 'low', 'close')
+                }
+                return BarArray(
+                    symbol,
+                    [datetime_to_ns(bar.timestamp) for bar in bars],
+                    bars[0].timestamp.tzinfo,
+                    volume=[-1 if bar.volume is None else int(bar.volume) for bar in bars],
+                    **columns
+                )
             
             bar_data = []
             for bar in bars:
@@ -8,7 +8,7 @@ import ssl
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Callable, Any, Set
+from typing import Dict, List, Optional, Callable, Any, Set, Union
 from enum import Enum
 
 try:
@@ -20,9 +20,12 @@ except ImportError:
     WebSocketException = Exception
 
 from financial_portfolio_automation.models.core import Quote
+from financial_portfolio_automation.analysis.streaming_indicators import StreamingIndicatorEngine
 from financial_portfolio_automation.config.settings import get_config
+from financial_portfolio_automation.data.async_store import AsyncDataStore
+from financial_portfolio_automation.data.store import DataStore
 from financial_portfolio_automation.utils.logging import get_logger
-from financial_portfolio_automation.exceptions import APIError, DataError
+from financial_portfolio_automation.exceptions import APIError, DataError, DatabaseError
 
 
 class ConnectionState(Enum):
@@ -44,8 +47,27 @@ class WebSocketHandler:
     def __init__(self, 
                  on_quote: Optional[Callable[[Quote], None]] = None,
                  on_trade: Optional[Callable[[Dict], None]] = None,
-                 on_error: Optional[Callable[[Exception], None]] = None):
-        """Initialize WebSocket handler."""
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 indicator_engine: Optional[StreamingIndicatorEngine] = None,
+                 data_store: Optional[Union[DataStore, AsyncDataStore]] = None,
+                 quote_batch_size: int = 500,
+                 quote_flush_interval: float = 1.0):
+        """
+        Initialize WebSocket handler.
+        
+        Args:
+            on_quote: Called with each received quote
+            on_trade: Called with each received trade
+            on_error: Called with errors
+            indicator_engine: Streaming indicators updated from every quote and
+                trade before the callbacks run
+            data_store: Store that received quotes are persisted to, in
+                batches of quote_batch_size. A DataStore is wrapped in an
+                AsyncDataStore with a single writer thread
+            quote_batch_size: Number of quotes buffered per database write
+            quote_flush_interval: Seconds a quote may stay buffered before
+                the batch is written, however few quotes it holds
+        """
         if websockets is None:
             raise ImportError("websockets library is required for WebSocket functionality")
         
@@ -61,6 +83,17 @@ class WebSocketHandler:
         self._on_quote = on_quote
         self._on_trade = on_trade
         self._on_error = on_error
+        self._indicator_engine = indicator_engine
+        
+        # Quote persistence
+        if isinstance(data_store, DataStore):
+            data_store = AsyncDataStore(data_store, max_workers=1)
+        self._data_store: Optional[AsyncDataStore] = data_store
+        self._quote_batch_size = quote_batch_size
+        self._quote_flush_interval = quote_flush_interval
+        self._pending_quotes: List[Quote] = []
+        self._pending_since: Optional[float] = None
+        self._quotes_persisted = 0
         
         # Subscriptions
         self._subscribed_symbols: Set[str] = set()
@@ -143,6 +176,8 @@ class WebSocketHandler:
                 # Start message handling task
                 asyncio.create_task(self._message_loop())
                 asyncio.create_task(self._heartbeat_loop())
+                if self._data_store:
+                    asyncio.create_task(self._quote_flush_loop())
                 
                 return True
             else:
@@ -271,6 +306,8 @@ class WebSocketHandler:
     
     async def disconnect(self) -> None:
         """Disconnect from WebSocket server."""
+        await self.flush_quotes()
+        
         if self._websocket and not self._websocket.closed:
             try:
                 await self._websocket.close()
@@ -356,7 +393,7 @@ class WebSocketHandler:
     async def _handle_quote(self, data: Dict[str, Any]) -> None:
         """Handle quote message."""
         try:
-            quote = Quote(
+            quote = Quote.from_trusted(
                 symbol=data["S"],
                 timestamp=datetime.fromtimestamp(data["t"] / 1000000000, tz=timezone.utc),
                 bid=Decimal(str(data["bp"])),
@@ -370,14 +407,43 @@ class WebSocketHandler:
                             bid=float(quote.bid), 
                             ask=float(quote.ask))
             
+            if self._indicator_engine:
+                self._indicator_engine.on_quote(quote)
+            
             if self._on_quote:
                 self._on_quote(quote)
+            
+            if self._data_store:
+                if not self._pending_quotes:
+                    self._pending_since = time.monotonic()
+                self._pending_quotes.append(quote)
+                if (len(self._pending_quotes) >= self._quote_batch_size or
+                    time.monotonic() - self._pending_since >= self._quote_flush_interval):
+                    await self.flush_quotes()
                 
         except (KeyError, ValueError, TypeError) as e:
             self.logger.error("Invalid quote data", data=data, error=str(e))
             if self._on_error:
                 self._on_error(DataError(f"Invalid quote data: {e}"))
     
+    async def flush_quotes(self) -> None:
+        """Write buffered quotes to the data store in one transaction."""
+        if not self._data_store or not self._pending_quotes:
+            return
+        
+        batch = self._pending_quotes
+        self._pending_quotes = []
+        self._pending_since = None
+        
+        try:
+            # The write runs on the store's own pool so streaming is not blocked
+            await self._data_store.save_quotes_batch(batch)
+            self._quotes_persisted += len(batch)
+        except DatabaseError as e:
+            self.logger.error("Failed to persist quotes", count=len(batch), error=str(e))
+            if self._on_error:
+                self._on_error(e)
+    
     async def _handle_trade(self, data: Dict[str, Any]) -> None:
         """Handle trade message."""
         try:
@@ -394,6 +460,9 @@ class WebSocketHandler:
                             price=float(trade_data["price"]), 
                             size=trade_data["size"])
             
+            if self._indicator_engine:
+                self._indicator_engine.on_trade(trade_data)
+            
             if self._on_trade:
                 self._on_trade(trade_data)
                 
@@ -437,6 +506,17 @@ class WebSocketHandler:
                 self.logger.error("Error in heartbeat loop", error=str(e))
                 break
     
+    async def _quote_flush_loop(self) -> None:
+        """Write buffered quotes periodically, so a quiet stream does not hold them back."""
+        while self.is_connected:
+            try:
+                await asyncio.sleep(self._quote_flush_interval)
+                await self.flush_quotes()
+                
+            except Exception as e:
+                self.logger.error("Error in quote flush loop", error=str(e))
+                break
+    
     async def _handle_disconnection(self) -> None:
         """Handle WebSocket disconnection and attempt reconnection."""
         self.logger.warning("WebSocket disconnected, attempting reconnection")
@@ -493,6 +573,7 @@ class WebSocketHandler:
             "connected": self.is_connected,
             "uptime_seconds": uptime,
             "messages_received": self._messages_received,
+            "quotes_persisted": self._quotes_persisted,
             "last_message_time": self._last_message_time,
             "subscribed_symbols": len(self._subscribed_symbols),
             "reconnect_attempts": self._reconnect_attempts,
@@ -136,6 +136,9 @@ def backtest(ctx, strategy_name: str, start_date: Optional[str], end_date: Optio
             click.echo("❌ Backtest failed or returned no results")
             return
         
+        if backtest_results.get('cached'):
+            click.echo("♻️  Identical backtest found, using cached results")
+        
         # Display performance summary
         click.echo("\n📈 Performance Summary")
         click.echo("=" * 30)
@@ -341,6 +344,13 @@ def optimize(ctx, strategy_name: str, parameter: tuple, objective: str,
         perf_output = format_output(performance_metrics, ctx.obj['output_format'])
         click.echo(perf_output)
         
+        # Ranked parameter combinations
+        results_table = optimization_results.get('results_table', [])
+        if results_table:
+            click.echo("\n🏅 Top Parameter Combinations:")
+            table_output = format_output(results_table[:10], ctx.obj['output_format'])
+            click.echo(table_output)
+        
         # Optimization statistics
         opt_stats = optimization_results.get('optimization_stats', {})
         if opt_stats:
@@ -348,8 +358,9 @@ def optimize(ctx, strategy_name: str, parameter: tuple, objective: str,
             stats_metrics = {
                 'Total Iterations': opt_stats.get('total_iterations', 0),
                 'Successful Runs': opt_stats.get('successful_runs', 0),
+                'Pruned Runs': opt_stats.get('pruned_runs', 0),
                 'Best Iteration': opt_stats.get('best_iteration', 0),
-                'Improvement %': format_percentage(opt_stats.get('improvement_percent', 0)),
+                'Improvement %': format_percentage(opt_stats.get('improvement_percent', 0) / 100),
                 'Convergence': 'Yes' if opt_stats.get('converged', False) else 'No'
             }
             
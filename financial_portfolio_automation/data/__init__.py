@@ -0,0 +1,15 @@
+"""
+Data storage for market and portfolio data.
+"""
+
+from .store import DataStore, RetentionPolicy
+from .async_store import AsyncDataStore
+from .cache import DataCache, CacheEntry
+
+__all__ = [
+    "DataStore",
+    "AsyncDataStore",
+    "RetentionPolicy",
+    "DataCache",
+    "CacheEntry",
+]
@@ -0,0 +1,172 @@
+"""
+Awaitable access to a DataStore for coroutines.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Union
+
+from ..models.core import Quote, Order, PortfolioSnapshot
+from ..models.quote_frame import BarArray, QuoteFrame
+from .store import DataStore
+
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class AsyncDataStore:
+    """
+    Coroutine facade over a DataStore.
+
+    Every call runs on a dedicated thread pool, so queries never block the
+    event loop, and at most max_workers of them run at once; further calls
+    wait their turn. The pool is separate from the loop's default executor,
+    so slow report queries do not hold up other work sent there.
+    """
+
+    def __init__(self, data_store: DataStore, max_workers: int = 4):
+        """
+        Initialize the facade.
+
+        Args:
+            data_store: Store to run queries against
+            max_workers: Maximum number of queries running at once
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        self.data_store = data_store
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="datastore"
+        )
+
+    async def _run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    # Writes
+
+    async def store_quote(self, quote: Quote) -> None:
+        """Save a quote (see ``DataStore.save_quote``)."""
+        await self._run(self.data_store.save_quote, quote)
+
+    save_quote = store_quote
+
+    async def save_quotes_batch(self, quotes: Iterable[Quote]) -> int:
+        """Save many quotes in one transaction (see ``DataStore.save_quotes_batch``)."""
+        # Materialize here so a lazy iterable is not consumed on the pool
+        return await self._run(self.data_store.save_quotes_batch, list(quotes))
+
+    async def save_bars_batch(self, bars: Union[BarArray, QuoteFrame]) -> int:
+        """Save columnar bars in one transaction (see ``DataStore.save_bars_batch``)."""
+        return await self._run(self.data_store.save_bars_batch, bars)
+
+    async def save_order(self, order: Order) -> None:
+        """Save an order (see ``DataStore.save_order``)."""
+        await self._run(self.data_store.save_order, order)
+
+    async def save_portfolio_snapshot(self, snapshot: PortfolioSnapshot) -> int:
+        """Save a portfolio snapshot (see ``DataStore.save_portfolio_snapshot``)."""
+        return await self._run(self.data_store.save_portfolio_snapshot, snapshot)
+
+    # Queries
+
+    async def get_quotes(self,
+                         symbol: str,
+                         start_time: Optional[datetime] = None,
+                         end_time: Optional[datetime] = None,
+                         limit: Optional[int] = None) -> List[Quote]:
+        """Get quotes for a symbol, most recent first (see ``DataStore.get_quotes``)."""
+        return await self._run(
+            self.data_store.get_quotes, symbol,
+            start_time=start_time, end_time=end_time, limit=limit
+        )
+
+    async def get_bars(self,
+                       symbol: str,
+                       start_time: Optional[datetime] = None,
+                       end_time: Optional[datetime] = None) -> BarArray:
+        """Get stored quotes as a BarArray (see ``DataStore.get_bars``)."""
+        return await self._run(
+            self.data_store.get_bars, symbol,
+            start_time=start_time, end_time=end_time
+        )
+
+    async def get_orders(self,
+                         symbol: Optional[str] = None,
+                         status: Optional[str] = None,
+                         side: Optional[str] = None,
+                         start_date: Optional[Union[date, datetime]] = None,
+                         end_date: Optional[Union[date, datetime]] = None,
+                         limit: Optional[int] = None) -> List[Order]:
+        """Get orders, most recently created first (see ``DataStore.get_orders``)."""
+        return await self._run(
+            self.data_store.get_orders, symbol=symbol, status=status, side=side,
+            start_date=start_date, end_date=end_date, limit=limit
+        )
+
+    async def get_portfolio_snapshots(self,
+                                      start_date: Optional[Union[date, datetime]] = None,
+                                      end_date: Optional[Union[date, datetime]] = None) -> List[PortfolioSnapshot]:
+        """Get portfolio snapshots in a period (see ``DataStore.get_portfolio_snapshots``)."""
+        return await self._run(
+            self.data_store.get_portfolio_snapshots,
+            start_date=start_date, end_date=end_date
+        )
+
+    async def get_latest_portfolio_snapshot(self) -> Optional[PortfolioSnapshot]:
+        """Get the most recent portfolio snapshot."""
+        return await self._run(self.data_store.get_latest_portfolio_snapshot)
+
+    async def iter_quotes(self,
+                          symbol: str,
+                          start_time: Optional[datetime] = None,
+                          end_time: Optional[datetime] = None,
+                          batch_size: int = 1000) -> AsyncIterator[Quote]:
+        """
+        Stream quotes for a symbol, most recent first.
+
+        Quotes are fetched batch_size at a time, each batch as its own query
+        that resumes below the oldest timestamp already returned, so no
+        cursor or connection is held between batches.
+
+        Args:
+            symbol: Symbol to stream quotes for
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            batch_size: Number of quotes fetched per query
+
+        Yields:
+            Quotes ordered by timestamp descending
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        while True:
+            batch = await self.get_quotes(
+                symbol, start_time=start_time, end_time=end_time, limit=batch_size
+            )
+            for quote in batch:
+                yield quote
+
+            if len(batch) < batch_size:
+                return
+            # Timestamps are unique per symbol and stored to the microsecond
+            end_time = batch[-1].timestamp - _ONE_MICROSECOND
+
+    # Lifecycle
+
+    async def close(self) -> None:
+        """Wait for running queries and stop the thread pool."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True)
+        )
+
+    async def __aenter__(self) -> 'AsyncDataStore':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
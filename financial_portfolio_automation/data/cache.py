@@ -0,0 +1,208 @@
+"""
+In-process time-to-live cache for market and portfolio data.
+
+Entries expire a fixed time after they are set. Expired entries are ignored
+on read and removed by a periodic cleanup on a daemon timer thread, so a
+cache never keeps the process alive.
+"""
+
+import fnmatch
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..utils.logging import get_logger
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its expiry time and access statistics."""
+
+    value: Any
+    expires_at: float
+    access_count: int = 0
+    last_accessed: float = 0.0
+
+    def is_expired(self) -> bool:
+        """Check whether the entry has passed its expiry time."""
+        return time.time() >= self.expires_at
+
+    def touch(self) -> None:
+        """Record an access to the entry."""
+        self.access_count += 1
+        self.last_accessed = time.time()
+
+
+class DataCache:
+    """
+    Thread-safe key-value cache with per-entry time to live.
+
+    Keys are strings such as ``quote:AAPL``; ``invalidate_pattern`` removes
+    keys matching a shell-style pattern.
+    """
+
+    def __init__(self, default_ttl: float = 300, cleanup_interval: float = 60):
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl: Seconds an entry lives unless set with its own ttl
+            cleanup_interval: Seconds between removals of expired entries
+        """
+        if default_ttl <= 0 or cleanup_interval <= 0:
+            raise ValueError("default_ttl and cleanup_interval must be positive")
+
+        self.default_ttl = default_ttl
+        self.cleanup_interval = cleanup_interval
+        self.logger = get_logger(__name__)
+
+        self._cache: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+        self._cleanup_timer: Optional[threading.Timer] = None
+        self._closed = False
+        self._schedule_cleanup()
+
+    def get(self, key: str) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The value, or None if the key is missing or expired
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.is_expired():
+                self._miss_count += 1
+                return None
+            entry.touch()
+            self._hit_count += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Cache a value, replacing any existing entry for the key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds the entry lives (defaults to default_ttl)
+        """
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            return self._cache.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._cache.clear()
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Remove all keys matching a shell-style pattern.
+
+        Args:
+            pattern: Pattern such as ``quote:*``
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock:
+            keys = [key for key in self._cache if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def warm_cache(self, data_loader: Callable[[str], Any], keys: Iterable[str],
+                   ttl: Optional[float] = None) -> None:
+        """
+        Load keys into the cache ahead of use.
+
+        Keys whose loader returns None or raises are left uncached.
+
+        Args:
+            data_loader: Function returning the value for a key
+            keys: Keys to load
+            ttl: Seconds the loaded entries live (defaults to default_ttl)
+        """
+        for key in keys:
+            try:
+                value = data_loader(key)
+            except Exception as e:
+                self.logger.warning(f"Failed to warm cache for {key}: {e}")
+                continue
+            if value is not None:
+                self.set(key, value, ttl=ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Entry counts (total, active, expired) and hit/miss counts and rate
+        """
+        with self._lock:
+            total = len(self._cache)
+            expired = sum(1 for entry in self._cache.values() if entry.is_expired())
+            hits, misses = self._hit_count, self._miss_count
+
+        requests = hits + misses
+        return {
+            'total_entries': total,
+            'active_entries': total - expired,
+            'expired_entries': expired,
+            'hit_count': hits,
+            'miss_count': misses,
+            'hit_rate': hits / requests if requests else 0.0
+        }
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            expired = [key for key, entry in self._cache.items() if entry.is_expired()]
+            for key in expired:
+                del self._cache[key]
+        return len(expired)
+
+    def _schedule_cleanup(self) -> None:
+        if self._closed:
+            return
+        self._cleanup_timer = threading.Timer(self.cleanup_interval, self._run_cleanup)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+    def _run_cleanup(self) -> None:
+        removed = self.cleanup_expired()
+        if removed:
+            self.logger.debug("Removed expired cache entries", count=removed)
+        self._schedule_cleanup()
+
+    def close(self) -> None:
+        """Stop the periodic cleanup."""
+        self._closed = True
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.cancel()
@@ -0,0 +1,1237 @@
+"""
+SQLite storage for quotes, orders, positions and portfolio snapshots.
+
+Timestamps are stored as integer microseconds since the epoch in UTC, market
+prices as REAL and account amounts as exact Decimal text. Quotes hold both
+real-time bid/ask data and OHLCV bars, keyed by symbol and timestamp.
+
+Quotes and trades are partitioned by UTC day or month into tables such as
+``quotes_202401``, listed in the ``partitions`` catalog. Range queries only
+read the partitions that overlap the range, and a ``RetentionPolicy``
+downsamples old quote partitions to bars and drops expired partitions.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..exceptions import DatabaseError
+from ..models.core import (
+    Quote, Position, Order, PortfolioSnapshot,
+    OrderSide, OrderType, OrderStatus
+)
+from ..models.quote_frame import BarArray, QuoteFrame, ns_to_datetime
+from ..utils.logging import get_logger
+
+
+SCHEMA_VERSION = 2
+
+PARTITION_PERIODS = ('day', 'month')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at INTEGER NOT NULL
+);
+
+-- Unpartitioned quotes and trades from schema version 1; rows found here
+-- are moved into partitions when the store is opened
+CREATE TABLE IF NOT EXISTS quotes (
+    symbol TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    bid REAL,
+    ask REAL,
+    bid_size INTEGER,
+    ask_size INTEGER,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    PRIMARY KEY (symbol, timestamp)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    price TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_timestamp ON trades (symbol, timestamp);
+
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    order_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    filled_quantity INTEGER NOT NULL,
+    average_fill_price TEXT,
+    limit_price TEXT,
+    stop_price TEXT,
+    time_in_force TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    filled_at INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_orders_symbol_status ON orders (symbol, status);
+CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at);
+
+CREATE TABLE IF NOT EXISTS portfolio_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp INTEGER NOT NULL,
+    total_value TEXT NOT NULL,
+    buying_power TEXT NOT NULL,
+    day_pnl TEXT NOT NULL,
+    total_pnl TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp ON portfolio_snapshots (timestamp);
+
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_id INTEGER REFERENCES portfolio_snapshots (id),
+    symbol TEXT NOT NULL,
+    quantity TEXT NOT NULL,
+    market_value TEXT NOT NULL,
+    cost_basis TEXT NOT NULL,
+    unrealized_pnl TEXT NOT NULL,
+    day_pnl TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_positions_snapshot ON positions (snapshot_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_positions_current
+    ON positions (symbol) WHERE snapshot_id IS NULL;
+
+CREATE TABLE IF NOT EXISTS partitions (
+    name TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    period_start INTEGER NOT NULL,
+    period_end INTEGER NOT NULL,
+    compacted INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_partitions_kind_period ON partitions (kind, period_start);
+"""
+
+# Statements creating one partition table of each kind
+_PARTITION_SCHEMAS = {
+    'quotes': (
+        """CREATE TABLE IF NOT EXISTS {name} (
+            symbol TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            bid REAL,
+            ask REAL,
+            bid_size INTEGER,
+            ask_size INTEGER,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume INTEGER,
+            PRIMARY KEY (symbol, timestamp)
+        ) WITHOUT ROWID""",
+    ),
+    'trades': (
+        """CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            price TEXT NOT NULL,
+            size INTEGER NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_{name}_symbol_timestamp ON {name} (symbol, timestamp)",
+    ),
+}
+
+# Downsamples a quote partition to OHLCV bars of a given length; quotes
+# without a close are priced at their mid
+_COMPACT_QUOTES = """
+INSERT INTO {target} (symbol, timestamp, open, high, low, close, volume)
+SELECT symbol, bucket, MAX(first_price), MAX(high_price), MIN(low_price),
+       MAX(last_price), SUM(volume)
+FROM (
+    SELECT symbol, bucket, high_price, low_price, volume,
+           FIRST_VALUE(open_price) OVER bar AS first_price,
+           LAST_VALUE(price) OVER bar AS last_price
+    FROM (
+        SELECT symbol, timestamp, timestamp - timestamp % ? AS bucket, volume,
+               COALESCE(close, (bid + ask) / 2) AS price,
+               COALESCE(open, close, (bid + ask) / 2) AS open_price,
+               COALESCE(high, close, (bid + ask) / 2) AS high_price,
+               COALESCE(low, close, (bid + ask) / 2) AS low_price
+        FROM {source}
+        WHERE COALESCE(close, (bid + ask) / 2) IS NOT NULL
+    )
+    WINDOW bar AS (
+        PARTITION BY symbol, bucket ORDER BY timestamp
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    )
+)
+GROUP BY symbol, bucket
+"""
+
+# Per-connection settings; WAL mode itself is persistent and set at creation
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+)
+
+_QUOTE_COLUMNS = (
+    "symbol, timestamp, bid, ask, bid_size, ask_size, "
+    "open, high, low, close, volume"
+)
+
+_TRADE_COLUMNS = "symbol, timestamp, price, size"
+
+_INSERT_QUOTE = "INSERT OR REPLACE INTO {table} (" + _QUOTE_COLUMNS + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_TRADE = "INSERT INTO {table} (" + _TRADE_COLUMNS + ") VALUES (?, ?, ?, ?)"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_ONE_DAY = timedelta(days=1)
+
+
+def _to_epoch_us(timestamp: datetime) -> int:
+    # Naive timestamps are taken to be UTC
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_epoch_us(value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _period_bounds(timestamp: int, partition_by: str) -> Tuple[int, int, str]:
+    """Get the start, end and table suffix of the partition holding a timestamp."""
+    moment = _EPOCH + timedelta(microseconds=timestamp)
+    if partition_by == 'day':
+        start = datetime(moment.year, moment.month, moment.day, tzinfo=timezone.utc)
+        end = start + _ONE_DAY
+        suffix = start.strftime('%Y%m%d')
+    else:
+        start = datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+        if moment.month == 12:
+            end = datetime(moment.year + 1, 1, 1, tzinfo=timezone.utc)
+        else:
+            end = datetime(moment.year, moment.month + 1, 1, tzinfo=timezone.utc)
+        suffix = start.strftime('%Y%m')
+    return _to_epoch_us(start), _to_epoch_us(end), suffix
+
+
+def _range_start(value: Union[date, datetime]) -> int:
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min, timezone.utc)
+    return _to_epoch_us(value)
+
+
+def _range_end(value: Union[date, datetime]) -> int:
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.max, timezone.utc)
+    return _to_epoch_us(value)
+
+
+def _to_text(value: Optional[Decimal]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _to_decimal(value: Optional[str]) -> Optional[Decimal]:
+    return None if value is None else Decimal(value)
+
+
+def _to_float(value: Optional[Decimal]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _to_price(value: Optional[float]) -> Optional[Decimal]:
+    # The shortest repr round-trips prices with up to 15 significant digits
+    return None if value is None else Decimal(repr(value))
+
+
+def _quote_row(quote: Quote) -> Tuple:
+    return (
+        quote.symbol, _to_epoch_us(quote.timestamp),
+        _to_float(quote.bid), _to_float(quote.ask),
+        quote.bid_size, quote.ask_size,
+        _to_float(quote.open), _to_float(quote.high),
+        _to_float(quote.low), _to_float(quote.close),
+        quote.volume
+    )
+
+
+def _size_column(values: np.ndarray) -> List[Optional[int]]:
+    # Missing sizes are -1 in a BarArray and NULL in the table
+    if (values < 0).any():
+        return [None if value < 0 else value for value in values.tolist()]
+    return values.tolist()
+
+
+def _bar_rows(bars: BarArray) -> Iterator[Tuple]:
+    tzinfo = bars.tzinfo
+    if tzinfo is None or isinstance(tzinfo, timezone):
+        offset = tzinfo.utcoffset(None) if tzinfo is not None else timedelta(0)
+        timestamps = (bars.timestamps // 1000 - offset // _ONE_MICROSECOND).tolist()
+    else:
+        # Zones with daylight saving need the offset of each bar
+        timestamps = [
+            _to_epoch_us(ns_to_datetime(value, tzinfo))
+            for value in bars.timestamps.tolist()
+        ]
+
+    # NaN prices are stored as NULL by SQLite
+    return zip(
+        repeat(bars.symbol), timestamps,
+        bars.bid.tolist(), bars.ask.tolist(),
+        _size_column(bars.bid_size), _size_column(bars.ask_size),
+        bars.open.tolist(), bars.high.tolist(),
+        bars.low.tolist(), bars.close.tolist(),
+        _size_column(bars.volume)
+    )
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    How long partitioned market data is kept.
+
+    Ages are measured from the end of a partition's period, so a partition is
+    only compacted or dropped once all of its rows are older than the limit.
+    """
+
+    # Quote partitions older than this are downsampled to bars
+    raw_quote_days: int = 30
+    # Quote partitions older than this are dropped (None keeps them)
+    bar_days: Optional[int] = 365
+    # Length of the bars that old quotes are downsampled to
+    bar_interval: timedelta = timedelta(minutes=1)
+    # Trade partitions older than this are dropped
+    trade_days: int = 30
+
+    def __post_init__(self):
+        """Validate the policy."""
+        if self.raw_quote_days < 0 or self.trade_days < 0:
+            raise ValueError("Retention days must be non-negative")
+        if self.bar_days is not None and self.bar_days < self.raw_quote_days:
+            raise ValueError("bar_days cannot be shorter than raw_quote_days")
+        if self.bar_interval <= timedelta(0) or _ONE_DAY % self.bar_interval:
+            raise ValueError("bar_interval must be positive and divide a day evenly")
+
+
+class DataStore:
+    """
+    SQLite-backed store for market and portfolio data.
+
+    One store can be shared across threads. Each thread reads through its own
+    read-only connection, while all writes go through a single connection
+    serialized by a lock. With WAL journaling, readers see the last committed
+    state and are never blocked by a write in progress.
+    """
+
+    def __init__(self, db_path: str = "portfolio_automation.db", partition_by: str = 'month'):
+        """
+        Initialize the store, creating the database and schema if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+            partition_by: Period of quote and trade partitions ('day' or 'month')
+
+        Raises:
+            ValueError: If the partition period is unknown
+            DatabaseError: If the database cannot be opened or initialized
+        """
+        if partition_by not in PARTITION_PERIODS:
+            raise ValueError(f"partition_by must be one of {PARTITION_PERIODS}")
+
+        self.db_path = db_path
+        self.partition_by = partition_by
+        self.logger = get_logger(__name__)
+        # Every connection to ":memory:" is a separate database, so an
+        # in-memory store does all its reads on the write connection
+        self._in_memory = db_path == ":memory:"
+
+        # Connection pool
+        self._write_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers = threading.local()
+        # Every open read connection with the thread it belongs to
+        self._read_connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._pool_lock = threading.Lock()
+
+        # Partition tables known to exist, maintained by the writer
+        self._known_partitions = set()
+
+        self._initialize_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Pooled connections are closed from whichever thread calls close()
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get the calling thread's read connection, opening it if needed."""
+        conn = getattr(self._readers, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            self._readers.conn = conn
+            with self._pool_lock:
+                # Threads that have exited will not use their connections again
+                live = []
+                for thread, reader in self._read_connections:
+                    if thread.is_alive():
+                        live.append((thread, reader))
+                    else:
+                        reader.close()
+                live.append((threading.current_thread(), conn))
+                self._read_connections = live
+        return conn
+
+    def _open_writer(self) -> sqlite3.Connection:
+        """Open the write connection, creating the schema if needed."""
+        conn = self._connect()
+        try:
+            # Lets dropped partitions be reclaimed without a full VACUUM; only
+            # takes effect on a new database
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("BEGIN")
+            conn.execute(
+                "INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (SCHEMA_VERSION, _to_epoch_us(datetime.now(timezone.utc)))
+            )
+            self._known_partitions.clear()
+            self._migrate_unpartitioned(conn)
+            conn.commit()
+        except sqlite3.Error:
+            self._known_partitions.clear()
+            conn.close()
+            raise
+        return conn
+
+    def _migrate_unpartitioned(self, conn: sqlite3.Connection) -> None:
+        """Move quotes and trades from the version 1 tables into partitions."""
+        for kind, columns in (('quotes', _QUOTE_COLUMNS), ('trades', _TRADE_COLUMNS)):
+            timestamp = conn.execute(f"SELECT MIN(timestamp) FROM {kind}").fetchone()[0]
+            while timestamp is not None:
+                start, end, suffix = _period_bounds(timestamp, self.partition_by)
+                name = self._ensure_partition(conn, kind, start, end, suffix)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {name} ({columns}) SELECT {columns} FROM {kind} "
+                    "WHERE timestamp >= ? AND timestamp < ?",
+                    (start, end)
+                )
+                timestamp = conn.execute(
+                    f"SELECT MIN(timestamp) FROM {kind} WHERE timestamp >= ?", (end,)
+                ).fetchone()[0]
+            conn.execute(f"DELETE FROM {kind}")
+
+    def _initialize_database(self) -> None:
+        """Open the write connection, creating the schema and enabling WAL journaling."""
+        try:
+            with self._write_lock:
+                self._writer = self._open_writer()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to initialize database {self.db_path}: {e}") from e
+
+        self.logger.debug("Database initialized", db_path=self.db_path)
+
+    @contextmanager
+    def get_connection(self, readonly: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a pooled connection.
+
+        A read-only connection belongs to the calling thread and can be used
+        concurrently with other threads' reads and with a write. The write
+        connection is held exclusively for the block, which runs as one
+        transaction: committed when the block exits normally and rolled back
+        on error. Blocks on the write connection are not re-entrant. A read
+        block sees one consistent snapshot of the database.
+
+        Args:
+            readonly: Borrow the calling thread's read connection instead of
+                the write connection
+
+        Yields:
+            SQLite connection
+
+        Raises:
+            DatabaseError: If a database operation fails
+        """
+        if readonly and not self._in_memory:
+            try:
+                conn = self._get_reader()
+                # Partitions can be dropped between the statements of a read
+                owns_transaction = not conn.in_transaction
+                if owns_transaction:
+                    conn.execute("BEGIN")
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to connect to database: {e}") from e
+
+            try:
+                yield conn
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Database query failed: {e}") from e
+            finally:
+                if owns_transaction:
+                    conn.rollback()
+            return
+
+        with self._write_lock:
+            conn = self._acquire_writer()
+            try:
+                # Explicit so that partition DDL is part of the transaction
+                conn.execute("BEGIN")
+                yield conn
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                self._known_partitions.clear()
+                raise DatabaseError(f"Database operation failed: {e}") from e
+            except Exception:
+                conn.rollback()
+                self._known_partitions.clear()
+                raise
+
+    def _acquire_writer(self) -> sqlite3.Connection:
+        """Get the write connection, opening it if needed; the write lock must be held."""
+        try:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            return self._writer
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to connect to database: {e}") from e
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+
+        The store stays usable; connections are reopened on next use, except
+        that an in-memory store starts over empty. Call only when no other
+        thread is using the store.
+        """
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._pool_lock:
+            for _, conn in self._read_connections:
+                conn.close()
+            self._read_connections = []
+            self._readers = threading.local()
+
+    def __enter__(self) -> 'DataStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # Partitions
+
+    def _ensure_partition(self,
+                          conn: sqlite3.Connection,
+                          kind: str,
+                          start: int,
+                          end: int,
+                          suffix: str) -> str:
+        """Create a partition table and its catalog entry if they do not exist."""
+        name = f"{kind}_{suffix}"
+        if name not in self._known_partitions:
+            for statement in _PARTITION_SCHEMAS[kind]:
+                conn.execute(statement.format(name=name))
+            conn.execute(
+                "INSERT OR IGNORE INTO partitions (name, kind, period_start, period_end) "
+                "VALUES (?, ?, ?, ?)",
+                (name, kind, start, end)
+            )
+            self._known_partitions.add(name)
+        return name
+
+    def _write_partitioned(self,
+                           conn: sqlite3.Connection,
+                           kind: str,
+                           rows: Iterable[Tuple],
+                           insert: str) -> int:
+        """Insert rows with the timestamp second into their partitions."""
+        buckets: Dict[Tuple[int, int, str], List[Tuple]] = {}
+        start = end = 0
+        bucket: List[Tuple] = []
+        for row in rows:
+            # Rows usually arrive in time order, so the bounds rarely change
+            if not start <= row[1] < end:
+                start, end, suffix = _period_bounds(row[1], self.partition_by)
+                bucket = buckets.setdefault((start, end, suffix), [])
+            bucket.append(row)
+
+        count = 0
+        for (start, end, suffix), bucket in buckets.items():
+            name = self._ensure_partition(conn, kind, start, end, suffix)
+            count += conn.executemany(insert.format(table=name), bucket).rowcount
+        return count
+
+    def _partition_names(self,
+                         conn: sqlite3.Connection,
+                         kind: str,
+                         start: Optional[int] = None,
+                         end: Optional[int] = None,
+                         newest_first: bool = False) -> List[str]:
+        """Get the partitions of a kind overlapping [start, end], by period."""
+        query = "SELECT name FROM partitions WHERE kind = ?"
+        params: List[Any] = [kind]
+        if start is not None:
+            query += " AND period_end > ?"
+            params.append(start)
+        if end is not None:
+            query += " AND period_start <= ?"
+            params.append(end)
+        query += " ORDER BY period_start DESC" if newest_first else " ORDER BY period_start"
+        return [row[0] for row in conn.execute(query, params)]
+
+    def get_partitions(self, kind: str = 'quotes') -> List[Dict[str, Any]]:
+        """
+        Get the catalog of partitions.
+
+        Args:
+            kind: 'quotes' or 'trades'
+
+        Returns:
+            Partitions oldest first, each with name, start, end (UTC) and
+            whether it has been compacted to bars
+        """
+        with self.get_connection(readonly=True) as conn:
+            rows = conn.execute(
+                "SELECT name, period_start, period_end, compacted FROM partitions "
+                "WHERE kind = ? ORDER BY period_start",
+                (kind,)
+            ).fetchall()
+
+        return [
+            {
+                'name': row[0],
+                'start': _from_epoch_us(row[1]),
+                'end': _from_epoch_us(row[2]),
+                'compacted': bool(row[3])
+            }
+            for row in rows
+        ]
+
+    def apply_retention(self,
+                        policy: Optional[RetentionPolicy] = None,
+                        now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Compact and drop old partitions.
+
+        Quote partitions past raw_quote_days are replaced by bars of
+        bar_interval, and quote and trade partitions past their limits are
+        dropped. Freed pages are then returned to the file system.
+
+        Args:
+            policy: Retention policy (defaults apply if None)
+            now: Time the ages are measured from (defaults to now)
+
+        Returns:
+            Number of partitions compacted and dropped
+        """
+        policy = policy or RetentionPolicy()
+        now_us = _to_epoch_us(now or datetime.now(timezone.utc))
+        day_us = _ONE_DAY // _ONE_MICROSECOND
+        raw_cutoff = now_us - policy.raw_quote_days * day_us
+        bar_cutoff = None if policy.bar_days is None else now_us - policy.bar_days * day_us
+        trade_cutoff = now_us - policy.trade_days * day_us
+
+        with self.get_connection() as conn:
+            expired = [
+                row[0] for row in conn.execute(
+                    "SELECT name FROM partitions WHERE kind = 'trades' AND period_end <= ?",
+                    (trade_cutoff,)
+                )
+            ]
+            if bar_cutoff is not None:
+                expired += [
+                    row[0] for row in conn.execute(
+                        "SELECT name FROM partitions WHERE kind = 'quotes' AND period_end <= ?",
+                        (bar_cutoff,)
+                    )
+                ]
+            for name in expired:
+                conn.execute(f"DROP TABLE {name}")
+                conn.execute("DELETE FROM partitions WHERE name = ?", (name,))
+                self._known_partitions.discard(name)
+
+            to_compact = [
+                row[0] for row in conn.execute(
+                    "SELECT name FROM partitions WHERE kind = 'quotes' AND compacted = 0 "
+                    "AND period_end <= ?",
+                    (raw_cutoff,)
+                )
+            ]
+            interval_us = policy.bar_interval // _ONE_MICROSECOND
+            for name in to_compact:
+                self._compact_partition(conn, name, interval_us)
+
+        self._run_maintenance("PRAGMA incremental_vacuum;")
+
+        result = {'compacted': len(to_compact), 'dropped': len(expired)}
+        self.logger.info("Applied retention policy", **result)
+        return result
+
+    def _compact_partition(self, conn: sqlite3.Connection, name: str, interval_us: int) -> None:
+        """Replace the rows of a quote partition with bars of the given length."""
+        target = f"{name}_compacted"
+        conn.execute(_PARTITION_SCHEMAS['quotes'][0].format(name=target))
+        conn.execute(_COMPACT_QUOTES.format(source=name, target=target), (interval_us,))
+        conn.execute(f"DROP TABLE {name}")
+        conn.execute(f"ALTER TABLE {target} RENAME TO {name}")
+        conn.execute("UPDATE partitions SET compacted = 1 WHERE name = ?", (name,))
+
+    # Quotes
+
+    def save_quote(self, quote: Quote) -> None:
+        """
+        Save a quote, replacing any quote with the same symbol and timestamp.
+
+        Args:
+            quote: Quote to save
+        """
+        with self.get_connection() as conn:
+            self._write_partitioned(conn, 'quotes', (_quote_row(quote),), _INSERT_QUOTE)
+
+    def save_quotes_batch(self, quotes: Iterable[Quote]) -> int:
+        """
+        Save many quotes in one transaction.
+
+        Quotes with the same symbol and timestamp as a stored quote replace
+        it, as in ``save_quote``.
+
+        Args:
+            quotes: Quotes to save
+
+        Returns:
+            Number of quotes saved
+        """
+        with self.get_connection() as conn:
+            count = self._write_partitioned(conn, 'quotes', map(_quote_row, quotes), _INSERT_QUOTE)
+
+        self.logger.debug("Saved quote batch", count=count)
+        return count
+
+    def save_bars_batch(self, bars: Union[BarArray, QuoteFrame]) -> int:
+        """
+        Save columnar bars in one transaction.
+
+        Rows are built straight from the arrays without creating ``Quote``
+        objects.
+
+        Args:
+            bars: Bars of one symbol, or of several symbols as a QuoteFrame
+
+        Returns:
+            Number of bars saved
+        """
+        bar_arrays = list(bars.values()) if isinstance(bars, QuoteFrame) else [bars]
+
+        count = 0
+        with self.get_connection() as conn:
+            for bar_array in bar_arrays:
+                count += self._write_partitioned(conn, 'quotes', _bar_rows(bar_array), _INSERT_QUOTE)
+
+        self.logger.debug("Saved bar batch", count=count)
+        return count
+
+    def get_quotes(self,
+                   symbol: str,
+                   start_time: Optional[datetime] = None,
+                   end_time: Optional[datetime] = None,
+                   limit: Optional[int] = None) -> List[Quote]:
+        """
+        Get quotes for a symbol, most recent first.
+
+        Args:
+            symbol: Symbol to get quotes for
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+            limit: Maximum number of quotes
+
+        Returns:
+            List of quotes ordered by timestamp descending
+        """
+        where, params, start, end = self._time_range_filter(symbol, start_time, end_time)
+
+        rows: List[Tuple] = []
+        with self.get_connection(readonly=True) as conn:
+            # Newest partitions first, stopping once the limit is reached
+            for name in self._partition_names(conn, 'quotes', start, end, newest_first=True):
+                query = f"SELECT {_QUOTE_COLUMNS} FROM {name} WHERE {where} ORDER BY timestamp DESC"
+                if limit is None:
+                    rows.extend(conn.execute(query, params))
+                    continue
+                rows.extend(conn.execute(query + " LIMIT ?", params + [limit - len(rows)]))
+                if len(rows) >= limit:
+                    break
+
+        return [
+            Quote.from_trusted(
+                symbol=row[0], timestamp=_from_epoch_us(row[1]),
+                bid=_to_price(row[2]), ask=_to_price(row[3]),
+                bid_size=row[4], ask_size=row[5],
+                open=_to_price(row[6]), high=_to_price(row[7]),
+                low=_to_price(row[8]), close=_to_price(row[9]),
+                volume=row[10]
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _time_range_filter(symbol: str,
+                           start_time: Optional[datetime],
+                           end_time: Optional[datetime]) -> Tuple[str, List[Any], Optional[int], Optional[int]]:
+        """Build the WHERE clause and parameters for a symbol and time range."""
+        where = "symbol = ?"
+        params: List[Any] = [symbol]
+        start = end = None
+        if start_time is not None:
+            start = _range_start(start_time)
+            where += " AND timestamp >= ?"
+            params.append(start)
+        if end_time is not None:
+            end = _range_end(end_time)
+            where += " AND timestamp <= ?"
+            params.append(end)
+        return where, params, start, end
+
+    def get_bars(self,
+                 symbol: str,
+                 start_time: Optional[datetime] = None,
+                 end_time: Optional[datetime] = None) -> BarArray:
+        """
+        Get stored quotes of a symbol as a columnar BarArray, oldest first.
+
+        Args:
+            symbol: Symbol to get bars for
+            start_time: Earliest timestamp (inclusive)
+            end_time: Latest timestamp (inclusive)
+
+        Returns:
+            BarArray with UTC timestamps
+        """
+        where, params, start, end = self._time_range_filter(symbol, start_time, end_time)
+
+        rows: List[Tuple] = []
+        with self.get_connection(readonly=True) as conn:
+            for name in self._partition_names(conn, 'quotes', start, end):
+                rows.extend(conn.execute(
+                    "SELECT timestamp, bid, ask, coalesce(bid_size, -1), coalesce(ask_size, -1), "
+                    f"open, high, low, close, coalesce(volume, -1) FROM {name} "
+                    f"WHERE {where} ORDER BY timestamp",
+                    params
+                ))
+
+        if not rows:
+            return BarArray(symbol, [], timezone.utc)
+
+        columns = list(zip(*rows))
+        # NULL prices become NaN in the float columns
+        return BarArray(
+            symbol,
+            np.array(columns[0], dtype=np.int64) * 1000,
+            timezone.utc,
+            bid=np.array(columns[1], dtype=np.float64),
+            ask=np.array(columns[2], dtype=np.float64),
+            bid_size=columns[3],
+            ask_size=columns[4],
+            open=np.array(columns[5], dtype=np.float64),
+            high=np.array(columns[6], dtype=np.float64),
+            low=np.array(columns[7], dtype=np.float64),
+            close=np.array(columns[8], dtype=np.float64),
+            volume=columns[9]
+        )
+
+    # Trades
+
+    def save_trade(self, trade: Dict[str, Any]) -> None:
+        """
+        Save a market trade print.
+
+        Args:
+            trade: Trade with symbol, timestamp, price and size, as produced
+                by the WebSocket handler
+        """
+        row = (trade["symbol"], _to_epoch_us(trade["timestamp"]), str(trade["price"]), trade["size"])
+        with self.get_connection() as conn:
+            self._write_partitioned(conn, 'trades', (row,), _INSERT_TRADE)
+
+    # Positions
+
+    def save_position(self, position: Position, snapshot_id: Optional[int] = None) -> None:
+        """
+        Save a position.
+
+        Without a snapshot the position replaces the current position of the
+        same symbol; with one it is stored as part of that snapshot.
+
+        Args:
+            position: Position to save
+            snapshot_id: ID of the portfolio snapshot the position belongs to
+        """
+        with self.get_connection() as conn:
+            if snapshot_id is None:
+                conn.execute(
+                    "DELETE FROM positions WHERE snapshot_id IS NULL AND symbol = ?",
+                    (position.symbol,)
+                )
+            conn.execute(
+                "INSERT INTO positions (snapshot_id, symbol, quantity, market_value, "
+                "cost_basis, unrealized_pnl, day_pnl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (snapshot_id,) + self._position_values(position)
+            )
+
+    @staticmethod
+    def _position_values(position: Position) -> Tuple:
+        return (
+            position.symbol, str(position.quantity), str(position.market_value),
+            str(position.cost_basis), str(position.unrealized_pnl), str(position.day_pnl)
+        )
+
+    @staticmethod
+    def _position_from_row(row: Tuple) -> Position:
+        return Position.from_trusted(
+            symbol=row[0], quantity=Decimal(row[1]), market_value=Decimal(row[2]),
+            cost_basis=Decimal(row[3]), unrealized_pnl=Decimal(row[4]),
+            day_pnl=Decimal(row[5])
+        )
+
+    def get_positions(self, snapshot_id: Optional[int] = None) -> List[Position]:
+        """
+        Get the current positions, or the positions of a snapshot.
+
+        Args:
+            snapshot_id: ID of a portfolio snapshot (current positions if None)
+
+        Returns:
+            List of positions ordered by symbol
+        """
+        query = (
+            "SELECT symbol, quantity, market_value, cost_basis, unrealized_pnl, day_pnl "
+            "FROM positions WHERE "
+        )
+        if snapshot_id is None:
+            query += "snapshot_id IS NULL ORDER BY symbol"
+            params: Tuple = ()
+        else:
+            query += "snapshot_id = ? ORDER BY symbol"
+            params = (snapshot_id,)
+
+        with self.get_connection(readonly=True) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._position_from_row(row) for row in rows]
+
+    def get_current_positions(self) -> List[Position]:
+        """Get the current positions."""
+        return self.get_positions()
+
+    def get_positions_at_date(self, as_of: Union[date, datetime]) -> List[Position]:
+        """
+        Get the positions of the latest snapshot taken on or before a date.
+
+        Args:
+            as_of: Date (end of day) or time to look up
+
+        Returns:
+            List of positions (empty if no snapshot exists by then)
+        """
+        with self.get_connection(readonly=True) as conn:
+            row = conn.execute(
+                "SELECT id FROM portfolio_snapshots WHERE timestamp <= ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1",
+                (_range_end(as_of),)
+            ).fetchone()
+
+        return self.get_positions(row[0]) if row else []
+
+    # Orders
+
+    @staticmethod
+    def _order_values(order: Order) -> Tuple:
+        return (
+            order.symbol, order.quantity, order.side.value, order.order_type.value,
+            order.status.value, order.filled_quantity,
+            _to_text(order.average_fill_price), _to_text(order.limit_price),
+            _to_text(order.stop_price), order.time_in_force,
+            _to_epoch_us(order.created_at), _to_epoch_us(order.updated_at),
+            _to_epoch_us(order.filled_at) if order.filled_at else None,
+            order.order_id
+        )
+
+    def save_order(self, order: Order) -> None:
+        """
+        Save an order, replacing any stored order with the same ID.
+
+        Args:
+            order: Order to save
+        """
+        with self.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO orders (symbol, quantity, side, order_type, status, "
+                "filled_quantity, average_fill_price, limit_price, stop_price, "
+                "time_in_force, created_at, updated_at, filled_at, order_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._order_values(order)
+            )
+
+    def update_order(self, order: Order) -> None:
+        """
+        Update a stored order.
+
+        Args:
+            order: Order with new status and fill information
+
+        Raises:
+            DatabaseError: If the order is not stored
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE orders SET symbol = ?, quantity = ?, side = ?, order_type = ?, "
+                "status = ?, filled_quantity = ?, average_fill_price = ?, limit_price = ?, "
+                "stop_price = ?, time_in_force = ?, created_at = ?, updated_at = ?, "
+                "filled_at = ? WHERE order_id = ?",
+                self._order_values(order)
+            )
+            if cursor.rowcount == 0:
+                raise DatabaseError(f"Order not found: {order.order_id}")
+
+    def get_orders(self,
+                   symbol: Optional[str] = None,
+                   status: Optional[str] = None,
+                   side: Optional[str] = None,
+                   start_date: Optional[Union[date, datetime]] = None,
+                   end_date: Optional[Union[date, datetime]] = None,
+                   limit: Optional[int] = None) -> List[Order]:
+        """
+        Get orders, most recently created first.
+
+        Args:
+            symbol: Only orders for this symbol
+            status: Only orders with this status (case-insensitive)
+            side: Only orders on this side (case-insensitive)
+            start_date: Earliest creation date or time (inclusive)
+            end_date: Latest creation date or time (inclusive)
+            limit: Maximum number of orders
+
+        Returns:
+            List of orders
+        """
+        conditions = []
+        params: List[Any] = []
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            params.append(symbol)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status.lower())
+        if side is not None:
+            conditions.append("side = ?")
+            params.append(side.lower())
+        if start_date is not None:
+            conditions.append("created_at >= ?")
+            params.append(_range_start(start_date))
+        if end_date is not None:
+            conditions.append("created_at <= ?")
+            params.append(_range_end(end_date))
+
+        query = (
+            "SELECT order_id, symbol, quantity, side, order_type, status, filled_quantity, "
+            "average_fill_price, limit_price, stop_price, time_in_force, created_at, "
+            "updated_at, filled_at FROM orders"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.get_connection(readonly=True) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            Order.from_trusted(
+                order_id=row[0], symbol=row[1], quantity=row[2],
+                side=OrderSide(row[3]), order_type=OrderType(row[4]),
+                status=OrderStatus(row[5]), filled_quantity=row[6],
+                average_fill_price=_to_decimal(row[7]), limit_price=_to_decimal(row[8]),
+                stop_price=_to_decimal(row[9]), time_in_force=row[10],
+                created_at=_from_epoch_us(row[11]), updated_at=_from_epoch_us(row[12]),
+                filled_at=_from_epoch_us(row[13])
+            )
+            for row in rows
+        ]
+
+    # Portfolio snapshots
+
+    def save_portfolio_snapshot(self, snapshot: PortfolioSnapshot) -> int:
+        """
+        Save a portfolio snapshot with its positions.
+
+        Args:
+            snapshot: Snapshot to save
+
+        Returns:
+            ID of the saved snapshot
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO portfolio_snapshots (timestamp, total_value, buying_power, "
+                "day_pnl, total_pnl) VALUES (?, ?, ?, ?, ?)",
+                (_to_epoch_us(snapshot.timestamp), str(snapshot.total_value),
+                 str(snapshot.buying_power), str(snapshot.day_pnl), str(snapshot.total_pnl))
+            )
+            snapshot_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO positions (snapshot_id, symbol, quantity, market_value, "
+                "cost_basis, unrealized_pnl, day_pnl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(snapshot_id,) + self._position_values(position)
+                 for position in snapshot.positions]
+            )
+
+        return snapshot_id
+
+    def _snapshot_from_row(self, row: Tuple, positions: Optional[List[Position]] = None) -> PortfolioSnapshot:
+        return PortfolioSnapshot.from_trusted(
+            timestamp=_from_epoch_us(row[1]), total_value=Decimal(row[2]),
+            buying_power=Decimal(row[3]), day_pnl=Decimal(row[4]), total_pnl=Decimal(row[5]),
+            positions=self.get_positions(row[0]) if positions is None else positions
+        )
+
+    def get_portfolio_snapshot(self, snapshot_id: int) -> Optional[PortfolioSnapshot]:
+        """
+        Get a portfolio snapshot by ID.
+
+        Args:
+            snapshot_id: ID returned by ``save_portfolio_snapshot``
+
+        Returns:
+            Snapshot with its positions, or None if not found
+        """
+        with self.get_connection(readonly=True) as conn:
+            row = conn.execute(
+                "SELECT id, timestamp, total_value, buying_power, day_pnl, total_pnl "
+                "FROM portfolio_snapshots WHERE id = ?",
+                (snapshot_id,)
+            ).fetchone()
+
+        return self._snapshot_from_row(row) if row else None
+
+    def get_latest_portfolio_snapshot(self) -> Optional[PortfolioSnapshot]:
+        """Get the most recent portfolio snapshot, or None if none is stored."""
+        with self.get_connection(readonly=True) as conn:
+            row = conn.execute(
+                "SELECT id, timestamp, total_value, buying_power, day_pnl, total_pnl "
+                "FROM portfolio_snapshots ORDER BY timestamp DESC, id DESC LIMIT 1"
+            ).fetchone()
+
+        return self._snapshot_from_row(row) if row else None
+
+    def get_portfolio_snapshots(self,
+                                start_date: Optional[Union[date, datetime]] = None,
+                                end_date: Optional[Union[date, datetime]] = None) -> List[PortfolioSnapshot]:
+        """
+        Get portfolio snapshots in a period, oldest first.
+
+        Args:
+            start_date: Earliest date or time (inclusive)
+            end_date: Latest date or time (inclusive)
+
+        Returns:
+            List of snapshots with their positions
+        """
+        conditions = []
+        params: List[Any] = []
+        if start_date is not None:
+            conditions.append("timestamp >= ?")
+            params.append(_range_start(start_date))
+        if end_date is not None:
+            conditions.append("timestamp <= ?")
+            params.append(_range_end(end_date))
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+        with self.get_connection(readonly=True) as conn:
+            rows = conn.execute(
+                "SELECT id, timestamp, total_value, buying_power, day_pnl, total_pnl "
+                "FROM portfolio_snapshots" + where + " ORDER BY timestamp, id",
+                params
+            ).fetchall()
+            # Positions of all the snapshots are read in one query
+            position_rows = conn.execute(
+                "SELECT snapshot_id, symbol, quantity, market_value, cost_basis, unrealized_pnl, day_pnl "
+                "FROM positions WHERE snapshot_id IN (SELECT id FROM portfolio_snapshots" + where + ") "
+                "ORDER BY snapshot_id, symbol",
+                params
+            ).fetchall()
+
+        positions: Dict[int, List[Position]] = {}
+        for row in position_rows:
+            positions.setdefault(row[0], []).append(self._position_from_row(row[1:]))
+
+        return [self._snapshot_from_row(row, positions.get(row[0], [])) for row in rows]
+
+    # Maintenance
+
+    def get_database_stats(self) -> Dict[str, Any]:
+        """
+        Get row counts and the size of the database.
+
+        Returns:
+            Dictionary with a ``<table>_count`` entry per table,
+            ``quote_partitions``, ``trade_partitions`` and ``db_size_bytes``
+        """
+        stats: Dict[str, Any] = {}
+        with self.get_connection(readonly=True) as conn:
+            for kind, singular in (('quotes', 'quote'), ('trades', 'trade')):
+                names = self._partition_names(conn, kind)
+                stats[f"{kind}_count"] = sum(
+                    conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0] for name in names
+                )
+                stats[f"{singular}_partitions"] = len(names)
+            for table in ('positions', 'orders', 'portfolio_snapshots'):
+                stats[f"{table}_count"] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+
+        # Pages in use, which also covers in-memory databases
+        stats['db_size_bytes'] = page_count * page_size
+        return stats
+
+    def _run_maintenance(self, script: str) -> None:
+        """Run statements on the write connection outside of a transaction."""
+        # The write connection has no transaction open between blocks, and
+        # executescript steps statements such as incremental_vacuum to the end
+        with self._write_lock:
+            conn = self._acquire_writer()
+            try:
+                conn.executescript(script)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Database operation failed: {e}") from e
+
+    def vacuum_database(self) -> None:
+        """Rebuild the database file to reclaim free space."""
+        self._run_maintenance("VACUUM;")
+        self.logger.info("Database vacuumed", db_path=self.db_path)
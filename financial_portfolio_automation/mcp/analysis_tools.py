@@ -9,6 +9,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 
+from ..analysis.shared_indicator_cache import get_shared_indicator_cache
 from ..analysis.technical_analysis import TechnicalAnalysis
 from ..analysis.portfolio_analyzer import PortfolioAnalyzer
 from ..api.market_data_client import MarketDataClient
@@ -90,6 +91,7 @@ class AnalysisTools:
                 'analysis_results': {}
             }
             
+            price_history = {}
             for symbol in symbols:
                 try:
                     # Get historical price data
@@ -106,30 +108,37 @@ class AnalysisTools:
                         }
                         continue
                     
+                    # Reject malformed bars here so they fail only this symbol
+                    # rather than the batch calculation for every symbol
+                    self._validate_price_bars(price_data)
+                    price_history[symbol] = price_data
+                    
+                except Exception as e:
+                    self.logger.error(f"Error analyzing {symbol}: {str(e)}")
+                    results['analysis_results'][symbol] = {
+                        'error': f'Analysis failed: {str(e)}'
+                    }
+            
+            if price_history:
+                # Calculate indicators for all symbols in one batch per indicator,
+                # reusing series other tools and strategies computed for the same bars
+                indicator_series = self._shared_indicator_series(price_history, indicators)
+                
+                for symbol, price_data in price_history.items():
                     symbol_analysis = {
-                        'current_price': price_data[-1].get('close') if price_data else None,
-                        'indicators': {}
+                        'current_price': price_data[-1].get('close'),
+                        'indicators': {
+                            indicator: self._summarize_indicator(indicator, indicator_series[symbol])
+                            for indicator in indicators
+                        }
                     }
                     
-                    # Calculate requested indicators
-                    for indicator in indicators:
-                        indicator_result = await self._calculate_indicator(
-                            indicator, symbol, price_data
-                        )
-                        symbol_analysis['indicators'][indicator] = indicator_result
-                    
                     # Add signal analysis
                     symbol_analysis['signals'] = await self._analyze_signals(
                         symbol_analysis['indicators']
                     )
                     
                     results['analysis_results'][symbol] = symbol_analysis
-                    
-                except Exception as e:
-                    self.logger.error(f"Error analyzing {symbol}: {str(e)}")
-                    results['analysis_results'][symbol] = {
-                        'error': f'Analysis failed: {str(e)}'
-                    }
             
             self.logger.info("Technical analysis completed")
             return results
@@ -334,34 +343,96 @@ class AnalysisTools:
             self.logger.error(f"Error in sector analysis: {str(e)}")
             raise PortfolioAutomationError(f"Sector analysis failed: {str(e)}")
     
-    async def _calculate_indicator(self, indicator: str, symbol: str, 
-                                 price_data: List[Dict]) -> Dict[str, Any]:
-        """Calculate specific technical indicator."""
-        try:
-            if indicator.lower() == "sma":
-                return await self.technical_analysis.calculate_sma(price_data, periods=[20, 50, 200])
-            elif indicator.lower() == "ema":
-                return await self.technical_analysis.calculate_ema(price_data, periods=[12, 26])
-            elif indicator.lower() == "rsi":
-                return await self.technical_analysis.calculate_rsi(price_data, period=14)
-            elif indicator.lower() == "macd":
-                return await self.technical_analysis.calculate_macd(price_data)
-            elif indicator.lower() == "bollinger":
-                return await self.technical_analysis.calculate_bollinger_bands(price_data)
-            elif indicator.lower() == "stochastic":
-                return await self.technical_analysis.calculate_stochastic(price_data)
-            else:
-                return {'error': f'Unsupported indicator: {indicator}'}
+    # Shared indicator cache series (name, indicator, parameters) behind each requested indicator
+    _INDICATOR_SERIES = {
+        'sma': [
+            ('sma_20', 'sma', {'period': 20}),
+            ('sma_50', 'sma', {'period': 50}),
+            ('sma_200', 'sma', {'period': 200})
+        ],
+        'ema': [('ema_12', 'ema', {'period': 12}), ('ema_26', 'ema', {'period': 26})],
+        'rsi': [('rsi', 'rsi', {'period': 14})],
+        'macd': [('macd', 'macd', {})],
+        'bollinger': [('bollinger_bands', 'bollinger_bands', {})],
+        'stochastic': [('stochastic', 'stochastic', {})]
+    }
+    
+    def _validate_price_bars(self, price_data: List[Dict]) -> None:
+        """Check that every bar has numeric prices for the indicator calculations."""
+        for index, bar in enumerate(price_data):
+            try:
+                float(bar['close'])
+                float(bar.get('high', bar['close']))
+                float(bar.get('low', bar['close']))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid price bar at index {index}: {e!r}") from e
+    
+    def _shared_indicator_series(self, price_history: Dict[str, List[Dict]],
+                                 indicators: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the indicator series behind the requested indicators for every symbol."""
+        symbols = list(price_history)
+        histories = list(price_history.values())
+        timestamps = [[bar.get('timestamp') for bar in bars] for bars in histories]
+        closes = [[float(bar['close']) for bar in bars] for bars in histories]
+        highs = [[float(bar.get('high', bar['close'])) for bar in bars] for bars in histories]
+        lows = [[float(bar.get('low', bar['close'])) for bar in bars] for bars in histories]
         
-        except Exception as e:
-            return {'error': f'Calculation failed: {str(e)}'}
+        cache = get_shared_indicator_cache()
+        series = {symbol: {} for symbol in symbols}
+        for indicator in dict.fromkeys(indicator.lower() for indicator in indicators):
+            for name, cached_indicator, params in self._INDICATOR_SERIES.get(indicator, []):
+                results = cache.get_many(
+                    symbols, cached_indicator, timestamps, closes, highs=highs, lows=lows,
+                    timeframe='1Day', **params
+                )
+                for symbol, result in zip(symbols, results):
+                    series[symbol][name] = result
+        return series
+    
+    def _summarize_indicator(self, indicator: str, series: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the latest values of an indicator from one symbol's series."""
+        def latest(values) -> Optional[float]:
+            value = float(values[-1])
+            return None if value != value else value
+        
+        indicator = indicator.lower()
+        if indicator == "sma":
+            return {
+                'sma_20': latest(series['sma_20']),
+                'sma_50': latest(series['sma_50']),
+                'sma_200': latest(series['sma_200'])
+            }
+        elif indicator == "ema":
+            return {'ema_12': latest(series['ema_12']), 'ema_26': latest(series['ema_26'])}
+        elif indicator == "rsi":
+            rsi_value = latest(series['rsi'])
+            return {
+                'current_value': rsi_value,
+                'overbought': rsi_value is not None and rsi_value > 70,
+                'oversold': rsi_value is not None and rsi_value < 30
+            }
+        elif indicator == "macd":
+            return {
+                'macd_line': latest(series['macd']['macd']),
+                'signal': latest(series['macd']['signal']),
+                'histogram': latest(series['macd']['histogram'])
+            }
+        elif indicator == "bollinger":
+            return {name: latest(values) for name, values in series['bollinger_bands'].items()}
+        elif indicator == "stochastic":
+            return {
+                'k_percent': latest(series['stochastic']['%K']),
+                'd_percent': latest(series['stochastic']['%D'])
+            }
+        else:
+            return {'error': f'Unsupported indicator: {indicator}'}
     
     async def _analyze_signals(self, indicators: Dict[str, Any]) -> Dict[str, str]:
         """Analyze trading signals from indicators."""
         signals = {}
         
         # RSI signals
-        if 'rsi' in indicators and 'current_value' in indicators['rsi']:
+        if 'rsi' in indicators and indicators['rsi'].get('current_value') is not None:
             rsi_value = indicators['rsi']['current_value']
             if rsi_value > 70:
                 signals['rsi'] = 'overbought'
@@ -373,7 +444,7 @@ class AnalysisTools:
         # MACD signals
         if 'macd' in indicators:
             macd_data = indicators['macd']
-            if 'signal' in macd_data and 'macd_line' in macd_data:
+            if macd_data.get('signal') is not None and macd_data.get('macd_line') is not None:
                 if macd_data['macd_line'] > macd_data['signal']:
                     signals['macd'] = 'bullish'
                 else:
@@ -382,7 +453,7 @@ class AnalysisTools:
         # SMA trend signals
         if 'sma' in indicators:
             sma_data = indicators['sma']
-            if 'sma_20' in sma_data and 'sma_50' in sma_data:
+            if sma_data.get('sma_20') is not None and sma_data.get('sma_50') is not None:
                 if sma_data['sma_20'] > sma_data['sma_50']:
                     signals['trend'] = 'bullish'
                 else:
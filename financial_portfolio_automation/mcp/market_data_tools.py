@@ -9,6 +9,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 
+from ..analysis.shared_indicator_cache import get_shared_indicator_cache
 from ..api.market_data_client import MarketDataClient
 from ..api.websocket_handler import WebSocketHandler
 from ..data.cache import DataCache
@@ -47,7 +48,7 @@ class MarketDataTools:
             self.websocket_handler = None
             
         try:
-            self.data_cache = DataCache(config.get('cache_config', {}))
+            self.data_cache = DataCache(**config.get('cache_config', {}))
         except Exception as e:
             self.logger.warning(f"Data cache not available: {e}")
             self.data_cache = None
@@ -434,8 +435,8 @@ class MarketDataTools:
         closes = [float(bar.get('close', 0)) for bar in price_data]
         
         # Calculate momentum indicators
-        short_ma = sum(closes[-5:]) / 5 if len(closes) >= 5 else closes[-1]
-        long_ma = sum(closes[-20:]) / 20 if len(closes) >= 20 else sum(closes) / len(closes)
+        short_ma = self._latest_sma(symbol, price_data, closes, 5, fallback=closes[-1])
+        long_ma = self._latest_sma(symbol, price_data, closes, 20, fallback=sum(closes) / len(closes))
         
         # Price momentum
         price_momentum = (closes[-1] - closes[0]) / closes[0] * 100 if closes[0] > 0 else 0
@@ -462,6 +463,18 @@ class MarketDataTools:
             'resistance_level': max(closes[-10:]) if len(closes) >= 10 else max(closes)
         }
     
+    def _latest_sma(self, symbol: str, price_data: List[Dict], closes: List[float],
+                    period: int, fallback: float) -> float:
+        """Get the latest SMA from the shared indicator cache, or the fallback for short histories."""
+        if len(closes) < period:
+            return fallback
+        
+        sma = get_shared_indicator_cache().get(
+            symbol, 'sma', [bar.get('timestamp') for bar in price_data], closes,
+            timeframe='1Day', period=period
+        )
+        return float(sma[-1])
+    
     async def _analyze_mean_reversion(self, symbol: str, price_data: List[Dict]) -> Dict[str, Any]:
         """Analyze mean reversion opportunities."""
         closes = [float(bar.get('close', 0)) for bar in price_data]
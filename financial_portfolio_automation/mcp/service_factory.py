@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, List
 
 from ..config.settings import get_config, SystemConfig
 from ..data.store import DataStore
+from ..data.async_store import AsyncDataStore
 from ..data.cache import DataCache
 from ..analytics.analytics_service import AnalyticsService, AnalyticsConfig
 from ..analysis.portfolio_analyzer import PortfolioAnalyzer
@@ -97,6 +98,7 @@ class ServiceFactory:
         
         # Initialize core services
         self._data_store = None
+        self._async_data_store = None
         self._data_cache = None
         self._alpaca_client = None
         self._portfolio_analyzer = None
@@ -258,6 +260,15 @@ class ServiceFactory:
                 return None
         return self._data_store
     
+    def get_async_data_store(self) -> Optional[AsyncDataStore]:
+        """Get or create the awaitable facade over the shared data store."""
+        if self._async_data_store is None:
+            data_store = self.get_data_store()
+            if data_store is None:
+                return None
+            self._async_data_store = AsyncDataStore(data_store)
+        return self._async_data_store
+    
     def get_data_cache(self) -> Optional[DataCache]:
         """Get or create data cache instance."""
         if self._data_cache is None:
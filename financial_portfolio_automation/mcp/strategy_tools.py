@@ -5,14 +5,19 @@ This module provides AI assistants with access to strategy backtesting,
 optimization, and performance analysis capabilities.
 """
 
+import dataclasses
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
 from ..strategy.backtester import Backtester
 from ..strategy.executor import StrategyExecutor
-from ..strategy.registry import StrategyRegistry
+from ..strategy.registry import StrategyRegistry, get_global_registry
 from ..strategy.factory import StrategyFactory
+from ..strategy.parameter_sweep import OBJECTIVES, ParameterSweep, parameter_grid_from_ranges
+from ..strategy.result_cache import get_global_result_cache
+from ..models.core import Quote
 from ..exceptions import PortfolioAutomationError
 
 
@@ -24,16 +29,20 @@ class StrategyTools:
     and strategy comparison capabilities.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize strategy tools.
         
         Args:
             config: Configuration dictionary containing service configurations
         """
+        config = config or {}
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        # Shared across instances so repeated API/CLI requests hit the same cache
+        self.result_cache = config.get('backtest_result_cache') or get_global_result_cache()
+        
         # Initialize required services with error handling
         try:
             self.backtester = Backtester(config)
@@ -68,7 +77,9 @@ class StrategyTools:
         Backtest trading strategy with historical data.
         
         Args:
-            strategy_config: Strategy configuration parameters
+            strategy_config: Strategy configuration parameters. 'strategy_id' (or
+                'name') selects a registered strategy and 'parameters' overrides
+                its parameters
             start_date: Backtest start date (YYYY-MM-DD)
             end_date: Backtest end date (YYYY-MM-DD)
             initial_capital: Initial capital for backtest
@@ -79,44 +90,28 @@ class StrategyTools:
         try:
             self.logger.info(f"Running backtest from {start_date} to {end_date}")
             
-            # Parse dates
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            # Create strategy instance
-            strategy = await self.strategy_factory.create_strategy(strategy_config)
-            
-            # Run backtest
-            backtest_results = await self.backtester.run_backtest(
-                strategy=strategy,
-                start_date=start_dt,
-                end_date=end_dt,
-                initial_capital=initial_capital
-            )
-            
-            # Calculate comprehensive metrics
-            performance_metrics = await self.backtester.calculate_performance_metrics(
-                backtest_results
+            strategy_name = strategy_config.get('strategy_id') or strategy_config.get('name')
+            backtest_results = self.run_backtest(
+                strategy_name=strategy_name,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=initial_capital,
+                parameters=strategy_config.get('parameters')
             )
             
             # Generate backtest report
             result = {
-                'backtest_id': backtest_results.get('backtest_id'),
+                'backtest_id': backtest_results['cache_key'],
                 'strategy_name': strategy_config.get('name', 'Unknown'),
                 'strategy_type': strategy_config.get('type', 'Unknown'),
-                'period': {
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'duration_days': (end_dt - start_dt).days
-                },
+                'period': backtest_results['period'],
                 'initial_capital': initial_capital,
-                'final_value': backtest_results.get('final_portfolio_value', 0),
-                'performance_metrics': performance_metrics,
-                'trade_statistics': backtest_results.get('trade_statistics', {}),
-                'risk_metrics': backtest_results.get('risk_metrics', {}),
-                'drawdown_analysis': backtest_results.get('drawdown_analysis', {}),
-                'monthly_returns': backtest_results.get('monthly_returns', []),
-                'equity_curve': backtest_results.get('equity_curve', [])
+                'final_value': backtest_results['final_value'],
+                'performance_metrics': backtest_results['performance'],
+                'trade_statistics': backtest_results['trading_stats'],
+                'risk_metrics': backtest_results['risk_metrics'],
+                'cached': backtest_results['cached'],
+                'cache_stats': backtest_results['cache_stats']
             }
             
             # Add AI-friendly summary
@@ -132,6 +127,106 @@ class StrategyTools:
             self.logger.error(f"Error running backtest: {str(e)}")
             raise PortfolioAutomationError(f"Backtest failed: {str(e)}")
     
+    def run_backtest(self, strategy_name: str,
+                     start_date: Optional[str] = None,
+                     end_date: Optional[str] = None,
+                     initial_capital: float = 100000,
+                     benchmark: Optional[str] = None,
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     historical_data: Optional[Dict[str, List[Quote]]] = None,
+                     parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Backtest a registered strategy, reusing cached results for identical requests.
+        
+        Results are cached by strategy config, transaction costs, capital,
+        period and a fingerprint of the historical data, so any change to
+        these runs a fresh backtest.
+        
+        Args:
+            strategy_name: ID of the registered strategy to backtest
+            start_date: Backtest start date (YYYY-MM-DD)
+            end_date: Backtest end date (YYYY-MM-DD)
+            initial_capital: Initial capital for backtest
+            benchmark: Benchmark symbol (not yet used by the backtesting engine)
+            progress_callback: Called with the completion percentage
+            historical_data: Historical market data by symbol (loaded from the
+                configured market data client if None)
+            parameters: Parameter overrides for the strategy's config
+            
+        Returns:
+            Dictionary containing performance, trading statistics and cache stats
+        """
+        try:
+            strategy = get_global_registry().get_strategy(strategy_name)
+            if strategy is None:
+                raise ValueError(f"Strategy {strategy_name} not found")
+            
+            if parameters:
+                config = dataclasses.replace(
+                    strategy.config, parameters={**strategy.config.parameters, **parameters}
+                )
+                strategy = type(strategy)(config)
+            
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else end_dt - timedelta(days=365)
+            
+            if historical_data is None:
+                historical_data = self._load_historical_data(strategy.symbols, start_dt, end_dt)
+            
+            backtester = Backtester(
+                initial_capital=Decimal(str(initial_capital)),
+                result_cache=self.result_cache
+            )
+            results = backtester.run_backtest(strategy, historical_data, start_dt, end_dt)
+            
+            if progress_callback:
+                progress_callback(100)
+            
+            return {
+                'strategy_name': strategy_name,
+                'period': {
+                    'start_date': start_dt.strftime('%Y-%m-%d'),
+                    'end_date': end_dt.strftime('%Y-%m-%d'),
+                    'duration_days': (end_dt - start_dt).days
+                },
+                'initial_capital': float(results.initial_capital),
+                'final_value': float(results.final_value),
+                'performance': {
+                    'total_return': results.total_return,
+                    'annualized_return': results.annual_return,
+                    'volatility': results.performance_metrics.get('volatility', 0),
+                    'sharpe_ratio': results.sharpe_ratio,
+                    'sortino_ratio': results.sortino_ratio,
+                    'max_drawdown': results.max_drawdown,
+                    'win_rate': results.win_rate,
+                    'profit_factor': results.profit_factor
+                },
+                'trading_stats': {
+                    'total_trades': results.total_trades,
+                    'winning_trades': results.winning_trades,
+                    'losing_trades': results.losing_trades,
+                    'total_commission': float(results.total_commission),
+                    'total_slippage': float(results.total_slippage)
+                },
+                'risk_metrics': results.performance_metrics,
+                'cached': backtester.last_run_cached,
+                'cache_key': backtester.last_cache_key,
+                'cache_stats': self.result_cache.get_stats()
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error running backtest: {str(e)}")
+            raise PortfolioAutomationError(f"Backtest failed: {str(e)}")
+    
+    def get_backtest_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the backtest result cache.
+        
+        Returns:
+            Dictionary containing cache statistics
+        """
+        return self.result_cache.get_stats()
+    
     async def optimize_strategy_parameters(self, strategy_type: str,
                                          parameter_ranges: Dict[str, Any],
                                          optimization_metric: str = "sharpe") -> Dict[str, Any]:
@@ -182,6 +277,116 @@ class StrategyTools:
             self.logger.error(f"Error optimizing strategy parameters: {str(e)}")
             raise PortfolioAutomationError(f"Parameter optimization failed: {str(e)}")
     
+    def optimize_strategy(self, strategy_name: str,
+                          parameter_ranges: Dict[str, Dict[str, float]],
+                          objective: str = "sharpe",
+                          start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          max_iterations: int = 100,
+                          progress_callback: Optional[Callable[[int], None]] = None,
+                          historical_data: Optional[Dict[str, List[Quote]]] = None,
+                          prune_fraction: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Optimize a registered strategy's parameters with a grid search.
+        
+        Args:
+            strategy_name: ID of the registered strategy to optimize
+            parameter_ranges: Ranges by parameter name with 'min', 'max' and 'step'
+            objective: Optimization objective ('sharpe', 'return', 'sortino', 'calmar')
+            start_date: Optimization start date (YYYY-MM-DD)
+            end_date: Optimization end date (YYYY-MM-DD)
+            max_iterations: Maximum number of parameter combinations to evaluate
+            progress_callback: Called with the number of finished combinations
+            historical_data: Historical market data by symbol (loaded from the
+                configured market data client if None)
+            prune_fraction: Fraction of the period used to screen out weak combinations
+            
+        Returns:
+            Dictionary containing the best parameters and a ranked results table
+        """
+        try:
+            self.logger.info(f"Optimizing strategy {strategy_name}")
+            
+            strategy = get_global_registry().get_strategy(strategy_name)
+            if strategy is None:
+                raise ValueError(f"Strategy {strategy_name} not found")
+            
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else end_dt - timedelta(days=365)
+            
+            if historical_data is None:
+                historical_data = self._load_historical_data(strategy.symbols, start_dt, end_dt)
+            
+            sweep = ParameterSweep(strategy.config, type(strategy), objective=objective)
+            sweep_results = sweep.run(
+                historical_data,
+                start_dt,
+                end_dt,
+                parameter_grid_from_ranges(parameter_ranges),
+                max_combinations=max_iterations,
+                prune_fraction=prune_fraction,
+                progress_callback=progress_callback
+            )
+            
+            best = sweep_results.best
+            if best is None:
+                raise ValueError("No parameter combination completed successfully")
+            
+            ranked_scores = [r.score for r in sweep_results.completed]
+            worst_score = ranked_scores[-1]
+            
+            result = {
+                'strategy_name': strategy_name,
+                'objective': objective,
+                'parameter_ranges': parameter_ranges,
+                'best_parameters': sweep_results.best_parameters,
+                'best_performance': {objective: best.metrics.get(OBJECTIVES[objective][0]), **best.metrics},
+                'optimization_stats': {
+                    'total_iterations': sweep_results.total_combinations,
+                    'successful_runs': len(sweep_results.completed),
+                    'pruned_runs': sum(1 for r in sweep_results.results if r.status == 'pruned'),
+                    'failed_runs': sum(1 for r in sweep_results.results if r.status == 'failed'),
+                    'improvement_percent': (
+                        (best.score - worst_score) / abs(worst_score) * 100 if worst_score else 0
+                    )
+                },
+                'results_table': sweep_results.to_table(),
+                'cache_stats': sweep_results.cache_stats
+            }
+            
+            self.logger.info("Strategy optimization completed")
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Error optimizing strategy: {str(e)}")
+            raise PortfolioAutomationError(f"Strategy optimization failed: {str(e)}")
+    
+    def _load_historical_data(self, symbols: List[str],
+                              start_date: datetime,
+                              end_date: datetime) -> Dict[str, List[Quote]]:
+        """Load daily bars for symbols from the configured market data client."""
+        market_data_client = self.config.get('market_data_client')
+        if market_data_client is None:
+            raise ValueError("No historical data provided and no market data client configured")
+        
+        historical_data = {}
+        for symbol in symbols:
+            bars = market_data_client.get_historical_bars(symbol, '1Day', start_date, end_date)
+            historical_data[symbol] = [
+                Quote(
+                    symbol=symbol,
+                    timestamp=datetime.fromisoformat(bar['timestamp']),
+                    open=Decimal(str(bar['open'])),
+                    high=Decimal(str(bar['high'])),
+                    low=Decimal(str(bar['low'])),
+                    close=Decimal(str(bar['close'])),
+                    volume=bar['volume']
+                )
+                for bar in bars if bar.get('timestamp')
+            ]
+        
+        return historical_data
+    
     async def compare_strategies(self, strategies: List[Dict[str, Any]],
                                comparison_period: str = "1y") -> Dict[str, Any]:
         """
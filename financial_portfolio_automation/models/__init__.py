@@ -12,6 +12,11 @@ from .core import (
     OrderStatus,
 )
 
+from .quote_frame import (
+    BarArray,
+    QuoteFrame,
+)
+
 from .config import (
     AlpacaConfig,
     RiskLimits,
@@ -31,6 +36,9 @@ __all__ = [
     "OrderSide",
     "OrderType",
     "OrderStatus",
+    # Columnar market data
+    "BarArray",
+    "QuoteFrame",
     # Configuration models
     "AlpacaConfig",
     "RiskLimits",
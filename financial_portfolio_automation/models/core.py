@@ -13,6 +13,10 @@ from typing import List, Optional, Dict, Any
 import re
 
 
+# Ticker symbols: one to five upper-case letters
+_SYMBOL_PATTERN = re.compile(r'^[A-Z]{1,5}$')
+
+
 class OrderSide(Enum):
     """Order side enumeration."""
     BUY = "buy"
@@ -64,7 +68,7 @@ class Quote:
         if not self.symbol or not isinstance(self.symbol, str):
             raise ValueError("Symbol must be a non-empty string")
         
-        if not re.match(r'^[A-Z]{1,5}$', self.symbol):
+        if not _SYMBOL_PATTERN.match(self.symbol):
             raise ValueError(f"Invalid symbol format: {self.symbol}")
         
         if not isinstance(self.timestamp, datetime):
@@ -100,6 +104,28 @@ class Quote:
         if self.volume is not None and self.volume < 0:
             raise ValueError("Volume must be non-negative")
     
+    @classmethod
+    def from_trusted(cls, symbol: str, timestamp: datetime,
+                     bid: Optional[Decimal] = None, ask: Optional[Decimal] = None,
+                     bid_size: Optional[int] = None, ask_size: Optional[int] = None,
+                     open: Optional[Decimal] = None, high: Optional[Decimal] = None,
+                     low: Optional[Decimal] = None, close: Optional[Decimal] = None,
+                     volume: Optional[int] = None) -> 'Quote':
+        """
+        Create a quote from data that is already known to be valid.
+
+        Skips ``validate()``; use only for data that was validated when it
+        first entered the system, such as stored history or decoded feed
+        messages with typed fields.
+        """
+        quote = object.__new__(cls)
+        quote.__dict__.update(
+            symbol=symbol, timestamp=timestamp, bid=bid, ask=ask,
+            bid_size=bid_size, ask_size=ask_size, open=open, high=high,
+            low=low, close=close, volume=volume
+        )
+        return quote
+    
     @property
     def spread(self) -> Optional[Decimal]:
         """Calculate the bid-ask spread."""
@@ -135,7 +161,7 @@ class Position:
         if not self.symbol or not isinstance(self.symbol, str):
             raise ValueError("Symbol must be a non-empty string")
         
-        if not re.match(r'^[A-Z]{1,5}$', self.symbol):
+        if not _SYMBOL_PATTERN.match(self.symbol):
             raise ValueError(f"Invalid symbol format: {self.symbol}")
         
         if not isinstance(self.quantity, (int, Decimal)):
@@ -150,6 +176,18 @@ class Position:
         if self.market_value < 0:
             raise ValueError("Market value cannot be negative")
     
+    @classmethod
+    def from_trusted(cls, symbol: str, quantity: Decimal, market_value: Decimal,
+                     cost_basis: Decimal, unrealized_pnl: Decimal,
+                     day_pnl: Decimal) -> 'Position':
+        """Create a position from data that is already known to be valid, skipping ``validate()``."""
+        position = object.__new__(cls)
+        position.__dict__.update(
+            symbol=symbol, quantity=quantity, market_value=market_value,
+            cost_basis=cost_basis, unrealized_pnl=unrealized_pnl, day_pnl=day_pnl
+        )
+        return position
+    
     @property
     def average_cost(self) -> Decimal:
         """Calculate average cost per share."""
@@ -222,7 +260,7 @@ class Order:
         if not self.symbol or not isinstance(self.symbol, str):
             raise ValueError("Symbol must be a non-empty string")
         
-        if not re.match(r'^[A-Z]{1,5}$', self.symbol):
+        if not _SYMBOL_PATTERN.match(self.symbol):
             raise ValueError(f"Invalid symbol format: {self.symbol}")
         
         if not isinstance(self.quantity, int) or self.quantity <= 0:
@@ -255,6 +293,38 @@ class Order:
         if self.time_in_force not in ["day", "gtc", "ioc", "fok"]:
             raise ValueError("Invalid time in force value")
     
+    @classmethod
+    def from_trusted(cls, order_id: str, symbol: str, quantity: int,
+                     side: OrderSide, order_type: OrderType, status: OrderStatus,
+                     filled_quantity: int = 0,
+                     average_fill_price: Optional[Decimal] = None,
+                     limit_price: Optional[Decimal] = None,
+                     stop_price: Optional[Decimal] = None,
+                     time_in_force: str = "day",
+                     created_at: Optional[datetime] = None,
+                     updated_at: Optional[datetime] = None,
+                     filled_at: Optional[datetime] = None) -> 'Order':
+        """
+        Create an order from data that is already known to be valid.
+
+        Skips ``validate()`` and the string/Decimal conversions, so side,
+        order type and status must already be enum values and quantities
+        integers. Timestamps default as in the regular constructor.
+        """
+        if created_at is None:
+            created_at = datetime.now(timezone.utc)
+        order = object.__new__(cls)
+        order.__dict__.update(
+            order_id=order_id, symbol=symbol, quantity=quantity, side=side,
+            order_type=order_type, status=status, filled_quantity=filled_quantity,
+            average_fill_price=average_fill_price, limit_price=limit_price,
+            stop_price=stop_price, time_in_force=time_in_force,
+            created_at=created_at,
+            updated_at=created_at if updated_at is None else updated_at,
+            filled_at=filled_at
+        )
+        return order
+    
     @property
     def remaining_quantity(self) -> int:
         """Calculate remaining unfilled quantity."""
@@ -314,6 +384,19 @@ class PortfolioSnapshot:
         if len(symbols) != len(set(symbols)):
             raise ValueError("Portfolio cannot have duplicate positions for the same symbol")
     
+    @classmethod
+    def from_trusted(cls, timestamp: datetime, total_value: Decimal,
+                     buying_power: Decimal, day_pnl: Decimal, total_pnl: Decimal,
+                     positions: Optional[List[Position]] = None) -> 'PortfolioSnapshot':
+        """Create a snapshot from data that is already known to be valid, skipping ``validate()``."""
+        snapshot = object.__new__(cls)
+        snapshot.__dict__.update(
+            timestamp=timestamp, total_value=total_value, buying_power=buying_power,
+            day_pnl=day_pnl, total_pnl=total_pnl,
+            positions=[] if positions is None else positions
+        )
+        return snapshot
+    
     @property
     def position_count(self) -> int:
         """Get the number of positions in the portfolio."""
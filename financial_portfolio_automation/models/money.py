@@ -0,0 +1,153 @@
+"""
+Fixed-point money arithmetic for hot paths.
+
+Prices, costs and balances are held as integer counts of micro-units
+(millionths of a currency or price unit). Integer arithmetic is an order of
+magnitude faster than ``Decimal`` and is exact for sums and for products
+with whole share quantities, so ``Decimal`` is only needed at API,
+persistence and report boundaries.
+
+Rates (per-share fees and cost factors) are not limited to micro-unit
+precision: to_ratio() keeps them as exact integer ratios, and mul_ratio()
+applies them to micro-unit amounts.
+
+Rounding rules:
+    - Converting a value with more than six decimal places rounds it to the
+      nearest micro-unit, half to even. Amounts finer than a micro-unit are
+      therefore not representable; use to_ratio() for rates.
+    - Products and quotients of scaled values are computed exactly on
+      integers and rounded once, half to even, to the nearest micro-unit.
+"""
+
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Tuple, Union
+
+
+MICROS_PER_UNIT = 1_000_000
+
+_MICROS_PER_UNIT_DECIMAL = Decimal(MICROS_PER_UNIT)
+
+
+def to_micros(value: Union[Decimal, int, float, str], rounding: str = ROUND_HALF_EVEN) -> int:
+    """
+    Convert an amount to micro-units.
+
+    Floats are converted through their shortest repr, so ``0.1`` becomes
+    exactly 100000 micro-units.
+
+    Args:
+        value: Amount to convert
+        rounding: Decimal rounding mode for amounts finer than a micro-unit
+
+    Returns:
+        Amount in micro-units
+
+    Raises:
+        ValueError: If the value is not finite
+    """
+    if isinstance(value, int):
+        return value * MICROS_PER_UNIT
+    if isinstance(value, float):
+        value = repr(value)
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    scaled = value * _MICROS_PER_UNIT_DECIMAL
+    try:
+        micros = int(scaled)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Cannot convert {value} to micro-units") from None
+    if micros != scaled:
+        micros = int(scaled.to_integral_value(rounding=rounding))
+    return micros
+
+
+def to_ratio(value: Union[Decimal, int, float, str]) -> Tuple[int, int]:
+    """
+    Convert a rate to an exact integer ratio.
+
+    Floats are converted through their shortest repr, like to_micros().
+
+    Args:
+        value: Rate to convert (e.g. Decimal('0.00000025'))
+
+    Returns:
+        (numerator, denominator) with a positive denominator
+
+    Raises:
+        ValueError: If the value is not finite
+    """
+    if isinstance(value, float):
+        value = repr(value)
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    if not value.is_finite():
+        raise ValueError(f"Cannot convert {value} to a ratio")
+    return value.as_integer_ratio()
+
+
+def from_micros(micros: int) -> Decimal:
+    """
+    Convert micro-units back to a Decimal.
+
+    The result is exact and carries no trailing zeros beyond the unit, so
+    1500000 becomes ``Decimal('1.5')``.
+
+    Args:
+        micros: Amount in micro-units
+
+    Returns:
+        Amount as a Decimal
+    """
+    return Decimal(micros) / _MICROS_PER_UNIT_DECIMAL
+
+
+def scaled_div(numerator: int, denominator: int) -> int:
+    """
+    Divide integers, rounding half to even.
+
+    Args:
+        numerator: Dividend
+        denominator: Divisor (must be positive)
+
+    Returns:
+        Rounded quotient
+
+    Raises:
+        ValueError: If the denominator is not positive
+    """
+    if denominator <= 0:
+        raise ValueError("Denominator must be positive")
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def mul_micros(a: int, b: int) -> int:
+    """
+    Multiply two micro-unit amounts (e.g. a price and a rate).
+
+    Args:
+        a: First factor in micro-units
+        b: Second factor in micro-units
+
+    Returns:
+        Product in micro-units, rounded half to even
+    """
+    return scaled_div(a * b, MICROS_PER_UNIT)
+
+
+def mul_ratio(micros: int, ratio: Tuple[int, int]) -> int:
+    """
+    Multiply a micro-unit amount by an exact rate.
+
+    Args:
+        micros: Amount in micro-units
+        ratio: Rate from to_ratio()
+
+    Returns:
+        Product in micro-units, rounded half to even
+    """
+    numerator, denominator = ratio
+    return scaled_div(micros * numerator, denominator)
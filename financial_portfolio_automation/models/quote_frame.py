@@ -0,0 +1,401 @@
+"""
+Columnar containers for historical market data.
+
+``BarArray`` holds the bars of one symbol as one NumPy array per quote
+field, and ``QuoteFrame`` groups the bars of several symbols in shared
+columns. Both convert to and from ``Quote`` lists, and can be passed where a
+``List[Quote]`` or ``Dict[str, List[Quote]]`` is read: indexing and
+iteration build ``Quote`` objects on demand, while slicing and symbol
+lookup return views without copying.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime, timedelta, tzinfo as TZInfo
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .core import Quote
+
+
+# Missing prices are stored as NaN and missing sizes as -1
+PRICE_FIELDS = ('bid', 'ask', 'open', 'high', 'low', 'close')
+SIZE_FIELDS = ('bid_size', 'ask_size', 'volume')
+COLUMNS = ('timestamps',) + PRICE_FIELDS + SIZE_FIELDS
+
+NS_PER_DAY = 86_400_000_000_000
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def datetime_to_ns(timestamp: datetime) -> int:
+    """Convert a datetime to nanoseconds since the epoch of its wall-clock time."""
+    delta = timestamp.replace(tzinfo=None) - _EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+def ns_to_datetime(timestamp: int, tzinfo: Optional[TZInfo] = None) -> datetime:
+    """Convert wall-clock nanoseconds since the epoch back to a datetime."""
+    return (_EPOCH + timedelta(microseconds=timestamp // 1000)).replace(tzinfo=tzinfo)
+
+
+def _price(value: float) -> Optional[Decimal]:
+    # The shortest repr round-trips prices with up to 15 significant digits
+    return None if value != value else Decimal(repr(value))
+
+
+def _size(value: int) -> Optional[int]:
+    return None if value < 0 else value
+
+
+class BarArray(Sequence):
+    """
+    Bars of one symbol stored column by column.
+
+    Timestamps are int64 nanoseconds of the bars' wall-clock time, with the
+    timezone kept once for the whole array. Prices are float64 and sizes and
+    volume int64. Slicing with a step of one returns a view, and indexing
+    returns a ``Quote`` built without re-validation.
+    """
+
+    __slots__ = ('symbol', 'tzinfo') + COLUMNS
+
+    def __init__(self,
+                 symbol: str,
+                 timestamps: Any,
+                 tzinfo: Optional[TZInfo] = None,
+                 **columns: Any):
+        """
+        Initialize the array.
+
+        Args:
+            symbol: Symbol of the bars
+            timestamps: Wall-clock nanoseconds since the epoch, oldest first
+            tzinfo: Timezone of the timestamps (None for naive)
+            **columns: Price and size columns by quote field name; omitted
+                columns are filled as missing
+
+        Raises:
+            ValueError: If a column is unknown or its length differs
+        """
+        unknown = set(columns) - set(PRICE_FIELDS + SIZE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown bar columns: {sorted(unknown)}")
+
+        self.symbol = symbol
+        self.tzinfo = tzinfo
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        length = len(self.timestamps)
+
+        for name in PRICE_FIELDS + SIZE_FIELDS:
+            values = columns.get(name)
+            if values is None:
+                fill = np.nan if name in PRICE_FIELDS else -1
+                dtype = np.float64 if name in PRICE_FIELDS else np.int64
+                values = np.full(length, fill, dtype=dtype)
+            else:
+                values = np.asarray(values, dtype=np.float64 if name in PRICE_FIELDS else np.int64)
+                if len(values) != length:
+                    raise ValueError(f"Column {name} has {len(values)} values, expected {length}")
+            setattr(self, name, values)
+
+    @classmethod
+    def from_quotes(cls, symbol: str, quotes: Iterable[Quote]) -> 'BarArray':
+        """
+        Pack quotes into columns.
+
+        Args:
+            symbol: Symbol of the quotes
+            quotes: Quotes, oldest first
+
+        Returns:
+            BarArray holding the quotes
+
+        Raises:
+            ValueError: If the quotes mix timezones
+        """
+        quotes = list(quotes)
+        tzinfos = {quote.timestamp.tzinfo for quote in quotes}
+        if len(tzinfos) > 1:
+            raise ValueError(f"Quotes for {symbol} must share a single timezone")
+
+        columns = {}
+        for name in PRICE_FIELDS:
+            columns[name] = [
+                np.nan if value is None else float(value)
+                for value in (getattr(quote, name) for quote in quotes)
+            ]
+        for name in SIZE_FIELDS:
+            columns[name] = [
+                -1 if value is None else value
+                for value in (getattr(quote, name) for quote in quotes)
+            ]
+
+        return cls(
+            symbol,
+            [datetime_to_ns(quote.timestamp) for quote in quotes],
+            tzinfos.pop() if tzinfos else None,
+            **columns
+        )
+
+    @classmethod
+    def from_records(cls, symbol: str, records: Iterable[Dict[str, Any]]) -> 'BarArray':
+        """
+        Pack bar dictionaries, such as ``MarketDataClient.get_historical_bars`` rows.
+
+        Args:
+            symbol: Symbol of the bars
+            records: Dictionaries with a datetime or ISO 8601 ``timestamp``
+                and any quote fields, oldest first
+
+        Returns:
+            BarArray holding the bars
+        """
+        records = list(records)
+        timestamps = [
+            datetime.fromisoformat(value.replace('Z', '+00:00')) if isinstance(value, str) else value
+            for value in (record['timestamp'] for record in records)
+        ]
+        tzinfos = {timestamp.tzinfo for timestamp in timestamps}
+        if len(tzinfos) > 1:
+            raise ValueError(f"Bars for {symbol} must share a single timezone")
+
+        columns = {}
+        for name in PRICE_FIELDS + SIZE_FIELDS:
+            if any(name in record for record in records):
+                missing = np.nan if name in PRICE_FIELDS else -1
+                columns[name] = [
+                    missing if record.get(name) is None else record[name] for record in records
+                ]
+
+        return cls(
+            symbol,
+            [datetime_to_ns(timestamp) for timestamp in timestamps],
+            tzinfos.pop() if tzinfos else None,
+            **columns
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Quote, 'BarArray']:
+        if isinstance(index, slice):
+            return self._view(index)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BarArray index out of range")
+        return self._quote(
+            int(self.timestamps[index]),
+            *(float(getattr(self, name)[index]) for name in PRICE_FIELDS),
+            *(int(getattr(self, name)[index]) for name in SIZE_FIELDS)
+        )
+
+    def __iter__(self) -> Iterator[Quote]:
+        columns = [getattr(self, name).tolist() for name in COLUMNS]
+        for row in zip(*columns):
+            yield self._quote(*row)
+
+    def __reversed__(self) -> Iterator[Quote]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"BarArray(symbol={self.symbol!r}, len={len(self)})"
+
+    def _quote(self, timestamp, bid, ask, open, high, low, close,
+               bid_size, ask_size, volume) -> Quote:
+        return Quote.from_trusted(
+            symbol=self.symbol,
+            timestamp=ns_to_datetime(timestamp, self.tzinfo),
+            bid=_price(bid), ask=_price(ask),
+            bid_size=_size(bid_size), ask_size=_size(ask_size),
+            open=_price(open), high=_price(high), low=_price(low), close=_price(close),
+            volume=_size(volume)
+        )
+
+    def _view(self, index: slice) -> 'BarArray':
+        view = object.__new__(BarArray)
+        view.symbol = self.symbol
+        view.tzinfo = self.tzinfo
+        for name in COLUMNS:
+            setattr(view, name, getattr(self, name)[index])
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the columns."""
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    @property
+    def days(self) -> np.ndarray:
+        """Get the wall-clock day of each bar as days since the epoch."""
+        return self.timestamps // NS_PER_DAY
+
+    def dates(self) -> List[date]:
+        """Get the wall-clock date of each bar."""
+        return [_EPOCH.date() + timedelta(days=day) for day in self.days.tolist()]
+
+    def date_range(self) -> Tuple[date, date]:
+        """
+        Get the earliest and latest wall-clock dates of the bars.
+
+        Raises:
+            ValueError: If the array is empty
+        """
+        if not len(self):
+            raise ValueError("BarArray is empty")
+        days = self.days
+        return (
+            _EPOCH.date() + timedelta(days=int(days.min())),
+            _EPOCH.date() + timedelta(days=int(days.max()))
+        )
+
+    def between(self, start: datetime, end: datetime) -> 'BarArray':
+        """
+        Get a view of the bars whose date is within a range.
+
+        The bars must be in chronological order.
+
+        Args:
+            start: Range start (inclusive, compared by date)
+            end: Range end (inclusive, compared by date)
+
+        Returns:
+            View of the bars in the range
+        """
+        days = self.days
+        first = (start.date() - _EPOCH.date()).days
+        last = (end.date() - _EPOCH.date()).days
+        return self._view(slice(
+            int(np.searchsorted(days, first, side='left')),
+            int(np.searchsorted(days, last, side='right'))
+        ))
+
+    def to_quotes(self) -> List[Quote]:
+        """
+        Convert the bars back to quotes.
+
+        Returns:
+            List of quotes, oldest first
+        """
+        return list(self)
+
+
+class QuoteFrame(Mapping):
+    """
+    Bars of several symbols in shared columns, grouped by symbol.
+
+    Each symbol's bars are a contiguous block of the columns, so looking up
+    a symbol returns a ``BarArray`` view in O(1). The frame is a read-only
+    mapping from symbol to ``BarArray`` and can be passed where historical
+    data by symbol is expected.
+    """
+
+    def __init__(self, bar_arrays: Iterable[BarArray]):
+        """
+        Initialize the frame.
+
+        Args:
+            bar_arrays: Bars of each symbol, in the order symbols are listed
+
+        Raises:
+            ValueError: If a symbol appears more than once
+        """
+        bar_arrays = list(bar_arrays)
+        self._groups: Dict[str, Tuple[int, int, Optional[TZInfo]]] = {}
+        offset = 0
+        for bars in bar_arrays:
+            if bars.symbol in self._groups:
+                raise ValueError(f"Duplicate symbol in frame: {bars.symbol}")
+            self._groups[bars.symbol] = (offset, offset + len(bars), bars.tzinfo)
+            offset += len(bars)
+
+        self._columns = {
+            name: np.concatenate([getattr(bars, name) for bars in bar_arrays])
+            if bar_arrays else np.empty(0, dtype=np.int64 if name not in PRICE_FIELDS else np.float64)
+            for name in COLUMNS
+        }
+
+    @classmethod
+    def from_quotes(cls, historical_data: Mapping) -> 'QuoteFrame':
+        """
+        Pack quote lists by symbol into a frame.
+
+        Args:
+            historical_data: Quotes by symbol, oldest first
+
+        Returns:
+            QuoteFrame holding the quotes
+        """
+        return cls(
+            quotes if isinstance(quotes, BarArray) else BarArray.from_quotes(symbol, quotes)
+            for symbol, quotes in historical_data.items()
+        )
+
+    def __getitem__(self, symbol: str) -> BarArray:
+        start, stop, tzinfo = self._groups[symbol]
+        bars = object.__new__(BarArray)
+        bars.symbol = symbol
+        bars.tzinfo = tzinfo
+        for name in COLUMNS:
+            setattr(bars, name, self._columns[name][start:stop])
+        return bars
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"QuoteFrame(symbols={len(self)}, bars={self.total_bars})"
+
+    @property
+    def total_bars(self) -> int:
+        """Get the number of bars across all symbols."""
+        return len(self._columns['timestamps'])
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the columns."""
+        return sum(values.nbytes for values in self._columns.values())
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a column for all symbols, grouped in symbol order.
+
+        Args:
+            name: Column name ('timestamps' or a quote field)
+
+        Returns:
+            Read-only view of the column
+        """
+        values = self._columns[name].view()
+        values.flags.writeable = False
+        return values
+
+    def between(self, start: datetime, end: datetime) -> 'QuoteFrame':
+        """
+        Get the bars whose date is within a range, dropping symbols without any.
+
+        Args:
+            start: Range start (inclusive, compared by date)
+            end: Range end (inclusive, compared by date)
+
+        Returns:
+            QuoteFrame of the bars in the range
+        """
+        windows = (bars.between(start, end) for bars in self.values())
+        return QuoteFrame(bars for bars in windows if len(bars))
+
+    def to_quotes(self) -> Dict[str, List[Quote]]:
+        """
+        Convert the frame back to quote lists.
+
+        Returns:
+            Quotes by symbol, oldest first
+        """
+        return {symbol: bars.to_quotes() for symbol, bars in self.items()}
@@ -12,9 +12,15 @@ from enum import Enum
 
 from ..models.core import Position, Quote, PortfolioSnapshot
 from ..analysis.portfolio_analyzer import PortfolioAnalyzer
+from ..analysis.streaming_indicators import StreamingVolatility
 from ..analysis.technical_analysis import TechnicalAnalysis
 from ..data.cache import DataCache
 from ..exceptions import MonitoringError
+from .price_buffer import PriceRingBuffer
+
+
+# 252 sessions of 6.5 hours, for annualizing volatility of intraday samples
+TRADING_SECONDS_PER_YEAR = 252 * 6.5 * 3600
 
 
 class AlertSeverity(Enum):
@@ -56,6 +62,28 @@ class MonitoringThresholds:
     # Time-based settings
     monitoring_interval: int = 5  # Monitor every 5 seconds
     volatility_window: int = 20  # 20-period volatility calculation
+    volatility_sample_interval: float = 60.0  # Seconds between prices in the volatility window
+    
+    def __post_init__(self):
+        # Volatility needs at least two returns, i.e. three prices
+        if self.volatility_window < 3:
+            raise ValueError(
+                f"volatility_window must be at least 3 prices, got {self.volatility_window}"
+            )
+    
+    @property
+    def volatility_periods_per_year(self) -> float:
+        """Sampling intervals per trading year, for annualizing volatility."""
+        return TRADING_SECONDS_PER_YEAR / self.volatility_sample_interval
+
+
+def _quote_price(quote: Quote) -> Optional[Decimal]:
+    """Get a quote's mid price, or its close on bars without a bid and ask (None if neither is positive)."""
+    if quote.bid and quote.ask and quote.bid > 0 and quote.ask > 0:
+        return (quote.bid + quote.ask) / 2
+    if quote.close is not None and quote.close > 0:
+        return quote.close
+    return None
 
 
 class PortfolioMonitor:
@@ -93,7 +121,8 @@ class PortfolioMonitor:
         self._last_portfolio_snapshot: Optional[PortfolioSnapshot] = None
         self._position_baselines: Dict[str, Decimal] = {}
         self._price_baselines: Dict[str, Decimal] = {}
-        self._volatility_cache: Dict[str, List[float]] = {}
+        self._price_buffers: Dict[str, PriceRingBuffer] = {}
+        self._volatility_estimators: Dict[str, StreamingVolatility] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
     
     def add_alert_callback(self, callback: Callable[[MonitoringAlert], None]) -> None:
@@ -156,10 +185,10 @@ class PortfolioMonitor:
             # Set price baselines
             for symbol in symbols:
                 quote = await self._get_latest_quote(symbol)
-                if quote:
-                    mid_price = (quote.bid + quote.ask) / 2
-                    self._price_baselines[symbol] = mid_price
-                    self._volatility_cache[symbol] = []
+                price = _quote_price(quote) if quote else None
+                if price:
+                    self._price_baselines[symbol] = price
+                    self.record_price(symbol, float(price), quote.timestamp)
             
             self.logger.info(f"Initialized baselines for {len(symbols)} symbols")
             
@@ -307,7 +336,9 @@ class PortfolioMonitor:
             if not quote or symbol not in self._price_baselines:
                 return
             
-            current_price = (quote.bid + quote.ask) / 2
+            current_price = _quote_price(quote)
+            if not current_price:
+                return
             baseline_price = self._price_baselines[symbol]
             
             price_change_percent = float((current_price - baseline_price) / baseline_price * 100)
@@ -324,8 +355,8 @@ class PortfolioMonitor:
                         "previous_price": float(baseline_price),
                         "current_price": float(current_price),
                         "change_percent": price_change_percent,
-                        "bid": float(quote.bid),
-                        "ask": float(quote.ask)
+                        "bid": float(quote.bid) if quote.bid is not None else None,
+                        "ask": float(quote.ask) if quote.ask is not None else None
                     }
                 )
                 
@@ -338,13 +369,17 @@ class PortfolioMonitor:
     async def _monitor_volatility(self, symbol: str) -> None:
         """Monitor volatility for a specific symbol."""
         try:
-            # Get recent price data for volatility calculation
-            historical_data = await self._get_historical_prices(symbol, self.thresholds.volatility_window)
-            if not historical_data or len(historical_data) < self.thresholds.volatility_window:
-                return
+            # Add the cached quote to the price history; websocket quotes
+            # arrive through on_quote between cycles
+            quote = await self._get_latest_quote(symbol)
+            price = _quote_price(quote) if quote else None
+            if price:
+                self.record_price(symbol, float(price), quote.timestamp)
             
-            # Calculate volatility using technical analysis
-            volatility = self.technical_analysis.calculate_volatility(historical_data)
+            estimator = self._volatility_estimators.get(symbol)
+            volatility = estimator.value if estimator else None
+            if volatility is None:
+                return
             
             if volatility >= self.thresholds.volatility_threshold:
                 await self._generate_alert(
@@ -356,13 +391,102 @@ class PortfolioMonitor:
                         "symbol": symbol,
                         "volatility": volatility,
                         "threshold": self.thresholds.volatility_threshold,
-                        "window_periods": self.thresholds.volatility_window
+                        "window_periods": self.thresholds.volatility_window,
+                        "sample_interval": self.thresholds.volatility_sample_interval
                     }
                 )
             
         except Exception as e:
             self.logger.error(f"Error monitoring volatility for {symbol}: {e}")
     
+    def record_price(self, symbol: str, price: float, timestamp: Optional[datetime] = None) -> Optional[float]:
+        """
+        Add a price to a symbol's recent price history and volatility estimate.
+        
+        Prices are sampled at volatility_sample_interval: only the first price
+        in each interval is recorded, so websocket ticks and the quotes read on
+        each monitoring cycle give one evenly spaced series. Intervals without
+        a price are skipped.
+        
+        Args:
+            symbol: Symbol
+            price: Price
+            timestamp: Time of the price (defaults to now)
+            
+        Returns:
+            Annualized volatility over the last volatility_window samples, or None
+            until enough prices have been recorded
+        """
+        timestamp = timestamp or datetime.now()
+        buffer = self._get_price_buffer(symbol)
+        if buffer.last_timestamp is not None:
+            interval = self.thresholds.volatility_sample_interval
+            if timestamp.timestamp() // interval <= buffer.last_timestamp.timestamp() // interval:
+                return self._volatility_estimators[symbol].value
+        
+        buffer.append(price, timestamp)
+        return self._volatility_estimators[symbol].update(price)
+    
+    def seed_prices(self, symbol: str, prices: List[float]) -> Optional[float]:
+        """
+        Fill a symbol's recent price history with already sampled prices.
+        
+        The prices must be spaced volatility_sample_interval apart (e.g. minute
+        bars for the default interval); daily bars would be annualized as if
+        they were intraday samples.
+        
+        Args:
+            symbol: Symbol
+            prices: Prices, oldest first
+            
+        Returns:
+            Annualized volatility after the last price
+        """
+        buffer = self._get_price_buffer(symbol)
+        estimator = self._volatility_estimators[symbol]
+        volatility = estimator.value
+        for price in prices[-self.thresholds.volatility_window:]:
+            buffer.append(float(price))
+            volatility = estimator.update(float(price))
+        return volatility
+    
+    def _get_price_buffer(self, symbol: str) -> PriceRingBuffer:
+        """Get a symbol's price buffer, creating it and its volatility estimator."""
+        buffer = self._price_buffers.get(symbol)
+        if buffer is None:
+            window = self.thresholds.volatility_window
+            buffer = self._price_buffers[symbol] = PriceRingBuffer(window)
+            self._volatility_estimators[symbol] = StreamingVolatility(
+                window - 1, self.thresholds.volatility_periods_per_year
+            )
+        return buffer
+    
+    def on_quote(self, quote: Quote) -> None:
+        """
+        Quote callback for WebSocketHandler; records the mid price, or the
+        close of bars without a bid and ask.
+        
+        Args:
+            quote: Live quote
+        """
+        price = _quote_price(quote)
+        if price:
+            self.record_price(quote.symbol, float(price), quote.timestamp)
+    
+    def get_recent_prices(self, symbol: str, periods: Optional[int] = None) -> List[float]:
+        """
+        Get a symbol's recorded prices.
+        
+        Args:
+            symbol: Symbol
+            periods: Number of most recent prices (all recorded prices if None)
+            
+        Returns:
+            Prices, oldest first
+        """
+        buffer = self._price_buffers.get(symbol)
+        return buffer.latest(periods).tolist() if buffer else []
+    
     async def _generate_alert(
         self,
         alert_type: str,
@@ -408,16 +532,6 @@ class PortfolioMonitor:
             self.logger.error(f"Error getting quote for {symbol}: {e}")
             return None
     
-    async def _get_historical_prices(self, symbol: str, periods: int) -> List[float]:
-        """Get historical prices for volatility calculation."""
-        try:
-            # This would typically fetch from data store or cache
-            # For now, return empty list as placeholder
-            return []
-        except Exception as e:
-            self.logger.error(f"Error getting historical prices for {symbol}: {e}")
-            return []
-    
     def get_monitoring_status(self) -> Dict[str, Any]:
         """Get current monitoring status and statistics."""
         return {
@@ -0,0 +1,84 @@
+"""
+Fixed-size ring buffer of recent prices for real-time monitoring.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """
+    The most recent prices of one symbol in a preallocated NumPy array.
+
+    Appending overwrites the oldest price once the buffer is full, so memory
+    stays fixed and each append is O(1).
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of prices kept
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._next = 0
+        self._size = 0
+        self.last_timestamp: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the buffer holds capacity prices."""
+        return self._size == self.capacity
+
+    @property
+    def last_price(self) -> Optional[float]:
+        """Get the most recent price (None if empty)."""
+        if not self._size:
+            return None
+        return float(self._prices[self._next - 1])
+
+    def append(self, price: float, timestamp: Optional[datetime] = None) -> None:
+        """
+        Add a price, overwriting the oldest one when full.
+
+        Args:
+            price: New price
+            timestamp: Time of the price
+        """
+        self._prices[self._next] = price
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent prices, oldest first.
+
+        Args:
+            count: Number of prices (all buffered prices if None)
+
+        Returns:
+            Copy of up to count prices
+        """
+        count = self._size if count is None else min(count, self._size)
+        start = (self._next - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._prices[start:start + count].copy()
+        return np.concatenate((self._prices[start:], self._prices[:self._next]))
+
+    def clear(self) -> None:
+        """Remove all prices."""
+        self._next = 0
+        self._size = 0
+        self.last_timestamp = None
@@ -16,7 +16,22 @@ from .factory import (
     create_momentum_strategy, 
     create_mean_reversion_strategy
 )
-from .backtester import Backtester, BacktestResults, BacktestTrade, TransactionCosts
+from .backtester import Backtester, BacktestCheckpoint, BacktestResults, BacktestTrade, TransactionCosts
+from .market_data_index import MarketDataIndex, HistoricalView
+from .vectorized_backtester import VectorizedBacktester, MarketDataMatrices
+from .indicator_cache import IndicatorCache
+from .parameter_sweep import ParameterSweep, SweepResult, SweepResults
+from .result_cache import BacktestResultCache, get_global_result_cache
+from .intraday_backtester import (
+    IntradayBacktester,
+    IntradayStrategy,
+    IntradayContext,
+    Bar,
+    Fill,
+    LatencyModel,
+    CsvBarSource,
+    QuoteBarSource
+)
 
 __all__ = [
     'Strategy',
@@ -35,7 +50,26 @@ __all__ = [
     'create_momentum_strategy',
     'create_mean_reversion_strategy',
     'Backtester',
+    'BacktestCheckpoint',
     'BacktestResults',
     'BacktestTrade',
-    'TransactionCosts'
+    'TransactionCosts',
+    'MarketDataIndex',
+    'HistoricalView',
+    'VectorizedBacktester',
+    'MarketDataMatrices',
+    'IndicatorCache',
+    'ParameterSweep',
+    'SweepResult',
+    'SweepResults',
+    'BacktestResultCache',
+    'get_global_result_cache',
+    'IntradayBacktester',
+    'IntradayStrategy',
+    'IntradayContext',
+    'Bar',
+    'Fill',
+    'LatencyModel',
+    'CsvBarSource',
+    'QuoteBarSource'
 ]
\ No newline at end of file
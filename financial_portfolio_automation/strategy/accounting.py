@@ -0,0 +1,319 @@
+"""
+Array-backed accounting core for the backtesting engine.
+
+The backtester marks every open position to market on every simulated day.
+Doing that with ``Decimal`` arithmetic and fully validated ``Position`` and
+``PortfolioSnapshot`` objects dominates backtest runtime, so positions are kept
+in float64 arrays instead and model objects are only materialized when a
+strategy or the results actually read them.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.core import Position, PortfolioSnapshot
+
+
+def float_to_decimal(value: float) -> Decimal:
+    """Convert a float to the shortest Decimal that round-trips to it."""
+    return Decimal(repr(float(value)))
+
+
+class PositionArrays:
+    """
+    Immutable copy of the open positions of a ``PositionBook``.
+
+    Holds plain arrays only, so snapshots can be pickled and deep-copied.
+    """
+
+    __slots__ = ('symbols', 'quantity', 'market_value', 'cost_basis', 'day_pnl')
+
+    def __init__(self,
+                 symbols: List[str],
+                 quantity: np.ndarray,
+                 market_value: np.ndarray,
+                 cost_basis: np.ndarray,
+                 day_pnl: np.ndarray):
+        self.symbols = symbols
+        self.quantity = quantity
+        self.market_value = market_value
+        self.cost_basis = cost_basis
+        self.day_pnl = day_pnl
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def to_positions(self) -> List[Position]:
+        """
+        Materialize the positions as ``Position`` objects.
+
+        The book keeps quantities non-zero and values non-negative, so the
+        positions are built without re-validation.
+
+        Returns:
+            List of positions in the order they were opened
+        """
+        positions = []
+        for i, symbol in enumerate(self.symbols):
+            market_value = float_to_decimal(self.market_value[i])
+            cost_basis = float_to_decimal(self.cost_basis[i])
+            positions.append(Position.from_trusted(
+                symbol=symbol,
+                quantity=int(self.quantity[i]),
+                market_value=market_value,
+                cost_basis=cost_basis,
+                unrealized_pnl=market_value - cost_basis,
+                day_pnl=float_to_decimal(self.day_pnl[i])
+            ))
+        return positions
+
+
+class LazyPortfolioSnapshot(PortfolioSnapshot):
+    """
+    ``PortfolioSnapshot`` whose positions are built on first access.
+
+    Totals are stored directly. The position list is materialized from a
+    ``PositionArrays`` copy the first time ``positions`` is read, and the
+    snapshot is not re-validated since the book maintains its invariants.
+    """
+
+    def __init__(self,
+                 timestamp: datetime,
+                 total_value: Decimal,
+                 buying_power: Decimal,
+                 day_pnl: Decimal,
+                 total_pnl: Decimal,
+                 position_arrays: PositionArrays):
+        self.timestamp = timestamp
+        self.total_value = total_value
+        self.buying_power = buying_power
+        self.day_pnl = day_pnl
+        self.total_pnl = total_pnl
+        self._position_arrays = position_arrays
+        self._positions: Optional[List[Position]] = None
+
+    @property
+    def positions(self) -> List[Position]:
+        """Get positions, materializing them on first access."""
+        if self._positions is None:
+            self._positions = self._position_arrays.to_positions()
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: List[Position]) -> None:
+        self._positions = positions
+
+    @property
+    def position_count(self) -> int:
+        """Get the number of positions without materializing them."""
+        if self._positions is None:
+            return len(self._position_arrays)
+        return len(self._positions)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PortfolioSnapshot):
+            return NotImplemented
+        return (
+            self.timestamp == other.timestamp
+            and self.total_value == other.total_value
+            and self.buying_power == other.buying_power
+            and self.day_pnl == other.day_pnl
+            and self.total_pnl == other.total_pnl
+            and self.positions == other.positions
+        )
+
+
+class PositionBook:
+    """
+    Open positions held in float64 arrays, one slot per symbol.
+
+    Quantities are whole shares. Market value and cost basis follow the
+    backtester's conventions: market value is refreshed from the mid price
+    each day and from the execution price after a fill, and sells leave the
+    cost basis of the remaining shares unchanged.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty book.
+
+        Args:
+            capacity: Initial number of symbol slots
+        """
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        # Open slots in the order their positions were opened
+        self._open: Dict[int, None] = {}
+        self.quantity = np.zeros(capacity, dtype=np.int64)
+        self.market_value = np.zeros(capacity)
+        self.cost_basis = np.zeros(capacity)
+        self.day_pnl = np.zeros(capacity)
+
+    def __contains__(self, symbol: str) -> bool:
+        slot = self._slots.get(symbol)
+        return slot is not None and slot in self._open
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    @property
+    def open_symbols(self) -> List[str]:
+        """Get symbols with open positions in the order they were opened."""
+        return [self._symbols[slot] for slot in self._open]
+
+    def quantity_of(self, symbol: str) -> int:
+        """Get the open quantity for a symbol (0 if no position)."""
+        slot = self._slots.get(symbol)
+        if slot is None or slot not in self._open:
+            return 0
+        return int(self.quantity[slot])
+
+    def clear(self) -> None:
+        """Close all positions."""
+        for slot in self._open:
+            self._clear_slot(slot)
+        self._open.clear()
+
+    def apply_fill(self, symbol: str, side_sign: int, quantity: int, price: float) -> None:
+        """
+        Apply an executed trade to the book.
+
+        Args:
+            symbol: Traded symbol
+            side_sign: 1 for buys, -1 for sells
+            quantity: Filled shares (positive)
+            price: Execution price
+
+        Raises:
+            ValueError: If the fill would leave a short position
+        """
+        slot = self._slot(symbol)
+
+        if slot in self._open:
+            new_quantity = int(self.quantity[slot]) + side_sign * quantity
+            if side_sign > 0:
+                new_cost_basis = self.cost_basis[slot] + price * quantity
+            else:
+                new_cost_basis = self.cost_basis[slot]
+        else:
+            new_quantity = side_sign * quantity
+            new_cost_basis = price * quantity
+
+        if new_quantity < 0:
+            raise ValueError(f"Short positions are not supported: {symbol} quantity {new_quantity}")
+
+        if new_quantity == 0:
+            self._clear_slot(slot)
+            self._open.pop(slot, None)
+            return
+
+        self.quantity[slot] = new_quantity
+        self.cost_basis[slot] = new_cost_basis
+        self.market_value[slot] = new_quantity * price
+        self.day_pnl[slot] = 0.0
+        self._open.setdefault(slot, None)
+
+    def mark_to_market(self, prices: Dict[str, float]) -> Tuple[float, float]:
+        """
+        Revalue open positions at new prices.
+
+        Positions without a price keep their market value and day P&L.
+
+        Args:
+            prices: Current price by symbol
+
+        Returns:
+            Tuple of (total market value, day P&L of the repriced positions)
+        """
+        if not self._open:
+            return 0.0, 0.0
+
+        slots = np.fromiter(self._open, dtype=np.intp, count=len(self._open))
+        current = np.array([prices.get(self._symbols[slot], np.nan) for slot in slots])
+        priced = ~np.isnan(current)
+
+        repriced = slots[priced]
+        new_values = np.abs(self.quantity[repriced]) * current[priced]
+        changes = new_values - self.market_value[repriced]
+
+        self.day_pnl[repriced] = changes
+        self.market_value[repriced] = new_values
+
+        return float(self.market_value[slots].sum()), float(changes.sum())
+
+    def total_market_value(self) -> float:
+        """Get the total market value of open positions."""
+        if not self._open:
+            return 0.0
+        return float(self.market_value[list(self._open)].sum())
+
+    def snapshot(self) -> PositionArrays:
+        """
+        Copy the open positions.
+
+        Returns:
+            PositionArrays for the open positions
+        """
+        slots = list(self._open)
+        return PositionArrays(
+            symbols=[self._symbols[slot] for slot in slots],
+            quantity=self.quantity[slots],
+            market_value=self.market_value[slots],
+            cost_basis=self.cost_basis[slots],
+            day_pnl=self.day_pnl[slots]
+        )
+
+    def to_positions(self) -> Dict[str, Position]:
+        """
+        Materialize open positions as ``Position`` objects.
+
+        Returns:
+            Dictionary of positions by symbol
+        """
+        return {position.symbol: position for position in self.snapshot().to_positions()}
+
+    def load_positions(self, positions: Iterable[Position]) -> None:
+        """
+        Replace the book's contents with existing positions.
+
+        Args:
+            positions: Positions to load
+        """
+        self.clear()
+        for position in positions:
+            slot = self._slot(position.symbol)
+            self.quantity[slot] = int(position.quantity)
+            self.market_value[slot] = float(position.market_value)
+            self.cost_basis[slot] = float(position.cost_basis)
+            self.day_pnl[slot] = float(position.day_pnl)
+            self._open[slot] = None
+
+    def _slot(self, symbol: str) -> int:
+        """Get the slot for a symbol, allocating one if needed."""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot == len(self.quantity):
+                self._grow()
+            self._slots[symbol] = slot
+            self._symbols.append(symbol)
+        return slot
+
+    def _grow(self) -> None:
+        """Double the number of slots."""
+        capacity = max(1, 2 * len(self.quantity))
+        for name in ('quantity', 'market_value', 'cost_basis', 'day_pnl'):
+            values = getattr(self, name)
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[:len(values)] = values
+            setattr(self, name, grown)
+
+    def _clear_slot(self, slot: int) -> None:
+        """Zero a slot's values."""
+        self.quantity[slot] = 0
+        self.market_value[slot] = 0.0
+        self.cost_basis[slot] = 0.0
+        self.day_pnl[slot] = 0.0
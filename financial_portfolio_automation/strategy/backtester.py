@@ -7,17 +7,30 @@ transaction cost modeling, slippage estimation, walk-forward analysis, and Monte
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any, Callable, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
+import os
+import pickle
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import copy
 
-from .base import Strategy, StrategySignal, SignalType
+from .base import Strategy, StrategySignal, SignalType, StrategyState
+from .market_data_index import MarketDataIndex
+from .accounting import PositionBook, LazyPortfolioSnapshot, float_to_decimal
+from .result_cache import BacktestResultCache, fingerprint_historical_data, strategy_state_key
+from .monte_carlo import (
+    run_process_pool_simulations,
+    build_log_return_matrix,
+    generate_return_paths,
+    evaluate_portfolio_paths
+)
 from ..models.core import Quote, Position, Order, PortfolioSnapshot, OrderSide, OrderType, OrderStatus
+from ..models.quote_frame import BarArray, QuoteFrame
+from ..models.money import MICROS_PER_UNIT, from_micros, mul_ratio, scaled_div, to_micros, to_ratio
 from ..models.config import StrategyConfig
 from ..analysis.portfolio_analyzer import PortfolioAnalyzer
 from ..analysis.technical_analysis import TechnicalAnalysis
@@ -38,6 +51,34 @@ class TransactionCosts:
     slippage_factor: Decimal = Decimal('0.0005')      # 0.05% slippage
 
 
+class _CostMicros(NamedTuple):
+    """
+    Transaction cost parameters for integer arithmetic.
+    
+    Commission limits are in micro-units. The per-share commission and the
+    cost factors are exact integer ratios, so rates finer than a micro-unit
+    are applied without rounding.
+    """
+    
+    commission_per_share: Tuple[int, int]
+    commission_minimum: int
+    commission_maximum: int
+    spread_cost_factor: Tuple[int, int]
+    market_impact_factor: Tuple[int, int]
+    slippage_factor: Tuple[int, int]
+    
+    @classmethod
+    def from_costs(cls, costs: TransactionCosts) -> '_CostMicros':
+        return cls(
+            commission_per_share=to_ratio(costs.commission_per_share),
+            commission_minimum=to_micros(costs.commission_minimum),
+            commission_maximum=to_micros(costs.commission_maximum),
+            spread_cost_factor=to_ratio(costs.spread_cost_factor),
+            market_impact_factor=to_ratio(costs.market_impact_factor),
+            slippage_factor=to_ratio(costs.slippage_factor)
+        )
+
+
 @dataclass
 class BacktestTrade:
     """Represents a trade executed during backtesting."""
@@ -95,6 +136,107 @@ class BacktestResults:
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BacktestCheckpoint:
+    """
+    Complete backtester and strategy state at the end of a backtest run.
+    
+    A checkpoint lets a later run resume after ``last_date`` and process only
+    new trading days, producing the same results as a full re-run as long as
+    the history up to ``last_date`` is unchanged.
+    """
+    
+    strategy_id: str
+    start_date: datetime
+    last_date: datetime
+    initial_capital: Decimal
+    transaction_costs: TransactionCosts
+    cash_balance: Decimal
+    positions: Dict[str, Position]
+    current_portfolio: Optional[PortfolioSnapshot]
+    trades: List[BacktestTrade]
+    portfolio_history: List[PortfolioSnapshot]
+    strategy_state: StrategyState
+    data_fingerprint: Dict[str, Tuple[int, Optional[datetime]]] = field(default_factory=dict)
+    
+    def save(self, path: str) -> None:
+        """
+        Serialize the checkpoint to a file.
+        
+        Args:
+            path: Destination file path
+        """
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: str) -> 'BacktestCheckpoint':
+        """
+        Load a checkpoint written by ``save``.
+        
+        Args:
+            path: Checkpoint file path
+            
+        Returns:
+            Loaded BacktestCheckpoint
+        """
+        with open(path, 'rb') as f:
+            checkpoint = pickle.load(f)
+        
+        if not isinstance(checkpoint, cls):
+            raise ValueError(f"File {path} does not contain a backtest checkpoint")
+        
+        return checkpoint
+
+
+def _history_fingerprint(data_index: MarketDataIndex,
+                         last_date: datetime) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """Summarize each symbol's history up to a date as (quote count, last timestamp)."""
+    fingerprint = {}
+    for symbol, quotes in data_index.history_up_to(last_date).items():
+        fingerprint[symbol] = (len(quotes), quotes[-1].timestamp if len(quotes) else None)
+    return fingerprint
+
+
+def _quote_bid_ask(quote: Quote) -> Tuple[Decimal, Decimal]:
+    """Get a quote's bid and ask, using the close for both on bars without them."""
+    if quote.bid is not None and quote.ask is not None:
+        return quote.bid, quote.ask
+    return quote.close, quote.close
+
+
+def _quote_price(quote: Quote) -> Decimal:
+    """Get a quote's mid price, or its close on bars without bid and ask."""
+    bid, ask = _quote_bid_ask(quote)
+    return (bid + ask) / 2
+
+
+def _walk_forward_period_summary(testing_start: datetime,
+                                 testing_end: datetime,
+                                 period_result: BacktestResults) -> Dict[str, Any]:
+    """Summarize a single walk-forward testing period."""
+    return {
+        'period_start': testing_start,
+        'period_end': testing_end,
+        'total_return': period_result.total_return,
+        'sharpe_ratio': period_result.sharpe_ratio,
+        'max_drawdown': period_result.max_drawdown,
+        'win_rate': period_result.win_rate,
+        'total_trades': period_result.total_trades
+    }
+
+
+def _run_walk_forward_window(task: Tuple[Strategy, Dict[str, List[Quote]], datetime, datetime,
+                                         TransactionCosts, Decimal]) -> Dict[str, Any]:
+    """Backtest one walk-forward window in a worker process."""
+    strategy, window_data, testing_start, testing_end, transaction_costs, initial_capital = task
+    
+    backtester = Backtester(transaction_costs, initial_capital)
+    period_result = backtester.run_backtest(strategy, window_data, testing_start, testing_end)
+    
+    return _walk_forward_period_summary(testing_start, testing_end, period_result)
+
+
 class Backtester:
     """
     Comprehensive backtesting engine for strategy validation and optimization.
@@ -105,100 +247,180 @@ class Backtester:
     
     def __init__(self, 
                  transaction_costs: Optional[TransactionCosts] = None,
-                 initial_capital: Decimal = Decimal('100000')):
+                 initial_capital: Decimal = Decimal('100000'),
+                 result_cache: Optional[BacktestResultCache] = None):
         """
         Initialize the backtester.
         
         Args:
             transaction_costs: Transaction cost configuration
             initial_capital: Initial capital for backtesting
+            result_cache: Cache for results of identical backtest requests
         """
         self.transaction_costs = transaction_costs or TransactionCosts()
         self.initial_capital = initial_capital
+        self.result_cache = result_cache
+        self.last_run_cached = False
+        self.last_cache_key: Optional[str] = None
         self.logger = logging.getLogger(__name__)
         self.portfolio_analyzer = PortfolioAnalyzer()
         self.technical_analyzer = TechnicalAnalysis()
         
-        # Backtesting state
+        # Backtesting state. Positions live in a float64 book and are only
+        # materialized as Position objects when read. Cash and trade costs
+        # are integer micro-units and converted to Decimal for snapshots
+        # and trade records.
         self._current_portfolio: Optional[PortfolioSnapshot] = None
-        self._current_positions: Dict[str, Position] = {}
-        self._cash_balance: Decimal = initial_capital
+        self._book = PositionBook()
+        self._cash_micros = to_micros(initial_capital)
+        self._cost_micros = _CostMicros.from_costs(self.transaction_costs)
         self._trades: List[BacktestTrade] = []
         self._portfolio_history: List[PortfolioSnapshot] = []
+        self._last_checkpoint: Optional[BacktestCheckpoint] = None
+        # What get_checkpoint needs to build the checkpoint of the last run
+        # on request: strategy id, start date, final strategy state and data
+        self._checkpoint_source: Optional[Tuple[str, datetime, StrategyState, MarketDataIndex]] = None
+        # Index of the historical data of the current run, and that data
+        self._data_index: Optional[MarketDataIndex] = None
+        self._data_index_source: Optional[Any] = None
     
     def run_backtest(self,
                      strategy: Strategy,
-                     historical_data: Dict[str, List[Quote]],
+                     historical_data: Union[Dict[str, List[Quote]], QuoteFrame],
                      start_date: datetime,
                      end_date: datetime,
-                     rebalance_frequency: str = 'daily') -> BacktestResults:
+                     rebalance_frequency: str = 'daily',
+                     checkpoint: Optional[BacktestCheckpoint] = None) -> BacktestResults:
         """
         Run a comprehensive backtest for a strategy.
         
         Args:
             strategy: Strategy to backtest
-            historical_data: Historical market data by symbol
-            start_date: Backtest start date
+            historical_data: Historical market data by symbol, as quote lists
+                or a columnar QuoteFrame. Strategies receive QuoteFrame
+                history as BarArray views
+            start_date: Backtest start date (ignored when resuming, the
+                checkpoint's start date is used instead)
             end_date: Backtest end date
             rebalance_frequency: How often to rebalance ('daily', 'weekly', 'monthly')
+            checkpoint: Checkpoint from an earlier run to resume from. Only
+                trading dates after the checkpoint's last date are simulated
+                
+        When a result cache is configured, a run with the same strategy
+        class, config and starting state, costs, capital, period and data
+        returns the stored results and restores the strategy state they
+        ended with.
             
         Returns:
             BacktestResults containing performance metrics and trade history
         """
         try:
+            if checkpoint is not None:
+                start_date = checkpoint.start_date
+            
+            cache_key = None
+            self.last_run_cached = False
+            self.last_cache_key = None
+            if self.result_cache is not None and checkpoint is None:
+                cache_key = self.result_cache.make_key(
+                    type(strategy), strategy.config, self.transaction_costs, self.initial_capital,
+                    start_date, end_date, fingerprint_historical_data(historical_data),
+                    engine=type(self).__name__, rebalance_frequency=rebalance_frequency,
+                    strategy_state=strategy_state_key(strategy.state)
+                )
+                self.last_cache_key = cache_key
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    results, self._last_checkpoint = cached
+                    self._checkpoint_source = None
+                    self.last_run_cached = True
+                    if self._last_checkpoint is not None:
+                        strategy.state = copy.deepcopy(self._last_checkpoint.strategy_state)
+                    self.logger.info(f"Using cached backtest results for strategy {strategy.strategy_id}")
+                    return results
+            
             self.logger.info(f"Starting backtest for strategy {strategy.strategy_id}")
             self.logger.info(f"Period: {start_date} to {end_date}")
             self.logger.info(f"Initial capital: ${self.initial_capital}")
             
-            # Reset backtesting state
-            self._reset_state()
-            
             # Validate inputs
             self._validate_backtest_inputs(historical_data, start_date, end_date)
             
+            # Index market data by date once so per-day lookups are O(symbols)
+            data_index = MarketDataIndex(historical_data)
+            self._data_index, self._data_index_source = data_index, historical_data
+            self._cost_micros = _CostMicros.from_costs(self.transaction_costs)
+            
             # Get all trading dates
-            trading_dates = self._get_trading_dates(historical_data, start_date, end_date)
+            trading_dates = data_index.trading_dates(start_date, end_date)
             
             if not trading_dates:
                 raise ValueError("No trading dates found in the specified period")
             
-            # Run simulation
-            for i, current_date in enumerate(trading_dates):
-                # Get market data for current date
-                market_data = self._get_market_data_for_date(historical_data, current_date)
-                
-                if not market_data:
-                    continue
-                
-                # Get historical data up to current date for strategy analysis
-                historical_subset = self._get_historical_subset(
-                    historical_data, trading_dates[:i+1]
-                )
-                
-                # Update portfolio with current market prices
-                self._update_portfolio_values(market_data, current_date)
-                
-                # Generate signals
-                signals = strategy.generate_signals(
-                    market_data, self._current_portfolio, historical_subset
-                )
-                
-                # Execute trades based on signals
-                for signal in signals:
-                    if strategy.validate_signal(signal):
-                        self._execute_signal(signal, market_data[signal.symbol], current_date)
-                
-                # Update strategy state
-                strategy.update_state(market_data, self._current_portfolio)
-                
-                # Record portfolio snapshot
-                self._record_portfolio_snapshot(current_date)
+            # The simulation overwrites the state an earlier checkpoint is built from
+            self._last_checkpoint = None
+            self._checkpoint_source = None
+            
+            if checkpoint is None:
+                # Reset backtesting state
+                self._reset_state()
+            else:
+                # Restore state and skip the days already simulated
+                self._restore_checkpoint(checkpoint, strategy, data_index, end_date)
+                self.logger.info(f"Resuming from checkpoint at {checkpoint.last_date}")
+                trading_dates = [d for d in trading_dates if d > checkpoint.last_date]
+            
+            # Strategy windows move forward a bar every day, so they would never
+            # hit the shared indicator cache and would only churn its entries
+            use_shared_cache = strategy.use_shared_indicator_cache
+            strategy.use_shared_indicator_cache = False
+            try:
+                # Run simulation
+                for current_date in trading_dates:
+                    # Get market data for current date
+                    market_data = data_index.market_data_for_date(current_date)
+                    
+                    if not market_data:
+                        continue
+                    
+                    # Get zero-copy views of history up to current date for strategy analysis
+                    historical_subset = data_index.history_up_to(current_date)
+                    
+                    # Update portfolio with current market prices
+                    self._update_portfolio_values(market_data, current_date)
+                    
+                    # Generate signals
+                    signals = strategy.generate_signals(
+                        market_data, self._current_portfolio, historical_subset
+                    )
+                    
+                    # Execute trades based on signals
+                    for signal in signals:
+                        if strategy.validate_signal(signal):
+                            self._execute_signal(signal, market_data[signal.symbol], current_date)
+                    
+                    # Update strategy state
+                    strategy.update_state(market_data, self._current_portfolio)
+                    
+                    # Record portfolio snapshot
+                    self._record_portfolio_snapshot(current_date)
+            finally:
+                strategy.use_shared_indicator_cache = use_shared_cache
+            
+            # Keep what a checkpoint of the end-of-run state needs; copying the
+            # whole state is left to get_checkpoint, as most runs never resume
+            self._checkpoint_source = (
+                strategy.strategy_id, start_date, copy.deepcopy(strategy.state), data_index
+            )
             
             # Calculate final results
             results = self._calculate_backtest_results(
                 strategy.strategy_id, start_date, end_date
             )
             
+            if cache_key is not None:
+                self.result_cache.put(cache_key, (results, self.get_checkpoint()))
+            
             self.logger.info(f"Backtest completed. Total return: {results.total_return:.2%}")
             self.logger.info(f"Sharpe ratio: {results.sharpe_ratio:.2f}")
             self.logger.info(f"Max drawdown: {results.max_drawdown:.2%}")
@@ -211,12 +433,14 @@ class Backtester:
     
     def run_walk_forward_analysis(self,
                                   strategy: Strategy,
-                                  historical_data: Dict[str, List[Quote]],
+                                  historical_data: Union[Dict[str, List[Quote]], QuoteFrame],
                                   start_date: datetime,
                                   end_date: datetime,
                                   training_period_months: int = 12,
                                   testing_period_months: int = 3,
-                                  step_months: int = 1) -> Dict[str, Any]:
+                                  step_months: int = 1,
+                                  parallel: bool = False,
+                                  max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Run walk-forward analysis to test strategy robustness.
         
@@ -228,6 +452,10 @@ class Backtester:
             training_period_months: Months of data for training
             testing_period_months: Months of data for testing
             step_months: Step size in months
+            parallel: Run windows on a process pool. Each worker receives a fresh
+                copy of the strategy and only the history from its training start
+                to its testing end, so strategy lookbacks must fit in the training period
+            max_workers: Worker processes for parallel mode (defaults to CPU count)
             
         Returns:
             Dictionary containing walk-forward analysis results
@@ -235,39 +463,22 @@ class Backtester:
         try:
             self.logger.info("Starting walk-forward analysis")
             
-            results = []
-            current_start = start_date
+            windows = self._get_walk_forward_windows(
+                start_date, end_date, training_period_months, testing_period_months, step_months
+            )
             
-            while current_start < end_date:
-                # Define training period
-                training_end = current_start + timedelta(days=training_period_months * 30)
-                
-                # Define testing period
-                testing_start = training_end
-                testing_end = testing_start + timedelta(days=testing_period_months * 30)
-                
-                if testing_end > end_date:
-                    break
-                
-                self.logger.info(f"Walk-forward period: {testing_start} to {testing_end}")
-                
-                # Run backtest for this period
-                period_result = self.run_backtest(
-                    strategy, historical_data, testing_start, testing_end
-                )
-                
-                results.append({
-                    'period_start': testing_start,
-                    'period_end': testing_end,
-                    'total_return': period_result.total_return,
-                    'sharpe_ratio': period_result.sharpe_ratio,
-                    'max_drawdown': period_result.max_drawdown,
-                    'win_rate': period_result.win_rate,
-                    'total_trades': period_result.total_trades
-                })
-                
-                # Move to next period
-                current_start += timedelta(days=step_months * 30)
+            if parallel and windows:
+                results = self._run_parallel_walk_forward(strategy, historical_data, windows, max_workers)
+            else:
+                results = []
+                for _, testing_start, testing_end in windows:
+                    self.logger.info(f"Walk-forward period: {testing_start} to {testing_end}")
+                    
+                    # Run backtest for this period
+                    period_result = self.run_backtest(
+                        strategy, historical_data, testing_start, testing_end
+                    )
+                    results.append(_walk_forward_period_summary(testing_start, testing_end, period_result))
             
             # Calculate aggregate statistics
             if results:
@@ -294,7 +505,8 @@ class Backtester:
                 'parameters': {
                     'training_period_months': training_period_months,
                     'testing_period_months': testing_period_months,
-                    'step_months': step_months
+                    'step_months': step_months,
+                    'parallel': parallel
                 }
             }
             
@@ -302,13 +514,76 @@ class Backtester:
             self.logger.error(f"Walk-forward analysis failed: {e}")
             raise
     
+    def _get_walk_forward_windows(self,
+                                  start_date: datetime,
+                                  end_date: datetime,
+                                  training_period_months: int,
+                                  testing_period_months: int,
+                                  step_months: int) -> List[Tuple[datetime, datetime, datetime]]:
+        """Get (training start, testing start, testing end) for each walk-forward window."""
+        windows = []
+        current_start = start_date
+        
+        while current_start < end_date:
+            # Define training period
+            training_end = current_start + timedelta(days=training_period_months * 30)
+            
+            # Define testing period
+            testing_start = training_end
+            testing_end = testing_start + timedelta(days=testing_period_months * 30)
+            
+            if testing_end > end_date:
+                break
+            
+            windows.append((current_start, testing_start, testing_end))
+            
+            # Move to next period
+            current_start += timedelta(days=step_months * 30)
+        
+        return windows
+    
+    def _run_parallel_walk_forward(self,
+                                   strategy: Strategy,
+                                   historical_data: Union[Dict[str, List[Quote]], QuoteFrame],
+                                   windows: List[Tuple[datetime, datetime, datetime]],
+                                   max_workers: Optional[int]) -> List[Dict[str, Any]]:
+        """Run walk-forward windows on a process pool, returning results in window order."""
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(windows)))
+        self.logger.info(f"Running {len(windows)} walk-forward windows on {workers} processes")
+        
+        tasks = []
+        for training_start, testing_start, testing_end in windows:
+            window_data = {}
+            for symbol, quotes in historical_data.items():
+                if isinstance(quotes, BarArray):
+                    window_quotes = quotes.between(training_start, testing_end)
+                else:
+                    window_quotes = [
+                        q for q in quotes
+                        if training_start.date() <= q.timestamp.date() <= testing_end.date()
+                    ]
+                if len(window_quotes):
+                    window_data[symbol] = window_quotes
+            
+            tasks.append((
+                strategy, window_data, testing_start, testing_end,
+                self.transaction_costs, self.initial_capital
+            ))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, keeping results deterministic
+            return list(executor.map(_run_walk_forward_window, tasks))
+    
     def run_monte_carlo_simulation(self,
                                    strategy: Strategy,
                                    historical_data: Dict[str, List[Quote]],
                                    start_date: datetime,
                                    end_date: datetime,
                                    num_simulations: int = 1000,
-                                   confidence_levels: List[float] = [0.05, 0.95]) -> Dict[str, Any]:
+                                   confidence_levels: List[float] = [0.05, 0.95],
+                                   execution_mode: str = 'thread',
+                                   max_workers: Optional[int] = None,
+                                   random_seed: Optional[int] = None) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation to assess strategy performance distribution.
         
@@ -319,6 +594,11 @@ class Backtester:
             end_date: Simulation end date
             num_simulations: Number of Monte Carlo runs
             confidence_levels: Confidence levels for VaR calculation
+            execution_mode: 'thread' to run pre-generated datasets on a thread pool, or
+                'process' to run on a process pool where each worker draws its own
+                seeded bootstrap sample from a shared-memory copy of the history
+            max_workers: Pool size (defaults to 4 threads, or one process per CPU)
+            random_seed: Base seed for reproducible samples in 'process' mode
             
         Returns:
             Dictionary containing Monte Carlo simulation results
@@ -326,74 +606,34 @@ class Backtester:
         try:
             self.logger.info(f"Starting Monte Carlo simulation with {num_simulations} runs")
             
-            # Prepare randomized data sets
-            randomized_datasets = self._generate_randomized_datasets(
-                historical_data, num_simulations
-            )
-            
-            # Run simulations in parallel
-            simulation_results = []
-            
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-                
-                for i, dataset in enumerate(randomized_datasets):
-                    future = executor.submit(
-                        self._run_single_simulation,
-                        copy.deepcopy(strategy),
-                        dataset,
-                        start_date,
-                        end_date,
-                        i
-                    )
-                    futures.append(future)
-                
-                # Collect results
-                for future in as_completed(futures):
-                    try:
-                        result = future.result()
-                        simulation_results.append(result)
-                    except Exception as e:
-                        self.logger.warning(f"Simulation failed: {e}")
+            if execution_mode == 'process':
+                simulation_results = run_process_pool_simulations(
+                    strategy,
+                    historical_data,
+                    start_date,
+                    end_date,
+                    num_simulations,
+                    (self.transaction_costs, self.initial_capital),
+                    max_workers=max_workers,
+                    random_seed=random_seed
+                )
+            elif execution_mode == 'thread':
+                simulation_results = self._run_threaded_simulations(
+                    strategy, historical_data, start_date, end_date,
+                    num_simulations, max_workers or 4
+                )
+            else:
+                raise ValueError(f"Unsupported Monte Carlo execution mode: {execution_mode}")
             
             if not simulation_results:
                 raise ValueError("All Monte Carlo simulations failed")
             
-            # Analyze results
-            returns = [r.total_return for r in simulation_results]
-            sharpe_ratios = [r.sharpe_ratio for r in simulation_results if r.sharpe_ratio is not None]
-            drawdowns = [r.max_drawdown for r in simulation_results]
-            
-            # Calculate statistics
-            statistics = {
-                'simulations_completed': len(simulation_results),
-                'mean_return': np.mean(returns),
-                'median_return': np.median(returns),
-                'std_return': np.std(returns),
-                'min_return': np.min(returns),
-                'max_return': np.max(returns),
-                'mean_sharpe': np.mean(sharpe_ratios) if sharpe_ratios else 0,
-                'mean_drawdown': np.mean(drawdowns),
-                'worst_drawdown': np.max(drawdowns) if drawdowns else 0,
-                'positive_returns_pct': sum(1 for r in returns if r > 0) / len(returns) * 100
-            }
-            
-            # Calculate Value at Risk (VaR) and Conditional VaR
-            var_results = {}
-            for confidence_level in confidence_levels:
-                percentile = confidence_level * 100
-                var_value = np.percentile(returns, percentile)
-                
-                # Conditional VaR (Expected Shortfall)
-                if confidence_level < 0.5:
-                    cvar_returns = [r for r in returns if r <= var_value]
-                else:
-                    cvar_returns = [r for r in returns if r >= var_value]
-                
-                cvar_value = np.mean(cvar_returns) if cvar_returns else var_value
-                
-                var_results[f'var_{int(percentile)}'] = var_value
-                var_results[f'cvar_{int(percentile)}'] = cvar_value
+            statistics, var_results = self._summarize_simulations(
+                [r.total_return for r in simulation_results],
+                [r.sharpe_ratio for r in simulation_results if r.sharpe_ratio is not None],
+                [r.max_drawdown for r in simulation_results],
+                confidence_levels
+            )
             
             return {
                 'statistics': statistics,
@@ -401,7 +641,8 @@ class Backtester:
                 'simulation_results': simulation_results,
                 'parameters': {
                     'num_simulations': num_simulations,
-                    'confidence_levels': confidence_levels
+                    'confidence_levels': confidence_levels,
+                    'execution_mode': execution_mode
                 }
             }
             
@@ -409,6 +650,189 @@ class Backtester:
             self.logger.error(f"Monte Carlo simulation failed: {e}")
             raise
     
+    def run_vectorized_monte_carlo(self,
+                                   historical_data: Dict[str, List[Quote]],
+                                   start_date: datetime,
+                                   end_date: datetime,
+                                   weights: Optional[Dict[str, float]] = None,
+                                   num_paths: int = 10000,
+                                   horizon: Optional[int] = None,
+                                   method: str = 'stationary_bootstrap',
+                                   block_size: int = 20,
+                                   degrees_of_freedom: float = 5.0,
+                                   rebalance: bool = False,
+                                   confidence_levels: List[float] = [0.05, 0.95],
+                                   batch_size: int = 10000,
+                                   random_seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run a path-level Monte Carlo simulation on log-return matrices.
+        
+        Unlike run_monte_carlo_simulation, which resamples quotes and replays a
+        strategy, this simulates whole price paths for a fixed-weight portfolio
+        with NumPy and evaluates all paths in batch. Transaction costs are not
+        modeled. The statistics and VaR/CVaR summary have the same shape as
+        run_monte_carlo_simulation.
+        
+        Args:
+            historical_data: Historical market data used to fit the return model
+            start_date: Start of the fitting window
+            end_date: End of the fitting window
+            weights: Portfolio weights by symbol (defaults to equal weights)
+            num_paths: Number of simulated paths
+            horizon: Periods per path (defaults to the length of the fitting window)
+            method: 'block_bootstrap', 'stationary_bootstrap', 'gbm' or 'student_t'
+            block_size: Block length (fixed) or mean block length (stationary)
+            degrees_of_freedom: Degrees of freedom for Student-t paths
+            rebalance: Rebalance to target weights every period instead of buy-and-hold
+            confidence_levels: Confidence levels for VaR calculation
+            batch_size: Paths generated per batch, bounding peak memory
+            random_seed: Seed for reproducible paths
+            
+        Returns:
+            Dictionary containing Monte Carlo simulation results
+        """
+        try:
+            self.logger.info(f"Starting vectorized Monte Carlo simulation with {num_paths} paths")
+            
+            self._validate_backtest_inputs(historical_data, start_date, end_date)
+            symbols, log_returns = build_log_return_matrix(historical_data, start_date, end_date)
+            horizon = horizon or log_returns.shape[0]
+            
+            if weights is None:
+                weight_vector = np.full(len(symbols), 1.0 / len(symbols))
+            else:
+                weight_vector = np.array([float(weights.get(symbol, 0.0)) for symbol in symbols])
+                if weight_vector.sum() <= 0:
+                    raise ValueError("Portfolio weights must sum to a positive value")
+                weight_vector = weight_vector / weight_vector.sum()
+            
+            rng = np.random.default_rng(random_seed)
+            batches = []
+            for batch_start in range(0, num_paths, batch_size):
+                paths = generate_return_paths(
+                    log_returns,
+                    min(batch_size, num_paths - batch_start),
+                    horizon,
+                    method=method,
+                    block_size=block_size,
+                    degrees_of_freedom=degrees_of_freedom,
+                    rng=rng
+                )
+                batches.append(evaluate_portfolio_paths(
+                    paths, weight_vector, rebalance, self.portfolio_analyzer.risk_free_rate
+                ))
+            
+            path_results = {
+                key: np.concatenate([batch[key] for batch in batches]) for key in batches[0]
+            }
+            
+            statistics, var_results = self._summarize_simulations(
+                path_results['total_return'],
+                path_results['sharpe_ratio'],
+                path_results['max_drawdown'],
+                confidence_levels
+            )
+            
+            return {
+                'statistics': statistics,
+                'var_analysis': var_results,
+                'path_results': path_results,
+                'parameters': {
+                    'num_simulations': num_paths,
+                    'confidence_levels': confidence_levels,
+                    'method': method,
+                    'horizon': horizon,
+                    'weights': dict(zip(symbols, weight_vector.tolist())),
+                    'rebalance': rebalance
+                }
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Vectorized Monte Carlo simulation failed: {e}")
+            raise
+    
+    def _run_threaded_simulations(self,
+                                  strategy: Strategy,
+                                  historical_data: Dict[str, List[Quote]],
+                                  start_date: datetime,
+                                  end_date: datetime,
+                                  num_simulations: int,
+                                  max_workers: int) -> List[BacktestResults]:
+        """Run Monte Carlo simulations on pre-generated datasets using a thread pool."""
+        # Prepare randomized data sets
+        randomized_datasets = self._generate_randomized_datasets(
+            historical_data, num_simulations
+        )
+        
+        # Run simulations in parallel
+        simulation_results = []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            
+            for i, dataset in enumerate(randomized_datasets):
+                future = executor.submit(
+                    self._run_single_simulation,
+                    copy.deepcopy(strategy),
+                    dataset,
+                    start_date,
+                    end_date,
+                    i
+                )
+                futures.append(future)
+            
+            # Collect results
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    simulation_results.append(result)
+                except Exception as e:
+                    self.logger.warning(f"Simulation failed: {e}")
+        
+        return simulation_results
+    
+    def _summarize_simulations(self,
+                               returns: Sequence[float],
+                               sharpe_ratios: Sequence[float],
+                               drawdowns: Sequence[float],
+                               confidence_levels: List[float]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Calculate distribution statistics and VaR/CVaR for simulated outcomes."""
+        returns = np.asarray(returns, dtype=float)
+        sharpe_ratios = np.asarray(sharpe_ratios, dtype=float)
+        drawdowns = np.asarray(drawdowns, dtype=float)
+        
+        statistics = {
+            'simulations_completed': len(returns),
+            'mean_return': np.mean(returns),
+            'median_return': np.median(returns),
+            'std_return': np.std(returns),
+            'min_return': np.min(returns),
+            'max_return': np.max(returns),
+            'mean_sharpe': np.mean(sharpe_ratios) if len(sharpe_ratios) else 0,
+            'mean_drawdown': np.mean(drawdowns),
+            'worst_drawdown': np.max(drawdowns) if len(drawdowns) else 0,
+            'positive_returns_pct': np.count_nonzero(returns > 0) / len(returns) * 100
+        }
+        
+        # Calculate Value at Risk (VaR) and Conditional VaR
+        var_results = {}
+        for confidence_level in confidence_levels:
+            percentile = confidence_level * 100
+            var_value = np.percentile(returns, percentile)
+            
+            # Conditional VaR (Expected Shortfall)
+            if confidence_level < 0.5:
+                cvar_returns = returns[returns <= var_value]
+            else:
+                cvar_returns = returns[returns >= var_value]
+            
+            cvar_value = np.mean(cvar_returns) if len(cvar_returns) else var_value
+            
+            var_results[f'var_{int(percentile)}'] = var_value
+            var_results[f'cvar_{int(percentile)}'] = cvar_value
+        
+        return statistics, var_results
+    
     def _reset_state(self) -> None:
         """Reset backtesting state for a new run."""
         self._current_positions = {}
@@ -424,8 +848,77 @@ class Backtester:
             positions=[]
         )
     
+    def get_checkpoint(self) -> Optional[BacktestCheckpoint]:
+        """
+        Get the checkpoint of the state at the end of the last backtest run.
+        
+        The checkpoint is built on the first call after a run.
+        
+        Returns:
+            BacktestCheckpoint, or None if no backtest has completed
+        """
+        if self._last_checkpoint is None and self._checkpoint_source is not None:
+            self._last_checkpoint = self._create_checkpoint(*self._checkpoint_source)
+            self._checkpoint_source = None
+        return self._last_checkpoint
+    
+    def _create_checkpoint(self,
+                           strategy_id: str,
+                           start_date: datetime,
+                           strategy_state: StrategyState,
+                           data_index: MarketDataIndex) -> Optional[BacktestCheckpoint]:
+        """Capture backtester and strategy state after the last simulated day."""
+        if not self._portfolio_history:
+            return None
+        
+        last_date = self._portfolio_history[-1].timestamp
+        
+        # Deep copies keep the checkpoint independent of later runs
+        return BacktestCheckpoint(
+            strategy_id=strategy_id,
+            start_date=start_date,
+            last_date=last_date,
+            initial_capital=self.initial_capital,
+            transaction_costs=copy.deepcopy(self.transaction_costs),
+            cash_balance=self._cash_balance,
+            positions=copy.deepcopy(self._current_positions),
+            current_portfolio=copy.deepcopy(self._current_portfolio),
+            trades=copy.deepcopy(self._trades),
+            portfolio_history=copy.deepcopy(self._portfolio_history),
+            strategy_state=strategy_state,
+            data_fingerprint=_history_fingerprint(data_index, last_date)
+        )
+    
+    def _restore_checkpoint(self,
+                            checkpoint: BacktestCheckpoint,
+                            strategy: Strategy,
+                            data_index: MarketDataIndex,
+                            end_date: datetime) -> None:
+        """Validate a checkpoint against this run and restore its state."""
+        if checkpoint.strategy_id != strategy.strategy_id:
+            raise ValueError(
+                f"Checkpoint is for strategy {checkpoint.strategy_id}, not {strategy.strategy_id}"
+            )
+        
+        if (checkpoint.initial_capital != self.initial_capital
+                or checkpoint.transaction_costs != self.transaction_costs):
+            raise ValueError("Checkpoint was created with different capital or transaction costs")
+        
+        if end_date.date() < checkpoint.last_date.date():
+            raise ValueError("End date must not be before the checkpoint's last date")
+        
+        if _history_fingerprint(data_index, checkpoint.last_date) != checkpoint.data_fingerprint:
+            raise ValueError("Historical data up to the checkpoint date has changed")
+        
+        self._cash_balance = checkpoint.cash_balance
+        self._current_positions = copy.deepcopy(checkpoint.positions)
+        self._current_portfolio = copy.deepcopy(checkpoint.current_portfolio)
+        self._trades = copy.deepcopy(checkpoint.trades)
+        self._portfolio_history = copy.deepcopy(checkpoint.portfolio_history)
+        strategy.state = copy.deepcopy(checkpoint.strategy_state)
+    
     def _validate_backtest_inputs(self,
-                                  historical_data: Dict[str, List[Quote]],
+                                  historical_data: Union[Dict[str, List[Quote]], QuoteFrame],
                                   start_date: datetime,
                                   end_date: datetime) -> None:
         """Validate backtest inputs."""
@@ -440,13 +933,16 @@ class Backtester:
         
         # Check data availability
         for symbol, quotes in historical_data.items():
-            if not quotes:
+            if not len(quotes):
                 raise ValueError(f"No quotes available for symbol {symbol}")
             
             # Check date range coverage
-            quote_dates = [q.timestamp.date() for q in quotes]
-            min_date = min(quote_dates)
-            max_date = max(quote_dates)
+            if isinstance(quotes, BarArray):
+                min_date, max_date = quotes.date_range()
+            else:
+                quote_dates = [q.timestamp.date() for q in quotes]
+                min_date = min(quote_dates)
+                max_date = max(quote_dates)
             
             if start_date.date() < min_date or end_date.date() > max_date:
                 self.logger.warning(
@@ -459,102 +955,72 @@ class Backtester:
                            start_date: datetime,
                            end_date: datetime) -> List[datetime]:
         """Get sorted list of trading dates from historical data."""
-        all_dates = set()
-        
-        for quotes in historical_data.values():
-            for quote in quotes:
-                quote_date = quote.timestamp.date()
-                if start_date.date() <= quote_date <= end_date.date():
-                    all_dates.add(quote.timestamp.replace(hour=16, minute=0, second=0, microsecond=0))
-        
-        return sorted(list(all_dates))
+        return self._get_data_index(historical_data).trading_dates(start_date, end_date)
     
     def _get_market_data_for_date(self,
                                   historical_data: Dict[str, List[Quote]],
                                   target_date: datetime) -> Dict[str, Quote]:
         """Get market data for a specific date."""
-        market_data = {}
-        target_date_only = target_date.date()
-        
-        for symbol, quotes in historical_data.items():
-            # Find quote for the target date
-            for quote in quotes:
-                if quote.timestamp.date() == target_date_only:
-                    market_data[symbol] = quote
-                    break
-        
-        return market_data
+        return self._get_data_index(historical_data).market_data_for_date(target_date)
     
     def _get_historical_subset(self,
                                historical_data: Dict[str, List[Quote]],
-                               dates_up_to: List[datetime]) -> Dict[str, List[Quote]]:
+                               dates_up_to: List[datetime]) -> Dict[str, Sequence[Quote]]:
         """Get historical data subset up to specified dates."""
-        subset = {}
-        max_date = max(dates_up_to).date() if dates_up_to else None
-        
-        if max_date is None:
-            return subset
+        if not dates_up_to:
+            return {}
         
-        for symbol, quotes in historical_data.items():
-            subset[symbol] = [
-                quote for quote in quotes
-                if quote.timestamp.date() <= max_date
-            ]
-        
-        return subset
+        return self._get_data_index(historical_data).history_up_to(max(dates_up_to))
+    
+    def _get_data_index(self, historical_data: Union[Dict[str, List[Quote]], QuoteFrame]) -> MarketDataIndex:
+        """Get the index of historical data, reusing the one built for the same data."""
+        if self._data_index_source is not historical_data:
+            self._data_index = MarketDataIndex(historical_data)
+            self._data_index_source = historical_data
+        return self._data_index
+    
+    @property
+    def _current_positions(self) -> Dict[str, Position]:
+        """Current positions materialized from the position book."""
+        return self._book.to_positions()
+    
+    @_current_positions.setter
+    def _current_positions(self, positions: Dict[str, Position]) -> None:
+        self._book.load_positions(positions.values())
+    
+    @property
+    def _cash_balance(self) -> Decimal:
+        """Cash balance converted from the micro-unit ledger."""
+        return from_micros(self._cash_micros)
+    
+    @_cash_balance.setter
+    def _cash_balance(self, value: Decimal) -> None:
+        self._cash_micros = to_micros(value)
     
     def _update_portfolio_values(self,
                                  market_data: Dict[str, Quote],
                                  current_date: datetime) -> None:
         """Update portfolio values based on current market prices."""
-        total_value = self._cash_balance
-        day_pnl = Decimal('0')
-        
-        updated_positions = []
+        prices = {
+            symbol: float(_quote_price(market_data[symbol]))
+            for symbol in self._book.open_symbols
+            if symbol in market_data
+        }
         
-        for symbol, position in self._current_positions.items():
-            if symbol in market_data:
-                quote = market_data[symbol]
-                current_price = quote.mid_price
-                
-                # Calculate new market value
-                new_market_value = abs(position.quantity) * current_price
-                if position.quantity < 0:  # Short position
-                    new_market_value = -new_market_value
-                
-                # Calculate PnL
-                pnl_change = new_market_value - position.market_value
-                
-                # Update position
-                updated_position = Position(
-                    symbol=symbol,
-                    quantity=position.quantity,
-                    market_value=new_market_value,
-                    cost_basis=position.cost_basis,
-                    unrealized_pnl=new_market_value - position.cost_basis,
-                    day_pnl=pnl_change
-                )
-                
-                updated_positions.append(updated_position)
-                total_value += new_market_value
-                day_pnl += pnl_change
-            else:
-                # Keep existing position if no market data
-                updated_positions.append(position)
-                total_value += position.market_value
+        # Positions without market data keep their last value
+        positions_value, day_pnl = self._book.mark_to_market(prices)
+        cash_balance = self._cash_balance
+        total_value = cash_balance + float_to_decimal(positions_value)
         
         # Update current portfolio
-        self._current_portfolio = PortfolioSnapshot(
+        self._current_portfolio = LazyPortfolioSnapshot(
             timestamp=current_date,
             total_value=total_value,
-            buying_power=self._cash_balance,
-            day_pnl=day_pnl,
+            buying_power=cash_balance,
+            day_pnl=float_to_decimal(day_pnl),
             total_pnl=total_value - self.initial_capital,
-            positions=updated_positions
+            position_arrays=self._book.snapshot()
         )
-        
-        # Update positions dictionary
-        self._current_positions = {pos.symbol: pos for pos in updated_positions}
     
     def _execute_signal(self,
                         signal: StrategySignal,
@@ -572,35 +1038,39 @@ class Backtester:
                     max_position_value = self._cash_balance * Decimal('0.1')  # Max 10% per position
                     signal_factor = Decimal(str(signal.strength))
                     position_value = max_position_value * signal_factor
-                    quantity = int(position_value / quote.mid_price)
+                    quantity = int(position_value / _quote_price(quote))
                 else:
                     quantity = signal.quantity
                 
                 if quantity <= 0:
                     return
                 
+                # Prices and costs in micro-units; bars without bid and ask
+                # fill at the close without a spread
+                bid, ask = (to_micros(price) for price in _quote_bid_ask(quote))
+                
                 # Calculate execution price with slippage
-                execution_price = self._calculate_execution_price(quote, side, quantity)
+                execution_price = self._execution_price_micros(bid, ask, side, quantity)
                 
                 # Calculate transaction costs
-                commission = self._calculate_commission(quantity, execution_price)
-                slippage_cost = self._calculate_slippage_cost(quote, side, quantity)
-                market_impact = self._calculate_market_impact(quantity, execution_price)
+                commission = self._commission_micros(quantity)
+                slippage_cost = self._slippage_cost_micros(ask - bid, quantity)
+                market_impact = self._market_impact_micros(quantity, execution_price)
+                costs = commission + slippage_cost + market_impact
                 
                 # Check if we have sufficient capital
-                total_cost = quantity * execution_price + commission + slippage_cost + market_impact
-                if side == OrderSide.BUY and total_cost > self._cash_balance:
+                total_cost = quantity * execution_price + costs
+                if side == OrderSide.BUY and total_cost > self._cash_micros:
                     # Reduce quantity to fit available capital
-                    available_for_shares = self._cash_balance - commission - slippage_cost - market_impact
-                    quantity = max(1, int(available_for_shares / execution_price))
-                    total_cost = quantity * execution_price + commission + slippage_cost + market_impact
+                    quantity = max(1, (self._cash_micros - costs) // execution_price)
+                    total_cost = quantity * execution_price + costs
                     
-                    if total_cost > self._cash_balance:
+                    if total_cost > self._cash_micros:
                         self.logger.debug(f"Insufficient capital for {signal.symbol} trade")
                         return
                 
                 # Execute the trade
-                self._execute_trade(
+                self._record_trade(
                     symbol=signal.symbol,
                     side=side,
                     quantity=quantity,
@@ -616,37 +1086,54 @@ class Backtester:
         except Exception as e:
             self.logger.error(f"Failed to execute signal for {signal.symbol}: {e}")
     
-    def _calculate_execution_price(self, quote: Quote, side: OrderSide, quantity: int) -> Decimal:
-        """Calculate realistic execution price including slippage."""
-        base_price = quote.ask if side == OrderSide.BUY else quote.bid
-        
-        # Add slippage based on quantity and spread
-        spread = quote.spread
-        slippage_factor = min(Decimal('0.01'), self.transaction_costs.slippage_factor * Decimal(str(quantity / 1000)))
-        slippage = spread * slippage_factor
+    def _execution_price_micros(self, bid: int, ask: int, side: OrderSide, quantity: int) -> int:
+        """Calculate the execution price including slippage, in micro-units."""
+        # Slippage factor is min(1%, slippage_factor * quantity / 1000)
+        numerator, denominator = self._cost_micros.slippage_factor
+        numerator, denominator = numerator * quantity, denominator * 1000
+        if numerator * 100 > denominator:
+            numerator, denominator = 1, 100
+        slippage = scaled_div((ask - bid) * numerator, denominator)
         
         if side == OrderSide.BUY:
-            return base_price + slippage
+            return ask + slippage
         else:
-            return base_price - slippage
+            return bid - slippage
+    
+    def _commission_micros(self, quantity: int) -> int:
+        """Calculate commission costs in micro-units."""
+        costs = self._cost_micros
+        commission = max(mul_ratio(quantity * MICROS_PER_UNIT, costs.commission_per_share),
+                         costs.commission_minimum)
+        return min(commission, costs.commission_maximum)
+    
+    def _slippage_cost_micros(self, spread: int, quantity: int) -> int:
+        """Calculate slippage costs in micro-units."""
+        return mul_ratio(spread * quantity, self._cost_micros.spread_cost_factor)
+    
+    def _market_impact_micros(self, quantity: int, price: int) -> int:
+        """Calculate market impact costs in micro-units."""
+        return mul_ratio(quantity * price, self._cost_micros.market_impact_factor)
+    
+    def _calculate_execution_price(self, quote: Quote, side: OrderSide, quantity: int) -> Decimal:
+        """Calculate realistic execution price including slippage."""
+        bid, ask = _quote_bid_ask(quote)
+        return from_micros(self._execution_price_micros(
+            to_micros(bid), to_micros(ask), side, quantity
+        ))
     
     def _calculate_commission(self, quantity: int, price: Decimal) -> Decimal:
         """Calculate commission costs."""
-        commission = Decimal(str(quantity)) * self.transaction_costs.commission_per_share
-        commission = max(commission, self.transaction_costs.commission_minimum)
-        commission = min(commission, self.transaction_costs.commission_maximum)
-        return commission
+        return from_micros(self._commission_micros(quantity))
     
     def _calculate_slippage_cost(self, quote: Quote, side: OrderSide, quantity: int) -> Decimal:
         """Calculate slippage costs."""
-        spread = quote.spread
-        slippage_cost = spread * self.transaction_costs.spread_cost_factor
-        return slippage_cost * Decimal(str(quantity))
+        bid, ask = _quote_bid_ask(quote)
+        return from_micros(self._slippage_cost_micros(to_micros(ask - bid), quantity))
     
     def _calculate_market_impact(self, quantity: int, price: Decimal) -> Decimal:
         """Calculate market impact costs."""
-        trade_value = Decimal(str(quantity)) * price
-        return trade_value * self.transaction_costs.market_impact_factor
+        return from_micros(self._market_impact_micros(quantity, to_micros(price)))
     
     def _execute_trade(self,
                        symbol: str,
@@ -660,91 +1147,75 @@ class Backtester:
                        strategy_id: str,
                        signal_strength: float) -> None:
         """Execute a trade and update portfolio state."""
+        self._record_trade(
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            price=to_micros(price),
+            commission=to_micros(commission),
+            slippage=to_micros(slippage),
+            market_impact=to_micros(market_impact),
+            timestamp=timestamp,
+            strategy_id=strategy_id,
+            signal_strength=signal_strength
+        )
+    
+    def _record_trade(self,
+                      symbol: str,
+                      side: OrderSide,
+                      quantity: int,
+                      price: int,
+                      commission: int,
+                      slippage: int,
+                      market_impact: int,
+                      timestamp: datetime,
+                      strategy_id: str,
+                      signal_strength: float) -> None:
+        """Record a trade given in micro-units and update portfolio state."""
+        # Reject oversells before the trade list or cash change
+        if side == OrderSide.SELL:
+            held = self._book.quantity_of(symbol)
+            if quantity > held:
+                raise ValueError(f"Short positions are not supported: {symbol} quantity {held - quantity}")
+        
         # Create trade record
         trade = BacktestTrade(
             timestamp=timestamp,
             symbol=symbol,
             side=side,
             quantity=quantity,
-            price=price,
-            commission=commission,
-            slippage=slippage,
-            market_impact=market_impact,
+            price=from_micros(price),
+            commission=from_micros(commission),
+            slippage=from_micros(slippage),
+            market_impact=from_micros(market_impact),
             strategy_id=strategy_id,
             signal_strength=signal_strength
         )
         
         self._trades.append(trade)
         
-        # Update cash balance
+        # Update cash balance with the trade's net amount
+        costs = commission + slippage + market_impact
         if side == OrderSide.BUY:
-            self._cash_balance -= trade.net_amount
+            self._cash_micros -= quantity * price + costs
         else:
-            self._cash_balance += trade.net_amount
+            self._cash_micros += quantity * price - costs
         
         # Update positions
-        if symbol in self._current_positions:
-            existing_position = self._current_positions[symbol]
-            
-            if side == OrderSide.BUY:
-                new_quantity = existing_position.quantity + quantity
-                new_cost_basis = existing_position.cost_basis + (price * quantity)
-            else:
-                new_quantity = existing_position.quantity - quantity
-                # For sells, we don't change cost basis of remaining shares
-                new_cost_basis = existing_position.cost_basis
-                if new_quantity == 0:
-                    new_cost_basis = Decimal('0')
-            
-            if new_quantity == 0:
-                # Position closed
-                del self._current_positions[symbol]
-            else:
-                # Update existing position
-                new_market_value = abs(new_quantity) * price
-                if new_quantity < 0:
-                    new_market_value = -new_market_value
-                
-                self._current_positions[symbol] = Position(
-                    symbol=symbol,
-                    quantity=new_quantity,
-                    market_value=new_market_value,
-                    cost_basis=new_cost_basis,
-                    unrealized_pnl=new_market_value - new_cost_basis,
-                    day_pnl=Decimal('0')
-                )
-        else:
-            # New position
-            if side == OrderSide.BUY:
-                new_quantity = quantity
-                new_cost_basis = price * quantity
-            else:
-                new_quantity = -quantity
-                new_cost_basis = -(price * quantity)
-            
-            new_market_value = abs(new_quantity) * price
-            if new_quantity < 0:
-                new_market_value = -new_market_value
-            
-            self._current_positions[symbol] = Position(
-                symbol=symbol,
-                quantity=new_quantity,
-                market_value=new_market_value,
-                cost_basis=new_cost_basis,
-                unrealized_pnl=new_market_value - new_cost_basis,
-                day_pnl=Decimal('0')
-            )
+        self._book.apply_fill(
+            symbol, 1 if side == OrderSide.BUY else -1, quantity, price / MICROS_PER_UNIT
+        )
     
     def _record_portfolio_snapshot(self, timestamp: datetime) -> None:
         """Record current portfolio state."""
         if self._current_portfolio:
-            snapshot = PortfolioSnapshot(
+            snapshot = LazyPortfolioSnapshot(
                 timestamp=timestamp,
                 total_value=self._current_portfolio.total_value,
                 buying_power=self._cash_balance,
                 day_pnl=self._current_portfolio.day_pnl,
                 total_pnl=self._current_portfolio.total_pnl,
-                positions=list(self._current_positions.values())
+                position_arrays=self._book.snapshot()
             )
             self._portfolio_history.append(snapshot)
     
@@ -836,7 +1307,7 @@ class Backtester:
             
             for symbol, quotes in historical_data.items():
                 if len(quotes) < 2:
-                    randomized_data[symbol] = quotes.copy()
+                    randomized_data[symbol] = list(quotes)
                     continue
                 
                 # Bootstrap sampling with replacement
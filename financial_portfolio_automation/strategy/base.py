@@ -10,10 +10,16 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, List, Optional, Sequence, Union
 import logging
 
+import numpy as np
+
+from .signal_matrix import signals_to_positions
+from ..analysis.shared_indicator_cache import compute_indicator, get_shared_indicator_cache
+from ..analysis.vectorized_indicators import to_optional_list
 from ..models.core import Quote, Position, PortfolioSnapshot
+from ..models.quote_frame import BarArray
 from ..models.config import StrategyConfig, RiskLimits
 
 
@@ -127,6 +133,13 @@ class Strategy(ABC):
         self.state = StrategyState(strategy_id=config.strategy_id)
         self.logger = logging.getLogger(f"{__name__}.{config.strategy_id}")
         
+        # Optional cache of indicator matrices shared across backtests (see IndicatorCache)
+        self.indicator_cache = None
+        
+        # Whether shared_indicator reuses series through the process-wide
+        # SharedIndicatorCache; backtests turn this off while they run
+        self.use_shared_indicator_cache = True
+        
         # Validate configuration
         config.validate()
         
@@ -172,7 +185,7 @@ class Strategy(ABC):
         self,
         market_data: Dict[str, Quote],
         portfolio: PortfolioSnapshot,
-        historical_data: Optional[Dict[str, List[Quote]]] = None
+        historical_data: Optional[Dict[str, Sequence[Quote]]] = None
     ) -> List[StrategySignal]:
         """
         Generate trading signals based on market data and portfolio state.
@@ -202,6 +215,135 @@ class Strategy(ABC):
         """
         pass
     
+    def generate_signal_matrix(self, closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        """
+        Generate signal strengths for every date and symbol at once.
+        
+        Optional array API used by the vectorized backtester. Row ``t`` may only
+        use data up to and including row ``t``.
+        
+        Args:
+            closes: Close prices with shape (dates, symbols), NaN where missing
+            volumes: Volumes with the same shape, NaN where missing
+            
+        Returns:
+            Matrix of the same shape: positive buy strengths, negative sell
+            strengths and 0 for hold
+        """
+        raise NotImplementedError(
+            f"Strategy {self.strategy_id} does not implement the signal-matrix API"
+        )
+    
+    def generate_position_matrix(
+        self,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        capital: float,
+        start_index: int = 0
+    ) -> np.ndarray:
+        """
+        Generate target positions in shares for every date and symbol at once.
+        
+        The default implementation converts ``generate_signal_matrix`` output
+        into long-only positions sized at ``position_fraction`` (default 0.1)
+        of capital scaled by signal strength, ignoring signals weaker than
+        ``min_signal_strength``.
+        
+        Args:
+            closes: Close prices with shape (dates, symbols), NaN where missing
+            volumes: Volumes with the same shape, NaN where missing
+            capital: Capital available to the strategy
+            start_index: First row on which the strategy may trade
+            
+        Returns:
+            Target positions with shape (dates, symbols)
+        """
+        signals = self.generate_signal_matrix(closes, volumes)
+        return signals_to_positions(
+            signals,
+            closes,
+            capital,
+            position_fraction=self.config.parameters.get('position_fraction', 0.1),
+            min_strength=self.config.parameters.get('min_signal_strength', 0.5),
+            start_index=start_index
+        )
+    
+    def cached_indicator(self, indicator: str, period: Any, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Compute an indicator matrix, reusing the shared indicator cache if set.
+        
+        Args:
+            indicator: Indicator name
+            period: Period or other hashable parameters the series depends on
+            compute: Callable returning the indicator matrix
+            
+        Returns:
+            Indicator matrix with symbols on the last axis
+        """
+        if self.indicator_cache is None:
+            return compute()
+        return self.indicator_cache.get_or_compute(indicator, period, compute)
+    
+    def shared_indicator(self,
+                         symbol: str,
+                         indicator: str,
+                         quotes: Sequence[Quote],
+                         prices: Optional[List[float]] = None,
+                         **params: Any) -> Union[List[Optional[float]], Dict[str, List[Optional[float]]]]:
+        """
+        Compute an indicator over quotes, reusing series other callers computed for the same bars.
+        
+        The series is computed directly, without caching, while
+        use_shared_indicator_cache is False.
+        
+        Args:
+            symbol: Symbol of the quotes
+            indicator: Indicator name supported by SharedIndicatorCache
+            quotes: Quotes (bars) to compute over, oldest first
+            prices: Closing prices of the quotes, if already extracted
+            **params: Indicator parameters (e.g. period=14)
+            
+        Returns:
+            Indicator values (None for insufficient data points), or a dictionary
+            of them for indicators with several lines
+        """
+        extra = {}
+        if isinstance(quotes, BarArray):
+            # Columnar history is read without building Quote objects
+            timestamps = quotes.timestamps
+            if prices is None:
+                prices = quotes.close
+            if indicator in ('stochastic', 'atr'):
+                extra['highs'] = quotes.high
+                extra['lows'] = quotes.low
+        else:
+            timestamps = [quote.timestamp for quote in quotes]
+            if prices is None:
+                prices = [float(quote.close) for quote in quotes]
+            if indicator in ('stochastic', 'atr'):
+                extra['highs'] = [float(quote.high) for quote in quotes]
+                extra['lows'] = [float(quote.low) for quote in quotes]
+        
+        if self.use_shared_indicator_cache:
+            # Looked up per call so strategies stay picklable for process pools
+            result = get_shared_indicator_cache().get(
+                symbol, indicator, timestamps, prices, **extra, **params
+            )
+        else:
+            result = compute_indicator(indicator, prices, **extra, **params)
+        if isinstance(result, dict):
+            return {name: to_optional_list(values) for name, values in result.items()}
+        return to_optional_list(result)
+    
+    @property
+    def supports_vectorized(self) -> bool:
+        """Check if the strategy implements the array API for vectorized backtests."""
+        strategy_class = type(self)
+        return (
+            strategy_class.generate_signal_matrix is not Strategy.generate_signal_matrix
+            or strategy_class.generate_position_matrix is not Strategy.generate_position_matrix
+        )
+    
     def validate_signal(self, signal: StrategySignal) -> bool:
         """
         Validate a generated signal against strategy constraints.
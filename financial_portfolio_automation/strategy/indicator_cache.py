@@ -0,0 +1,104 @@
+"""
+Indicator cache shared between backtests over the same market data.
+
+Parameter sweeps run many backtests over identical price matrices where most
+indicator series (RSI, SMAs, MACD, Bollinger statistics) only depend on a
+period, not on the thresholds being swept. This cache stores each series once
+per (symbol, indicator, period) so every combination can reuse it.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+import numpy as np
+
+
+class IndicatorCache:
+    """
+    Thread-safe cache of indicator series for a fixed set of symbol columns.
+
+    Cached arrays have symbols on their last axis, in the column order the
+    cache was created with. A cache must only be shared between computations
+    over the same price matrices.
+    """
+
+    def __init__(self, symbols: List[str]):
+        """
+        Initialize the cache.
+
+        Args:
+            symbols: Symbols in matrix column order
+        """
+        self.symbols = list(symbols)
+        self._series: Dict[Tuple[str, str, Hashable], np.ndarray] = {}
+        self._matrices: Dict[Tuple[str, Hashable], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self,
+                       indicator: str,
+                       period: Hashable,
+                       compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Get an indicator matrix, computing and storing it on first use.
+
+        Args:
+            indicator: Indicator name
+            period: Period or other hashable parameters the series depends on
+            compute: Callable returning the matrix with symbols on the last axis
+
+        Returns:
+            Indicator matrix with symbols on the last axis
+        """
+        keys = [(symbol, indicator, period) for symbol in self.symbols]
+
+        with self._lock:
+            matrix = self._matrices.get((indicator, period))
+            if matrix is None and keys and all(key in self._series for key in keys):
+                matrix = np.stack([self._series[key] for key in keys], axis=-1)
+                self._matrices[(indicator, period)] = matrix
+            if matrix is not None:
+                self._hits += 1
+                return matrix
+
+        values = np.asarray(compute())
+        if values.shape[-1] != len(self.symbols):
+            raise ValueError(
+                f"Indicator {indicator} has {values.shape[-1]} columns, expected {len(self.symbols)}"
+            )
+
+        # Cached arrays are shared between callers and must not be modified
+        values.setflags(write=False)
+
+        with self._lock:
+            self._misses += 1
+            self._matrices.setdefault((indicator, period), values)
+            for column, key in enumerate(keys):
+                self._series.setdefault(key, values[..., column])
+
+        return values
+
+    def clear(self) -> None:
+        """Remove all cached series and reset statistics."""
+        with self._lock:
+            self._series.clear()
+            self._matrices.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and number of cached series
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'cached_series': len(self._series)
+            }
@@ -0,0 +1,941 @@
+"""
+Event-driven intraday backtesting engine.
+
+The daily ``Backtester`` collapses market data to one timestamp per trading
+day. This module simulates intraday strategies over minute bars with a
+priority queue of market, signal, order and fill events, latency between
+them, partial fills against bar volume, and the ``OrderExecutor`` routes
+(immediate, TWAP, VWAP and iceberg).
+
+Bars are pulled lazily from one stream per symbol, so the queue never holds
+more than one pending bar per symbol and a year of minute data can be
+replayed from disk in bounded memory.
+"""
+
+import csv
+import heapq
+import itertools
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .accounting import PositionBook, LazyPortfolioSnapshot, float_to_decimal
+from .backtester import BacktestResults, BacktestTrade, TransactionCosts
+from .base import StrategySignal, SignalType
+from ..execution.order_executor import ExecutionStrategy, OrderRequest
+from ..models.core import Quote, OrderSide, OrderType, PortfolioSnapshot
+from ..analysis.portfolio_analyzer import PortfolioAnalyzer
+from ..exceptions import InvalidOrderError
+
+
+logger = logging.getLogger(__name__)
+
+_CSV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'bid', 'ask')
+
+
+class Bar:
+    """
+    Compact OHLCV bar used by the intraday engine.
+
+    Prices are floats and ``bid``/``ask`` are optional. The timestamp is the
+    end of the bar interval, so a bar is only known once its timestamp has
+    passed.
+    """
+
+    __slots__ = ('symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume', 'bid', 'ask')
+
+    def __init__(self,
+                 symbol: str,
+                 timestamp: datetime,
+                 open: float,
+                 high: float,
+                 low: float,
+                 close: float,
+                 volume: int,
+                 bid: Optional[float] = None,
+                 ask: Optional[float] = None):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.bid = bid
+        self.ask = ask
+
+    @classmethod
+    def from_quote(cls, quote: Quote) -> 'Bar':
+        """
+        Create a bar from a quote, falling back to the mid price for missing OHLC fields.
+
+        Args:
+            quote: Quote with OHLCV and/or bid/ask data
+
+        Returns:
+            Bar for the quote
+        """
+        bid = float(quote.bid) if quote.bid is not None else None
+        ask = float(quote.ask) if quote.ask is not None else None
+        if quote.close is not None:
+            close = float(quote.close)
+        elif bid is not None and ask is not None:
+            close = (bid + ask) / 2
+        else:
+            raise ValueError(f"Quote for {quote.symbol} at {quote.timestamp} has no price")
+
+        return cls(
+            symbol=quote.symbol,
+            timestamp=quote.timestamp,
+            open=float(quote.open) if quote.open is not None else close,
+            high=float(quote.high) if quote.high is not None else close,
+            low=float(quote.low) if quote.low is not None else close,
+            close=close,
+            volume=quote.volume or 0,
+            bid=bid,
+            ask=ask
+        )
+
+    def __repr__(self) -> str:
+        return f"Bar({self.symbol}, {self.timestamp.isoformat()}, close={self.close}, volume={self.volume})"
+
+
+def read_csv_bars(path: str, symbol: str) -> Iterator[Bar]:
+    """
+    Stream bars from a CSV file without loading it into memory.
+
+    The file needs a header with ``timestamp`` (ISO 8601), ``open``, ``high``,
+    ``low``, ``close`` and ``volume`` columns; ``bid`` and ``ask`` are
+    optional. Rows must be in chronological order.
+
+    Args:
+        path: CSV file path
+        symbol: Symbol of the bars
+
+    Yields:
+        Bars in file order
+    """
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        columns = {name.strip().lower(): i for i, name in enumerate(header)}
+        missing = [name for name in _CSV_COLUMNS[:6] if name not in columns]
+        if missing:
+            raise ValueError(f"Bar file {path} is missing columns: {', '.join(missing)}")
+
+        ts, op, hi, lo, cl, vo = (columns[name] for name in _CSV_COLUMNS[:6])
+        bid_column = columns.get('bid')
+        ask_column = columns.get('ask')
+        parse_timestamp = datetime.fromisoformat
+
+        for row in reader:
+            if not row:
+                continue
+            bid = row[bid_column] if bid_column is not None else ''
+            ask = row[ask_column] if ask_column is not None else ''
+            yield Bar(
+                symbol,
+                parse_timestamp(row[ts]),
+                float(row[op]),
+                float(row[hi]),
+                float(row[lo]),
+                float(row[cl]),
+                int(float(row[vo])),
+                float(bid) if bid else None,
+                float(ask) if ask else None
+            )
+
+
+def write_csv_bars(path: str, bars: Iterable[Bar]) -> int:
+    """
+    Write bars to a CSV file readable by ``read_csv_bars``.
+
+    Args:
+        path: Destination file path
+        bars: Bars to write in chronological order
+
+    Returns:
+        Number of bars written
+    """
+    count = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_COLUMNS)
+        for bar in bars:
+            writer.writerow((
+                bar.timestamp.isoformat(), repr(bar.open), repr(bar.high), repr(bar.low),
+                repr(bar.close), bar.volume,
+                repr(bar.bid) if bar.bid is not None else '',
+                repr(bar.ask) if bar.ask is not None else ''
+            ))
+            count += 1
+    return count
+
+
+class CsvBarSource:
+    """Bar source streaming one chronologically ordered CSV file per symbol."""
+
+    def __init__(self, paths: Dict[str, str]):
+        """
+        Initialize the source.
+
+        Args:
+            paths: CSV file path by symbol
+        """
+        self.paths = dict(paths)
+
+    @classmethod
+    def from_directory(cls, directory: str, symbols: Optional[Sequence[str]] = None) -> 'CsvBarSource':
+        """
+        Create a source from ``<SYMBOL>.csv`` files in a directory.
+
+        Args:
+            directory: Directory containing the bar files
+            symbols: Symbols to include (all files if None)
+
+        Returns:
+            CsvBarSource for the files
+        """
+        if symbols is None:
+            symbols = sorted(
+                name[:-4] for name in os.listdir(directory) if name.endswith('.csv')
+            )
+        return cls({symbol: os.path.join(directory, f"{symbol}.csv") for symbol in symbols})
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get the symbols available from the source."""
+        return list(self.paths)
+
+    def streams(self) -> Dict[str, Iterator[Bar]]:
+        """
+        Open a bar stream for every symbol.
+
+        Returns:
+            Lazy bar iterators by symbol
+        """
+        return {symbol: read_csv_bars(path, symbol) for symbol, path in self.paths.items()}
+
+
+class QuoteBarSource:
+    """Bar source over in-memory historical quotes."""
+
+    def __init__(self, historical_data: Dict[str, List[Quote]]):
+        """
+        Initialize the source.
+
+        Args:
+            historical_data: Chronologically ordered quotes by symbol
+        """
+        self.historical_data = historical_data
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get the symbols available from the source."""
+        return list(self.historical_data)
+
+    def streams(self) -> Dict[str, Iterator[Bar]]:
+        """
+        Open a bar stream for every symbol.
+
+        Returns:
+            Lazy bar iterators by symbol
+        """
+        return {
+            symbol: (Bar.from_quote(quote) for quote in quotes)
+            for symbol, quotes in self.historical_data.items()
+        }
+
+
+class EventType(IntEnum):
+    """
+    Intraday event types.
+
+    The value is the processing priority for events with equal timestamps:
+    fill reports first, then market data, then signals and orders. An order
+    arriving at the same time as a bar is therefore matched from the next bar.
+    """
+    FILL = 0
+    MARKET = 1
+    SIGNAL = 2
+    ORDER = 3
+
+
+@dataclass
+class LatencyModel:
+    """Delays between the intraday event stages."""
+
+    signal_latency: timedelta = timedelta(0)                   # Bar -> strategy signal
+    order_latency: timedelta = timedelta(milliseconds=50)      # Signal -> order at the exchange
+    fill_latency: timedelta = timedelta(milliseconds=10)       # Execution -> fill report
+
+    def __post_init__(self):
+        for name in ('signal_latency', 'order_latency', 'fill_latency'):
+            if getattr(self, name) < timedelta(0):
+                raise ValueError(f"{name} cannot be negative")
+
+
+@dataclass
+class Fill:
+    """Execution report for a (possibly partial) fill of an intraday order."""
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    quantity: int
+    price: float
+    commission: float
+    slippage: float
+    market_impact: float
+    timestamp: datetime
+    remaining_quantity: int
+
+
+class _WorkingOrder:
+    """Order state tracked by the engine from submission until done."""
+
+    __slots__ = ('order_id', 'request', 'strategy_id', 'signal_strength', 'released',
+                 'filled', 'status', 'chunk_size')
+
+    def __init__(self, order_id: str, request: OrderRequest, strategy_id: str, signal_strength: float):
+        self.order_id = order_id
+        self.request = request
+        self.strategy_id = strategy_id
+        self.signal_strength = signal_strength
+        # Quantity the execution algorithm has made available to the market so far
+        self.released = 0
+        self.filled = 0
+        self.status = 'pending'
+        self.chunk_size = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.request.quantity - self.filled
+
+
+class IntradayContext:
+    """Read-only view of the simulation passed to intraday strategies."""
+
+    def __init__(self, engine: 'IntradayBacktester'):
+        self._engine = engine
+
+    @property
+    def time(self) -> Optional[datetime]:
+        """Get the current simulation time."""
+        return self._engine._current_time
+
+    @property
+    def cash(self) -> float:
+        """Get the current cash balance."""
+        return self._engine._cash
+
+    def position(self, symbol: str) -> int:
+        """Get the current position in shares."""
+        return self._engine._position_quantity(symbol)
+
+    def last_price(self, symbol: str) -> Optional[float]:
+        """Get the last close seen for a symbol."""
+        return self._engine._last_prices.get(symbol)
+
+    def open_orders(self, symbol: str) -> int:
+        """Get the number of submitted orders for a symbol that are not done."""
+        return sum(1 for order in self._engine._open_orders.values() if order.request.symbol == symbol)
+
+
+class IntradayStrategy(ABC):
+    """
+    Base class for strategies driven by intraday bars.
+
+    ``on_bar`` is called for every bar of the strategy's symbols and may
+    return signals (sized by the engine) or fully specified ``OrderRequest``
+    objects. Signals choose an execution route with
+    ``metadata['execution_strategy']`` (an ``ExecutionStrategy`` or its value).
+    """
+
+    def __init__(self, strategy_id: str, symbols: List[str]):
+        """
+        Initialize the strategy.
+
+        Args:
+            strategy_id: Strategy identifier recorded on trades
+            symbols: Symbols whose bars are passed to the strategy
+        """
+        self.strategy_id = strategy_id
+        self.symbols = list(symbols)
+
+    @abstractmethod
+    def on_bar(self, bar: Bar, context: IntradayContext) -> List[Union[StrategySignal, OrderRequest]]:
+        """
+        React to a new bar.
+
+        Args:
+            bar: Bar that just completed
+            context: Current simulation state
+
+        Returns:
+            Signals or order requests to submit
+        """
+        pass
+
+    def on_fill(self, fill: Fill, context: IntradayContext) -> None:
+        """
+        React to a fill report.
+
+        Args:
+            fill: Fill that was reported
+            context: Current simulation state
+        """
+        pass
+
+
+class IntradayBacktester:
+    """
+    Event-driven backtesting engine for intraday strategies.
+
+    Each bar first fills working orders for its symbol and is then passed to
+    the strategy. Signals reach the engine after ``signal_latency`` and the
+    resulting orders reach the market after ``order_latency``, so they can
+    only fill from later bars. Fill reports reach the strategy after
+    ``fill_latency``; cash and positions are updated at execution time.
+
+    Fills per bar are limited by the bar's remaining volume. Immediate and
+    smart orders may take the whole bar; VWAP, TWAP and iceberg orders are
+    capped at the request's ``max_participation_rate``. TWAP orders release
+    equal slices over ``twap_duration`` and iceberg orders release the next
+    chunk once the visible one is filled. Unfilled 'day' orders are cancelled
+    at the end of each session, and orders are reduced to the available cash
+    or position (no short selling).
+
+    Transaction costs use the same formulas as ``Backtester``. Equity is
+    recorded once per session from the last closes, and risk metrics are
+    computed from those daily values.
+    """
+
+    def __init__(self,
+                 transaction_costs: Optional[TransactionCosts] = None,
+                 initial_capital: Decimal = Decimal('100000'),
+                 latency: Optional[LatencyModel] = None,
+                 twap_slices: int = 6,
+                 twap_duration: timedelta = timedelta(minutes=30),
+                 iceberg_max_chunk: int = 1000,
+                 position_fraction: float = 0.1):
+        """
+        Initialize the intraday backtester.
+
+        Args:
+            transaction_costs: Transaction cost configuration
+            initial_capital: Initial capital for backtesting
+            latency: Event latency model
+            twap_slices: Number of slices TWAP orders are split into
+            twap_duration: Time over which TWAP slices are released
+            iceberg_max_chunk: Maximum visible quantity of iceberg orders
+            position_fraction: Fraction of cash used for signals without a quantity,
+                scaled by signal strength
+        """
+        if twap_slices <= 0:
+            raise ValueError("twap_slices must be positive")
+        if iceberg_max_chunk <= 0:
+            raise ValueError("iceberg_max_chunk must be positive")
+
+        self.transaction_costs = transaction_costs or TransactionCosts()
+        self.initial_capital = initial_capital
+        self.latency = latency or LatencyModel()
+        self.twap_slices = twap_slices
+        self.twap_duration = twap_duration
+        self.iceberg_max_chunk = iceberg_max_chunk
+        self.position_fraction = position_fraction
+        self.logger = logging.getLogger(__name__)
+        self.portfolio_analyzer = PortfolioAnalyzer()
+
+        self._reset_state()
+
+    def run_backtest(self,
+                     strategy: IntradayStrategy,
+                     source: Union[CsvBarSource, QuoteBarSource],
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> BacktestResults:
+        """
+        Replay bars through the event queue and simulate the strategy.
+
+        Args:
+            strategy: Intraday strategy to backtest
+            source: Bar source providing one stream per symbol
+            start_date: First session to simulate (inclusive, by date)
+            end_date: Last session to simulate (inclusive, by date)
+
+        Returns:
+            BacktestResults with daily portfolio history and all fills as trades
+        """
+        try:
+            self.logger.info(f"Starting intraday backtest for strategy {strategy.strategy_id}")
+
+            if start_date and end_date and start_date > end_date:
+                raise ValueError("Start date must be before end date")
+
+            self._reset_state()
+            self._strategy = strategy
+            self._context = IntradayContext(self)
+
+            first_day = start_date.date() if start_date else None
+            last_day = end_date.date() if end_date else None
+
+            streams = source.streams()
+            for symbol, stream in streams.items():
+                self._streams[symbol] = self._bounded(stream, first_day, last_day)
+                self._push_next_bar(symbol)
+
+            if not self._queue:
+                raise ValueError("No bars found in the specified period")
+
+            current_day: Optional[date] = None
+
+            while self._queue:
+                timestamp, event_type, _, payload = heapq.heappop(self._queue)
+                self._current_time = timestamp
+                self._events_processed += 1
+
+                if event_type == EventType.MARKET:
+                    bar_day = timestamp.date()
+                    if bar_day != current_day:
+                        if current_day is not None:
+                            self._end_session()
+                        current_day = bar_day
+                    self._on_market(payload)
+                    self._push_next_bar(payload.symbol)
+                elif event_type == EventType.SIGNAL:
+                    self._on_signal(payload)
+                elif event_type == EventType.ORDER:
+                    self._on_order(*payload)
+                else:
+                    self._strategy.on_fill(payload, self._context)
+
+            self._end_session()
+
+            results = self._calculate_backtest_results(
+                strategy.strategy_id,
+                start_date or self._portfolio_history[0].timestamp,
+                end_date or self._portfolio_history[-1].timestamp
+            )
+
+            self.logger.info(
+                f"Intraday backtest completed: {self._events_processed} events, "
+                f"total return {results.total_return:.2%}"
+            )
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Intraday backtest failed: {e}")
+            raise
+
+    def _reset_state(self) -> None:
+        """Reset simulation state for a new run."""
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._streams: Dict[str, Iterator[Bar]] = {}
+        self._strategy: Optional[IntradayStrategy] = None
+        self._context: Optional[IntradayContext] = None
+        self._current_time: Optional[datetime] = None
+        self._last_prices: Dict[str, float] = {}
+        self._cash = float(self.initial_capital)
+        self._book = PositionBook()
+        self._open_orders: Dict[str, _WorkingOrder] = {}
+        self._working: Dict[str, List[_WorkingOrder]] = defaultdict(list)
+        self._order_ids = itertools.count(1)
+        self._trades: List[BacktestTrade] = []
+        self._portfolio_history: List[PortfolioSnapshot] = []
+        self._last_bar_time: Optional[datetime] = None
+        self._stats = {
+            'orders_submitted': 0,
+            'orders_rejected': 0,
+            'orders_filled': 0,
+            'orders_cancelled': 0,
+            'partial_fills': 0
+        }
+        self._events_processed = 0
+        self._max_queue_size = 0
+
+        costs = self.transaction_costs
+        self._commission_per_share = float(costs.commission_per_share)
+        self._commission_minimum = float(costs.commission_minimum)
+        self._commission_maximum = float(costs.commission_maximum)
+        self._spread_cost_factor = float(costs.spread_cost_factor)
+        self._market_impact_factor = float(costs.market_impact_factor)
+        self._slippage_factor = float(costs.slippage_factor)
+
+    def _push(self, timestamp: datetime, event_type: EventType, payload: Any) -> None:
+        """Add an event to the queue."""
+        heapq.heappush(self._queue, (timestamp, event_type, next(self._sequence), payload))
+        if len(self._queue) > self._max_queue_size:
+            self._max_queue_size = len(self._queue)
+
+    @staticmethod
+    def _bounded(stream: Iterator[Bar], first_day: Optional[date], last_day: Optional[date]) -> Iterator[Bar]:
+        """Restrict a bar stream to a session range, stopping at the first bar after it."""
+        for bar in stream:
+            bar_day = bar.timestamp.date()
+            if first_day is not None and bar_day < first_day:
+                continue
+            if last_day is not None and bar_day > last_day:
+                return
+            yield bar
+
+    def _push_next_bar(self, symbol: str) -> None:
+        """Queue the next bar of a symbol's stream, keeping one pending bar per symbol."""
+        bar = next(self._streams[symbol], None)
+        if bar is not None:
+            self._push(bar.timestamp, EventType.MARKET, bar)
+
+    def _on_market(self, bar: Bar) -> None:
+        """Fill working orders from a bar, then pass it to the strategy."""
+        self._last_prices[bar.symbol] = bar.close
+        self._last_bar_time = bar.timestamp
+
+        working = self._working.get(bar.symbol)
+        if working:
+            self._match(bar, working)
+
+        if bar.symbol in self._strategy.symbols:
+            actions = self._strategy.on_bar(bar, self._context)
+            if actions:
+                signal_time = bar.timestamp + self.latency.signal_latency
+                for action in actions:
+                    self._push(signal_time, EventType.SIGNAL, action)
+
+    def _on_signal(self, action: Union[StrategySignal, OrderRequest]) -> None:
+        """Turn a signal into an order and send it to the market."""
+        try:
+            if isinstance(action, OrderRequest):
+                request, strength = action, 1.0
+            else:
+                request, strength = self._signal_to_request(action), action.strength
+
+            if request is None:
+                return
+
+            request.validate()
+        except (InvalidOrderError, ValueError) as e:
+            self._stats['orders_rejected'] += 1
+            self.logger.debug(f"Rejected order at {self._current_time}: {e}")
+            return
+
+        order = _WorkingOrder(
+            f"BT-{next(self._order_ids)}", request, self._strategy.strategy_id, strength
+        )
+        self._open_orders[order.order_id] = order
+        self._stats['orders_submitted'] += 1
+
+        self._push(self._current_time + self.latency.order_latency, EventType.ORDER, (order, None))
+
+    def _signal_to_request(self, signal: StrategySignal) -> Optional[OrderRequest]:
+        """Size a strategy signal into an order request."""
+        if signal.signal_type == SignalType.HOLD:
+            return None
+
+        if signal.signal_type == SignalType.CLOSE:
+            side = OrderSide.SELL
+            quantity = signal.quantity or self._position_quantity(signal.symbol)
+        else:
+            side = OrderSide.BUY if signal.signal_type == SignalType.BUY else OrderSide.SELL
+            quantity = signal.quantity
+            if quantity is None:
+                price = self._last_prices.get(signal.symbol)
+                if not price:
+                    return None
+                quantity = int(self._cash * self.position_fraction * signal.strength / price)
+
+        if not quantity or quantity <= 0:
+            return None
+
+        route = signal.metadata.get('execution_strategy', ExecutionStrategy.IMMEDIATE)
+        if not isinstance(route, ExecutionStrategy):
+            route = ExecutionStrategy(str(route).lower())
+
+        return OrderRequest(
+            symbol=signal.symbol,
+            quantity=int(quantity),
+            side=side,
+            order_type=OrderType.LIMIT if signal.price is not None else OrderType.MARKET,
+            limit_price=signal.price,
+            execution_strategy=route,
+            max_participation_rate=signal.metadata.get('max_participation_rate', 0.1)
+        )
+
+    def _on_order(self, order: _WorkingOrder, release: Optional[int]) -> None:
+        """Handle an order arriving at the market or a scheduled release of more quantity."""
+        if order.status in ('filled', 'cancelled'):
+            return
+
+        if release is not None:
+            order.released = min(order.request.quantity, order.released + release)
+            return
+
+        order.status = 'working'
+        self._working[order.request.symbol].append(order)
+
+        quantity = order.request.quantity
+        route = order.request.execution_strategy
+
+        if route == ExecutionStrategy.TWAP:
+            slices = min(self.twap_slices, quantity)
+            base, extra = divmod(quantity, slices)
+            interval = self.twap_duration / slices
+            order.released = base + (1 if extra else 0)
+            for k in range(1, slices):
+                self._push(
+                    self._current_time + interval * k, EventType.ORDER,
+                    (order, base + (1 if k < extra else 0))
+                )
+        elif route == ExecutionStrategy.ICEBERG:
+            # Same chunking as OrderExecutor._execute_iceberg
+            order.chunk_size = min(quantity // 4, self.iceberg_max_chunk) or quantity
+            order.released = order.chunk_size
+        else:
+            order.released = quantity
+
+    def _match(self, bar: Bar, working: List[_WorkingOrder]) -> None:
+        """Fill working orders for a bar's symbol from its volume."""
+        liquidity = bar.volume or 0
+        done = []
+
+        for order in working:
+            if liquidity <= 0:
+                break
+
+            request = order.request
+            available = order.released - order.filled
+            if available <= 0:
+                continue
+
+            if request.execution_strategy in (ExecutionStrategy.IMMEDIATE, ExecutionStrategy.SMART):
+                cap = liquidity
+            else:
+                cap = min(liquidity, int(bar.volume * request.max_participation_rate))
+
+            quantity = min(available, cap)
+            if quantity <= 0:
+                continue
+
+            is_buy = request.side == OrderSide.BUY
+            price = self._execution_price(bar, is_buy, quantity)
+
+            if request.order_type == OrderType.LIMIT:
+                limit = float(request.limit_price)
+                if is_buy and price > limit:
+                    if bar.low > limit:
+                        continue
+                    price = limit
+                elif not is_buy and price < limit:
+                    if bar.high < limit:
+                        continue
+                    price = limit
+
+            spread = bar.ask - bar.bid if bar.bid is not None and bar.ask is not None else 0.0
+
+            if is_buy:
+                quantity = self._affordable_quantity(quantity, price, spread)
+            else:
+                quantity = min(quantity, self._position_quantity(request.symbol))
+
+            if quantity <= 0:
+                # Nothing more can be bought or sold for this order
+                order.status = 'cancelled'
+                self._stats['orders_cancelled'] += 1
+                done.append(order)
+                continue
+
+            self._execute_fill(order, bar, quantity, price, spread)
+            liquidity -= quantity
+
+            if order.remaining == 0:
+                order.status = 'filled'
+                self._stats['orders_filled'] += 1
+                done.append(order)
+            else:
+                self._stats['partial_fills'] += 1
+                if request.execution_strategy == ExecutionStrategy.ICEBERG and order.filled == order.released:
+                    order.released = min(request.quantity, order.released + order.chunk_size)
+
+        for order in done:
+            working.remove(order)
+            self._open_orders.pop(order.order_id, None)
+
+    def _execution_price(self, bar: Bar, is_buy: bool, quantity: int) -> float:
+        """Calculate the fill price, including size-dependent slippage, like Backtester."""
+        if is_buy:
+            base = bar.ask if bar.ask is not None else bar.close
+        else:
+            base = bar.bid if bar.bid is not None else bar.close
+
+        if bar.bid is None or bar.ask is None:
+            return base
+
+        slippage = (bar.ask - bar.bid) * min(0.01, self._slippage_factor * quantity / 1000)
+        return base + slippage if is_buy else base - slippage
+
+    def _fill_costs(self, quantity: int, price: float, spread: float) -> tuple:
+        """Get (commission, slippage, market impact) for a fill."""
+        commission = min(max(quantity * self._commission_per_share, self._commission_minimum),
+                         self._commission_maximum)
+        slippage = spread * self._spread_cost_factor * quantity
+        impact = quantity * price * self._market_impact_factor
+        return commission, slippage, impact
+
+    def _affordable_quantity(self, quantity: int, price: float, spread: float) -> int:
+        """Reduce a buy quantity to what the current cash can pay for, including costs."""
+        commission, slippage, impact = self._fill_costs(quantity, price, spread)
+        if quantity * price + commission + slippage + impact <= self._cash:
+            return quantity
+
+        unit_cost = price * (1 + self._market_impact_factor) + spread * self._spread_cost_factor
+        quantity = int((self._cash - self._commission_maximum) / unit_cost)
+        while quantity > 0:
+            commission, slippage, impact = self._fill_costs(quantity, price, spread)
+            if quantity * price + commission + slippage + impact <= self._cash:
+                break
+            quantity -= 1
+        return max(quantity, 0)
+
+    def _execute_fill(self, order: _WorkingOrder, bar: Bar, quantity: int, price: float, spread: float) -> None:
+        """Apply a fill to cash and positions, record the trade and queue the fill report."""
+        request = order.request
+        is_buy = request.side == OrderSide.BUY
+        commission, slippage, impact = self._fill_costs(quantity, price, spread)
+        costs = commission + slippage + impact
+
+        if is_buy:
+            self._cash -= quantity * price + costs
+        else:
+            self._cash += quantity * price - costs
+
+        self._book.apply_fill(request.symbol, 1 if is_buy else -1, quantity, price)
+        order.filled += quantity
+
+        self._trades.append(BacktestTrade(
+            timestamp=bar.timestamp,
+            symbol=request.symbol,
+            side=request.side,
+            quantity=quantity,
+            price=float_to_decimal(price),
+            commission=float_to_decimal(commission),
+            slippage=float_to_decimal(slippage),
+            market_impact=float_to_decimal(impact),
+            strategy_id=order.strategy_id,
+            signal_strength=order.signal_strength
+        ))
+
+        fill = Fill(
+            order_id=order.order_id,
+            symbol=request.symbol,
+            side=request.side,
+            quantity=quantity,
+            price=price,
+            commission=commission,
+            slippage=slippage,
+            market_impact=impact,
+            timestamp=bar.timestamp,
+            remaining_quantity=order.remaining
+        )
+        self._push(bar.timestamp + self.latency.fill_latency, EventType.FILL, fill)
+
+    def _position_quantity(self, symbol: str) -> int:
+        """Get the current position in shares."""
+        return self._book.quantity_of(symbol)
+
+    def _end_session(self) -> None:
+        """Cancel day orders and record the end-of-session portfolio."""
+        for symbol, working in self._working.items():
+            remaining = []
+            for order in working:
+                if order.request.time_in_force == 'day':
+                    order.status = 'cancelled'
+                    self._stats['orders_cancelled'] += 1
+                    self._open_orders.pop(order.order_id, None)
+                else:
+                    remaining.append(order)
+            working[:] = remaining
+
+        # Day orders still on their way to the market expire with the session
+        for order_id, order in list(self._open_orders.items()):
+            if order.status == 'pending' and order.request.time_in_force == 'day':
+                order.status = 'cancelled'
+                self._stats['orders_cancelled'] += 1
+                del self._open_orders[order_id]
+
+        positions_value, day_pnl = self._book.mark_to_market(self._last_prices)
+        total_value = float_to_decimal(self._cash + positions_value)
+
+        self._portfolio_history.append(LazyPortfolioSnapshot(
+            timestamp=self._last_bar_time,
+            total_value=total_value,
+            buying_power=float_to_decimal(self._cash),
+            day_pnl=float_to_decimal(day_pnl),
+            total_pnl=total_value - self.initial_capital,
+            position_arrays=self._book.snapshot()
+        ))
+
+    def _calculate_backtest_results(self,
+                                    strategy_id: str,
+                                    start_date: datetime,
+                                    end_date: datetime) -> BacktestResults:
+        """Calculate backtest results from the daily portfolio history and fills."""
+        equity = [float(snapshot.total_value) for snapshot in self._portfolio_history]
+        final_value = self._portfolio_history[-1].total_value
+        total_return = float((final_value - self.initial_capital) / self.initial_capital)
+
+        # Calculate time-based metrics
+        days = (end_date - start_date).days
+        years = days / 365.25
+        annual_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else total_return
+
+        risk_metrics = {}
+        if len(equity) > 1:
+            try:
+                risk_metrics = self.portfolio_analyzer.calculate_risk_metrics_from_values(equity)
+            except Exception as e:
+                self.logger.warning(f"Failed to calculate risk metrics: {e}")
+
+        # Same simplified convention as Backtester: sells count as winning trades
+        winning = [t for t in self._trades if t.side == OrderSide.SELL]
+        losing = [t for t in self._trades if t.side == OrderSide.BUY]
+        gross_profit = sum((t.price * t.quantity - t.total_cost for t in winning), Decimal('0'))
+        gross_loss = sum((t.price * t.quantity + t.total_cost for t in losing), Decimal('0'))
+        profit_factor = float(gross_profit / gross_loss) if gross_loss > 0 else float('inf')
+
+        performance_metrics = dict(risk_metrics)
+        performance_metrics.update(self._stats)
+        performance_metrics['events_processed'] = self._events_processed
+        performance_metrics['max_queue_size'] = self._max_queue_size
+
+        return BacktestResults(
+            strategy_id=strategy_id,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=self.initial_capital,
+            final_value=final_value,
+            total_return=total_return,
+            annual_return=annual_return,
+            max_drawdown=risk_metrics.get('max_drawdown', 0),
+            sharpe_ratio=risk_metrics.get('sharpe_ratio', 0),
+            sortino_ratio=risk_metrics.get('sortino_ratio', 0),
+            calmar_ratio=risk_metrics.get('calmar_ratio', 0),
+            win_rate=len(winning) / len(self._trades) if self._trades else 0,
+            profit_factor=profit_factor,
+            total_trades=len(self._trades),
+            winning_trades=len(winning),
+            losing_trades=len(losing),
+            total_commission=sum((t.commission for t in self._trades), Decimal('0')),
+            total_slippage=sum((t.slippage for t in self._trades), Decimal('0')),
+            trades=self._trades,
+            portfolio_history=self._portfolio_history,
+            performance_metrics=performance_metrics
+        )
@@ -0,0 +1,226 @@
+"""
+Date-indexed market data layout for the backtesting engine.
+
+This module provides a one-time index over historical quote data so that the
+backtester can look up the quotes for a trading date, and the history up to
+that date, without rescanning or copying the full history of every symbol on
+every simulated day. Symbols whose history is a columnar ``BarArray`` are
+indexed with array operations and only materialize quotes when read.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Dict, List, Mapping, Optional, Union
+
+import numpy as np
+
+from ..models.core import Quote
+from ..models.quote_frame import BarArray
+
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class HistoricalView(Sequence):
+    """
+    Read-only, zero-copy view of the first ``stop`` quotes of a quote list.
+
+    Behaves like the list ``quotes[:stop]`` for ``len``, indexing (including
+    negative indices), slicing and iteration, without copying the underlying
+    history. Slicing returns a plain list containing only the requested bars.
+    """
+
+    __slots__ = ('_quotes', '_stop')
+
+    def __init__(self, quotes: List[Quote], stop: int):
+        """
+        Initialize the view.
+
+        Args:
+            quotes: Underlying chronologically ordered quotes
+            stop: Number of leading quotes exposed by the view
+        """
+        self._quotes = quotes
+        self._stop = max(0, min(stop, len(quotes)))
+
+    def __len__(self) -> int:
+        return self._stop
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Quote, List[Quote]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._stop)
+            if step == 1:
+                return self._quotes[start:stop] if start < stop else []
+            return [self._quotes[i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += self._stop
+        if not 0 <= index < self._stop:
+            raise IndexError("HistoricalView index out of range")
+        return self._quotes[index]
+
+    def __iter__(self):
+        return islice(self._quotes, self._stop)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (HistoricalView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"HistoricalView(len={self._stop})"
+
+
+class _BarsByDate:
+    """Date lookup over a ``BarArray`` that builds the quote on access."""
+
+    __slots__ = ('_bars', '_rows')
+
+    def __init__(self, bars: BarArray, rows: Dict[date, int]):
+        self._bars = bars
+        self._rows = rows
+
+    def get(self, quote_date: date) -> Optional[Quote]:
+        row = self._rows.get(quote_date)
+        return None if row is None else self._bars[row]
+
+
+class MarketDataIndex:
+    """
+    Per-symbol date index over historical market data.
+
+    The index is built once per backtest in O(total quotes). Afterwards, the
+    trading calendar is available directly and per-day market data lookups
+    cost O(symbols) instead of O(symbols x quotes).
+    """
+
+    def __init__(self, historical_data: Mapping[str, Union[List[Quote], BarArray]]):
+        """
+        Build the index.
+
+        Args:
+            historical_data: Historical market data by symbol, as quote
+                lists, BarArrays or a QuoteFrame
+        """
+        self.historical_data = historical_data
+        self._quotes_by_date: Dict[str, Union[Dict[date, Quote], _BarsByDate]] = {}
+        self._quote_dates: Dict[str, Union[List[date], np.ndarray]] = {}
+        self._is_sorted: Dict[str, bool] = {}
+
+        all_dates = set()
+
+        for symbol, quotes in historical_data.items():
+            if isinstance(quotes, BarArray):
+                self._index_bars(symbol, quotes, all_dates)
+                continue
+
+            by_date: Dict[date, Quote] = {}
+            quote_dates: List[date] = []
+
+            for quote in quotes:
+                quote_date = quote.timestamp.date()
+                quote_dates.append(quote_date)
+
+                # Keep the first quote seen for a date, matching a linear scan
+                if quote_date not in by_date:
+                    by_date[quote_date] = quote
+
+                all_dates.add(quote.timestamp.replace(hour=16, minute=0, second=0, microsecond=0))
+
+            self._quotes_by_date[symbol] = by_date
+            self._quote_dates[symbol] = quote_dates
+            self._is_sorted[symbol] = all(
+                quote_dates[i] <= quote_dates[i + 1] for i in range(len(quote_dates) - 1)
+            )
+
+        self._trading_dates: List[datetime] = sorted(all_dates)
+
+    def _index_bars(self, symbol: str, bars: BarArray, all_dates: set) -> None:
+        """Index a BarArray by date with array operations."""
+        days = bars.days
+        unique_days, first_rows = np.unique(days, return_index=True)
+        dates = [_EPOCH_DATE + timedelta(days=day) for day in unique_days.tolist()]
+
+        self._quotes_by_date[symbol] = _BarsByDate(bars, dict(zip(dates, first_rows.tolist())))
+        self._quote_dates[symbol] = days
+        self._is_sorted[symbol] = bool(np.all(days[1:] >= days[:-1]))
+        all_dates.update(datetime.combine(day, time(16), tzinfo=bars.tzinfo) for day in dates)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get indexed symbols in their original order."""
+        return list(self._quotes_by_date.keys())
+
+    def trading_dates(self, start_date: datetime, end_date: datetime) -> List[datetime]:
+        """
+        Get sorted trading dates (normalized to 16:00) within a date range.
+
+        Args:
+            start_date: Range start (inclusive, compared by date)
+            end_date: Range end (inclusive, compared by date)
+
+        Returns:
+            Sorted list of trading timestamps
+        """
+        start = start_date.date()
+        end = end_date.date()
+        return [d for d in self._trading_dates if start <= d.date() <= end]
+
+    def market_data_for_date(self, target_date: datetime) -> Dict[str, Quote]:
+        """
+        Get the quote for each symbol on a specific date.
+
+        Args:
+            target_date: Date to look up
+
+        Returns:
+            Dictionary of quotes by symbol for symbols that traded on the date
+        """
+        target_date_only = target_date.date()
+        market_data = {}
+
+        for symbol, by_date in self._quotes_by_date.items():
+            quote = by_date.get(target_date_only)
+            if quote is not None:
+                market_data[symbol] = quote
+
+        return market_data
+
+    def history_up_to(self, target_date: datetime) -> Dict[str, Sequence]:
+        """
+        Get each symbol's history up to and including a date.
+
+        For chronologically ordered input the result is a zero-copy
+        ``HistoricalView`` (or ``BarArray`` view) whose cut-off is found by
+        bisecting the precomputed quote dates. Unordered input falls back to a filtered list so the
+        result always equals filtering the full history by date.
+
+        Args:
+            target_date: Last date (inclusive) to expose
+
+        Returns:
+            Dictionary of quote sequences by symbol
+        """
+        max_date = target_date.date()
+        subset: Dict[str, Sequence] = {}
+
+        for symbol, quotes in self.historical_data.items():
+            quote_dates = self._quote_dates[symbol]
+
+            if isinstance(quotes, BarArray):
+                max_day = (max_date - _EPOCH_DATE).days
+                if self._is_sorted[symbol]:
+                    subset[symbol] = quotes[:int(np.searchsorted(quote_dates, max_day, side='right'))]
+                else:
+                    subset[symbol] = [quotes[row] for row in np.flatnonzero(quote_dates <= max_day)]
+            elif self._is_sorted[symbol]:
+                subset[symbol] = HistoricalView(quotes, bisect_right(quote_dates, max_date))
+            else:
+                subset[symbol] = [
+                    quote for quote, quote_date in zip(quotes, quote_dates)
+                    if quote_date <= max_date
+                ]
+
+        return subset
@@ -6,14 +6,19 @@ when prices deviate significantly from their historical average and
 generate signals expecting a return to the mean.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from decimal import Decimal
 from datetime import datetime, timezone
 import logging
 import statistics
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from .base import Strategy, StrategySignal, SignalType
+from .signal_matrix import trailing_rsi, trailing_sum
 from ..models.core import Quote, PortfolioSnapshot
+from ..models.quote_frame import BarArray
 from ..models.config import StrategyConfig
 from ..analysis.technical_analysis import TechnicalAnalysis
 
@@ -59,7 +64,7 @@ class MeanReversionStrategy(Strategy):
         self,
         market_data: Dict[str, Quote],
         portfolio: PortfolioSnapshot,
-        historical_data: Optional[Dict[str, List[Quote]]] = None
+        historical_data: Optional[Dict[str, Sequence[Quote]]] = None
     ) -> List[StrategySignal]:
         """
         Generate mean reversion trading signals.
@@ -100,7 +105,7 @@ class MeanReversionStrategy(Strategy):
         self,
         symbol: str,
         current_quote: Quote,
-        historical_quotes: List[Quote]
+        historical_quotes: Sequence[Quote]
     ) -> Optional[StrategySignal]:
         """
         Analyze mean reversion opportunity for a specific symbol.
@@ -114,8 +119,13 @@ class MeanReversionStrategy(Strategy):
             Mean reversion signal if conditions are met, None otherwise
         """
         # Extract price and volume data
-        prices = [float(quote.close) for quote in historical_quotes[-self.lookback_period:]]
-        volumes = [quote.volume for quote in historical_quotes[-self.lookback_period:]]
+        window = historical_quotes[-self.lookback_period:]
+        if isinstance(window, BarArray):
+            prices = window.close.tolist()
+            volumes = [volume if volume >= 0 else None for volume in window.volume.tolist()]
+        else:
+            prices = [float(quote.close) for quote in window]
+            volumes = [quote.volume for quote in window]
         
         if len(prices) < self.lookback_period:
             return None
@@ -127,10 +137,11 @@ class MeanReversionStrategy(Strategy):
         std_dev = statistics.stdev(prices) if len(prices) > 1 else 0
         
         # Calculate technical indicators
-        rsi = self.technical_analysis.calculate_rsi(prices, period=14)
-        bollinger_upper, bollinger_middle, bollinger_lower = self.technical_analysis.calculate_bollinger_bands(
-            prices, period=self.bollinger_period, std_dev=self.bollinger_std
+        rsi = self.shared_indicator(symbol, 'rsi', window, prices, period=14)
+        bands = self.shared_indicator(
+            symbol, 'bollinger_bands', window, prices, period=self.bollinger_period, std_dev=self.bollinger_std
         )
+        bollinger_upper, bollinger_lower = bands['upper'], bands['lower']
         
         # Calculate price deviation from mean
         price_deviation = (current_price - mean_price) / mean_price if mean_price > 0 else 0
@@ -143,8 +154,8 @@ class MeanReversionStrategy(Strategy):
         # Trend filter (optional)
         trend_direction = None
         if self.trend_filter:
-            sma_short = self.technical_analysis.calculate_sma(prices, period=10)
-            sma_long = self.technical_analysis.calculate_sma(prices, period=20)
+            sma_short = self.shared_indicator(symbol, 'sma', window, prices, period=10)
+            sma_long = self.shared_indicator(symbol, 'sma', window, prices, period=20)
             if sma_short and sma_long:
                 trend_direction = 'up' if sma_short[-1] > sma_long[-1] else 'down'
         
@@ -247,6 +258,125 @@ class MeanReversionStrategy(Strategy):
         
         return None
     
+    def generate_signal_matrix(self, closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        """
+        Compute mean reversion signal strengths for every date and symbol at once.
+        
+        Applies the ``_analyze_mean_reversion`` rules to each trailing window of
+        ``lookback_period`` bars. Windows with missing bars produce no signal.
+        
+        Args:
+            closes: Close prices with shape (dates, symbols), NaN where missing
+            volumes: Volumes with the same shape, NaN where missing
+            
+        Returns:
+            Signal matrix: positive buy strengths, negative sell strengths, 0 for hold
+        """
+        closes = np.asarray(closes, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+        lookback = self.lookback_period
+        signals = np.zeros(closes.shape)
+        
+        # RSI, Bollinger Bands and the trend filter all need full windows
+        required = max(15, self.bollinger_period, 20 if self.trend_filter else 0)
+        if lookback < required or closes.shape[0] < lookback:
+            return signals
+        
+        rows = slice(lookback - 1, None)
+        price_windows = sliding_window_view(closes, lookback, axis=0)
+        volume_windows = sliding_window_view(volumes, lookback, axis=0)
+        current_price = price_windows[..., -1]
+        
+        # Indicators only depend on periods, so they can be shared across parameter sweeps
+        mean_price = self.cached_indicator('rolling_mean', lookback, lambda: price_windows.mean(axis=-1))
+        std_dev = self.cached_indicator('rolling_std', lookback, lambda: price_windows.std(axis=-1, ddof=1))
+        
+        rsi = self.cached_indicator('rsi', 14, lambda: trailing_rsi(closes, 14))[rows]
+        band_period = self.bollinger_period
+        band_middle = self.cached_indicator(
+            'sma', band_period, lambda: trailing_sum(closes, band_period) / band_period
+        )[rows]
+        band_std = self.cached_indicator(
+            'rolling_population_std', band_period,
+            lambda: sliding_window_view(closes, band_period, axis=0).std(axis=-1)
+        )[lookback - band_period:]
+        bollinger_upper = band_middle + self.bollinger_std * band_std
+        bollinger_lower = band_middle - self.bollinger_std * band_std
+        
+        avg_volume = self.cached_indicator('volume_sma', 10, lambda: trailing_sum(volumes, 10) / 10)[rows]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_deviation = np.where(mean_price > 0, (current_price - mean_price) / mean_price, 0.0)
+            z_score = np.where(std_dev > 0, (current_price - mean_price) / std_dev, 0.0)
+            volume_ratio = np.where(avg_volume > 0, volume_windows[..., -1] / avg_volume, 1.0)
+            lower_band_deviation = (bollinger_lower - current_price) / bollinger_lower
+            upper_band_deviation = (current_price - bollinger_upper) / bollinger_upper
+        
+        volume_confirmed = (volume_ratio > 1.2) if self.volume_confirmation else np.zeros(volume_ratio.shape, dtype=bool)
+        
+        # Conditions are summed in the same order as _analyze_mean_reversion
+        oversold_strength = np.zeros(current_price.shape)
+        oversold_strength = oversold_strength + np.where(
+            price_deviation < -self.mean_reversion_threshold, np.abs(price_deviation) * 2, 0.0
+        )
+        oversold_strength = oversold_strength + np.where(
+            z_score < -self.std_dev_threshold,
+            np.minimum(np.abs(z_score) / self.std_dev_threshold * 0.3, 0.3),
+            0.0
+        )
+        oversold_strength = oversold_strength + np.where(rsi < self.rsi_oversold, 0.25, 0.0)
+        oversold_strength = oversold_strength + np.where(
+            current_price < bollinger_lower, np.minimum(lower_band_deviation * 2, 0.2), 0.0
+        )
+        oversold_strength = oversold_strength + np.where(volume_confirmed, 0.1, 0.0)
+        
+        overbought_strength = np.zeros(current_price.shape)
+        overbought_strength = overbought_strength + np.where(
+            price_deviation > self.mean_reversion_threshold, price_deviation * 2, 0.0
+        )
+        overbought_strength = overbought_strength + np.where(
+            z_score > self.std_dev_threshold,
+            np.minimum(z_score / self.std_dev_threshold * 0.3, 0.3),
+            0.0
+        )
+        overbought_strength = overbought_strength + np.where(rsi > self.rsi_overbought, 0.25, 0.0)
+        overbought_strength = overbought_strength + np.where(
+            current_price > bollinger_upper, np.minimum(upper_band_deviation * 2, 0.2), 0.0
+        )
+        overbought_strength = overbought_strength + np.where(volume_confirmed, 0.1, 0.0)
+        
+        # Reduce strength against the trend
+        if self.trend_filter:
+            sma_short = self.cached_indicator('sma', 10, lambda: trailing_sum(closes, 10) / 10)[rows]
+            sma_long = self.cached_indicator('sma', 20, lambda: trailing_sum(closes, 20) / 20)[rows]
+            trend_up = sma_short > sma_long
+            oversold_strength = np.where(
+                ~trend_up & (oversold_strength > 0), oversold_strength * 0.7, oversold_strength
+            )
+            overbought_strength = np.where(
+                trend_up & (overbought_strength > 0), overbought_strength * 0.7, overbought_strength
+            )
+        
+        buy_strength = np.minimum(oversold_strength, 1.0)
+        sell_strength = np.minimum(overbought_strength, 1.0)
+        is_buy = (oversold_strength > overbought_strength) & (buy_strength >= self.min_reversion_strength)
+        is_sell = (overbought_strength > oversold_strength) & (sell_strength >= self.min_reversion_strength)
+        
+        complete = self.cached_indicator(
+            'complete_window', lookback,
+            lambda: np.isfinite(price_windows).all(axis=-1) & np.isfinite(volume_windows).all(axis=-1)
+        )
+        valid = (
+            complete
+            & np.isfinite(oversold_strength)
+            & np.isfinite(overbought_strength)
+        )
+        signals[rows] = np.where(
+            valid, np.where(is_buy, buy_strength, np.where(is_sell, -sell_strength, 0.0)), 0.0
+        )
+        
+        return signals
+    
     def _calculate_mean_reversion_score(
         self,
         current_price: float,
@@ -5,13 +5,18 @@ This module implements momentum-based trading strategies that follow
 market trends and generate signals based on price momentum indicators.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from decimal import Decimal
 from datetime import datetime, timezone
 import logging
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from .base import Strategy, StrategySignal, SignalType
+from .signal_matrix import trailing_rsi, trailing_sum, window_ema
 from ..models.core import Quote, PortfolioSnapshot
+from ..models.quote_frame import BarArray
 from ..models.config import StrategyConfig
 from ..analysis.technical_analysis import TechnicalAnalysis
 
@@ -54,7 +59,7 @@ class MomentumStrategy(Strategy):
         self,
         market_data: Dict[str, Quote],
         portfolio: PortfolioSnapshot,
-        historical_data: Optional[Dict[str, List[Quote]]] = None
+        historical_data: Optional[Dict[str, Sequence[Quote]]] = None
     ) -> List[StrategySignal]:
         """
         Generate momentum-based trading signals.
@@ -95,7 +100,7 @@ class MomentumStrategy(Strategy):
         self,
         symbol: str,
         current_quote: Quote,
-        historical_quotes: List[Quote]
+        historical_quotes: Sequence[Quote]
     ) -> Optional[StrategySignal]:
         """
         Analyze momentum for a specific symbol.
@@ -109,17 +114,23 @@ class MomentumStrategy(Strategy):
             Momentum signal if conditions are met, None otherwise
         """
         # Extract price data
-        prices = [float(quote.close) for quote in historical_quotes[-self.lookback_period:]]
-        volumes = [quote.volume for quote in historical_quotes[-self.lookback_period:]]
+        window = historical_quotes[-self.lookback_period:]
+        if isinstance(window, BarArray):
+            prices = window.close.tolist()
+            volumes = [volume if volume >= 0 else None for volume in window.volume.tolist()]
+        else:
+            prices = [float(quote.close) for quote in window]
+            volumes = [quote.volume for quote in window]
         
         if len(prices) < self.lookback_period:
             return None
         
         # Calculate technical indicators
-        rsi = self.technical_analysis.calculate_rsi(prices, period=14)
-        macd_line, macd_signal, _ = self.technical_analysis.calculate_macd(prices)
-        sma_short = self.technical_analysis.calculate_sma(prices, period=10)
-        sma_long = self.technical_analysis.calculate_sma(prices, period=20)
+        rsi = self.shared_indicator(symbol, 'rsi', window, prices, period=14)
+        macd = self.shared_indicator(symbol, 'macd', window, prices)
+        macd_line, macd_signal = macd['macd'], macd['signal']
+        sma_short = self.shared_indicator(symbol, 'sma', window, prices, period=10)
+        sma_long = self.shared_indicator(symbol, 'sma', window, prices, period=20)
         
         current_price = float(current_quote.close)
         
@@ -224,6 +235,107 @@ class MomentumStrategy(Strategy):
         
         return None
     
+    def generate_signal_matrix(self, closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        """
+        Compute momentum signal strengths for every date and symbol at once.
+        
+        Applies the ``_analyze_momentum`` rules to each trailing window of
+        ``lookback_period`` bars. Windows with missing bars produce no signal.
+        
+        Args:
+            closes: Close prices with shape (dates, symbols), NaN where missing
+            volumes: Volumes with the same shape, NaN where missing
+            
+        Returns:
+            Signal matrix: positive buy strengths, negative sell strengths, 0 for hold
+        """
+        closes = np.asarray(closes, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+        lookback = self.lookback_period
+        signals = np.zeros(closes.shape)
+        
+        # The MACD crossover check needs two signal-line values (35 bars)
+        if lookback < 35 or closes.shape[0] < lookback:
+            return signals
+        
+        rows = slice(lookback - 1, None)
+        price_windows = sliding_window_view(closes, lookback, axis=0)
+        volume_windows = sliding_window_view(volumes, lookback, axis=0)
+        
+        # Indicators only depend on periods, so they can be shared across parameter sweeps
+        rsi = self.cached_indicator('rsi', 14, lambda: trailing_rsi(closes, 14))[rows]
+        sma_short = self.cached_indicator('sma', 10, lambda: trailing_sum(closes, 10) / 10)[rows]
+        sma_long = self.cached_indicator('sma', 20, lambda: trailing_sum(closes, 20) / 20)[rows]
+        avg_volume = self.cached_indicator('volume_sma', 10, lambda: trailing_sum(volumes, 10) / 10)[rows]
+        
+        # MACD is seeded at the start of each window, so it depends on the lookback
+        macd_now, macd_prev, signal_now, signal_prev = self.cached_indicator(
+            'macd_crossover', lookback, lambda: self._window_macd(price_windows)
+        )
+        
+        current_price = price_windows[..., -1]
+        previous_price = price_windows[..., -2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change = (current_price - previous_price) / previous_price
+            volume_ratio = np.where(avg_volume > 0, volume_windows[..., -1] / avg_volume, 1.0)
+        
+        # Conditions are summed in the same order as _analyze_momentum
+        bullish_strength = np.zeros(current_price.shape)
+        bullish_strength = bullish_strength + np.where((rsi < self.rsi_overbought) & (rsi > 50), 0.2, 0.0)
+        bullish_strength = bullish_strength + np.where(
+            macd_now > signal_now, np.where(macd_prev <= signal_prev, 0.3, 0.1), 0.0
+        )
+        bullish_strength = bullish_strength + np.where(
+            price_change > self.price_change_threshold, 0.25, np.where(price_change > 0, 0.1, 0.0)
+        )
+        bullish_strength = bullish_strength + np.where(volume_ratio > self.volume_threshold, 0.15, 0.0)
+        bullish_strength = bullish_strength + np.where(sma_short > sma_long, 0.1, 0.0)
+        
+        bearish_strength = np.zeros(current_price.shape)
+        bearish_strength = bearish_strength + np.where(
+            rsi > self.rsi_overbought, 0.2, np.where(rsi < 50, 0.1, 0.0)
+        )
+        bearish_strength = bearish_strength + np.where(
+            macd_now < signal_now, np.where(macd_prev >= signal_prev, 0.3, 0.1), 0.0
+        )
+        bearish_strength = bearish_strength + np.where(
+            price_change < -self.price_change_threshold, 0.25, np.where(price_change < 0, 0.1, 0.0)
+        )
+        bearish_strength = bearish_strength + np.where(sma_short < sma_long, 0.1, 0.0)
+        
+        buy_strength = np.minimum(bullish_strength, 1.0)
+        sell_strength = np.minimum(bearish_strength, 1.0)
+        is_buy = (bullish_strength > bearish_strength) & (buy_strength >= self.min_momentum_strength)
+        is_sell = (bearish_strength > bullish_strength) & (sell_strength >= self.min_momentum_strength)
+        
+        complete = self.cached_indicator(
+            'complete_window', lookback,
+            lambda: np.isfinite(price_windows).all(axis=-1) & np.isfinite(volume_windows).all(axis=-1)
+        )
+        valid = complete & np.isfinite(price_change)
+        signals[rows] = np.where(
+            valid, np.where(is_buy, buy_strength, np.where(is_sell, -sell_strength, 0.0)), 0.0
+        )
+        
+        return signals
+    
+    def _window_macd(self, price_windows: np.ndarray) -> np.ndarray:
+        """
+        Compute the last two MACD and signal line values of each price window.
+        
+        Args:
+            price_windows: Sliding windows of prices with the window on the last axis
+            
+        Returns:
+            Array stacking the current MACD, previous MACD, current signal and
+            previous signal values
+        """
+        fast_ema = window_ema(price_windows, 12)
+        slow_ema = window_ema(price_windows, 26)
+        macd_line = np.stack([fast - slow for fast, slow in zip(fast_ema[14:], slow_ema)], axis=-1)
+        macd_signal = window_ema(macd_line, 9)
+        return np.stack([macd_line[..., -1], macd_line[..., -2], macd_signal[-1], macd_signal[-2]])
+    
     def update_state(
         self,
         market_data: Dict[str, Quote],
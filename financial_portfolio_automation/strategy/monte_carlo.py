@@ -0,0 +1,448 @@
+"""
+Monte Carlo engines for the backtester.
+
+This module provides two engines. The process-pool engine runs bootstrapped
+strategy backtests across worker processes: the base price history is packed
+once into a shared memory block, each worker attaches to it, rebuilds the
+quotes a single time and then draws its own seeded bootstrap sample per
+simulation, so memory use does not grow with the number of simulations.
+
+The path-level engine works directly on log-return matrices. It generates
+paths x horizon x symbols return arrays with NumPy (block or stationary
+bootstrap, GBM or Student-t) and evaluates portfolio outcomes for all paths
+in batch.
+"""
+
+import copy
+import logging
+import os
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import Strategy
+from .market_data_index import MarketDataIndex
+from ..models.core import Quote
+
+
+logger = logging.getLogger(__name__)
+
+
+# Packed quote layout; missing prices are NaN and missing sizes are -1
+QUOTE_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('bid', 'f8'),
+    ('ask', 'f8'),
+    ('bid_size', 'i8'),
+    ('ask_size', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'i8'),
+])
+
+_PRICE_FIELDS = ('bid', 'ask', 'open', 'high', 'low', 'close')
+_SIZE_FIELDS = ('bid_size', 'ask_size', 'volume')
+_EPOCH = datetime(1970, 1, 1)
+
+# Per-process state populated by the pool initializer
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _pack_quote(quote: Quote) -> tuple:
+    """Convert a quote to a QUOTE_DTYPE row."""
+    delta = quote.timestamp.replace(tzinfo=None) - _EPOCH
+    timestamp = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    return (
+        timestamp,
+        np.nan if quote.bid is None else float(quote.bid),
+        np.nan if quote.ask is None else float(quote.ask),
+        -1 if quote.bid_size is None else quote.bid_size,
+        -1 if quote.ask_size is None else quote.ask_size,
+        np.nan if quote.open is None else float(quote.open),
+        np.nan if quote.high is None else float(quote.high),
+        np.nan if quote.low is None else float(quote.low),
+        np.nan if quote.close is None else float(quote.close),
+        -1 if quote.volume is None else quote.volume,
+    )
+
+
+class SharedQuoteHistory:
+    """
+    Historical quotes packed into a single shared memory block.
+
+    Prices are stored as float64 and converted back to ``Decimal`` through
+    their shortest repr, which round-trips any price with up to 15
+    significant digits exactly.
+    """
+
+    def __init__(self, historical_data: Dict[str, List[Quote]]):
+        """
+        Pack historical data into shared memory.
+
+        Args:
+            historical_data: Historical market data by symbol
+
+        Raises:
+            ValueError: If a symbol mixes timezone-aware and naive timestamps
+        """
+        total = sum(len(quotes) for quotes in historical_data.values())
+        self._shm = SharedMemory(create=True, size=max(1, total * QUOTE_DTYPE.itemsize))
+
+        symbols = []
+        offset = 0
+        packed = np.ndarray((total,), dtype=QUOTE_DTYPE, buffer=self._shm.buf)
+
+        try:
+            for symbol, quotes in historical_data.items():
+                tzinfos = {quote.timestamp.tzinfo for quote in quotes}
+                if len(tzinfos) > 1:
+                    raise ValueError(f"Quotes for {symbol} must share a single timezone")
+                tzinfo = tzinfos.pop() if tzinfos else None
+
+                rows = [_pack_quote(quote) for quote in quotes]
+                if rows:
+                    packed[offset:offset + len(rows)] = np.array(rows, dtype=QUOTE_DTYPE)
+
+                symbols.append((symbol, offset, len(quotes), tzinfo))
+                offset += len(quotes)
+        except Exception:
+            del packed
+            self.close()
+            raise
+
+        del packed
+        self.layout = {'name': self._shm.name, 'total': total, 'symbols': symbols}
+
+    def close(self) -> None:
+        """Release and unlink the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'SharedQuoteHistory':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def load_shared_history(layout: Dict[str, Any]) -> Dict[str, List[Quote]]:
+    """
+    Rebuild quotes from a shared memory block created by SharedQuoteHistory.
+
+    Args:
+        layout: Layout descriptor from ``SharedQuoteHistory.layout``
+
+    Returns:
+        Historical market data by symbol
+    """
+    shm = SharedMemory(name=layout['name'])
+    try:
+        packed = np.ndarray((layout['total'],), dtype=QUOTE_DTYPE, buffer=shm.buf)
+        historical_data = {}
+
+        for symbol, offset, count, tzinfo in layout['symbols']:
+            quotes = []
+            for row in packed[offset:offset + count].tolist():
+                fields = dict(zip(QUOTE_DTYPE.names, row))
+                timestamp = _EPOCH + timedelta(microseconds=fields.pop('timestamp'))
+                for name in _PRICE_FIELDS:
+                    value = fields[name]
+                    fields[name] = None if value != value else Decimal(repr(value))
+                for name in _SIZE_FIELDS:
+                    if fields[name] < 0:
+                        fields[name] = None
+                quotes.append(Quote.from_trusted(symbol=symbol, timestamp=timestamp.replace(tzinfo=tzinfo), **fields))
+            historical_data[symbol] = quotes
+
+        del packed
+        return historical_data
+    finally:
+        shm.close()
+
+
+def bootstrap_sample(historical_data: Dict[str, List[Quote]],
+                     rng: random.Random) -> Dict[str, List[Quote]]:
+    """
+    Draw one bootstrap sample (with replacement) of each symbol's quotes.
+
+    Args:
+        historical_data: Historical market data by symbol
+        rng: Seeded random generator for this sample
+
+    Returns:
+        Resampled market data, sorted chronologically per symbol
+    """
+    sample = {}
+
+    for symbol, quotes in historical_data.items():
+        if len(quotes) < 2:
+            sample[symbol] = quotes.copy()
+            continue
+
+        resampled = rng.choices(quotes, k=len(quotes))
+        resampled.sort(key=lambda q: q.timestamp)
+        sample[symbol] = resampled
+
+    return sample
+
+
+def simulation_seed(random_seed: int, simulation_id: int) -> int:
+    """Derive a distinct, reproducible seed for a single simulation."""
+    return (random_seed << 32) + simulation_id
+
+
+def _init_worker(layout: Dict[str, Any],
+                 strategy_bytes: bytes,
+                 backtester_args: Tuple[Any, Decimal],
+                 start_date: datetime,
+                 end_date: datetime,
+                 random_seed: int) -> None:
+    """Attach to the shared history and unpack the strategy once per worker."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(
+        historical_data=load_shared_history(layout),
+        strategy=pickle.loads(strategy_bytes),
+        backtester_args=backtester_args,
+        start_date=start_date,
+        end_date=end_date,
+        random_seed=random_seed,
+    )
+
+
+def _run_worker_simulation(simulation_id: int) -> Tuple[int, Any, Optional[str]]:
+    """Generate one bootstrap sample lazily and backtest it."""
+    from .backtester import Backtester
+
+    state = _WORKER_STATE
+    try:
+        rng = random.Random(simulation_seed(state['random_seed'], simulation_id))
+        dataset = bootstrap_sample(state['historical_data'], rng)
+
+        backtester = Backtester(*state['backtester_args'])
+        result = backtester.run_backtest(
+            copy.deepcopy(state['strategy']), dataset, state['start_date'], state['end_date']
+        )
+        return simulation_id, result, None
+    except Exception as e:
+        return simulation_id, None, str(e)
+
+
+def run_process_pool_simulations(strategy: Strategy,
+                                 historical_data: Dict[str, List[Quote]],
+                                 start_date: datetime,
+                                 end_date: datetime,
+                                 num_simulations: int,
+                                 backtester_args: Tuple[Any, Decimal],
+                                 max_workers: Optional[int] = None,
+                                 random_seed: Optional[int] = None) -> List[Any]:
+    """
+    Run bootstrapped Monte Carlo backtests on a process pool.
+
+    Args:
+        strategy: Strategy to simulate (pickled once per worker)
+        historical_data: Base historical market data
+        start_date: Simulation start date
+        end_date: Simulation end date
+        num_simulations: Number of Monte Carlo runs
+        backtester_args: ``(transaction_costs, initial_capital)`` for each run
+        max_workers: Worker processes (defaults to the machine's CPU count)
+        random_seed: Base seed; simulation ``i`` always uses the same sample
+
+    Returns:
+        BacktestResults of successful simulations in simulation order
+    """
+    workers = max(1, min(max_workers or os.cpu_count() or 1, num_simulations))
+    if random_seed is None:
+        random_seed = random.randrange(2 ** 31)
+
+    chunksize = max(1, num_simulations // (workers * 4))
+    strategy_bytes = pickle.dumps(strategy)
+    results = []
+
+    with SharedQuoteHistory(historical_data) as shared_history:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared_history.layout, strategy_bytes, backtester_args,
+                      start_date, end_date, random_seed)
+        ) as executor:
+            for simulation_id, result, error in executor.map(
+                _run_worker_simulation, range(num_simulations), chunksize=chunksize
+            ):
+                if error is not None:
+                    logger.warning(f"Simulation {simulation_id} failed: {error}")
+                else:
+                    results.append(result)
+
+    return results
+
+
+# Path generation methods supported by the vectorized engine
+PATH_METHODS = ('block_bootstrap', 'stationary_bootstrap', 'gbm', 'student_t')
+
+
+def build_log_return_matrix(historical_data: Dict[str, List[Quote]],
+                            start_date: datetime,
+                            end_date: datetime) -> Tuple[List[str], np.ndarray]:
+    """
+    Build a date-aligned log-return matrix from historical quotes.
+
+    Prices use the bar close when present and the bid/ask mid-price otherwise.
+    Gaps are forward-filled and dates before every symbol has a price are
+    dropped.
+
+    Args:
+        historical_data: Historical market data by symbol
+        start_date: First date to include
+        end_date: Last date to include
+
+    Returns:
+        Tuple of (symbols, log returns with shape (dates - 1, symbols))
+    """
+    index = MarketDataIndex(historical_data)
+    symbols = index.symbols
+    trading_dates = index.trading_dates(start_date, end_date)
+
+    prices = np.full((len(trading_dates), len(symbols)), np.nan)
+    for t, trading_date in enumerate(trading_dates):
+        market_data = index.market_data_for_date(trading_date)
+        for j, symbol in enumerate(symbols):
+            quote = market_data.get(symbol)
+            if quote is None:
+                continue
+            price = quote.close if quote.close is not None else quote.mid_price
+            if price is not None and price > 0:
+                prices[t, j] = float(price)
+
+    # Forward-fill gaps column by column
+    valid = ~np.isnan(prices)
+    last_valid = np.where(valid, np.arange(len(trading_dates))[:, None], 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    prices = prices[last_valid, np.arange(len(symbols))]
+
+    prices = prices[~np.isnan(prices).any(axis=1)]
+    if len(prices) < 2:
+        raise ValueError("At least two priced dates are required to build return paths")
+
+    return symbols, np.diff(np.log(prices), axis=0)
+
+
+def generate_return_paths(log_returns: np.ndarray,
+                          num_paths: int,
+                          horizon: int,
+                          method: str = 'stationary_bootstrap',
+                          block_size: int = 20,
+                          degrees_of_freedom: float = 5.0,
+                          rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Generate simulated log-return paths.
+
+    Args:
+        log_returns: Historical log returns with shape (periods, symbols)
+        num_paths: Number of paths to generate
+        horizon: Periods per path
+        method: One of PATH_METHODS
+        block_size: Block length (fixed) or mean block length (stationary)
+        degrees_of_freedom: Student-t degrees of freedom (must exceed 2)
+        rng: NumPy random generator
+
+    Returns:
+        Log returns with shape (num_paths, horizon, symbols)
+    """
+    rng = rng or np.random.default_rng()
+    periods = log_returns.shape[0]
+    steps = np.arange(horizon)
+
+    if method == 'block_bootstrap':
+        # Circular block bootstrap with fixed-length blocks
+        num_blocks = -(-horizon // block_size)
+        starts = rng.integers(0, periods, size=(num_paths, num_blocks))
+        indices = (starts[:, :, None] + np.arange(block_size)) % periods
+        return log_returns[indices.reshape(num_paths, -1)[:, :horizon]]
+
+    if method == 'stationary_bootstrap':
+        # Politis-Romano: a new block starts with probability 1 / block_size
+        new_block = rng.random((num_paths, horizon)) < 1.0 / block_size
+        new_block[:, 0] = True
+        block_start_step = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+        starts = np.take_along_axis(
+            rng.integers(0, periods, size=(num_paths, horizon)), block_start_step, axis=1
+        )
+        return log_returns[(starts + steps - block_start_step) % periods]
+
+    mean = log_returns.mean(axis=0)
+    cov = np.atleast_2d(np.cov(log_returns, rowvar=False))
+
+    if method == 'gbm':
+        return rng.multivariate_normal(mean, cov, size=(num_paths, horizon))
+
+    if method == 'student_t':
+        if degrees_of_freedom <= 2:
+            raise ValueError("Student-t paths require more than 2 degrees of freedom")
+        # Scale so the simulated covariance matches the historical covariance
+        scale = cov * (degrees_of_freedom - 2) / degrees_of_freedom
+        normal = rng.multivariate_normal(np.zeros(len(mean)), scale, size=(num_paths, horizon))
+        chi2 = rng.chisquare(degrees_of_freedom, size=(num_paths, horizon, 1)) / degrees_of_freedom
+        return mean + normal / np.sqrt(chi2)
+
+    raise ValueError(f"Unsupported path method: {method}. Use one of {PATH_METHODS}")
+
+
+def evaluate_portfolio_paths(return_paths: np.ndarray,
+                             weights: np.ndarray,
+                             rebalance: bool = False,
+                             risk_free_rate: float = 0.02) -> Dict[str, np.ndarray]:
+    """
+    Evaluate portfolio outcomes for a batch of return paths.
+
+    Metrics follow PortfolioAnalyzer conventions: Sharpe ratio from daily
+    returns annualized over 252 periods, and max drawdown as a positive
+    fraction of the running peak.
+
+    Args:
+        return_paths: Log returns with shape (paths, horizon, symbols)
+        weights: Portfolio weights per symbol (summing to 1)
+        rebalance: Rebalance to target weights every period instead of buy-and-hold
+        risk_free_rate: Annual risk-free rate for the Sharpe ratio
+
+    Returns:
+        Dictionary of per-path 'total_return', 'max_drawdown' and 'sharpe_ratio'
+    """
+    if rebalance:
+        values = np.cumprod(1.0 + np.expm1(return_paths) @ weights, axis=1)
+    else:
+        values = np.exp(np.cumsum(return_paths, axis=1)) @ weights
+
+    values = np.concatenate([np.ones((values.shape[0], 1)), values], axis=1)
+    period_returns = values[:, 1:] / values[:, :-1] - 1.0
+
+    annual_return = period_returns.mean(axis=1) * 252
+    if period_returns.shape[1] > 1:
+        annual_volatility = period_returns.std(axis=1, ddof=1) * np.sqrt(252)
+    else:
+        annual_volatility = np.zeros(values.shape[0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe_ratio = np.where(
+            annual_volatility > 0, (annual_return - risk_free_rate) / annual_volatility, 0.0
+        )
+
+    running_peak = np.maximum.accumulate(values, axis=1)
+    max_drawdown = (1.0 - values / running_peak).max(axis=1)
+
+    return {
+        'total_return': values[:, -1] - 1.0,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe_ratio,
+    }
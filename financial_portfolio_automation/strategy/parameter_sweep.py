@@ -0,0 +1,439 @@
+"""
+Parameter sweep engine for strategy optimization.
+
+This module evaluates a strategy over a grid of parameter combinations and
+ranks the results by an objective. Indicator series are computed once per
+(symbol, indicator, period) and shared by every combination through an
+``IndicatorCache``, combinations run in parallel, and an optional screening
+stage prunes poorly performing regions of the grid before the full run.
+
+Vectorized combinations run on a thread pool: their numpy kernels release
+the GIL and they share one in-process indicator cache. Event-driven
+combinations are pure Python, so they run on a process pool that receives
+the historical data once per worker.
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+import logging
+
+import pandas as pd
+
+from .backtester import Backtester, BacktestResults, TransactionCosts
+from .base import Strategy
+from .factory import get_global_factory
+from .indicator_cache import IndicatorCache
+from .vectorized_backtester import MarketDataMatrices, VectorizedBacktester
+from ..models.config import StrategyConfig
+from ..models.core import Quote
+
+
+logger = logging.getLogger(__name__)
+
+
+# Objective name -> (BacktestResults attribute, direction where 1 means higher is better)
+OBJECTIVES = {
+    'sharpe': ('sharpe_ratio', 1),
+    'return': ('total_return', 1),
+    'sortino': ('sortino_ratio', 1),
+    'calmar': ('calmar_ratio', 1),
+    'max_drawdown': ('max_drawdown', -1)
+}
+
+# Per-process state populated by the pool initializer
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(sweep: 'ParameterSweep',
+                 historical_data: Dict[str, List[Quote]],
+                 start_date: datetime,
+                 end_date: datetime) -> None:
+    """Store the sweep and its period once per worker process."""
+    _WORKER_STATE.update(
+        sweep=sweep, historical_data=historical_data, start_date=start_date, end_date=end_date
+    )
+
+
+def _evaluate_in_worker(parameters: Dict[str, Any]) -> 'SweepResult':
+    """Backtest one combination on the event-driven engine in a worker process."""
+    state = _WORKER_STATE
+    return state['sweep']._evaluate(
+        parameters, state['historical_data'], state['start_date'], state['end_date'], None, None
+    )
+
+
+def expand_parameter_grid(parameter_grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into all parameter combinations.
+
+    Args:
+        parameter_grid: Candidate values by parameter name
+
+    Returns:
+        List of parameter dictionaries, one per combination
+    """
+    names = list(parameter_grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*parameter_grid.values())]
+
+
+def parameter_grid_from_ranges(parameter_ranges: Dict[str, Dict[str, float]]) -> Dict[str, List[Any]]:
+    """
+    Build a parameter grid from min/max/step ranges.
+
+    Ranges whose bounds and step are all whole numbers produce integer values.
+
+    Args:
+        parameter_ranges: Ranges by parameter name with 'min', 'max' and 'step' keys
+
+    Returns:
+        Candidate values by parameter name
+    """
+    grid = {}
+
+    for name, spec in parameter_ranges.items():
+        minimum, maximum = spec['min'], spec['max']
+        step = spec.get('step') or (maximum - minimum) or 1
+
+        if step <= 0:
+            raise ValueError(f"Step for parameter {name} must be positive")
+        if maximum < minimum:
+            raise ValueError(f"Maximum for parameter {name} must not be below its minimum")
+
+        count = int(math.floor((maximum - minimum) / step + 1e-9)) + 1
+        values = [minimum + i * step for i in range(count)]
+
+        if all(float(v).is_integer() for v in (minimum, maximum, step)):
+            grid[name] = [int(round(v)) for v in values]
+        else:
+            grid[name] = [round(v, 10) for v in values]
+
+    return grid
+
+
+@dataclass
+class SweepResult:
+    """Result of evaluating one parameter combination."""
+
+    parameters: Dict[str, Any]
+    status: str  # 'completed', 'pruned' or 'failed'
+    score: Optional[float] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class SweepResults:
+    """Ranked results of a parameter sweep."""
+
+    objective: str
+    results: List[SweepResult]
+    total_combinations: int
+    cache_stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def completed(self) -> List[SweepResult]:
+        """Get combinations that ran over the full period, best first."""
+        return [r for r in self.results if r.status == 'completed']
+
+    @property
+    def best(self) -> Optional[SweepResult]:
+        """Get the best completed combination."""
+        completed = self.completed
+        return completed[0] if completed else None
+
+    @property
+    def best_parameters(self) -> Dict[str, Any]:
+        """Get the parameters of the best completed combination."""
+        return dict(self.best.parameters) if self.best else {}
+
+    def to_table(self) -> List[Dict[str, Any]]:
+        """
+        Get the ranked results as table rows.
+
+        Returns:
+            One row per combination with rank, parameters, score, key metrics and status
+        """
+        rows = []
+        for rank, result in enumerate(self.results, 1):
+            row = {'rank': rank}
+            row.update(result.parameters)
+            row['score'] = result.score
+            row.update(result.metrics)
+            row['status'] = result.status
+            if result.error:
+                row['error'] = result.error
+            rows.append(row)
+        return rows
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get the ranked results as a DataFrame."""
+        return pd.DataFrame(self.to_table())
+
+
+class ParameterSweep:
+    """
+    Grid-search engine that backtests every combination of strategy parameters.
+
+    Strategies implementing the signal-matrix API run on the
+    ``VectorizedBacktester`` with quote matrices and indicator series shared
+    across combinations; other strategies run on the event-driven ``Backtester``
+    in worker processes.
+    """
+
+    def __init__(self,
+                 base_config: StrategyConfig,
+                 strategy_class: Optional[Type[Strategy]] = None,
+                 transaction_costs: Optional[TransactionCosts] = None,
+                 initial_capital: Decimal = Decimal('100000'),
+                 objective: str = 'sharpe',
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the parameter sweep.
+
+        Args:
+            base_config: Strategy configuration the swept parameters are applied to
+            strategy_class: Strategy class to instantiate (resolved from the
+                strategy type if None)
+            transaction_costs: Transaction cost configuration
+            initial_capital: Initial capital for each backtest
+            objective: Ranking objective ('sharpe', 'return', 'sortino', 'calmar'
+                or 'max_drawdown')
+            max_workers: Maximum number of worker threads, or processes for
+                event-driven strategies (defaults to the CPU count)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unsupported optimization objective: {objective}")
+
+        self.base_config = base_config
+        self.strategy_class = strategy_class or get_global_factory().get_strategy_class(
+            base_config.strategy_type
+        )
+        self.transaction_costs = transaction_costs or TransactionCosts()
+        self.initial_capital = initial_capital
+        self.objective = objective
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.logger = logging.getLogger(__name__)
+
+    def run(self,
+            historical_data: Dict[str, List[Quote]],
+            start_date: datetime,
+            end_date: datetime,
+            parameter_grid: Dict[str, Sequence[Any]],
+            max_combinations: Optional[int] = None,
+            prune_fraction: Optional[float] = None,
+            prune_keep: float = 0.5,
+            progress_callback: Optional[Callable[[int], None]] = None) -> SweepResults:
+        """
+        Run the parameter sweep.
+
+        With ``prune_fraction`` set, every combination is first screened on the
+        leading fraction of the period and only the best ``prune_keep`` share
+        of them is run over the full period; the rest are reported as pruned.
+
+        Args:
+            historical_data: Historical market data by symbol
+            start_date: Backtest start date
+            end_date: Backtest end date
+            parameter_grid: Candidate values by parameter name
+            max_combinations: Maximum number of combinations to evaluate
+            prune_fraction: Fraction of the period used for screening (0 to 1)
+            prune_keep: Fraction of screened combinations kept for the full run
+            progress_callback: Called with the number of finished combinations
+
+        Returns:
+            SweepResults ranked by objective
+        """
+        combinations = expand_parameter_grid(parameter_grid)
+        if max_combinations is not None and len(combinations) > max_combinations:
+            self.logger.warning(
+                f"Parameter grid has {len(combinations)} combinations, evaluating first {max_combinations}"
+            )
+            combinations = combinations[:max_combinations]
+
+        if not combinations:
+            raise ValueError("Parameter grid is empty")
+
+        if prune_fraction is not None and not 0 < prune_fraction < 1:
+            raise ValueError("Prune fraction must be between 0 and 1")
+        if not 0 < prune_keep <= 1:
+            raise ValueError("Prune keep fraction must be between 0 and 1")
+
+        self.logger.info(f"Running parameter sweep over {len(combinations)} combinations")
+
+        finished = [0]
+
+        def report_progress(count: int) -> None:
+            finished[0] += count
+            if progress_callback:
+                progress_callback(finished[0])
+
+        caches = []
+        pruned: List[SweepResult] = []
+
+        if prune_fraction is not None and len(combinations) > 1:
+            screening_end = start_date + (end_date - start_date) * prune_fraction
+            screened = self._evaluate_all(combinations, historical_data, start_date, screening_end, caches)
+
+            ranked = self._rank(screened)
+            keep = max(1, math.ceil(len(combinations) * prune_keep))
+            survivors = [r for r in ranked if r.status == 'completed'][:keep]
+
+            if not survivors:
+                # Screening was uninformative; run everything over the full period
+                self.logger.warning("No combination completed screening, skipping pruning")
+                survivors = ranked
+
+            survivor_ids = {id(r) for r in survivors}
+            for result in ranked:
+                if id(result) not in survivor_ids:
+                    if result.status == 'completed':
+                        result.status = 'pruned'
+                    pruned.append(result)
+
+            report_progress(len(pruned))
+            combinations = [r.parameters for r in survivors]
+            self.logger.info(f"Pruned {len(pruned)} combinations after screening")
+
+        final = self._evaluate_all(
+            combinations, historical_data, start_date, end_date, caches,
+            on_result=lambda result: report_progress(1)
+        )
+
+        return SweepResults(
+            objective=self.objective,
+            results=self._rank(final) + self._rank(pruned),
+            total_combinations=len(final) + len(pruned),
+            cache_stats=self._combine_cache_stats(caches)
+        )
+
+    def _evaluate_all(self,
+                      combinations: List[Dict[str, Any]],
+                      historical_data: Dict[str, List[Quote]],
+                      start_date: datetime,
+                      end_date: datetime,
+                      caches: List[IndicatorCache],
+                      on_result: Optional[Callable[[SweepResult], None]] = None) -> List[SweepResult]:
+        """Evaluate combinations in parallel over one period."""
+        probe = self._create_strategy(combinations[0])
+        market_data = None
+        cache = None
+
+        # Quote matrices and indicators are shared by every combination in this period
+        if probe.supports_vectorized:
+            symbols = [symbol for symbol in probe.symbols if symbol in historical_data]
+            market_data = MarketDataMatrices.from_quotes(historical_data, symbols, end_date)
+            cache = IndicatorCache(symbols)
+            caches.append(cache)
+
+        workers = max(1, min(self.max_workers, len(combinations)))
+        if market_data is None and workers > 1:
+            # The event-driven engine is pure Python and would serialize on the GIL
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self, historical_data, start_date, end_date)
+            )
+            tasks = [(_evaluate_in_worker, parameters) for parameters in combinations]
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            tasks = [
+                (self._evaluate, parameters, historical_data, start_date, end_date, market_data, cache)
+                for parameters in combinations
+            ]
+
+        results = []
+        with executor:
+            futures = [executor.submit(*task) for task in tasks]
+
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+        return results
+
+    def _evaluate(self,
+                  parameters: Dict[str, Any],
+                  historical_data: Dict[str, List[Quote]],
+                  start_date: datetime,
+                  end_date: datetime,
+                  market_data: Optional[MarketDataMatrices],
+                  cache: Optional[IndicatorCache]) -> SweepResult:
+        """Backtest a single parameter combination."""
+        try:
+            strategy = self._create_strategy(parameters)
+
+            if market_data is not None and strategy.supports_vectorized:
+                strategy.indicator_cache = cache
+                backtester = VectorizedBacktester(self.transaction_costs, self.initial_capital)
+                results = backtester.run_backtest(
+                    strategy, historical_data, start_date, end_date, market_data=market_data
+                )
+            else:
+                backtester = Backtester(self.transaction_costs, self.initial_capital)
+                results = backtester.run_backtest(strategy, historical_data, start_date, end_date)
+
+            return SweepResult(
+                parameters=parameters,
+                status='completed',
+                score=self._score(results),
+                metrics=self._summarize(results)
+            )
+
+        except Exception as e:
+            self.logger.warning(f"Parameter combination {parameters} failed: {e}")
+            return SweepResult(parameters=parameters, status='failed', error=str(e))
+
+    def _create_strategy(self, parameters: Dict[str, Any]) -> Strategy:
+        """Create a strategy instance with swept parameters applied."""
+        config = replace(
+            self.base_config,
+            parameters={**self.base_config.parameters, **parameters},
+            symbols=list(self.base_config.symbols)
+        )
+        return self.strategy_class(config)
+
+    def _score(self, results: BacktestResults) -> float:
+        """Get the objective value of a backtest, oriented so higher is better."""
+        attribute, direction = OBJECTIVES[self.objective]
+        value = float(getattr(results, attribute))
+        return direction * value if math.isfinite(value) else -math.inf
+
+    def _summarize(self, results: BacktestResults) -> Dict[str, Any]:
+        """Extract the key metrics reported in the results table."""
+        return {
+            'total_return': results.total_return,
+            'sharpe_ratio': results.sharpe_ratio,
+            'sortino_ratio': results.sortino_ratio,
+            'calmar_ratio': results.calmar_ratio,
+            'max_drawdown': results.max_drawdown,
+            'win_rate': results.win_rate,
+            'total_trades': results.total_trades,
+            'final_value': float(results.final_value)
+        }
+
+    def _rank(self, results: List[SweepResult]) -> List[SweepResult]:
+        """Sort results best first, with failed combinations last."""
+        return sorted(
+            results,
+            key=lambda r: (r.status == 'failed', -(r.score if r.score is not None else -math.inf))
+        )
+
+    def _combine_cache_stats(self, caches: List[IndicatorCache]) -> Dict[str, Any]:
+        """Combine statistics from the indicator caches of each stage."""
+        stats = {'hits': 0, 'misses': 0, 'cached_series': 0}
+        for cache in caches:
+            cache_stats = cache.get_stats()
+            for key in stats:
+                stats[key] += cache_stats[key]
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
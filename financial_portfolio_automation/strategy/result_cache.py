@@ -0,0 +1,338 @@
+"""
+Persistent cache of backtest results.
+
+Identical backtest requests (same strategy configuration, transaction costs,
+capital, period and market data) are common from the API, CLI and MCP tools.
+This module keys stored results by a stable hash of those inputs so repeated
+requests can return immediately, while any change to the configuration or the
+data produces a different key.
+"""
+
+import copy
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..models.core import Quote
+from ..models.quote_frame import COLUMNS, BarArray
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when cached BacktestResults or the key layout change incompatibly
+CACHE_FORMAT_VERSION = 2
+
+_QUOTE_FIELDS = ('timestamp', 'bid', 'ask', 'bid_size', 'ask_size', 'open', 'high', 'low', 'close', 'volume')
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a value to a JSON-serializable form with a stable representation."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, Decimal):
+        # Normalize so Decimal('1.0') and Decimal('1.00') hash the same
+        return f"D:{value.normalize()}"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, float):
+        return repr(value)
+    return value
+
+
+def stable_hash(value: Any) -> str:
+    """
+    Get a stable SHA-256 hash of a (possibly nested) configuration value.
+
+    Dataclasses, enums, Decimals and datetimes are supported, and dictionary
+    key order does not affect the result.
+
+    Args:
+        value: Value to hash
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(_canonical(value), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def fingerprint_historical_data(historical_data: Dict[str, Sequence[Quote]]) -> str:
+    """
+    Get a fingerprint of historical market data.
+
+    Columnar bars (BarArray/QuoteFrame) hash their raw columns, so any
+    changed, added or removed bar changes the fingerprint. Quote lists are
+    summarized by their length and their first and last quotes to keep the
+    key cheap for long histories; an in-place edit of an interior quote is
+    not detected, so pass columnar bars or clear the cache when rewriting
+    history.
+
+    Args:
+        historical_data: Historical market data by symbol
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for symbol in sorted(historical_data):
+        digest.update(f"#{symbol}\n".encode('utf-8'))
+        quotes = historical_data[symbol]
+        if isinstance(quotes, BarArray):
+            # Columnar bars hash their raw columns instead of formatted rows
+            digest.update(f"bars:{quotes.tzinfo}\n".encode('utf-8'))
+            for name in COLUMNS:
+                digest.update(np.ascontiguousarray(getattr(quotes, name)).tobytes())
+            continue
+        digest.update(f"quotes:{len(quotes)}\n".encode('utf-8'))
+        if len(quotes):
+            for quote in (quotes[0], quotes[-1]):
+                row = '|'.join(str(getattr(quote, name, None)) for name in _QUOTE_FIELDS)
+                digest.update(row.encode('utf-8'))
+                digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def strategy_state_key(state: Any) -> Dict[str, Any]:
+    """
+    Get the parts of a strategy state that affect a backtest.
+
+    The last update time is left out, so two strategies that start from the
+    same positions, counters and metadata share a key.
+
+    Args:
+        state: StrategyState of the strategy before the run
+
+    Returns:
+        State fields other than last_update
+    """
+    return {
+        f.name: getattr(state, f.name)
+        for f in dataclasses.fields(state) if f.name != 'last_update'
+    }
+
+
+class BacktestResultCache:
+    """
+    Thread-safe backtest result cache with optional on-disk persistence.
+
+    Entries are kept in memory and, when a cache directory is configured,
+    pickled to one file per key so they survive process restarts. Stored
+    values are deep-copied on the way in and out, so callers cannot modify
+    cached entries.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_entries: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted entries (memory only if None)
+            max_memory_entries: Maximum number of entries kept in memory
+        """
+        if max_memory_entries <= 0:
+            raise ValueError("max_memory_entries must be positive")
+
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self._entries: Dict[str, Any] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self,
+                 strategy_class: type,
+                 strategy_config: Any,
+                 transaction_costs: Any,
+                 initial_capital: Decimal,
+                 start_date: datetime,
+                 end_date: datetime,
+                 data_fingerprint: str,
+                 **options: Any) -> str:
+        """
+        Build the cache key for a backtest request.
+
+        Args:
+            strategy_class: Strategy class being backtested
+            strategy_config: StrategyConfig of the strategy
+            transaction_costs: TransactionCosts used by the engine
+            initial_capital: Initial capital
+            start_date: Backtest start date
+            end_date: Backtest end date
+            data_fingerprint: Fingerprint from fingerprint_historical_data()
+            **options: Any other inputs that affect the results (e.g. the engine)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        return stable_hash({
+            'version': CACHE_FORMAT_VERSION,
+            'strategy_class': f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            'strategy_config': strategy_config,
+            'transaction_costs': transaction_costs,
+            'initial_capital': initial_capital,
+            'start_date': start_date,
+            'end_date': end_date,
+            'data_fingerprint': data_fingerprint,
+            'options': options
+        })
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached entry, counting a hit or a miss.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Copy of the cached value, or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(key)
+
+        if value is None:
+            value = self._load(key)
+            if value is not None:
+                with self._lock:
+                    self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key from make_key()
+            value: Value to store (must be picklable when persisting)
+        """
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._remember(key, value)
+
+        if self.cache_dir:
+            self._store(key, value)
+
+    def clear(self) -> None:
+        """Remove all entries, including persisted ones, and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.pkl'):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError as e:
+                        logger.warning(f"Failed to remove cached backtest {name}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and entry counts
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats = {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._entries)
+            }
+
+        if self.cache_dir:
+            stats['persisted_entries'] = sum(
+                1 for name in os.listdir(self.cache_dir) if name.endswith('.pkl')
+            )
+
+        return stats
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Keep an entry in memory, evicting the oldest one when full."""
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        while len(self._entries) > self.max_memory_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load(self, key: str) -> Optional[Any]:
+        """Load a persisted entry, treating unreadable files as missing."""
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached backtest {path}: {e}")
+            return None
+
+    def _store(self, key: str, value: Any) -> None:
+        """Persist an entry atomically so readers never see partial files."""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            logger.warning(f"Failed to persist cached backtest {key}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+_global_result_cache: Optional[BacktestResultCache] = None
+_global_result_cache_lock = Lock()
+
+
+def get_global_result_cache() -> BacktestResultCache:
+    """
+    Get the process-wide backtest result cache.
+
+    Entries are persisted under the BACKTEST_CACHE_DIR environment variable
+    when it is set, and kept in memory only otherwise.
+
+    Returns:
+        Global backtest result cache
+    """
+    global _global_result_cache
+
+    with _global_result_cache_lock:
+        if _global_result_cache is None:
+            _global_result_cache = BacktestResultCache(os.getenv('BACKTEST_CACHE_DIR') or None)
+        return _global_result_cache
@@ -0,0 +1,172 @@
+"""
+Array helpers for signal-matrix strategies.
+
+Strategies that support the vectorized backtester compute their signals for
+every date and symbol at once on (dates, symbols) matrices. This module holds
+the shared building blocks: trailing-window sums and EMAs that reproduce the
+list-based indicator arithmetic exactly, forward filling, and conversion of
+signal matrices into target position matrices.
+"""
+
+from typing import List
+
+import numpy as np
+
+
+def trailing_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sum each trailing window along the first (time) axis.
+
+    Terms are added oldest first, like ``sum(values[t - window + 1:t + 1])``,
+    so results match the list-based indicators bit for bit.
+
+    Args:
+        values: Array with time on the first axis
+        window: Window length
+
+    Returns:
+        Array of the same shape, NaN where fewer than ``window`` values exist
+    """
+    result = np.full(values.shape, np.nan)
+    periods = values.shape[0]
+    if window <= 0 or window > periods:
+        return result
+
+    total = np.zeros(values[window - 1:].shape)
+    for k in range(window):
+        total = total + values[k:periods - window + 1 + k]
+
+    result[window - 1:] = total
+    return result
+
+
+def trailing_rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Relative Strength Index over the trailing ``period`` price changes.
+
+    Uses the same simple-average formulation as
+    ``TechnicalAnalysis.relative_strength_index``.
+
+    Args:
+        closes: Prices with time on the first axis
+        period: RSI period
+
+    Returns:
+        Array of the same shape, NaN where fewer than ``period + 1`` prices exist
+    """
+    result = np.full(closes.shape, np.nan)
+    if closes.shape[0] < 2:
+        return result
+
+    changes = np.diff(closes, axis=0)
+    avg_gain = trailing_sum(np.clip(changes, 0, None), period) / period
+    avg_loss = trailing_sum(np.clip(-changes, 0, None), period) / period
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    result[1:] = np.where(avg_loss == 0, 100.0, rsi)
+    return result
+
+
+def window_ema(windows: np.ndarray, period: int) -> List[np.ndarray]:
+    """
+    Exponential moving average along the last axis of a batch of windows.
+
+    Seeds with the simple average of the first ``period`` values and then
+    applies the same recurrence as ``TechnicalAnalysis.exponential_moving_average``.
+
+    Args:
+        windows: Array whose last axis is the window (e.g. a sliding window view)
+        period: EMA period
+
+    Returns:
+        EMA values for window positions ``period - 1`` onwards, one array each
+    """
+    length = windows.shape[-1]
+    if length < period:
+        return []
+
+    total = np.zeros(windows.shape[:-1])
+    for k in range(period):
+        total = total + windows[..., k]
+
+    ema = total / period
+    values = [ema]
+    multiplier = 2 / (period + 1)
+
+    for k in range(period, length):
+        ema = (windows[..., k] * multiplier) + (ema * (1 - multiplier))
+        values.append(ema)
+
+    return values
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    Forward-fill NaNs along the first (time) axis.
+
+    Args:
+        values: Array with time on the first axis
+
+    Returns:
+        Filled copy; leading NaNs are left in place
+    """
+    if values.shape[0] == 0:
+        return values.copy()
+
+    index = np.arange(values.shape[0]).reshape((-1,) + (1,) * (values.ndim - 1))
+    last_valid = np.where(np.isnan(values), 0, index)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    return np.take_along_axis(values, last_valid, axis=0)
+
+
+def signals_to_positions(signals: np.ndarray,
+                         prices: np.ndarray,
+                         capital: float,
+                         position_fraction: float = 0.1,
+                         min_strength: float = 0.5,
+                         start_index: int = 0) -> np.ndarray:
+    """
+    Convert a signal matrix into target long positions in shares.
+
+    A buy signal (value >= ``min_strength``) opens a long position sized at
+    ``capital * position_fraction * strength / price`` shares, which is held
+    until a sell signal (value <= ``-min_strength``) closes it. Buy signals
+    while already long and sell signals while flat are ignored.
+
+    Args:
+        signals: Signal strengths with shape (dates, symbols)
+        prices: Prices used for sizing, same shape
+        capital: Capital the position fraction applies to
+        position_fraction: Fraction of capital per full-strength position
+        min_strength: Minimum absolute signal strength to act on
+        start_index: First date on which signals may be acted on
+
+    Returns:
+        Target positions in whole shares, same shape
+    """
+    signals = np.nan_to_num(np.asarray(signals, dtype=float))
+    periods = signals.shape[0]
+    tradable = (np.arange(periods) >= start_index)[:, None]
+
+    buys = tradable & (signals >= min_strength)
+    sells = tradable & (signals <= -min_strength)
+
+    # Long/flat state is the last buy or sell event seen so far
+    events = np.where(buys, 1.0, np.where(sells, 0.0, np.nan))
+    is_long = np.nan_to_num(forward_fill(events)) > 0
+
+    previous = np.vstack([np.zeros((1, signals.shape[1]), dtype=bool), is_long[:-1]])
+    entries = is_long & ~previous
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entry_size = np.floor(capital * position_fraction * signals / prices)
+    entry_size = np.where(entries & np.isfinite(entry_size), entry_size, 0.0)
+
+    # Hold the size chosen at the most recent entry
+    entry_index = np.where(entries, np.arange(periods)[:, None], 0)
+    np.maximum.accumulate(entry_index, axis=0, out=entry_index)
+    held_size = np.take_along_axis(entry_size, entry_index, axis=0)
+
+    return np.where(is_long, held_size, 0.0)
@@ -0,0 +1,398 @@
+"""
+Vectorized backtesting engine for signal-matrix strategies.
+
+This module provides an array-native alternative to the event-loop
+``Backtester``. Strategies implementing the signal-matrix API produce target
+positions for all dates and symbols at once; fills, transaction costs, cash
+and the equity curve are then computed with NumPy without a per-day loop.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from .backtester import BacktestResults, BacktestTrade, TransactionCosts
+from .base import Strategy
+from .market_data_index import MarketDataIndex
+from .signal_matrix import forward_fill
+from ..models.core import Quote, OrderSide
+from ..analysis.portfolio_analyzer import PortfolioAnalyzer
+
+
+logger = logging.getLogger(__name__)
+
+
+def _to_float(value: Optional[Decimal]) -> float:
+    """Convert an optional quote field to float, using NaN for missing values."""
+    return float(value) if value is not None else np.nan
+
+
+@dataclass
+class MarketDataMatrices:
+    """
+    Quotes aligned into (dates, symbols) matrices, NaN where missing.
+
+    Building the matrices is the only per-quote Python work in a vectorized
+    backtest, so they can be built once and reused across backtests over the
+    same data and end date (e.g. parameter sweeps).
+    """
+
+    trading_dates: List[datetime]
+    symbols: List[str]
+    bid: np.ndarray
+    ask: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_quotes(cls,
+                    historical_data: Dict[str, List[Quote]],
+                    symbols: List[str],
+                    end_date: datetime) -> 'MarketDataMatrices':
+        """
+        Align quotes up to an end date into matrices.
+
+        The first quote of each date is used, matching ``MarketDataIndex``.
+
+        Args:
+            historical_data: Historical market data by symbol
+            symbols: Symbols to include, in column order
+            end_date: Last date (inclusive) to include
+
+        Returns:
+            MarketDataMatrices covering every trading date up to ``end_date``
+        """
+        trading_dates = MarketDataIndex(historical_data).trading_dates(datetime.min, end_date)
+        row_for_date = {trading_date.date(): row for row, trading_date in enumerate(trading_dates)}
+        shape = (len(trading_dates), len(symbols))
+        fields = {name: np.full(shape, np.nan) for name in ('bid', 'ask', 'close', 'volume')}
+        filled = np.zeros(shape, dtype=bool)
+
+        for column, symbol in enumerate(symbols):
+            for quote in historical_data.get(symbol, []):
+                row = row_for_date.get(quote.timestamp.date())
+                if row is None or filled[row, column]:
+                    continue
+
+                filled[row, column] = True
+                fields['bid'][row, column] = _to_float(quote.bid)
+                fields['ask'][row, column] = _to_float(quote.ask)
+                fields['close'][row, column] = _to_float(quote.close)
+                fields['volume'][row, column] = _to_float(quote.volume)
+
+        return cls(trading_dates=trading_dates, symbols=list(symbols), **fields)
+
+    @property
+    def has_bid_ask(self) -> np.ndarray:
+        """Mask of quotes with both bid and ask prices."""
+        return np.isfinite(self.bid) & np.isfinite(self.ask)
+
+
+class VectorizedBacktester:
+    """
+    Array-native backtesting engine for strategies with a signal-matrix API.
+
+    Uses the same transaction cost model and equity convention as ``Backtester``
+    (each day's value is marked before that day's trades), so results are
+    directly comparable. Differences from the event engine:
+
+    - Position sizes come from the strategy's position matrix rather than the
+      running cash balance, and orders are not reduced for insufficient cash.
+    - Prices fall back to the close when a quote has no bid/ask.
+    - Only the equity curve is recorded; ``portfolio_history`` is left empty.
+    """
+
+    def __init__(self,
+                 transaction_costs: Optional[TransactionCosts] = None,
+                 initial_capital: Decimal = Decimal('100000')):
+        """
+        Initialize the vectorized backtester.
+
+        Args:
+            transaction_costs: Transaction cost configuration
+            initial_capital: Initial capital for backtesting
+        """
+        self.transaction_costs = transaction_costs or TransactionCosts()
+        self.initial_capital = initial_capital
+        self.logger = logging.getLogger(__name__)
+        self.portfolio_analyzer = PortfolioAnalyzer()
+
+    def run_backtest(self,
+                     strategy: Strategy,
+                     historical_data: Dict[str, List[Quote]],
+                     start_date: datetime,
+                     end_date: datetime,
+                     market_data: Optional[MarketDataMatrices] = None) -> BacktestResults:
+        """
+        Run a vectorized backtest for a strategy.
+
+        History before ``start_date`` is passed to the strategy for indicator
+        warm-up, but trading starts on the first trading date in the period.
+
+        Args:
+            strategy: Strategy implementing the signal-matrix API
+            historical_data: Historical market data by symbol
+            start_date: Backtest start date
+            end_date: Backtest end date
+            market_data: Prebuilt matrices of ``historical_data`` up to ``end_date``
+                for the strategy's symbols (built if not given)
+
+        Returns:
+            BacktestResults containing performance metrics and trade history
+        """
+        try:
+            self.logger.info(f"Starting vectorized backtest for strategy {strategy.strategy_id}")
+
+            if not strategy.supports_vectorized:
+                raise ValueError(
+                    f"Strategy {strategy.strategy_id} does not implement the signal-matrix API"
+                )
+
+            self._validate_backtest_inputs(historical_data, start_date, end_date)
+
+            symbols = [symbol for symbol in strategy.symbols if symbol in historical_data]
+            if market_data is None:
+                market_data = MarketDataMatrices.from_quotes(historical_data, symbols, end_date)
+            elif market_data.symbols != symbols:
+                raise ValueError(
+                    f"Market data columns {market_data.symbols} do not match strategy symbols {symbols}"
+                )
+
+            trading_dates = market_data.trading_dates
+            start_index = bisect_left([d.date() for d in trading_dates], start_date.date())
+
+            if start_index >= len(trading_dates):
+                raise ValueError("No trading dates found in the specified period")
+
+            positions = self._target_positions(strategy, market_data, start_index)
+            fills = self._calculate_fills(positions, market_data)
+            equity, cash = self._calculate_equity(positions, fills, market_data)
+
+            trades = self._materialize_trades(fills, trading_dates, symbols, strategy.strategy_id)
+
+            results = self._calculate_backtest_results(
+                strategy.strategy_id, start_date, end_date,
+                equity[start_index:], cash[start_index:], fills, trades
+            )
+
+            self.logger.info(f"Vectorized backtest completed. Total return: {results.total_return:.2%}")
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Vectorized backtest failed: {e}")
+            raise
+
+    def _validate_backtest_inputs(self,
+                                  historical_data: Dict[str, List[Quote]],
+                                  start_date: datetime,
+                                  end_date: datetime) -> None:
+        """Validate backtest inputs."""
+        if not historical_data:
+            raise ValueError("Historical data cannot be empty")
+
+        if start_date >= end_date:
+            raise ValueError("Start date must be before end date")
+
+        if self.initial_capital <= 0:
+            raise ValueError("Initial capital must be positive")
+
+        for symbol, quotes in historical_data.items():
+            if not quotes:
+                raise ValueError(f"No quotes available for symbol {symbol}")
+
+    def _target_positions(self,
+                          strategy: Strategy,
+                          market_data: MarketDataMatrices,
+                          start_index: int) -> np.ndarray:
+        """Get the strategy's target positions, tradable only on days with a quote."""
+        closes = market_data.close
+        positions = np.array(
+            strategy.generate_position_matrix(
+                closes, market_data.volume, float(self.initial_capital), start_index
+            ),
+            dtype=float
+        )
+
+        if positions.shape != closes.shape:
+            raise ValueError(
+                f"Position matrix shape {positions.shape} does not match market data shape {closes.shape}"
+            )
+
+        positions = np.trunc(np.nan_to_num(positions))
+        positions[:start_index] = 0.0
+
+        # Orders can only be filled on days with an execution price
+        tradable = market_data.has_bid_ask | np.isfinite(closes)
+        positions = np.where(tradable, positions, np.nan)
+
+        return np.nan_to_num(forward_fill(positions))
+
+    def _calculate_fills(self,
+                         positions: np.ndarray,
+                         market_data: MarketDataMatrices) -> Dict[str, np.ndarray]:
+        """Compute order quantities, execution prices and transaction costs."""
+        costs = self.transaction_costs
+        orders = np.diff(positions, axis=0, prepend=np.zeros((1, positions.shape[1])))
+        quantity = np.abs(orders)
+        is_buy = orders > 0
+        traded = quantity > 0
+
+        has_bid_ask = market_data.has_bid_ask
+        closes = market_data.close
+        ask = np.where(has_bid_ask, market_data.ask, closes)
+        bid = np.where(has_bid_ask, market_data.bid, closes)
+        spread = np.where(has_bid_ask, market_data.ask - market_data.bid, 0.0)
+
+        # Execution price including size-dependent slippage
+        slippage_factor = np.minimum(0.01, float(costs.slippage_factor) * quantity / 1000)
+        price_slippage = spread * slippage_factor
+        price = np.where(is_buy, ask + price_slippage, bid - price_slippage)
+
+        commission = np.clip(
+            quantity * float(costs.commission_per_share),
+            float(costs.commission_minimum),
+            float(costs.commission_maximum)
+        )
+        slippage = spread * float(costs.spread_cost_factor) * quantity
+        market_impact = quantity * price * float(costs.market_impact_factor)
+
+        total_cost = commission + slippage + market_impact
+        gross_amount = quantity * price
+        cash_flow = np.where(is_buy, -(gross_amount + total_cost), gross_amount - total_cost)
+
+        return {
+            'traded': traded,
+            'is_buy': is_buy,
+            'quantity': quantity,
+            'price': np.where(traded, price, 0.0),
+            'commission': np.where(traded, commission, 0.0),
+            'slippage': np.where(traded, slippage, 0.0),
+            'market_impact': np.where(traded, market_impact, 0.0),
+            'cash_flow': np.where(traded, cash_flow, 0.0)
+        }
+
+    def _calculate_equity(self,
+                          positions: np.ndarray,
+                          fills: Dict[str, np.ndarray],
+                          market_data: MarketDataMatrices) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the daily equity curve and end-of-day cash.
+
+        Equity on each day values the previous day's holdings at that day's
+        mid price plus the previous day's cash, as the event engine records
+        its snapshot before executing the day's trades.
+        """
+        capital = float(self.initial_capital)
+        cash = capital + np.cumsum(fills['cash_flow'].sum(axis=1))
+
+        if np.any(cash < 0):
+            self.logger.warning("Cash balance goes negative; position matrix exceeds available capital")
+
+        mid = np.where(
+            market_data.has_bid_ask, (market_data.bid + market_data.ask) / 2, market_data.close
+        )
+        valuation = forward_fill(mid)
+
+        held = np.vstack([np.zeros((1, positions.shape[1])), positions[:-1]])
+        cash_before = np.concatenate([[capital], cash[:-1]])
+        holdings_value = np.where(held != 0, held * valuation, 0.0)
+
+        return cash_before + np.nansum(holdings_value, axis=1), cash
+
+    def _materialize_trades(self,
+                            fills: Dict[str, np.ndarray],
+                            trading_dates: List[datetime],
+                            symbols: List[str],
+                            strategy_id: str) -> List[BacktestTrade]:
+        """Create trade records for every non-zero order."""
+        trades = []
+        rows, columns = np.nonzero(fills['traded'])
+
+        for row, column in zip(rows, columns):
+            trades.append(BacktestTrade(
+                timestamp=trading_dates[row],
+                symbol=symbols[column],
+                side=OrderSide.BUY if fills['is_buy'][row, column] else OrderSide.SELL,
+                quantity=int(fills['quantity'][row, column]),
+                price=Decimal(str(fills['price'][row, column])),
+                commission=Decimal(str(fills['commission'][row, column])),
+                slippage=Decimal(str(fills['slippage'][row, column])),
+                market_impact=Decimal(str(fills['market_impact'][row, column])),
+                strategy_id=strategy_id,
+                # Position matrices do not carry per-order signal strength
+                signal_strength=1.0
+            ))
+
+        return trades
+
+    def _calculate_backtest_results(self,
+                                    strategy_id: str,
+                                    start_date: datetime,
+                                    end_date: datetime,
+                                    equity: np.ndarray,
+                                    cash: np.ndarray,
+                                    fills: Dict[str, np.ndarray],
+                                    trades: List[BacktestTrade]) -> BacktestResults:
+        """Calculate backtest results from the equity curve and fills."""
+        final_value = Decimal(str(equity[-1]))
+        total_return = float((final_value - self.initial_capital) / self.initial_capital)
+
+        # Calculate time-based metrics
+        days = (end_date - start_date).days
+        years = days / 365.25
+        annual_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else total_return
+
+        risk_metrics = {}
+        if len(equity) > 1:
+            try:
+                risk_metrics = self.portfolio_analyzer.calculate_risk_metrics_from_values(equity)
+            except Exception as e:
+                self.logger.warning(f"Failed to calculate risk metrics: {e}")
+
+        # Trade statistics use the same simplified convention as Backtester:
+        # sells count as winning trades, buys as losing trades
+        traded = fills['traded']
+        is_sell = traded & ~fills['is_buy']
+        is_buy = traded & fills['is_buy']
+        trade_costs = fills['commission'] + fills['slippage'] + fills['market_impact']
+        gross_amount = fills['quantity'] * fills['price']
+
+        gross_profit = float(np.sum((gross_amount - trade_costs)[is_sell]))
+        gross_loss = float(np.sum((gross_amount + trade_costs)[is_buy]))
+        profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
+
+        winning_trades = int(np.count_nonzero(is_sell))
+        total_trades = len(trades)
+
+        performance_metrics = dict(risk_metrics)
+        performance_metrics['equity_curve'] = equity
+        performance_metrics['cash_curve'] = cash
+
+        return BacktestResults(
+            strategy_id=strategy_id,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=self.initial_capital,
+            final_value=final_value,
+            total_return=total_return,
+            annual_return=annual_return,
+            max_drawdown=risk_metrics.get('max_drawdown', 0),
+            sharpe_ratio=risk_metrics.get('sharpe_ratio', 0),
+            sortino_ratio=risk_metrics.get('sortino_ratio', 0),
+            calmar_ratio=risk_metrics.get('calmar_ratio', 0),
+            win_rate=winning_trades / total_trades if total_trades else 0,
+            profit_factor=profit_factor,
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=total_trades - winning_trades,
+            total_commission=sum((t.commission for t in trades), Decimal('0')),
+            total_slippage=sum((t.slippage for t in trades), Decimal('0')),
+            trades=trades,
+            performance_metrics=performance_metrics
+        )
@@ -6,14 +6,16 @@ Sync live Alpaca portfolio data to local database.
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from financial_portfolio_automation.models.config import AlpacaConfig, Environment, DataFeed
+from financial_portfolio_automation.models.quote_frame import QuoteFrame
 from financial_portfolio_automation.api.alpaca_client import AlpacaClient
+from financial_portfolio_automation.api.market_data_client import MarketDataClient
 from financial_portfolio_automation.data.store import DataStore
 
 
@@ -34,6 +36,7 @@ def main():
         
         # Initialize clients
         alpaca_client = AlpacaClient(alpaca_config)
+        market_data_client = MarketDataClient(alpaca_config)
         data_store = DataStore("portfolio_automation.db")
         
         # Authenticate
@@ -60,6 +63,23 @@ def main():
         snapshot_id = data_store.save_portfolio_snapshot(portfolio_snapshot)
         
         print(f"✅ Saved portfolio snapshot with ID: {snapshot_id}")
+        
+        # Save market data for held symbols, one transaction per batch
+        symbols = [pos.symbol for pos in portfolio_snapshot.positions]
+        if symbols and market_data_client.authenticate():
+            print("📈 Saving market data for positions...")
+            quotes = [market_data_client.get_quote_as_model(symbol) for symbol in symbols]
+            quote_count = data_store.save_quotes_batch(quotes)
+            
+            start = datetime.now(timezone.utc) - timedelta(days=30)
+            bars = QuoteFrame([
+                market_data_client.get_historical_bars(symbol, '1Day', start, as_frame=True)
+                for symbol in symbols
+            ])
+            bar_count = data_store.save_bars_batch(bars)
+            
+            print(f"✅ Saved {quote_count} quotes and {bar_count} daily bars")
+        
         print(f"💰 Portfolio Value: ${portfolio_snapshot.total_value}")
         print(f"💵 Buying Power: ${portfolio_snapshot.buying_power}")
         print(f"📋 Positions: {len(portfolio_snapshot.positions)}")
@@ -264,7 +264,7 @@ class TestPortfolioMonitoringIntegration:
             150.0, 155.0, 148.0, 160.0, 145.0, 165.0, 140.0, 170.0, 135.0, 175.0,
             130.0, 180.0, 125.0, 185.0, 120.0, 190.0, 115.0, 195.0, 110.0, 200.0
         ]
-        monitor._get_historical_prices = AsyncMock(return_value=volatile_prices)
+        monitor.seed_prices('AAPL', volatile_prices)
         
         # Set up alert collection
         volatility_alerts = []
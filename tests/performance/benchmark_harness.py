@@ -0,0 +1,211 @@
+"""
+Benchmark harness with a JSON baseline and regression threshold.
+
+Each benchmark is timed (best of several runs) and its peak Python memory is
+measured with ``tracemalloc`` in a separate run, so tracing overhead does not
+affect the timings. Results are compared against ``benchmark_baseline.json``:
+a benchmark fails when its throughput drops, or its peak memory grows, by
+more than the regression threshold.
+
+Environment variables:
+    BENCHMARK_RUN: Set to 1 to run the benchmarks, which are skipped otherwise
+    BENCHMARK_SCALE: 'small' (default), 'medium' or 'large'
+    BENCHMARK_REGRESSION_THRESHOLD: Allowed relative regression (overrides the
+        threshold stored in the baseline)
+    BENCHMARK_UPDATE_BASELINE: Set to 1 to record the current results as the
+        new baseline instead of comparing against it
+    BENCHMARK_RESULTS: Optional path to write the current results to
+
+Timings depend on the machine, so the baseline should be recorded on the
+machine that runs the comparison.
+"""
+
+import gc
+import json
+import os
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+BASELINE_PATH = Path(__file__).with_name('benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.5
+
+# Memory growth below this many MB is treated as noise
+MEMORY_SLACK_MB = 2.0
+
+SCALES = {
+    'small': {'symbols': 5, 'days': 252, 'intraday_days': 5, 'simulations': 4, 'snapshot_days': 63},
+    'medium': {'symbols': 20, 'days': 504, 'intraday_days': 20, 'simulations': 32, 'snapshot_days': 252},
+    'large': {'symbols': 100, 'days': 1260, 'intraday_days': 60, 'simulations': 100, 'snapshot_days': 1260},
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory measurements of one benchmark."""
+
+    name: str
+    items: int
+    unit: str
+    seconds: float
+    throughput: float
+    peak_memory_mb: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def get_scale() -> str:
+    """Get the configured benchmark scale."""
+    scale = os.getenv('BENCHMARK_SCALE', 'small')
+    if scale not in SCALES:
+        raise ValueError(f"Unknown BENCHMARK_SCALE {scale!r}, expected one of {sorted(SCALES)}")
+    return scale
+
+
+def measure(name: str, func: Callable[[], Any], items: int, unit: str, repeats: int = 3) -> BenchmarkResult:
+    """
+    Benchmark a function.
+
+    Args:
+        name: Benchmark name
+        func: Function to benchmark (called repeats + 1 times)
+        items: Units of work per call, used for throughput
+        unit: Name of the unit of work (e.g. 'bars')
+        repeats: Number of timed runs; the fastest is reported
+
+    Returns:
+        BenchmarkResult with the best time, throughput in items per second and
+        peak traced memory in MB
+    """
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = min(timings)
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        unit=unit,
+        seconds=seconds,
+        throughput=items / seconds if seconds > 0 else float('inf'),
+        peak_memory_mb=peak / (1024 * 1024)
+    )
+
+
+class BenchmarkBaseline:
+    """Stored benchmark results by scale and benchmark name."""
+
+    def __init__(self, path: Path = BASELINE_PATH):
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {'threshold': DEFAULT_THRESHOLD, 'scales': {}}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.data = json.load(f)
+        self.current: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def threshold(self) -> float:
+        """Get the allowed relative regression."""
+        override = os.getenv('BENCHMARK_REGRESSION_THRESHOLD')
+        if override:
+            return float(override)
+        return float(self.data.get('threshold', DEFAULT_THRESHOLD))
+
+    @property
+    def update_mode(self) -> bool:
+        """Check whether results should be recorded instead of compared."""
+        return os.getenv('BENCHMARK_UPDATE_BASELINE', '').lower() in ('1', 'true', 'yes')
+
+    def get(self, scale: str, name: str) -> Optional[Dict[str, Any]]:
+        """Get the baseline entry of a benchmark, if any."""
+        return self.data.get('scales', {}).get(scale, {}).get(name)
+
+    def check(self, scale: str, result: BenchmarkResult) -> List[str]:
+        """
+        Record a result and compare it against the baseline.
+
+        Args:
+            scale: Benchmark scale
+            result: Result to check
+
+        Returns:
+            Descriptions of regressions beyond the threshold (empty if none,
+            in update mode, or without a baseline entry)
+        """
+        self.current.setdefault(scale, {})[result.name] = result.to_dict()
+
+        baseline = self.get(scale, result.name)
+        if self.update_mode or baseline is None:
+            return []
+
+        threshold = self.threshold
+        regressions = []
+
+        min_throughput = baseline['throughput'] * (1 - threshold)
+        if result.throughput < min_throughput:
+            regressions.append(
+                f"{result.name}: throughput {result.throughput:,.1f} {result.unit}/s is below "
+                f"{min_throughput:,.1f} (baseline {baseline['throughput']:,.1f}, threshold {threshold:.0%})"
+            )
+
+        max_memory = baseline['peak_memory_mb'] * (1 + threshold) + MEMORY_SLACK_MB
+        if result.peak_memory_mb > max_memory:
+            regressions.append(
+                f"{result.name}: peak memory {result.peak_memory_mb:.1f} MB exceeds "
+                f"{max_memory:.1f} MB (baseline {baseline['peak_memory_mb']:.1f} MB)"
+            )
+
+        return regressions
+
+    def save(self) -> None:
+        """Write results: merge into the baseline in update mode, and to BENCHMARK_RESULTS if set."""
+        if not self.current:
+            return
+
+        results_path = os.getenv('BENCHMARK_RESULTS')
+        if results_path:
+            with open(results_path, 'w') as f:
+                json.dump(self._document(self.current), f, indent=2, sort_keys=True)
+
+        if self.update_mode:
+            scales = self.data.setdefault('scales', {})
+            for scale, results in self.current.items():
+                scales.setdefault(scale, {}).update(results)
+            document = self._document(scales)
+            document['threshold'] = self.data.get('threshold', DEFAULT_THRESHOLD)
+            with open(self.path, 'w') as f:
+                json.dump(document, f, indent=2, sort_keys=True)
+                f.write('\n')
+            self.data = document
+
+    @staticmethod
+    def _document(scales: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'machine': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'processor': platform.machine(),
+                'cpu_count': os.cpu_count()
+            },
+            'threshold': DEFAULT_THRESHOLD,
+            'scales': scales
+        }
@@ -0,0 +1,26 @@
+"""
+Pytest configuration for the performance tests.
+
+Benchmarks time the code against a machine-specific baseline, so they are
+opt-in: tests marked ``benchmark`` are skipped unless BENCHMARK_RUN=1 is set.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: Throughput and memory benchmarks compared against a baseline"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv('BENCHMARK_RUN', '').lower() in ('1', 'true', 'yes'):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmarks run only with BENCHMARK_RUN=1")
+    for item in items:
+        if item.get_closest_marker('benchmark'):
+            item.add_marker(skip_benchmark)
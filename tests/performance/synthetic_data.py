@@ -0,0 +1,212 @@
+"""
+Reproducible synthetic market data for benchmarks.
+
+Generates OHLCV ``Quote`` histories and ``PortfolioSnapshot`` series at a
+configurable scale (symbols x days x timeframe). Prices follow a geometric
+Brownian motion per symbol, so the same seed always produces the same data.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from financial_portfolio_automation.models.core import Quote, Position, PortfolioSnapshot
+
+
+# Bars per regular trading session (09:30-16:00) for each timeframe
+TIMEFRAMES = {
+    '1d': (1, timedelta(hours=6, minutes=30)),
+    '1h': (7, timedelta(hours=1)),
+    '15min': (26, timedelta(minutes=15)),
+    '5min': (78, timedelta(minutes=5)),
+    '1min': (390, timedelta(minutes=1)),
+}
+
+SESSION_OPEN = timedelta(hours=9, minutes=30)
+
+
+def synthetic_symbols(count: int) -> List[str]:
+    """
+    Get ``count`` distinct valid ticker symbols.
+
+    Args:
+        count: Number of symbols (at most 26**4)
+
+    Returns:
+        Symbols 'SAAAA', 'SAAAB', ...
+    """
+    symbols = []
+    for i in range(count):
+        letters = []
+        for _ in range(4):
+            i, remainder = divmod(i, 26)
+            letters.append(chr(ord('A') + remainder))
+        symbols.append('S' + ''.join(reversed(letters)))
+    return symbols
+
+
+def trading_days(start: datetime, days: int) -> List[datetime]:
+    """Get ``days`` consecutive weekdays starting at ``start`` (midnight)."""
+    current = datetime(start.year, start.month, start.day)
+    result = []
+    while len(result) < days:
+        if current.weekday() < 5:
+            result.append(current)
+        current += timedelta(days=1)
+    return result
+
+
+def generate_price_paths(num_symbols: int,
+                         num_bars: int,
+                         bars_per_day: int = 1,
+                         annual_drift: float = 0.08,
+                         annual_volatility: float = 0.25,
+                         seed: int = 42) -> np.ndarray:
+    """
+    Generate close price paths with geometric Brownian motion.
+
+    Args:
+        num_symbols: Number of symbols
+        num_bars: Number of bars per symbol
+        bars_per_day: Bars per trading day, used to scale drift and volatility
+        annual_drift: Annualized drift
+        annual_volatility: Annualized volatility
+        seed: Random seed
+
+    Returns:
+        Array of shape (num_bars, num_symbols) with close prices
+    """
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / (252 * bars_per_day)
+    starting_prices = rng.uniform(20.0, 500.0, size=num_symbols)
+    shocks = rng.standard_normal((num_bars, num_symbols))
+    log_returns = (annual_drift - 0.5 * annual_volatility ** 2) * dt + annual_volatility * np.sqrt(dt) * shocks
+    log_returns[0] = 0.0
+    return starting_prices * np.exp(np.cumsum(log_returns, axis=0))
+
+
+def generate_quote_history(num_symbols: int = 10,
+                           days: int = 252,
+                           timeframe: str = '1d',
+                           start: datetime = datetime(2022, 1, 3),
+                           seed: int = 42,
+                           symbols: Optional[List[str]] = None) -> Dict[str, List[Quote]]:
+    """
+    Generate OHLCV quote histories.
+
+    Quotes carry OHLCV fields and a bid/ask around the close, so they work
+    with both the bid/ask based backtesters and the close based indicators.
+
+    Args:
+        num_symbols: Number of symbols (ignored when ``symbols`` is given)
+        days: Number of trading days
+        timeframe: Bar size, one of TIMEFRAMES
+        start: First trading day
+        seed: Random seed
+        symbols: Explicit symbols to generate
+
+    Returns:
+        Chronologically ordered quotes by symbol
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+    symbols = symbols or synthetic_symbols(num_symbols)
+    bars_per_day, bar_size = TIMEFRAMES[timeframe]
+    num_bars = days * bars_per_day
+
+    closes = generate_price_paths(len(symbols), num_bars, bars_per_day, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    # Intrabar range and open offset relative to the close
+    ranges = np.abs(rng.normal(0.0, 0.01 / np.sqrt(bars_per_day), size=closes.shape)) + 1e-4
+    open_offsets = rng.uniform(-0.5, 0.5, size=closes.shape) * ranges
+    volumes = rng.integers(1_000, 1_000_000, size=closes.shape) // bars_per_day + 100
+
+    timestamps = [
+        day + SESSION_OPEN + bar_size * (i + 1)
+        for day in trading_days(start, days)
+        for i in range(bars_per_day)
+    ]
+
+    history = {}
+    for j, symbol in enumerate(symbols):
+        quotes = []
+        for i, timestamp in enumerate(timestamps):
+            close = float(closes[i, j])
+            open_price = close * (1 + open_offsets[i, j])
+            high = max(close, open_price) * (1 + ranges[i, j] / 2)
+            low = min(close, open_price) * (1 - ranges[i, j] / 2)
+            spread = max(0.01, close * 0.0002)
+            quotes.append(Quote(
+                symbol=symbol,
+                timestamp=timestamp,
+                bid=Decimal(f"{close - spread / 2:.2f}"),
+                ask=Decimal(f"{close + spread / 2:.2f}"),
+                bid_size=100,
+                ask_size=100,
+                open=Decimal(f"{open_price:.2f}"),
+                high=Decimal(f"{high:.2f}"),
+                low=Decimal(f"{low:.2f}"),
+                close=Decimal(f"{close:.2f}"),
+                volume=int(volumes[i, j])
+            ))
+        history[symbol] = quotes
+
+    return history
+
+
+def generate_portfolio_snapshots(days: int = 252,
+                                 snapshots_per_day: int = 7,
+                                 num_positions: int = 10,
+                                 start: datetime = datetime(2022, 1, 3),
+                                 seed: int = 42) -> List[PortfolioSnapshot]:
+    """
+    Generate portfolio snapshots for a simulated portfolio.
+
+    Args:
+        days: Number of trading days
+        snapshots_per_day: Snapshots per trading day
+        num_positions: Number of positions held
+        start: First trading day
+        seed: Random seed
+
+    Returns:
+        Chronologically ordered portfolio snapshots
+    """
+    symbols = synthetic_symbols(num_positions)
+    prices = generate_price_paths(num_positions, days * snapshots_per_day, snapshots_per_day, seed=seed)
+    quantities = np.full(num_positions, 100)
+    cost_basis = prices[0] * quantities
+    interval = timedelta(hours=6, minutes=30) / snapshots_per_day
+
+    snapshots = []
+    previous_value = None
+    for d, day in enumerate(trading_days(start, days)):
+        for i in range(snapshots_per_day):
+            row = d * snapshots_per_day + i
+            values = prices[row] * quantities
+            positions = [
+                Position(
+                    symbol=symbol,
+                    quantity=int(quantities[k]),
+                    market_value=Decimal(f"{values[k]:.2f}"),
+                    cost_basis=Decimal(f"{cost_basis[k]:.2f}"),
+                    unrealized_pnl=Decimal(f"{values[k] - cost_basis[k]:.2f}"),
+                    day_pnl=Decimal('0')
+                )
+                for k, symbol in enumerate(symbols)
+            ]
+            total_value = Decimal(f"{values.sum():.2f}")
+            snapshots.append(PortfolioSnapshot(
+                timestamp=day + SESSION_OPEN + interval * (i + 1),
+                total_value=total_value,
+                buying_power=Decimal('10000'),
+                day_pnl=total_value - previous_value if previous_value is not None else Decimal('0'),
+                total_pnl=Decimal(f"{values.sum() - cost_basis.sum():.2f}"),
+                positions=positions
+            ))
+            previous_value = total_value
+
+    return snapshots
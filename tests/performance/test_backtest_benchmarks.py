@@ -0,0 +1,217 @@
+"""
+Backtest and Analytics Benchmarks
+
+Tracks throughput and peak memory of the backtesting engine and the
+analytics hot paths on reproducible synthetic data, and fails when a change
+regresses beyond the threshold stored in benchmark_baseline.json.
+
+The benchmarks are skipped unless BENCHMARK_RUN=1 is set. Run them with:
+    BENCHMARK_RUN=1 pytest tests/performance/test_backtest_benchmarks.py
+
+Record a new baseline with:
+    BENCHMARK_RUN=1 BENCHMARK_UPDATE_BASELINE=1 pytest tests/performance/test_backtest_benchmarks.py
+"""
+
+import json
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.backtester import Backtester
+from financial_portfolio_automation.strategy.momentum import MomentumStrategy
+from financial_portfolio_automation.analysis.technical_analysis import TechnicalAnalysis
+from financial_portfolio_automation.analytics.data_aggregator import DataAggregator
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+
+from benchmark_harness import BenchmarkBaseline, BenchmarkResult, SCALES, get_scale, measure
+from synthetic_data import generate_quote_history, generate_portfolio_snapshots
+
+
+@pytest.fixture(scope="module")
+def scale():
+    """Configured benchmark scale name."""
+    return get_scale()
+
+
+@pytest.fixture(scope="module")
+def sizes(scale):
+    """Data sizes for the configured scale."""
+    return SCALES[scale]
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    """Benchmark baseline, saved after all benchmarks in the module ran."""
+    baseline = BenchmarkBaseline()
+    yield baseline
+    baseline.save()
+
+
+@pytest.fixture(scope="module")
+def daily_history(sizes):
+    """Daily OHLCV history for the configured scale."""
+    return generate_quote_history(num_symbols=sizes['symbols'], days=sizes['days'], timeframe='1d')
+
+
+@pytest.fixture(scope="module")
+def intraday_history(sizes):
+    """Minute OHLCV history for the configured scale."""
+    return generate_quote_history(
+        num_symbols=sizes['symbols'], days=sizes['intraday_days'], timeframe='1min', seed=7
+    )
+
+
+def _period(history):
+    quotes = next(iter(history.values()))
+    return quotes[0].timestamp.replace(hour=0, minute=0), quotes[-1].timestamp
+
+
+def _momentum(history):
+    return MomentumStrategy(StrategyConfig(
+        strategy_id="benchmark_momentum",
+        strategy_type=StrategyType.MOMENTUM,
+        name="Benchmark Momentum",
+        description="Momentum strategy for benchmarks",
+        symbols=list(history),
+        risk_limits=RiskLimits(
+            max_position_size=Decimal('100000'),
+            max_portfolio_concentration=0.2,
+            max_daily_loss=Decimal('10000'),
+            max_drawdown=0.2,
+            stop_loss_percentage=0.05
+        ),
+        # MACD needs 35 bars, so a shorter lookback never produces a signal
+        parameters={'lookback_period': 35, 'momentum_threshold': 0.02}
+    ))
+
+
+def _assert_no_regression(baseline, scale, result):
+    regressions = baseline.check(scale, result)
+    print(
+        f"\n{result.name}: {result.throughput:,.1f} {result.unit}/s, "
+        f"{result.seconds:.3f}s, peak {result.peak_memory_mb:.1f} MB"
+    )
+    assert not regressions, "\n".join(regressions)
+
+
+@pytest.mark.benchmark
+class TestBacktestBenchmarks:
+    """Benchmarks of the backtesting engine."""
+
+    def test_run_backtest(self, scale, baseline, daily_history):
+        """Benchmark a single backtest over the full daily history."""
+        start, end = _period(daily_history)
+        bars = sum(len(quotes) for quotes in daily_history.values())
+
+        def run():
+            results = Backtester(initial_capital=Decimal('1000000')).run_backtest(
+                _momentum(daily_history), daily_history, start, end
+            )
+            assert len(results.portfolio_history) > 0
+            assert results.total_trades > 0
+
+        _assert_no_regression(baseline, scale, measure("run_backtest", run, bars, "bars"))
+
+    def test_walk_forward(self, scale, baseline, daily_history):
+        """Benchmark walk-forward analysis with quarterly test windows."""
+        start, end = _period(daily_history)
+        bars = sum(len(quotes) for quotes in daily_history.values())
+
+        def run():
+            analysis = Backtester().run_walk_forward_analysis(
+                _momentum(daily_history), daily_history, start, end,
+                training_period_months=3, testing_period_months=3, step_months=3
+            )
+            assert analysis['period_results']
+            assert sum(period['total_trades'] for period in analysis['period_results']) > 0
+
+        _assert_no_regression(baseline, scale, measure("walk_forward", run, bars, "bars", repeats=2))
+
+    def test_monte_carlo(self, scale, baseline, sizes, daily_history):
+        """Benchmark the bootstrap Monte Carlo simulation."""
+        start, end = _period(daily_history)
+        simulations = sizes['simulations']
+
+        def run():
+            results = Backtester().run_monte_carlo_simulation(
+                _momentum(daily_history), daily_history, start, end,
+                num_simulations=simulations, execution_mode='thread'
+            )
+            assert results['simulation_results']
+            assert all(result.total_trades > 0 for result in results['simulation_results'])
+
+        _assert_no_regression(
+            baseline, scale, measure("monte_carlo", run, simulations, "simulations", repeats=2)
+        )
+
+
+@pytest.mark.benchmark
+class TestAnalyticsBenchmarks:
+    """Benchmarks of the analytics hot paths."""
+
+    def test_calculate_all_indicators(self, scale, baseline, intraday_history):
+        """Benchmark indicator calculation over minute bars."""
+        series = [
+            ([float(q.high) for q in quotes], [float(q.low) for q in quotes], [float(q.close) for q in quotes])
+            for quotes in intraday_history.values()
+        ]
+        bars = sum(len(closes) for _, _, closes in series)
+        analysis = TechnicalAnalysis()
+
+        def run():
+            for highs, lows, closes in series:
+                indicators = analysis.calculate_all_indicators(highs, lows, closes)
+                assert indicators
+
+        _assert_no_regression(baseline, scale, measure("calculate_all_indicators", run, bars, "bars"))
+
+    def test_aggregate_data(self, scale, baseline, sizes):
+        """Benchmark daily aggregation of intraday portfolio snapshots."""
+        snapshots = generate_portfolio_snapshots(days=sizes['snapshot_days'], snapshots_per_day=7)
+
+        class SnapshotStore:
+            def get_portfolio_snapshots(self, start_date=None, end_date=None):
+                return snapshots
+
+        aggregator = DataAggregator(SnapshotStore())
+        first_day = snapshots[0].timestamp.date()
+        last_day = snapshots[-1].timestamp.date() + timedelta(days=1)
+
+        def run():
+            result = aggregator.aggregate_data(first_day, last_day, timeframe='daily')
+            assert result['data_points'] == sizes['snapshot_days']
+
+        _assert_no_regression(
+            baseline, scale, measure("aggregate_data", run, len(snapshots), "snapshots")
+        )
+
+
+class TestBenchmarkHarness:
+    """Tests of the synthetic data generator and regression check."""
+
+    def test_synthetic_data_is_reproducible(self):
+        """Test the same seed produces the same bars."""
+        first = generate_quote_history(num_symbols=2, days=3, timeframe='1h', seed=3)
+        second = generate_quote_history(num_symbols=2, days=3, timeframe='1h', seed=3)
+
+        assert first == second
+        assert [len(quotes) for quotes in first.values()] == [21, 21]
+        assert all(q.low <= q.close <= q.high and q.bid <= q.ask for q in first['SAAAA'])
+
+    def test_regression_detected(self, tmp_path, monkeypatch):
+        """Test results beyond the threshold are reported."""
+        monkeypatch.delenv('BENCHMARK_UPDATE_BASELINE', raising=False)
+        monkeypatch.delenv('BENCHMARK_REGRESSION_THRESHOLD', raising=False)
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({'threshold': 0.2, 'scales': {'small': {'bench': {
+            'throughput': 100.0, 'peak_memory_mb': 10.0
+        }}}}))
+        baseline = BenchmarkBaseline(path)
+
+        def result(throughput, memory):
+            return BenchmarkResult('bench', 100, 'bars', 100 / throughput, throughput, memory)
+
+        assert baseline.check('small', result(85.0, 13.0)) == []
+        assert len(baseline.check('small', result(70.0, 10.0))) == 1
+        assert len(baseline.check('small', result(70.0, 20.0))) == 2
+        assert baseline.check('medium', result(1.0, 100.0)) == []
@@ -0,0 +1,132 @@
+"""
+Unit tests for the backtester accounting core.
+"""
+
+import copy
+import pickle
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.accounting import (
+    PositionBook, LazyPortfolioSnapshot, float_to_decimal
+)
+from financial_portfolio_automation.models.core import Position, PortfolioSnapshot
+
+
+@pytest.fixture
+def book():
+    """Create a book with AAPL and GOOGL positions."""
+    book = PositionBook(capacity=1)
+    book.apply_fill("AAPL", 1, 100, 150.0)
+    book.apply_fill("GOOGL", 1, 10, 2000.0)
+    return book
+
+
+class TestPositionBook:
+    """Test cases for PositionBook class."""
+
+    def test_fills_update_quantity_and_cost_basis(self, book):
+        """Test buys add cost basis and sells keep it."""
+        book.apply_fill("AAPL", 1, 50, 160.0)
+        book.apply_fill("AAPL", -1, 30, 170.0)
+
+        position = book.to_positions()["AAPL"]
+        assert position.quantity == 120
+        assert position.cost_basis == Decimal('23000.0')
+        assert position.market_value == Decimal('20400.0')
+        assert position.day_pnl == Decimal('0.0')
+
+    def test_closing_and_reopening_keeps_open_order(self, book):
+        """Test closed positions are removed and reopened ones go last."""
+        book.apply_fill("AAPL", -1, 100, 155.0)
+
+        assert "AAPL" not in book
+        assert book.open_symbols == ["GOOGL"]
+
+        book.apply_fill("AAPL", 1, 5, 155.0)
+        assert book.open_symbols == ["GOOGL", "AAPL"]
+
+    def test_short_positions_rejected(self, book):
+        """Test fills that would leave a short position are rejected."""
+        with pytest.raises(ValueError, match="Short positions"):
+            book.apply_fill("AAPL", -1, 101, 150.0)
+        with pytest.raises(ValueError, match="Short positions"):
+            book.apply_fill("MSFT", -1, 1, 300.0)
+
+        assert book.to_positions()["AAPL"].quantity == 100
+        assert "MSFT" not in book
+
+    def test_mark_to_market(self, book):
+        """Test repricing skips symbols without a price."""
+        total, day_pnl = book.mark_to_market({"AAPL": 151.5})
+
+        assert total == pytest.approx(100 * 151.5 + 10 * 2000.0)
+        assert day_pnl == pytest.approx(150.0)
+
+        positions = book.to_positions()
+        assert positions["AAPL"].day_pnl == Decimal('150.0')
+        assert positions["GOOGL"].market_value == Decimal('20000.0')
+
+    def test_load_positions_round_trip(self, book):
+        """Test materialized positions load back into an identical book."""
+        book.mark_to_market({"AAPL": 151.37, "GOOGL": 1999.99})
+        positions = book.to_positions()
+
+        other = PositionBook()
+        other.load_positions(positions.values())
+
+        assert other.to_positions() == positions
+        assert other.total_market_value() == book.total_market_value()
+
+
+class TestLazyPortfolioSnapshot:
+    """Test cases for LazyPortfolioSnapshot class."""
+
+    def _create_snapshot(self, book):
+        return LazyPortfolioSnapshot(
+            timestamp=datetime(2023, 1, 3),
+            total_value=Decimal('50000'),
+            buying_power=Decimal('15000'),
+            day_pnl=Decimal('0'),
+            total_pnl=Decimal('0'),
+            position_arrays=book.snapshot()
+        )
+
+    def test_positions_materialized_from_copy(self, book):
+        """Test snapshots are unaffected by later fills."""
+        snapshot = self._create_snapshot(book)
+        book.apply_fill("AAPL", -1, 100, 155.0)
+
+        assert snapshot.position_count == 2
+        assert [p.symbol for p in snapshot.positions] == ["AAPL", "GOOGL"]
+        assert all(isinstance(p, Position) for p in snapshot.positions)
+        assert snapshot.get_position("AAPL").quantity == 100
+
+    def test_equals_eager_snapshot(self, book):
+        """Test lazy snapshots compare equal to equivalent eager snapshots."""
+        snapshot = self._create_snapshot(book)
+        eager = PortfolioSnapshot(
+            timestamp=snapshot.timestamp,
+            total_value=snapshot.total_value,
+            buying_power=snapshot.buying_power,
+            day_pnl=snapshot.day_pnl,
+            total_pnl=snapshot.total_pnl,
+            positions=list(book.to_positions().values())
+        )
+
+        assert snapshot == eager
+        assert eager == snapshot
+
+    def test_pickle_and_deepcopy(self, book):
+        """Test snapshots can be serialized before positions are materialized."""
+        snapshot = self._create_snapshot(book)
+
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+        assert copy.deepcopy(snapshot) == snapshot
+
+
+def test_float_to_decimal_round_trips():
+    """Test converted floats convert back exactly."""
+    for value in [0.1, 151.37 * 100, 1e-9, -2.5]:
+        assert float(float_to_decimal(value)) == value
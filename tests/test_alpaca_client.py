@@ -209,7 +209,7 @@ class TestAlpacaClientConnectionTesting:
         
         assert "not authenticated" in str(exc_info.value)
     
-    @patch('time.time')
+    @patch('financial_portfolio_automation.api.alpaca_client.time')
     def test_test_connection_success(self, mock_time, alpaca_client, mock_account, mock_clock):
         """Test successful connection test."""
         # Setup authenticated client
@@ -217,7 +217,7 @@ class TestAlpacaClientConnectionTesting:
         alpaca_client._connection_verified = True
         
         # Setup mocks
-        mock_time.side_effect = [1000.0, 1000.1]  # 100ms response time
+        mock_time.time.side_effect = [1000.0, 1000.1]  # 100ms response time
         alpaca_client._api.get_account.return_value = mock_account
         alpaca_client._api.get_clock.return_value = mock_clock
         
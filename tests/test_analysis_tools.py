@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
 
+from financial_portfolio_automation.analysis.shared_indicator_cache import get_shared_indicator_cache
 from financial_portfolio_automation.mcp.analysis_tools import AnalysisTools
 from financial_portfolio_automation.exceptions import PortfolioAutomationError
 
@@ -54,15 +55,6 @@ class TestAnalysisTools:
             return_value=mock_price_data
         )
         
-        # Mock technical analysis calculations
-        mock_sma_result = {'sma_20': 105.5, 'sma_50': 102.3, 'sma_200': 98.7}
-        mock_rsi_result = {'current_value': 65.2, 'overbought': False, 'oversold': False}
-        mock_macd_result = {'macd_line': 2.1, 'signal': 1.8, 'histogram': 0.3}
-        
-        analysis_tools.technical_analysis.calculate_sma = AsyncMock(return_value=mock_sma_result)
-        analysis_tools.technical_analysis.calculate_rsi = AsyncMock(return_value=mock_rsi_result)
-        analysis_tools.technical_analysis.calculate_macd = AsyncMock(return_value=mock_macd_result)
-        
         result = await analysis_tools.analyze_technical_indicators(
             symbols=symbols,
             indicators=indicators,
@@ -80,6 +72,10 @@ class TestAnalysisTools:
         assert 'rsi' in aapl_result['indicators']
         assert 'macd' in aapl_result['indicators']
         assert 'signals' in aapl_result
+        
+        # Five bars are too few for any of the indicators
+        assert aapl_result['indicators']['rsi']['current_value'] is None
+        assert aapl_result['signals'] == {}
     
     @pytest.mark.asyncio
     async def test_analyze_technical_indicators_no_data(self, analysis_tools):
@@ -96,6 +92,22 @@ class TestAnalysisTools:
         assert 'error' in result['analysis_results']['INVALID']
         assert 'No price data available' in result['analysis_results']['INVALID']['error']
     
+    @pytest.mark.asyncio
+    async def test_analyze_technical_indicators_malformed_bar(self, analysis_tools, mock_price_data):
+        """Test a malformed bar fails only its own symbol."""
+        bad_data = mock_price_data[:-1] + [{'timestamp': '2024-01-05', 'volume': 1300000}]
+        
+        async def get_historical_data(symbol, **kwargs):
+            return bad_data if symbol == 'BAD' else mock_price_data
+        
+        analysis_tools.market_data_client.get_historical_data = get_historical_data
+        
+        result = await analysis_tools.analyze_technical_indicators(symbols=['AAPL', 'BAD'])
+        
+        assert 'Analysis failed' in result['analysis_results']['BAD']['error']
+        assert result['analysis_results']['AAPL']['current_price'] == 114
+        assert 'sma' in result['analysis_results']['AAPL']['indicators']
+    
     @pytest.mark.asyncio
     async def test_compare_with_benchmark_success(self, analysis_tools):
         """Test successful benchmark comparison."""
@@ -210,42 +222,34 @@ class TestAnalysisTools:
         # Check rotation analysis
         assert 'rotation_analysis' in result
     
-    @pytest.mark.asyncio
-    async def test_calculate_indicator_sma(self, analysis_tools):
-        """Test SMA indicator calculation."""
-        mock_price_data = [{'close': 100}, {'close': 105}, {'close': 110}]
-        
-        mock_sma_result = {'sma_20': 105.0, 'sma_50': 102.0}
-        analysis_tools.technical_analysis.calculate_sma = AsyncMock(return_value=mock_sma_result)
-        
-        result = await analysis_tools._calculate_indicator('sma', 'AAPL', mock_price_data)
-        
-        assert result == mock_sma_result
-        analysis_tools.technical_analysis.calculate_sma.assert_called_once_with(
-            mock_price_data, periods=[20, 50, 200]
-        )
-    
-    @pytest.mark.asyncio
-    async def test_calculate_indicator_rsi(self, analysis_tools):
-        """Test RSI indicator calculation."""
-        mock_price_data = [{'close': 100}, {'close': 105}, {'close': 110}]
+    def test_shared_indicator_series(self, analysis_tools):
+        """Test indicator summaries take each symbol's latest values from the shared cache."""
+        start = datetime(2024, 1, 1)
+        price_history = {
+            'RISE': [{'timestamp': start + timedelta(days=i), 'close': 100.0 + i} for i in range(220)],
+            'FALL': [{'timestamp': start + timedelta(days=i), 'close': 100.0 - i * 0.5} for i in range(30)]
+        }
         
-        mock_rsi_result = {'current_value': 65.2}
-        analysis_tools.technical_analysis.calculate_rsi = AsyncMock(return_value=mock_rsi_result)
+        series = analysis_tools._shared_indicator_series(price_history, ['sma', 'rsi'])
         
-        result = await analysis_tools._calculate_indicator('rsi', 'AAPL', mock_price_data)
+        rising = analysis_tools._summarize_indicator('sma', series['RISE'])
+        falling = analysis_tools._summarize_indicator('rsi', series['FALL'])
         
-        assert result == mock_rsi_result
-        analysis_tools.technical_analysis.calculate_rsi.assert_called_once_with(
-            mock_price_data, period=14
-        )
+        assert rising == {
+            'sma_20': pytest.approx(309.5), 'sma_50': pytest.approx(294.5), 'sma_200': pytest.approx(219.5)
+        }
+        assert falling == {'current_value': 0.0, 'overbought': False, 'oversold': True}
+        assert analysis_tools._summarize_indicator('sma', series['FALL'])['sma_50'] is None
+        assert analysis_tools._summarize_indicator('sma', series['FALL'])['sma_200'] is None
+        
+        # A second request for the same bars is served from the cache
+        hits = get_shared_indicator_cache().get_stats()['hits']
+        analysis_tools._shared_indicator_series(price_history, ['sma'])
+        assert get_shared_indicator_cache().get_stats()['hits'] == hits + 6
     
-    @pytest.mark.asyncio
-    async def test_calculate_indicator_unsupported(self, analysis_tools):
-        """Test unsupported indicator calculation."""
-        mock_price_data = [{'close': 100}]
-        
-        result = await analysis_tools._calculate_indicator('unsupported', 'AAPL', mock_price_data)
+    def test_summarize_indicator_unsupported(self, analysis_tools):
+        """Test unsupported indicator summaries."""
+        result = analysis_tools._summarize_indicator('unsupported', {})
         
         assert 'error' in result
         assert 'Unsupported indicator: unsupported' in result['error']
@@ -6,6 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
+import financial_portfolio_automation.api.app as api_app
 from financial_portfolio_automation.api.app import app
 
 
@@ -14,6 +15,7 @@ class TestAPIApp:
     
     def setup_method(self):
         """Set up test fixtures."""
+        api_app._data_store = None
         self.client = TestClient(app)
     
     def test_root_endpoint(self):
@@ -58,6 +60,19 @@ class TestAPIApp:
         assert data["status"] == "unhealthy"
         assert "error" in data
     
+    @patch('financial_portfolio_automation.config.settings.get_config')
+    @patch('financial_portfolio_automation.data.store.DataStore')
+    @patch('financial_portfolio_automation.mcp.portfolio_tools.PortfolioTools')
+    def test_health_endpoint_reuses_data_store(self, mock_portfolio_tools, mock_data_store, mock_get_config):
+        """Test startup and health checks share one data store, closed on shutdown."""
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            assert client.get("/health").status_code == 200
+        
+        mock_data_store.assert_called_once()
+        mock_data_store.return_value.close.assert_called_once()
+        assert api_app._data_store is None
+    
     def test_openapi_schema(self):
         """Test OpenAPI schema generation."""
         response = self.client.get("/api/v1/openapi.json")
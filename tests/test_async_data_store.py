@@ -0,0 +1,153 @@
+"""
+Unit tests for AsyncDataStore.
+"""
+
+import asyncio
+import threading
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from financial_portfolio_automation.data.store import DataStore
+from financial_portfolio_automation.data.async_store import AsyncDataStore
+from financial_portfolio_automation.models.core import (
+    Quote, Order, PortfolioSnapshot, OrderSide, OrderType, OrderStatus
+)
+
+
+class TestAsyncDataStore:
+
+    @pytest.fixture
+    def data_store(self, tmp_path):
+        """Create DataStore instance with temporary database."""
+        store = DataStore(str(tmp_path / "test.db"))
+        yield store
+        store.close()
+
+    @pytest.fixture
+    def quotes(self):
+        """Create quotes one second apart."""
+        base_time = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+        return [
+            Quote(
+                symbol="AAPL",
+                timestamp=base_time + timedelta(seconds=i),
+                bid=Decimal("150.00") + i,
+                ask=Decimal("150.05") + i,
+                bid_size=100,
+                ask_size=200
+            )
+            for i in range(25)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_quotes(self, data_store, quotes):
+        """Test awaitable writes and reads."""
+        async with AsyncDataStore(data_store) as store:
+            await store.store_quote(quotes[0])
+            assert await store.save_quotes_batch(quotes[1:]) == 24
+
+            result = await store.get_quotes("AAPL", limit=2)
+
+        assert [q.bid for q in result] == [Decimal("174.00"), Decimal("173.00")]
+
+    @pytest.mark.asyncio
+    async def test_get_orders_and_snapshots(self, data_store):
+        """Test awaitable order and snapshot queries."""
+        async with AsyncDataStore(data_store) as store:
+            await store.save_order(Order(
+                order_id="order_1",
+                symbol="AAPL",
+                quantity=10,
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                status=OrderStatus.FILLED,
+                filled_quantity=10
+            ))
+            await store.save_portfolio_snapshot(PortfolioSnapshot(
+                timestamp=datetime.now(timezone.utc),
+                total_value=Decimal("1000.00"),
+                buying_power=Decimal("500.00"),
+                day_pnl=Decimal("0"),
+                total_pnl=Decimal("0")
+            ))
+
+            orders = await store.get_orders(status="FILLED")
+            snapshots = await store.get_portfolio_snapshots()
+            latest = await store.get_latest_portfolio_snapshot()
+
+        assert [o.order_id for o in orders] == ["order_1"]
+        assert len(snapshots) == 1
+        assert latest.total_value == Decimal("1000.00")
+
+    @pytest.mark.asyncio
+    async def test_iter_quotes_in_batches(self, data_store, quotes):
+        """Test streaming quotes across several batches."""
+        data_store.save_quotes_batch(quotes)
+
+        async with AsyncDataStore(data_store) as store:
+            streamed = [q async for q in store.iter_quotes("AAPL", batch_size=10)]
+            ranged = [
+                q async for q in store.iter_quotes(
+                    "AAPL",
+                    start_time=quotes[5].timestamp,
+                    end_time=quotes[14].timestamp,
+                    batch_size=3
+                )
+            ]
+
+        assert [q.timestamp for q in streamed] == [q.timestamp for q in reversed(quotes)]
+        assert [q.timestamp for q in ranged] == [q.timestamp for q in reversed(quotes[5:15])]
+
+    @pytest.mark.asyncio
+    async def test_queries_do_not_block_event_loop(self, data_store, quotes):
+        """Test that the loop keeps running while a query waits on the database."""
+        data_store.save_quotes_batch(quotes)
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def slow_write():
+            with data_store.get_connection() as conn:
+                for name in data_store._partition_names(conn, 'quotes'):
+                    conn.execute(f"DELETE FROM {name}")
+                write_started.set()
+                release_write.wait(timeout=5)
+
+        async with AsyncDataStore(data_store, max_workers=2) as store:
+            write = asyncio.ensure_future(store._run(slow_write))
+            await asyncio.get_running_loop().run_in_executor(None, write_started.wait, 5)
+
+            # Reads complete on the other worker while the write is held open
+            result = await asyncio.wait_for(store.get_quotes("AAPL"), timeout=5)
+            assert len(result) == 25
+
+            release_write.set()
+            await write
+
+        assert data_store.get_quotes("AAPL") == []
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, data_store):
+        """Test that at most max_workers calls run at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracked_query():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+
+        async with AsyncDataStore(data_store, max_workers=2) as store:
+            await asyncio.gather(*(store._run(tracked_query) for _ in range(6)))
+
+        assert peak == 2
+
+    def test_invalid_max_workers(self, data_store):
+        """Test that the pool size must be positive."""
+        with pytest.raises(ValueError):
+            AsyncDataStore(data_store, max_workers=0)
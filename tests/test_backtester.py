@@ -5,14 +5,20 @@ Unit tests for the backtesting engine.
 import pytest
 import numpy as np
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_EVEN
 from unittest.mock import Mock, patch
 
 from financial_portfolio_automation.strategy.backtester import (
-    Backtester, BacktestResults, BacktestTrade, TransactionCosts
+    Backtester, BacktestCheckpoint, BacktestResults, BacktestTrade, TransactionCosts
 )
 from financial_portfolio_automation.strategy.base import Strategy, StrategySignal, SignalType
+from financial_portfolio_automation.strategy.market_data_index import MarketDataIndex
+from financial_portfolio_automation.analysis.shared_indicator_cache import get_shared_indicator_cache
+from financial_portfolio_automation.strategy.monte_carlo import (
+    SharedQuoteHistory, load_shared_history, generate_return_paths, evaluate_portfolio_paths
+)
 from financial_portfolio_automation.models.core import Quote, Position, PortfolioSnapshot, OrderSide
+from financial_portfolio_automation.models.quote_frame import QuoteFrame
 from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
 
 
@@ -32,6 +38,49 @@ class MockStrategy(Strategy):
         pass
 
 
+class AvailableSymbolsStrategy(MockStrategy):
+    """Mock strategy that only emits signals for symbols with market data."""
+    
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        """Generate predefined signals for available symbols."""
+        return [s for s in self.signals_to_generate if s.symbol in market_data]
+
+
+class StatefulStrategy(MockStrategy):
+    """Mock strategy whose signals depend on history and on its own state."""
+    
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        """Alternate buys and sells of the symbol with the longest history."""
+        if not market_data:
+            return []
+        
+        symbol = max(market_data, key=lambda s: (len(historical_data.get(s, [])), s))
+        signal_type = SignalType.BUY if self.state.signals_generated % 3 != 2 else SignalType.SELL
+        self.state.increment_signals()
+        
+        if signal_type == SignalType.SELL and symbol not in {p.symbol for p in portfolio.positions}:
+            return []
+        
+        return [StrategySignal(symbol=symbol, signal_type=signal_type, strength=0.8, quantity=10)]
+
+
+class IndicatorStrategy(MockStrategy):
+    """Mock strategy recording a shared indicator over each day's history."""
+    
+    def __init__(self, config: StrategyConfig):
+        super().__init__(config)
+        self.uses_shared_cache = []
+    
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        """Compute a moving average without trading."""
+        self.uses_shared_cache.append(self.use_shared_indicator_cache)
+        for symbol, history in historical_data.items():
+            if len(history) >= 5:
+                prices = [float(quote.bid) for quote in history]
+                self.shared_indicator(symbol, 'sma', history, prices, period=5)
+        return []
+
+
 @pytest.fixture
 def transaction_costs():
     """Create transaction costs configuration."""
@@ -244,7 +293,14 @@ class TestBacktester:
         """Test state reset functionality."""
         # Modify state
         backtester._cash_balance = Decimal('50000')
-        backtester._current_positions = {"AAPL": Mock()}
+        backtester._current_positions = {"AAPL": Position(
+            symbol="AAPL",
+            quantity=100,
+            market_value=Decimal('15000'),
+            cost_basis=Decimal('15000'),
+            unrealized_pnl=Decimal('0'),
+            day_pnl=Decimal('0')
+        )}
         backtester._trades = [Mock()]
         
         # Reset state
@@ -301,6 +357,25 @@ class TestBacktester:
         assert isinstance(market_data["AAPL"], Quote)
         assert market_data["AAPL"].timestamp.date() == target_date.date()
     
+    def test_market_data_index_built_once(self, backtester, sample_historical_data):
+        """Test date lookups over the same data share one market data index."""
+        with patch('financial_portfolio_automation.strategy.backtester.MarketDataIndex',
+                   wraps=MarketDataIndex) as index:
+            trading_dates = backtester._get_trading_dates(
+                sample_historical_data, datetime(2023, 1, 1), datetime(2023, 1, 10)
+            )
+            for trading_date in trading_dates:
+                backtester._get_market_data_for_date(sample_historical_data, trading_date)
+                subset = backtester._get_historical_subset(sample_historical_data, [trading_date])
+            
+            index.assert_called_once_with(sample_historical_data)
+            assert len(subset["AAPL"]) == 10
+            
+            # Other data gets its own index
+            backtester._get_trading_dates({"AAPL": sample_historical_data["AAPL"]},
+                                          datetime(2023, 1, 1), datetime(2023, 1, 10))
+            assert index.call_count == 2
+    
     def test_calculate_commission(self, backtester):
         """Test commission calculation."""
         # Test normal commission
@@ -458,6 +533,41 @@ class TestBacktester:
         # Position should be removed
         assert "AAPL" not in backtester._current_positions
     
+    def test_execute_trade_oversell_rejected(self, backtester):
+        """Test a sell larger than the position leaves trades and cash untouched."""
+        backtester._execute_trade(
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            quantity=100,
+            price=Decimal('150.00'),
+            commission=Decimal('1.00'),
+            slippage=Decimal('0.50'),
+            market_impact=Decimal('0.25'),
+            timestamp=datetime.now(),
+            strategy_id="test_strategy",
+            signal_strength=0.8
+        )
+        cash = backtester._cash_balance
+        
+        for symbol in ("AAPL", "MSFT"):
+            with pytest.raises(ValueError, match="Short positions"):
+                backtester._execute_trade(
+                    symbol=symbol,
+                    side=OrderSide.SELL,
+                    quantity=150,
+                    price=Decimal('155.00'),
+                    commission=Decimal('1.00'),
+                    slippage=Decimal('0.50'),
+                    market_impact=Decimal('0.25'),
+                    timestamp=datetime.now(),
+                    strategy_id="test_strategy",
+                    signal_strength=0.8
+                )
+        
+        assert len(backtester._trades) == 1
+        assert backtester._cash_balance == cash
+        assert backtester._current_positions["AAPL"].quantity == 100
+    
     def test_run_backtest_basic(self, backtester, mock_strategy, sample_historical_data):
         """Test basic backtest execution."""
         # Configure strategy to generate a simple buy signal
@@ -487,6 +597,24 @@ class TestBacktester:
         assert results.total_trades >= 0
         assert len(results.portfolio_history) > 0
     
+    def test_run_backtest_bypasses_shared_indicator_cache(self, backtester, mock_strategy,
+                                                          sample_historical_data):
+        """Test sliding backtest windows are computed without the process-wide cache."""
+        strategy = IndicatorStrategy(mock_strategy.config)
+        before = get_shared_indicator_cache().get_stats()
+        
+        backtester.run_backtest(
+            strategy=strategy,
+            historical_data=sample_historical_data,
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 20)
+        )
+        
+        after = get_shared_indicator_cache().get_stats()
+        assert strategy.uses_shared_cache and not any(strategy.uses_shared_cache)
+        assert strategy.use_shared_indicator_cache
+        assert (after['hits'], after['misses']) == (before['hits'], before['misses'])
+    
     def test_run_backtest_no_signals(self, backtester, mock_strategy, sample_historical_data):
         """Test backtest with no signals generated."""
         # Strategy generates no signals
@@ -519,6 +647,24 @@ class TestBacktester:
                 end_date=end_date
             )
     
+    def test_run_backtest_quote_frame_matches_lists(self, transaction_costs, mock_strategy,
+                                                    sample_historical_data):
+        """Test a backtest over a columnar QuoteFrame matches one over quote lists."""
+        start_date = datetime(2023, 1, 1)
+        end_date = datetime(2023, 1, 30)
+        
+        expected = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            StatefulStrategy(mock_strategy.config), sample_historical_data, start_date, end_date
+        )
+        results = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            StatefulStrategy(mock_strategy.config), QuoteFrame.from_quotes(sample_historical_data),
+            start_date, end_date
+        )
+        
+        assert results.trades == expected.trades
+        assert results.portfolio_history == expected.portfolio_history
+        assert results.final_value == expected.final_value
+    
     @patch('financial_portfolio_automation.strategy.backtester.random.choices')
     def test_generate_randomized_datasets(self, mock_choices, backtester, sample_historical_data):
         """Test randomized dataset generation for Monte Carlo."""
@@ -556,6 +702,46 @@ class TestBacktester:
         assert 'parameters' in results
         assert isinstance(results['period_results'], list)
     
+    def test_walk_forward_parallel_matches_sequential(self, backtester, mock_strategy):
+        """Test parallel walk-forward returns the sequential results in window order."""
+        strategy = AvailableSymbolsStrategy(mock_strategy.config)
+        strategy.signals_to_generate = [
+            StrategySignal(symbol="AAPL", signal_type=SignalType.BUY, strength=0.8, quantity=10)
+        ]
+        
+        base_date = datetime(2023, 1, 1)
+        rng = np.random.default_rng(3)
+        historical_data = {}
+        for symbol, price in (("AAPL", 150.0), ("GOOGL", 200.0)):
+            quotes = []
+            for day in range(150):
+                price *= 1 + rng.normal(0, 0.02)
+                quotes.append(Quote(
+                    symbol=symbol,
+                    timestamp=base_date + timedelta(days=day),
+                    bid=Decimal(str(round(price - 0.05, 2))),
+                    ask=Decimal(str(round(price + 0.05, 2))),
+                    bid_size=1000,
+                    ask_size=1000
+                ))
+            historical_data[symbol] = quotes
+        
+        kwargs = dict(
+            strategy=strategy,
+            historical_data=historical_data,
+            start_date=base_date,
+            end_date=base_date + timedelta(days=149),
+            training_period_months=1,
+            testing_period_months=1,
+            step_months=1
+        )
+        sequential = backtester.run_walk_forward_analysis(**kwargs)
+        parallel = backtester.run_walk_forward_analysis(parallel=True, max_workers=2, **kwargs)
+        
+        assert len(sequential['period_results']) == 3
+        assert parallel['period_results'] == sequential['period_results']
+        assert parallel['aggregate_statistics'] == sequential['aggregate_statistics']
+    
     def test_monte_carlo_simulation_basic(self, backtester, mock_strategy, sample_historical_data):
         """Test basic Monte Carlo simulation."""
         mock_strategy.signals_to_generate = []  # No signals for simplicity
@@ -604,6 +790,209 @@ class TestBacktester:
             assert mock_sim.call_count == 5
 
 
+class TestProcessPoolMonteCarlo:
+    """Test the process-pool Monte Carlo engine."""
+    
+    def test_shared_history_round_trip(self, sample_historical_data):
+        """Test quotes survive packing into shared memory unchanged."""
+        with SharedQuoteHistory(sample_historical_data) as shared_history:
+            restored = load_shared_history(shared_history.layout)
+        
+        assert restored == sample_historical_data
+    
+    def test_process_mode_is_reproducible(self, backtester, mock_strategy, sample_historical_data):
+        """Test seeded process-pool runs give identical ordered results."""
+        strategy = AvailableSymbolsStrategy(mock_strategy.config)
+        strategy.signals_to_generate = [
+            StrategySignal(symbol="AAPL", signal_type=SignalType.BUY, strength=0.8, quantity=10)
+        ]
+        
+        kwargs = dict(
+            strategy=strategy,
+            historical_data=sample_historical_data,
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 20),
+            num_simulations=6,
+            execution_mode='process',
+            max_workers=2,
+            random_seed=7
+        )
+        first = backtester.run_monte_carlo_simulation(**kwargs)
+        second = backtester.run_monte_carlo_simulation(**kwargs)
+        
+        assert first['statistics']['simulations_completed'] == 6
+        assert [r.final_value for r in first['simulation_results']] == \
+            [r.final_value for r in second['simulation_results']]
+        assert first['var_analysis'] == second['var_analysis']
+    
+    def test_invalid_execution_mode(self, backtester, mock_strategy, sample_historical_data):
+        """Test unknown execution modes are rejected."""
+        with pytest.raises(ValueError, match="Unsupported Monte Carlo execution mode"):
+            backtester.run_monte_carlo_simulation(
+                strategy=mock_strategy,
+                historical_data=sample_historical_data,
+                start_date=datetime(2023, 1, 1),
+                end_date=datetime(2023, 1, 10),
+                num_simulations=2,
+                execution_mode='gpu'
+            )
+
+
+class TestVectorizedMonteCarlo:
+    """Test the path-level vectorized Monte Carlo engine."""
+    
+    @pytest.mark.parametrize("method", ['block_bootstrap', 'stationary_bootstrap', 'gbm', 'student_t'])
+    def test_generate_return_paths_shape(self, method):
+        """Test every method returns paths x horizon x symbols arrays."""
+        log_returns = np.random.default_rng(0).normal(0, 0.01, size=(50, 3))
+        
+        paths = generate_return_paths(
+            log_returns, 100, 30, method=method, block_size=5, rng=np.random.default_rng(1)
+        )
+        
+        assert paths.shape == (100, 30, 3)
+        assert np.isfinite(paths).all()
+    
+    @pytest.mark.parametrize("method", ['block_bootstrap', 'stationary_bootstrap'])
+    def test_bootstrap_paths_resample_historical_rows(self, method):
+        """Test bootstrap paths only contain whole historical return rows."""
+        log_returns = np.arange(40, dtype=float).reshape(20, 2)
+        
+        paths = generate_return_paths(
+            log_returns, 10, 15, method=method, block_size=4, rng=np.random.default_rng(2)
+        )
+        
+        rows = {tuple(row) for row in log_returns}
+        assert all(tuple(row) in rows for row in paths.reshape(-1, 2))
+    
+    def test_evaluate_portfolio_paths(self):
+        """Test portfolio outcomes for a known path."""
+        path = np.log(np.array([[[1.1], [0.5], [1.2]]]))
+        
+        outcome = evaluate_portfolio_paths(path, np.array([1.0]))
+        
+        assert outcome['total_return'][0] == pytest.approx(1.1 * 0.5 * 1.2 - 1)
+        assert outcome['max_drawdown'][0] == pytest.approx(0.5)
+    
+    def test_vectorized_monte_carlo_summary(self, backtester, sample_historical_data):
+        """Test the summary matches run_monte_carlo_simulation's structure and is seeded."""
+        kwargs = dict(
+            historical_data=sample_historical_data,
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 30),
+            num_paths=2500,
+            batch_size=1000,
+            random_seed=11
+        )
+        
+        first = backtester.run_vectorized_monte_carlo(**kwargs)
+        second = backtester.run_vectorized_monte_carlo(**kwargs)
+        
+        assert first['statistics']['simulations_completed'] == 2500
+        assert set(first['var_analysis']) == {'var_5', 'cvar_5', 'var_95', 'cvar_95'}
+        assert first['var_analysis']['cvar_5'] <= first['var_analysis']['var_5']
+        assert first['parameters']['weights'] == {'AAPL': 0.5, 'GOOGL': 0.5}
+        np.testing.assert_array_equal(
+            first['path_results']['total_return'], second['path_results']['total_return']
+        )
+
+
+class TestBacktestCheckpoint:
+    """Test checkpointing and resuming backtests."""
+    
+    def _create_strategy(self, mock_strategy):
+        return StatefulStrategy(mock_strategy.config)
+    
+    def test_resume_matches_full_run(self, transaction_costs, mock_strategy, sample_historical_data):
+        """Test a resumed backtest is identical to a full re-run."""
+        start_date = datetime(2023, 1, 1)
+        middle_date = datetime(2023, 1, 18)
+        end_date = datetime(2023, 1, 30)
+        
+        full = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            self._create_strategy(mock_strategy), sample_historical_data, start_date, end_date
+        )
+        
+        first = Backtester(transaction_costs, Decimal('100000'))
+        first.run_backtest(self._create_strategy(mock_strategy), sample_historical_data, start_date, middle_date)
+        checkpoint = first.get_checkpoint()
+        
+        assert checkpoint.last_date.date() == middle_date.date()
+        
+        resumed = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            self._create_strategy(mock_strategy), sample_historical_data, start_date, end_date,
+            checkpoint=checkpoint
+        )
+        
+        assert resumed.start_date == full.start_date
+        assert resumed.trades == full.trades
+        assert resumed.portfolio_history == full.portfolio_history
+        assert resumed.final_value == full.final_value
+        assert resumed.sharpe_ratio == full.sharpe_ratio
+        assert resumed.max_drawdown == full.max_drawdown
+        assert resumed.total_trades == full.total_trades > 0
+        
+        # Resuming does not modify the checkpoint it started from
+        assert checkpoint.last_date.date() == middle_date.date()
+        assert len(checkpoint.portfolio_history) == 18
+    
+    def test_save_and_load(self, tmp_path, backtester, mock_strategy, sample_historical_data):
+        """Test checkpoints round-trip through a file."""
+        strategy = self._create_strategy(mock_strategy)
+        backtester.run_backtest(
+            strategy, sample_historical_data, datetime(2023, 1, 1), datetime(2023, 1, 15)
+        )
+        path = tmp_path / "backtest.ckpt"
+        
+        backtester.get_checkpoint().save(str(path))
+        loaded = BacktestCheckpoint.load(str(path))
+        
+        assert loaded.cash_balance == backtester.get_checkpoint().cash_balance
+        assert loaded.trades == backtester.get_checkpoint().trades
+        assert loaded.strategy_state.signals_generated == strategy.state.signals_generated
+    
+    def test_checkpoint_built_on_request(self, backtester, mock_strategy, sample_historical_data):
+        """Test runs defer copying their state until a checkpoint is requested."""
+        strategy = self._create_strategy(mock_strategy)
+        backtester.run_backtest(
+            strategy, sample_historical_data, datetime(2023, 1, 1), datetime(2023, 1, 15)
+        )
+        signals = strategy.state.signals_generated
+        assert backtester._last_checkpoint is None
+        
+        # Later changes to the strategy do not leak into the checkpoint
+        strategy.state.increment_signals()
+        checkpoint = backtester.get_checkpoint()
+        
+        assert checkpoint.strategy_state.signals_generated == signals
+        assert backtester.get_checkpoint() is checkpoint
+    
+    def test_resume_rejects_mismatches(self, backtester, mock_strategy, sample_historical_data):
+        """Test checkpoints are only applied to matching runs."""
+        backtester.run_backtest(
+            self._create_strategy(mock_strategy), sample_historical_data,
+            datetime(2023, 1, 1), datetime(2023, 1, 15)
+        )
+        checkpoint = backtester.get_checkpoint()
+        
+        other_capital = Backtester(backtester.transaction_costs, Decimal('50000'))
+        with pytest.raises(ValueError, match="different capital"):
+            other_capital.run_backtest(
+                self._create_strategy(mock_strategy), sample_historical_data,
+                datetime(2023, 1, 1), datetime(2023, 1, 30), checkpoint=checkpoint
+            )
+        
+        changed_data = {
+            symbol: [q for q in quotes if q.timestamp != datetime(2023, 1, 5)]
+            for symbol, quotes in sample_historical_data.items()
+        }
+        with pytest.raises(ValueError, match="has changed"):
+            backtester.run_backtest(
+                self._create_strategy(mock_strategy), changed_data,
+                datetime(2023, 1, 1), datetime(2023, 1, 30), checkpoint=checkpoint
+            )
+
+
 class TestBacktestResults:
     """Test backtest results data structure."""
     
@@ -643,5 +1032,104 @@ class TestBacktestResults:
         assert len(results.portfolio_history) == 0  # Default empty
 
 
+
+def _quantize(value):
+    """Round a Decimal to micro-units, half to even."""
+    return value.quantize(Decimal('0.000001'), rounding=ROUND_HALF_EVEN)
+
+
+class TestFixedPointCosts:
+    """Test the micro-unit cost path against the Decimal cost formulas."""
+    
+    def _decimal_costs(self, costs, bid, ask, side, quantity):
+        """Decimal formulas, with each amount rounded to micro-units as it is produced."""
+        spread = ask - bid
+        slippage_factor = min(Decimal('0.01'), costs.slippage_factor * Decimal(str(quantity / 1000)))
+        base = ask if side == OrderSide.BUY else bid
+        slippage = _quantize(spread * slippage_factor)
+        price = base + slippage if side == OrderSide.BUY else base - slippage
+        commission = min(max(Decimal(str(quantity)) * costs.commission_per_share,
+                             costs.commission_minimum), costs.commission_maximum)
+        slippage_cost = _quantize(spread * costs.spread_cost_factor * Decimal(str(quantity)))
+        market_impact = _quantize(Decimal(str(quantity)) * price * costs.market_impact_factor)
+        return price, commission, slippage_cost, market_impact
+    
+    @pytest.mark.parametrize('side', [OrderSide.BUY, OrderSide.SELL])
+    def test_costs_match_decimal_formulas(self, backtester, side):
+        """Test prices and costs equal the Decimal formulas under the rounding rules."""
+        costs = backtester.transaction_costs
+        for bid, ask in [('149.95', '150.05'), ('10.01', '10.02'), ('0.5123', '0.5189'), ('3000', '3000.25')]:
+            quote = Quote(symbol="AAPL", timestamp=datetime(2024, 1, 2), bid=Decimal(bid),
+                          ask=Decimal(ask), bid_size=100, ask_size=100)
+            for quantity in (1, 7, 10, 333, 1000, 12345, 50000):
+                price, commission, slippage_cost, market_impact = self._decimal_costs(
+                    costs, quote.bid, quote.ask, side, quantity
+                )
+                
+                assert backtester._calculate_execution_price(quote, side, quantity) == price
+                assert backtester._calculate_commission(quantity, price) == commission
+                assert backtester._calculate_slippage_cost(quote, side, quantity) == slippage_cost
+                assert backtester._calculate_market_impact(quantity, price) == market_impact
+    
+    def test_exact_amounts_match_unrounded_decimal(self, backtester):
+        """Test amounts needing no more than six decimals equal the Decimal results exactly."""
+        quote = Quote(symbol="AAPL", timestamp=datetime(2024, 1, 2), bid=Decimal('149.95'),
+                      ask=Decimal('150.05'), bid_size=100, ask_size=100)
+        costs = backtester.transaction_costs
+        spread = quote.spread
+        price = quote.ask + spread * costs.slippage_factor
+        
+        assert backtester._calculate_execution_price(quote, OrderSide.BUY, 1000) == price
+        assert backtester._calculate_slippage_cost(quote, OrderSide.BUY, 1000) == (
+            spread * costs.spread_cost_factor * 1000
+        )
+        assert backtester._calculate_market_impact(1000, price) == 1000 * price * costs.market_impact_factor
+    
+    @pytest.mark.parametrize('side', [OrderSide.BUY, OrderSide.SELL])
+    def test_sub_micro_rates_are_not_rounded(self, side):
+        """Test cost rates finer than a micro-unit are applied exactly."""
+        costs = TransactionCosts(
+            commission_per_share=Decimal('0.0000035'),
+            commission_minimum=Decimal('0'),
+            spread_cost_factor=Decimal('0.0000004'),
+            market_impact_factor=Decimal('0.00000025'),
+            slippage_factor=Decimal('0.0000005')
+        )
+        backtester = Backtester(costs)
+        quote = Quote(symbol="AAPL", timestamp=datetime(2024, 1, 2), bid=Decimal('149.95'),
+                      ask=Decimal('150.05'), bid_size=100, ask_size=100)
+        for quantity in (1, 7, 1000, 50000):
+            price, _, slippage_cost, market_impact = self._decimal_costs(
+                costs, quote.bid, quote.ask, side, quantity
+            )
+            
+            assert backtester._calculate_execution_price(quote, side, quantity) == price
+            assert backtester._calculate_commission(quantity, price) == _quantize(
+                costs.commission_per_share * quantity
+            )
+            assert backtester._calculate_slippage_cost(quote, side, quantity) == slippage_cost
+            assert backtester._calculate_market_impact(quantity, price) == market_impact
+        
+        assert backtester._calculate_market_impact(50000, Decimal('150')) == Decimal('1.875')
+    
+    def test_ledger_matches_decimal_trade_amounts(self, transaction_costs, mock_strategy,
+                                                  sample_historical_data):
+        """Test the micro-unit cash ledger equals summing the trades' Decimal net amounts."""
+        backtester = Backtester(transaction_costs, Decimal('100000'))
+        
+        results = backtester.run_backtest(
+            StatefulStrategy(mock_strategy.config), sample_historical_data,
+            datetime(2023, 1, 1), datetime(2023, 1, 30)
+        )
+        
+        cash = Decimal('100000')
+        for trade in results.trades:
+            cash += -trade.net_amount if trade.side == OrderSide.BUY else trade.net_amount
+            assert trade.price == _quantize(trade.price)
+        assert results.trades
+        assert backtester._cash_balance == cash
+        assert results.portfolio_history[-1].buying_power == cash
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
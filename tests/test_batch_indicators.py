@@ -0,0 +1,111 @@
+"""
+Unit tests for the batch (symbols x time) technical indicator kernels.
+"""
+
+import numpy as np
+import pytest
+
+from financial_portfolio_automation.analysis import batch_indicators as bi
+from financial_portfolio_automation.analysis import vectorized_indicators as vi
+from financial_portfolio_automation.analysis.technical_analysis import TechnicalAnalysis
+
+
+@pytest.fixture
+def histories():
+    """(highs, lows, closes) random walks with different history lengths."""
+    rng = np.random.default_rng(5)
+    result = []
+    for length in (300, 120, 45, 10, 0):
+        closes = 100 + np.cumsum(rng.normal(0, 1, length))
+        highs = closes + np.abs(rng.normal(0, 0.5, length))
+        lows = closes - np.abs(rng.normal(0, 0.5, length))
+        result.append((highs, lows, closes))
+    return result
+
+
+def _single(highs, lows, closes):
+    return {
+        'sma_20': vi.sma(closes, 20),
+        'sma_50': vi.sma(closes, 50),
+        'ema_12': vi.ema(closes, 12),
+        'ema_26': vi.ema(closes, 26),
+        'rsi': vi.rsi(closes),
+        'macd': vi.macd(closes),
+        'stochastic': vi.stochastic(highs, lows, closes),
+        'bollinger_bands': vi.bollinger_bands(closes),
+        'atr': vi.average_true_range(highs, lows, closes)
+    }
+
+
+def _flatten(indicators, prefix=''):
+    for name, value in indicators.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{name}.")
+        else:
+            yield prefix + name, value
+
+
+class TestBatchIndicators:
+    """Test batch kernels against the one-dimensional kernels."""
+
+    def test_price_matrix_alignment(self):
+        """Test histories are aligned on their latest price and left-padded."""
+        matrix = bi.price_matrix([[1.0, 2.0, 3.0], [4.0], []])
+
+        np.testing.assert_array_equal(matrix[0], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(matrix[1, 2:], [4.0])
+        assert np.isnan(matrix[1, :2]).all() and np.isnan(matrix[2]).all()
+        np.testing.assert_array_equal(bi.price_matrix([[1.0, 2.0, 3.0]], length=2), [[2.0, 3.0]])
+        np.testing.assert_array_equal(bi.first_valid_index(matrix), [0, 2, 3])
+
+    def test_rows_match_single_symbol_kernels(self, histories):
+        """Test every row equals the 1-D kernels on that symbol's own history."""
+        highs, lows, closes = (bi.price_matrix([h[i] for h in histories]) for i in range(3))
+        batch = dict(_flatten(bi.calculate_all_indicators(highs, lows, closes)))
+
+        for row, history in enumerate(histories):
+            padding = closes.shape[1] - len(history[2])
+            for name, expected in _flatten(_single(*history)):
+                assert np.isnan(batch[name][row, :padding]).all(), name
+                np.testing.assert_allclose(
+                    batch[name][row, padding:], expected, rtol=1e-9, atol=1e-9, err_msg=name
+                )
+
+    def test_interior_gaps(self):
+        """Test a missing price invalidates the windows containing it."""
+        closes = np.array([np.arange(1.0, 11.0)])
+        closes[0, 4] = np.nan
+
+        sma = bi.sma(closes, 3)[0]
+        assert np.isnan(sma[4:7]).all()
+        assert sma[3] == pytest.approx(3.0) and sma[7] == pytest.approx(7.0)
+        assert np.isnan(bi.rsi(closes, 2)[0, 4:7]).all()
+        assert np.isnan(bi.ema(closes, 2)[0, 4:]).all()
+
+    def test_invalid_inputs(self):
+        """Test non-matrix input and mismatched shapes are rejected."""
+        with pytest.raises(ValueError, match="symbols x time"):
+            bi.sma([1.0, 2.0, 3.0], 2)
+        with pytest.raises(ValueError, match="same shape"):
+            bi.true_range(np.ones((2, 3)), np.ones((2, 3)), np.ones((1, 3)))
+        with pytest.raises(ValueError, match="must be positive"):
+            bi.ema(np.ones((2, 3)), 0)
+
+
+class TestTechnicalAnalysisBatch:
+    """Test the TechnicalAnalysis batch API."""
+
+    def test_ragged_lists(self, histories):
+        """Test per-symbol lists of different lengths match calculate_all_indicators."""
+        ta = TechnicalAnalysis()
+        lists = [[values.tolist() for values in history] for history in histories[:3]]
+        batch = ta.calculate_all_indicators_batch(*([symbol[i] for symbol in lists] for i in range(3)))
+        latest = bi.latest_values(batch)
+
+        for row, (highs, lows, closes) in enumerate(lists):
+            single = ta.calculate_all_indicators(highs, lows, closes)
+            assert latest['rsi'][row] == pytest.approx(single['rsi'][-1])
+            assert latest['macd']['signal'][row] == pytest.approx(single['macd']['signal'][-1])
+            assert latest['atr'][row] == pytest.approx(single['atr'][-1])
+
+        assert np.isnan(latest['sma_50'][2]) and latest['sma_20'][2] == pytest.approx(np.mean(lists[2][2][-20:]))
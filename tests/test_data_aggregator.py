@@ -0,0 +1,93 @@
+"""
+Unit tests for DataAggregator rolling metrics.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from financial_portfolio_automation.analytics.data_aggregator import DataAggregator
+from financial_portfolio_automation.data.store import DataStore
+
+
+def _window_returns(window_data):
+    """Returns within a window as the per-window loops computed them."""
+    returns = []
+    for j in range(1, len(window_data)):
+        prev_close = window_data[j-1]['close_value']
+        curr_close = window_data[j]['close_value']
+        if prev_close > 0:
+            returns.append((curr_close - prev_close) / prev_close)
+    return returns
+
+
+def _reference_rolling_metrics(aggregated_data, window_size):
+    """Rolling mean and volatility, recomputing every window."""
+    rolling_returns = []
+    rolling_volatilities = []
+    for i in range(window_size, len(aggregated_data)):
+        window_returns = _window_returns(aggregated_data[i-window_size:i])
+        if window_returns:
+            avg_return = sum(window_returns) / len(window_returns)
+            rolling_returns.append(avg_return)
+            if len(window_returns) > 1:
+                variance = sum((r - avg_return) ** 2 for r in window_returns) / (len(window_returns) - 1)
+                rolling_volatilities.append(variance ** 0.5)
+    return rolling_returns, rolling_volatilities
+
+
+def _reference_rolling_risk_metrics(aggregator, aggregated_data, window_size):
+    """Rolling VaR (interpolated percentile) and max drawdown, recomputing every window."""
+    rolling_var_95 = []
+    rolling_var_99 = []
+    rolling_max_dd = []
+    for i in range(window_size, len(aggregated_data)):
+        window_data = aggregated_data[i-window_size:i]
+        window_returns = _window_returns(window_data)
+        if window_returns:
+            rolling_var_95.append(np.percentile(window_returns, 5) * 100)
+            rolling_var_99.append(np.percentile(window_returns, 1) * 100)
+            rolling_max_dd.append(aggregator._calculate_max_drawdown_from_data(window_data))
+    return rolling_var_95, rolling_var_99, rolling_max_dd
+
+
+class TestDataAggregatorRollingMetrics:
+    """Test rolling metrics against per-window computations."""
+    
+    @pytest.fixture
+    def aggregator(self):
+        """Create a data aggregator with a mock data store."""
+        return DataAggregator(Mock(spec=DataStore))
+    
+    @pytest.fixture
+    def aggregated_data(self):
+        """Daily closes of a random walk, with a zero close leaving undefined returns."""
+        rng = np.random.default_rng(11)
+        closes = 100_000 * np.cumprod(1 + rng.normal(0.0005, 0.02, 80))
+        closes[30] = 0.0
+        return [{'close_value': float(close)} for close in closes]
+    
+    @pytest.mark.parametrize('window_size', [2, 3, 5, 20, 79])
+    def test_rolling_metrics_match_per_window(self, aggregator, aggregated_data, window_size):
+        """Test rolling returns and volatilities match recomputing each window."""
+        result = aggregator._calculate_rolling_metrics(aggregated_data, window_size)
+        
+        rolling_returns, rolling_volatilities = _reference_rolling_metrics(aggregated_data, window_size)
+        assert result['window_size'] == window_size
+        assert result['rolling_returns'] == pytest.approx(rolling_returns, rel=1e-9, abs=1e-12)
+        assert result['rolling_volatilities'] == pytest.approx(rolling_volatilities, rel=1e-9, abs=1e-12)
+    
+    @pytest.mark.parametrize('window_size', [2, 3, 5, 20, 79])
+    def test_rolling_risk_metrics_match_per_window(self, aggregator, aggregated_data, window_size):
+        """Test rolling VaR and drawdown match recomputing each window."""
+        result = aggregator._calculate_rolling_risk_metrics(aggregated_data, window_size)
+        
+        var_95, var_99, max_dd = _reference_rolling_risk_metrics(aggregator, aggregated_data, window_size)
+        assert result['rolling_var_95'] == pytest.approx(var_95, rel=1e-9, abs=1e-12)
+        assert result['rolling_var_99'] == pytest.approx(var_99, rel=1e-9, abs=1e-12)
+        assert result['rolling_max_drawdown'] == pytest.approx(max_dd, rel=1e-9, abs=1e-12)
+    
+    def test_rolling_metrics_insufficient_data(self, aggregator, aggregated_data):
+        """Test no rolling metrics are calculated for fewer periods than the window."""
+        assert aggregator._calculate_rolling_metrics(aggregated_data[:5], 20) == {}
+        assert aggregator._calculate_rolling_risk_metrics(aggregated_data[:5], 20) == {}
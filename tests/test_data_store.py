@@ -3,17 +3,21 @@ Unit tests for DataStore implementation.
 """
 
 import pytest
+import sqlite3
 import tempfile
 import os
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
+from unittest.mock import patch
 
-from financial_portfolio_automation.data.store import DataStore
+from financial_portfolio_automation.data.store import DataStore, RetentionPolicy
 from financial_portfolio_automation.models.core import (
     Quote, Position, Order, PortfolioSnapshot,
     OrderSide, OrderType, OrderStatus
 )
+from financial_portfolio_automation.models.quote_frame import BarArray, QuoteFrame
 from financial_portfolio_automation.exceptions import DatabaseError
 
 
@@ -33,7 +37,9 @@ class TestDataStore:
     @pytest.fixture
     def data_store(self, temp_db):
         """Create DataStore instance with temporary database."""
-        return DataStore(temp_db)
+        store = DataStore(temp_db)
+        yield store
+        store.close()
     
     @pytest.fixture
     def sample_quote(self):
@@ -302,6 +308,32 @@ class TestDataStore:
         assert latest_snapshot is not None
         assert latest_snapshot.total_value == Decimal("25002.00")  # Last one saved
     
+    def test_get_portfolio_snapshots_reads_positions_in_one_query(self, data_store, sample_position):
+        """Test snapshots in a period are returned with their positions without a query per snapshot."""
+        base_time = datetime(2024, 1, 2, 16, 0, tzinfo=timezone.utc)
+        for day in range(4):
+            data_store.save_portfolio_snapshot(PortfolioSnapshot(
+                timestamp=base_time + timedelta(days=day),
+                total_value=Decimal(f"2500{day}.00"),
+                buying_power=Decimal("10000.00"),
+                day_pnl=Decimal("100.00"),
+                total_pnl=Decimal("500.00"),
+                positions=[sample_position] * (day % 2)
+            ))
+        
+        with patch.object(data_store, 'get_positions', wraps=data_store.get_positions) as get_positions:
+            snapshots = data_store.get_portfolio_snapshots(
+                start_date=(base_time + timedelta(days=1)).date()
+            )
+        
+        get_positions.assert_not_called()
+        assert [snapshot.total_value for snapshot in snapshots] == [
+            Decimal("25001.00"), Decimal("25002.00"), Decimal("25003.00")
+        ]
+        assert [len(snapshot.positions) for snapshot in snapshots] == [1, 0, 1]
+        assert snapshots[0].positions[0].symbol == sample_position.symbol
+        assert snapshots[0].positions[0].quantity == sample_position.quantity
+    
     def test_get_database_stats(self, data_store, sample_quote, sample_order):
         """Test getting database statistics."""
         # Initially empty database
@@ -421,4 +453,361 @@ class TestDataStore:
         assert len(limited_quotes) == 10
         
         # Verify quotes are ordered by timestamp DESC (most recent first)
-        assert limited_quotes[0].bid >= limited_quotes[1].bid  # Higher index should have higher bid
\ No newline at end of file
+        assert limited_quotes[0].bid >= limited_quotes[1].bid  # Higher index should have higher bid
+    
+    def test_save_quotes_batch(self, data_store):
+        """Test saving many quotes in one transaction."""
+        base_time = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+        quotes = [
+            Quote(
+                symbol="AAPL",
+                timestamp=base_time.replace(second=i),
+                bid=Decimal(f"150.{i:02d}"),
+                ask=Decimal(f"150.{i + 5:02d}"),
+                bid_size=100,
+                ask_size=200
+            )
+            for i in range(50)
+        ]
+        
+        assert data_store.save_quotes_batch(quotes) == 50
+        
+        stored = data_store.get_quotes("AAPL")
+        assert len(stored) == 50
+        assert stored[0].timestamp == quotes[-1].timestamp
+        assert stored[-1].bid == Decimal("150.00")
+        assert stored[-1].ask_size == 200
+        
+        # Same symbol and timestamp replaces, as with save_quote
+        quotes[0].bid = Decimal("149.90")
+        data_store.save_quotes_batch(quotes[:1])
+        stored = data_store.get_quotes("AAPL")
+        assert len(stored) == 50
+        assert stored[-1].bid == Decimal("149.90")
+    
+    def test_save_quotes_batch_empty(self, data_store):
+        """Test saving an empty batch."""
+        assert data_store.save_quotes_batch([]) == 0
+        assert data_store.get_database_stats()['quotes_count'] == 0
+    
+    def test_save_bars_batch(self, data_store):
+        """Test saving a BarArray and reading it back."""
+        base_ns = 1_704_205_800_000_000_000  # 2024-01-02 14:30 UTC
+        bars = BarArray(
+            "MSFT",
+            [base_ns + i * 60_000_000_000 for i in range(3)],
+            timezone.utc,
+            open=[370.0, 371.5, float('nan')],
+            close=[371.5, 372.25, 372.0],
+            volume=[1000, -1, 3000]
+        )
+        
+        assert data_store.save_bars_batch(bars) == 3
+        
+        quotes = data_store.get_quotes("MSFT")
+        assert [q.close for q in reversed(quotes)] == [
+            Decimal("371.5"), Decimal("372.25"), Decimal("372.0")
+        ]
+        assert quotes[0].open is None
+        assert quotes[1].volume is None
+        assert quotes[2].timestamp == datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+        
+        loaded = data_store.get_bars("MSFT")
+        assert len(loaded) == 3
+        assert loaded.timestamps.tolist() == bars.timestamps.tolist()
+        assert loaded.close.tolist() == bars.close.tolist()
+        assert loaded.volume.tolist() == [1000, -1, 3000]
+    
+    def test_save_bars_batch_offset_timezone(self, data_store):
+        """Test that bar timestamps with a UTC offset are stored in UTC."""
+        eastern = timezone(timedelta(hours=-5))
+        timestamp = datetime(2024, 1, 2, 9, 30, tzinfo=eastern)
+        bars = BarArray.from_quotes("SPY", [
+            Quote(symbol="SPY", timestamp=timestamp, close=Decimal("470.10"), volume=500)
+        ])
+        
+        data_store.save_bars_batch(bars)
+        
+        stored = data_store.get_quotes("SPY")
+        assert stored[0].timestamp == timestamp
+        assert stored[0].timestamp.tzinfo == timezone.utc
+    
+    def test_save_bars_batch_quote_frame(self, data_store):
+        """Test saving the bars of several symbols at once."""
+        timestamp = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        frame = QuoteFrame.from_quotes({
+            symbol: [Quote(symbol=symbol, timestamp=timestamp, close=Decimal("10.5"), volume=10)]
+            for symbol in ("AAPL", "MSFT", "SPY")
+        })
+        
+        assert data_store.save_bars_batch(frame) == 3
+        assert data_store.get_database_stats()['quotes_count'] == 3
+        assert data_store.get_quotes("SPY")[0].close == Decimal("10.5")
+    
+    def test_database_uses_wal(self, data_store):
+        """Test that the database is created in WAL journal mode."""
+        with data_store.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    
+    def test_read_connections_are_per_thread(self, data_store):
+        """Test that each thread gets its own read-only connection."""
+        with data_store.get_connection(readonly=True) as conn:
+            main_conn = conn
+        with data_store.get_connection(readonly=True) as conn:
+            assert conn is main_conn
+        
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(data_store._get_reader())
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not main_conn
+        
+        with pytest.raises(DatabaseError):
+            with data_store.get_connection(readonly=True) as conn:
+                conn.execute("DELETE FROM quotes")
+    
+    def test_read_connections_of_exited_threads_are_closed(self, data_store):
+        """Test read connections are closed once their thread exits, and all of them on close()."""
+        exited = []
+        thread = threading.Thread(target=lambda: exited.append(data_store._get_reader()))
+        thread.start()
+        thread.join()
+        
+        main_conn = data_store._get_reader()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            exited[0].execute("SELECT 1")
+        assert [conn for _, conn in data_store._read_connections] == [main_conn]
+        
+        data_store.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            main_conn.execute("SELECT 1")
+        assert data_store._read_connections == []
+    
+    def test_reads_not_blocked_by_write(self, data_store, sample_quote):
+        """Test that readers see committed data while a write is in progress."""
+        data_store.save_quote(sample_quote)
+        write_started = threading.Event()
+        release_write = threading.Event()
+        
+        def slow_write():
+            with data_store.get_connection() as conn:
+                for name in data_store._partition_names(conn, 'quotes'):
+                    conn.execute(f"DELETE FROM {name}")
+                write_started.set()
+                release_write.wait(timeout=5)
+        
+        writer = threading.Thread(target=slow_write)
+        writer.start()
+        try:
+            assert write_started.wait(timeout=5)
+            
+            results = []
+            reader = threading.Thread(
+                target=lambda: results.append(len(data_store.get_quotes("AAPL")))
+            )
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+            assert results == [1]
+        finally:
+            release_write.set()
+            writer.join()
+        
+        assert data_store.get_quotes("AAPL") == []
+    
+    def test_concurrent_writes_are_serialized(self, data_store):
+        """Test writes from several threads sharing one store."""
+        base_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        
+        def write_quotes(offset):
+            data_store.save_quotes_batch(
+                Quote(
+                    symbol="AAPL",
+                    timestamp=base_time + timedelta(seconds=offset + i),
+                    bid=Decimal("150.00"),
+                    ask=Decimal("150.05"),
+                    bid_size=100,
+                    ask_size=200
+                )
+                for i in range(100)
+            )
+        
+        threads = [threading.Thread(target=write_quotes, args=(n * 100,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert data_store.get_database_stats()['quotes_count'] == 800
+    
+    def test_write_rolled_back_on_error(self, data_store, sample_quote):
+        """Test that a failed write block leaves no partial changes."""
+        with pytest.raises(RuntimeError):
+            with data_store.get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO trades (symbol, timestamp, price, size) VALUES ('AAPL', 0, '1', 1)"
+                )
+                raise RuntimeError("abort")
+        
+        with data_store.get_connection(readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+    
+    def test_close_reopens_on_use(self, data_store, sample_quote):
+        """Test that closing the pool does not end the store."""
+        data_store.save_quote(sample_quote)
+        data_store.close()
+        
+        assert len(data_store.get_quotes("AAPL")) == 1
+        data_store.save_quote(sample_quote)
+    
+    def test_in_memory_store_shared_across_threads(self, sample_quote):
+        """Test that an in-memory store reads what it wrote from any thread."""
+        data_store = DataStore(":memory:")
+        data_store.save_quote(sample_quote)
+        
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(len(data_store.get_quotes("AAPL")))
+        )
+        thread.start()
+        thread.join()
+        
+        assert results == [1]
+        assert data_store.get_database_stats()['quotes_count'] == 1
+    
+    def _minute_quotes(self, symbol, start, count, step=timedelta(minutes=1)):
+        return [
+            Quote(
+                symbol=symbol,
+                timestamp=start + i * step,
+                bid=Decimal("100.00") + i,
+                ask=Decimal("100.10") + i,
+                bid_size=100,
+                ask_size=200
+            )
+            for i in range(count)
+        ]
+    
+    def test_quotes_partitioned_by_month(self, data_store):
+        """Test that quotes land in one table per month."""
+        data_store.save_quotes_batch(
+            self._minute_quotes("AAPL", datetime(2024, 1, 31, 23, 58, tzinfo=timezone.utc), 4)
+        )
+        
+        partitions = data_store.get_partitions('quotes')
+        assert [p['name'] for p in partitions] == ['quotes_202401', 'quotes_202402']
+        assert partitions[1]['start'] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+        assert partitions[1]['end'] == datetime(2024, 3, 1, tzinfo=timezone.utc)
+        
+        stats = data_store.get_database_stats()
+        assert stats['quotes_count'] == 4
+        assert stats['quote_partitions'] == 2
+        assert len(data_store.get_quotes("AAPL")) == 4
+    
+    def test_quotes_partitioned_by_day(self, temp_db):
+        """Test daily partitions and that reads skip partitions outside the range."""
+        data_store = DataStore(temp_db, partition_by='day')
+        start = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        data_store.save_quotes_batch(self._minute_quotes("AAPL", start, 3, step=timedelta(days=1)))
+        
+        assert [p['name'] for p in data_store.get_partitions()] == [
+            'quotes_20240101', 'quotes_20240102', 'quotes_20240103'
+        ]
+        with data_store.get_connection(readonly=True) as conn:
+            assert data_store._partition_names(
+                conn, 'quotes',
+                start=int(datetime(2024, 1, 2, tzinfo=timezone.utc).timestamp() * 1_000_000)
+            ) == ['quotes_20240102', 'quotes_20240103']
+        
+        quotes = data_store.get_quotes("AAPL", start_time=start + timedelta(days=1))
+        assert [q.timestamp for q in quotes] == [start + timedelta(days=2), start + timedelta(days=1)]
+        data_store.close()
+    
+    def test_invalid_partition_period(self, temp_db):
+        """Test that only day and month partitions are supported."""
+        with pytest.raises(ValueError):
+            DataStore(temp_db, partition_by='week')
+    
+    def test_get_quotes_limit_across_partitions(self, data_store):
+        """Test that a limit is filled from the newest partitions first."""
+        data_store.save_quotes_batch(
+            self._minute_quotes("AAPL", datetime(2024, 1, 1, tzinfo=timezone.utc), 3, step=timedelta(days=20))
+        )
+        
+        quotes = data_store.get_quotes("AAPL", limit=2)
+        assert [q.timestamp.month for q in quotes] == [2, 1]
+        bars = data_store.get_bars("AAPL")
+        assert len(bars) == 3
+    
+    def test_unpartitioned_rows_migrated(self, temp_db, sample_quote):
+        """Test that quotes and trades from the old schema move into partitions."""
+        data_store = DataStore(temp_db)
+        with data_store.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO quotes (symbol, timestamp, bid, ask) VALUES ('AAPL', ?, 1.5, 1.6)",
+                (int(sample_quote.timestamp.timestamp() * 1_000_000),)
+            )
+            conn.execute(
+                "INSERT INTO trades (symbol, timestamp, price, size) VALUES ('AAPL', 0, '1.5', 10)"
+            )
+        data_store.close()
+        
+        data_store = DataStore(temp_db)
+        stats = data_store.get_database_stats()
+        assert stats['quotes_count'] == 1
+        assert stats['trades_count'] == 1
+        assert [p['name'] for p in data_store.get_partitions('trades')] == ['trades_197001']
+        with data_store.get_connection(readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM quotes").fetchone()[0] == 0
+        data_store.close()
+    
+    def test_retention_compacts_old_quotes(self, data_store):
+        """Test that old quote partitions are downsampled to bars."""
+        start = datetime(2024, 1, 10, 14, 30, tzinfo=timezone.utc)
+        data_store.save_quotes_batch(self._minute_quotes("AAPL", start, 10))
+        data_store.save_quotes_batch(self._minute_quotes("AAPL", datetime(2024, 3, 1, tzinfo=timezone.utc), 2))
+        
+        policy = RetentionPolicy(raw_quote_days=10, bar_days=None, bar_interval=timedelta(minutes=5))
+        result = data_store.apply_retention(policy, now=datetime(2024, 3, 2, tzinfo=timezone.utc))
+        
+        assert result == {'compacted': 1, 'dropped': 0}
+        partitions = data_store.get_partitions()
+        assert [p['compacted'] for p in partitions] == [True, False]
+        
+        bars = data_store.get_quotes("AAPL", end_time=datetime(2024, 1, 31, tzinfo=timezone.utc))
+        assert [b.timestamp for b in bars] == [start + timedelta(minutes=5), start]
+        assert bars[1].open == Decimal("100.05")
+        assert bars[1].close == Decimal("104.05")
+        assert bars[1].high == Decimal("104.05")
+        assert bars[1].low == Decimal("100.05")
+        assert bars[1].bid is None
+        assert len(data_store.get_quotes("AAPL", start_time=datetime(2024, 3, 1, tzinfo=timezone.utc))) == 2
+    
+    def test_retention_drops_expired_partitions(self, data_store, sample_quote):
+        """Test that partitions past the retention limits are dropped."""
+        old = datetime(2023, 1, 15, tzinfo=timezone.utc)
+        data_store.save_quotes_batch(self._minute_quotes("AAPL", old, 2))
+        data_store.save_trade({"symbol": "AAPL", "timestamp": old, "price": Decimal("1.5"), "size": 10})
+        data_store.save_quote(sample_quote)
+        
+        result = data_store.apply_retention(now=sample_quote.timestamp)
+        
+        assert result['dropped'] == 2
+        stats = data_store.get_database_stats()
+        assert stats['quotes_count'] == 1
+        assert stats['trades_count'] == 0
+        assert stats['trade_partitions'] == 0
+        
+        # Dropped partitions are recreated on the next write
+        data_store.save_quotes_batch(self._minute_quotes("AAPL", old, 2))
+        assert data_store.get_database_stats()['quotes_count'] == 3
+    
+    def test_retention_policy_validation(self):
+        """Test that inconsistent retention policies are rejected."""
+        with pytest.raises(ValueError):
+            RetentionPolicy(bar_interval=timedelta(minutes=7))
+        with pytest.raises(ValueError):
+            RetentionPolicy(raw_quote_days=60, bar_days=30)
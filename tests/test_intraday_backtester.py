@@ -0,0 +1,325 @@
+"""
+Unit tests for the intraday event-driven backtester.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.intraday_backtester import (
+    IntradayBacktester, IntradayStrategy, Bar, LatencyModel,
+    CsvBarSource, QuoteBarSource, read_csv_bars, write_csv_bars
+)
+from financial_portfolio_automation.strategy.backtester import TransactionCosts
+from financial_portfolio_automation.strategy.base import StrategySignal, SignalType
+from financial_portfolio_automation.execution.order_executor import ExecutionStrategy, OrderRequest
+from financial_portfolio_automation.models.core import Quote, OrderSide
+
+
+SESSION_OPEN = datetime(2023, 1, 3, 9, 31)
+
+
+def make_bars(symbol, days=1, minutes=30, price=100.0, volume=1000, step=0.0):
+    """Create minute bars with a constant spread for consecutive sessions."""
+    bars = []
+    for day in range(days):
+        for minute in range(minutes):
+            close = price + step * (day * minutes + minute)
+            bars.append(Bar(
+                symbol,
+                SESSION_OPEN + timedelta(days=day, minutes=minute),
+                close, close + 0.5, close - 0.5, close, volume,
+                close - 0.05, close + 0.05
+            ))
+    return bars
+
+
+class ScriptedStrategy(IntradayStrategy):
+    """Strategy emitting predefined actions on given bar indices."""
+
+    def __init__(self, symbols, actions):
+        super().__init__("scripted", symbols)
+        self.actions = actions
+        self.bars_seen = 0
+        self.fills = []
+        self.fill_times = []
+
+    def on_bar(self, bar, context):
+        actions = self.actions.get(self.bars_seen, [])
+        self.bars_seen += 1
+        return actions
+
+    def on_fill(self, fill, context):
+        self.fills.append(fill)
+        self.fill_times.append(context.time)
+
+
+@pytest.fixture
+def backtester():
+    """Create an intraday backtester without transaction costs."""
+    return IntradayBacktester(
+        transaction_costs=TransactionCosts(
+            commission_per_share=Decimal('0'),
+            commission_minimum=Decimal('0'),
+            spread_cost_factor=0,
+            market_impact_factor=0,
+            slippage_factor=0
+        ),
+        initial_capital=Decimal('100000')
+    )
+
+
+def _source(*bar_lists):
+    return _ListSource({bars[0].symbol: bars for bars in bar_lists})
+
+
+class _ListSource:
+    def __init__(self, bars):
+        self.bars = bars
+
+    @property
+    def symbols(self):
+        return list(self.bars)
+
+    def streams(self):
+        return {symbol: iter(bars) for symbol, bars in self.bars.items()}
+
+
+class TestEventOrdering:
+    """Test event ordering and latency."""
+
+    def test_signal_fills_on_next_bar_after_latency(self, backtester):
+        """Test orders never fill from the bar that triggered them."""
+        bars = make_bars("AAPL", step=1.0)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=10)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        trade = results.trades[0]
+        assert trade.timestamp == bars[1].timestamp
+        assert trade.price == Decimal(repr(bars[1].ask))
+        assert strategy.fill_times == [bars[1].timestamp + backtester.latency.fill_latency]
+        assert strategy.fills[0].remaining_quantity == 0
+
+    def test_order_latency_can_skip_bars(self, backtester):
+        """Test an order latency longer than a bar delays the fill."""
+        backtester.latency = LatencyModel(order_latency=timedelta(minutes=2))
+        bars = make_bars("AAPL")
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=10)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        # Arrival at exactly bar 2's timestamp: bar 2 is processed first
+        assert results.trades[0].timestamp == bars[3].timestamp
+
+    def test_latency_must_be_non_negative(self):
+        """Test negative latencies are rejected."""
+        with pytest.raises(ValueError):
+            LatencyModel(order_latency=timedelta(seconds=-1))
+
+
+class TestFills:
+    """Test partial fills and execution routes."""
+
+    def test_immediate_order_limited_by_bar_volume(self, backtester):
+        """Test large orders fill partially across bars."""
+        bars = make_bars("AAPL", volume=100)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=250)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert [t.quantity for t in results.trades] == [100, 100, 50]
+        assert [f.remaining_quantity for f in strategy.fills] == [150, 50, 0]
+        assert results.performance_metrics['partial_fills'] == 2
+        assert results.performance_metrics['orders_filled'] == 1
+
+    def test_vwap_respects_participation_rate(self, backtester):
+        """Test VWAP orders take at most the participation rate of each bar."""
+        bars = make_bars("AAPL", volume=1000)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [OrderRequest("AAPL", 500, OrderSide.BUY,
+                             execution_strategy=ExecutionStrategy.VWAP, max_participation_rate=0.2)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert [t.quantity for t in results.trades] == [200, 200, 100]
+
+    def test_twap_releases_slices_over_time(self, backtester):
+        """Test TWAP orders are spread over the configured duration."""
+        backtester.twap_slices = 3
+        backtester.twap_duration = timedelta(minutes=9)
+        bars = make_bars("AAPL", volume=10000)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=300,
+                               metadata={'execution_strategy': 'twap'})]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert [t.quantity for t in results.trades] == [100, 100, 100]
+        fill_minutes = [(t.timestamp - SESSION_OPEN).seconds // 60 for t in results.trades]
+        assert fill_minutes == [1, 4, 7]
+
+    def test_iceberg_releases_next_chunk_after_fill(self, backtester):
+        """Test iceberg orders only show one chunk at a time."""
+        bars = make_bars("AAPL", volume=100000)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [OrderRequest("AAPL", 400, OrderSide.BUY,
+                             execution_strategy=ExecutionStrategy.ICEBERG, max_participation_rate=1.0)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert [t.quantity for t in results.trades] == [100, 100, 100, 100]
+        assert len({t.timestamp for t in results.trades}) == 4
+
+    def test_limit_order_waits_for_price(self, backtester):
+        """Test limit buys only fill once the bar trades through the limit."""
+        bars = make_bars("AAPL", price=110.0, step=-1.0)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, price=Decimal('105'), quantity=10)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        trade = results.trades[0]
+        # Bar 5 closes at 105 with a low of 104.5
+        assert trade.timestamp == bars[5].timestamp
+        assert trade.price <= Decimal('105')
+
+    def test_sells_limited_to_position_and_close_signal(self, backtester):
+        """Test sells never create short positions and CLOSE sells everything."""
+        bars = make_bars("AAPL")
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=10)],
+            3: [StrategySignal("AAPL", SignalType.SELL, 1.0, quantity=25)],
+            6: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=5)],
+            8: [StrategySignal("AAPL", SignalType.CLOSE, 1.0)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert [(t.side, t.quantity) for t in results.trades] == [
+            (OrderSide.BUY, 10), (OrderSide.SELL, 10), (OrderSide.BUY, 5), (OrderSide.SELL, 5)
+        ]
+        assert results.portfolio_history[-1].positions == []
+        # 15 shares bought at the ask and sold at the bid, 0.10 apart
+        assert results.final_value == Decimal('99998.5')
+
+    def test_buys_limited_to_cash(self, backtester):
+        """Test buys are reduced to the affordable quantity."""
+        backtester.initial_capital = Decimal('1000')
+        bars = make_bars("AAPL")
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=50)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert sum(t.quantity for t in results.trades) == 9
+        assert results.portfolio_history[-1].buying_power >= 0
+
+
+class TestSessions:
+    """Test session handling and results."""
+
+    def test_day_orders_cancelled_at_session_end(self, backtester):
+        """Test unfilled day orders do not carry over to the next session."""
+        bars = make_bars("AAPL", days=2, minutes=5, volume=10)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=1000)]
+        })
+
+        results = backtester.run_backtest(strategy, _source(bars))
+
+        assert sum(t.quantity for t in results.trades) == 40
+        assert all(t.timestamp.date() == SESSION_OPEN.date() for t in results.trades)
+        assert results.performance_metrics['orders_cancelled'] == 1
+
+    def test_daily_history_and_date_range(self, backtester):
+        """Test one snapshot is recorded per session within the range."""
+        bars = make_bars("AAPL", days=5, minutes=3, step=0.1)
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=100)]
+        })
+
+        results = backtester.run_backtest(
+            strategy, _source(bars), datetime(2023, 1, 4), datetime(2023, 1, 6)
+        )
+
+        assert [s.timestamp.date().day for s in results.portfolio_history] == [4, 5, 6]
+        assert results.portfolio_history[-1].get_position("AAPL").quantity == 100
+        assert results.total_return > 0
+        assert 'annual_volatility' in results.performance_metrics
+
+    def test_no_bars_raises(self, backtester):
+        """Test an empty period is rejected."""
+        bars = make_bars("AAPL")
+        with pytest.raises(ValueError, match="No bars"):
+            backtester.run_backtest(
+                ScriptedStrategy(["AAPL"], {}), _source(bars), datetime(2024, 1, 1), datetime(2024, 1, 2)
+            )
+
+    def test_quote_source(self, backtester):
+        """Test quotes are replayed as bars."""
+        quotes = [
+            Quote(symbol="AAPL", timestamp=SESSION_OPEN + timedelta(minutes=i),
+                  bid=Decimal('100'), ask=Decimal('100.10'), bid_size=100, ask_size=100, volume=500)
+            for i in range(5)
+        ]
+        strategy = ScriptedStrategy(["AAPL"], {
+            0: [StrategySignal("AAPL", SignalType.BUY, 1.0, quantity=10)]
+        })
+
+        results = backtester.run_backtest(strategy, QuoteBarSource({"AAPL": quotes}))
+
+        assert results.trades[0].price == Decimal('100.1')
+
+
+class TestCsvStreaming:
+    """Test streaming bars from disk."""
+
+    def test_round_trip(self, tmp_path):
+        """Test written bars are read back unchanged."""
+        bars = make_bars("AAPL", minutes=3, step=0.37)
+        path = str(tmp_path / "AAPL.csv")
+
+        assert write_csv_bars(path, bars) == 3
+        read = list(read_csv_bars(path, "AAPL"))
+
+        assert [(b.timestamp, b.close, b.bid, b.volume) for b in read] == \
+            [(b.timestamp, b.close, b.bid, b.volume) for b in bars]
+
+    def test_queue_stays_bounded(self, backtester, tmp_path):
+        """Test the event queue holds about one bar per symbol."""
+        symbols = ["AAPL", "MSFT", "GOOGL", "AMZN"]
+        for i, symbol in enumerate(symbols):
+            write_csv_bars(str(tmp_path / f"{symbol}.csv"),
+                           make_bars(symbol, days=3, minutes=200, price=100.0 + i))
+
+        strategy = ScriptedStrategy(symbols, {
+            k: [StrategySignal(symbols[k % 4], SignalType.BUY, 1.0, quantity=1)] for k in range(0, 2000, 7)
+        })
+        source = CsvBarSource.from_directory(str(tmp_path))
+        results = backtester.run_backtest(strategy, source)
+
+        assert sorted(source.symbols) == sorted(symbols)
+        assert strategy.bars_seen == 2400
+        assert len(results.portfolio_history) == 3
+        assert results.performance_metrics['events_processed'] > 2400
+        assert results.performance_metrics['max_queue_size'] <= 2 * len(symbols)
+
+    def test_missing_columns(self, tmp_path):
+        """Test files without required columns are rejected."""
+        path = tmp_path / "BAD.csv"
+        path.write_text("timestamp,close\n2023-01-03T09:31:00,100\n")
+
+        with pytest.raises(ValueError, match="missing columns"):
+            list(read_csv_bars(str(path), "BAD"))
@@ -6,6 +6,7 @@ to ensure proper data retrieval and error handling.
 """
 
 import pytest
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -13,6 +14,7 @@ from decimal import Decimal
 from financial_portfolio_automation.api.market_data_client import MarketDataClient
 from financial_portfolio_automation.models.config import AlpacaConfig, Environment, DataFeed
 from financial_portfolio_automation.models.core import Quote
+from financial_portfolio_automation.models.quote_frame import BarArray
 from financial_portfolio_automation.exceptions import (
     APIError, AuthenticationError, RateLimitError, NetworkError,
     DataError, ValidationError
@@ -288,6 +290,46 @@ class TestMarketDataClientHistoricalData:
         assert result[0]['volume'] == 1000000
         assert result[0]['timeframe'] == "1Day"
     
+    def test_get_historical_bars_as_frame(self, market_data_client, mock_bar):
+        """Test historical bars returned as a columnar BarArray."""
+        market_data_client._data_api = Mock()
+        market_data_client._connection_verified = True
+        market_data_client._data_api.get_bars.return_value = [mock_bar, mock_bar]
+        
+        start_date = datetime.now(timezone.utc) - timedelta(days=1)
+        
+        result = market_data_client.get_historical_bars("AAPL", "1Day", start_date, as_frame=True)
+        
+        assert isinstance(result, BarArray)
+        assert len(result) == 2
+        assert result.close.tolist() == [150.75, 150.75]
+        assert result[0].volume == 1000000
+        assert result[0].timestamp == mock_bar.timestamp
+    
+    def test_get_historical_bars_as_frame_missing_fields(self, market_data_client, mock_bar):
+        """Test missing bar prices become NaN and missing volumes -1, not zero."""
+        market_data_client._data_api = Mock()
+        market_data_client._connection_verified = True
+        partial_bar = Mock()
+        partial_bar.timestamp = mock_bar.timestamp + timedelta(days=1)
+        partial_bar.open = None
+        partial_bar.high = None
+        partial_bar.low = 0.0
+        partial_bar.close = 151.25
+        partial_bar.volume = None
+        market_data_client._data_api.get_bars.return_value = [mock_bar, partial_bar]
+        
+        start_date = datetime.now(timezone.utc) - timedelta(days=1)
+        
+        result = market_data_client.get_historical_bars("AAPL", "1Day", start_date, as_frame=True)
+        
+        assert np.isnan(result.open[1]) and np.isnan(result.high[1])
+        assert result.low[1] == 0.0
+        assert result.close.tolist() == [150.75, 151.25]
+        assert result.volume.tolist() == [1000000, -1]
+        assert result[1].open is None
+        assert result[1].volume is None
+    
     def test_get_historical_bars_invalid_timeframe(self, market_data_client):
         """Test historical bars with invalid timeframe."""
         market_data_client._data_api = Mock()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the backtester market data index.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.market_data_index import MarketDataIndex, HistoricalView
+from financial_portfolio_automation.models.core import Quote
+
+
+def _make_quote(symbol, timestamp, price):
+    return Quote(
+        symbol=symbol,
+        timestamp=timestamp,
+        bid=Decimal(str(price)) - Decimal('0.05'),
+        ask=Decimal(str(price)) + Decimal('0.05'),
+        bid_size=100,
+        ask_size=100
+    )
+
+
+@pytest.fixture
+def historical_data():
+    """Create historical data with gaps and duplicate dates."""
+    base_date = datetime(2023, 1, 1, 9, 30)
+    aapl = [_make_quote("AAPL", base_date + timedelta(days=d), 150 + d) for d in range(10)]
+    # GOOGL skips odd days and has two quotes on day 4
+    googl = [_make_quote("GOOGL", base_date + timedelta(days=d), 200 + d) for d in range(0, 10, 2)]
+    googl.insert(3, _make_quote("GOOGL", base_date + timedelta(days=4, hours=2), 999))
+    return {"AAPL": aapl, "GOOGL": googl}
+
+
+class TestMarketDataIndex:
+    """Test market data index lookups."""
+
+    def test_trading_dates_normalized_and_filtered(self, historical_data):
+        """Test trading dates are normalized to 16:00 and limited to the range."""
+        index = MarketDataIndex(historical_data)
+
+        dates = index.trading_dates(datetime(2023, 1, 3), datetime(2023, 1, 6))
+
+        assert dates == [datetime(2023, 1, d, 16, 0) for d in range(3, 7)]
+
+    def test_market_data_for_date_skips_missing_symbols(self, historical_data):
+        """Test symbols without a quote on the date are omitted."""
+        index = MarketDataIndex(historical_data)
+
+        market_data = index.market_data_for_date(datetime(2023, 1, 2))
+
+        assert list(market_data.keys()) == ["AAPL"]
+
+    def test_market_data_for_date_uses_first_quote(self, historical_data):
+        """Test the first quote of a date wins, as with a linear scan."""
+        index = MarketDataIndex(historical_data)
+
+        market_data = index.market_data_for_date(datetime(2023, 1, 5))
+
+        assert market_data["GOOGL"].bid == Decimal('203.95')
+
+    def test_matches_linear_scan(self, historical_data):
+        """Test index lookups match a full scan of the history."""
+        index = MarketDataIndex(historical_data)
+
+        for current_date in index.trading_dates(datetime(2023, 1, 1), datetime(2023, 1, 10)):
+            expected = {}
+            for symbol, quotes in historical_data.items():
+                for quote in quotes:
+                    if quote.timestamp.date() == current_date.date():
+                        expected[symbol] = quote
+                        break
+
+            assert index.market_data_for_date(current_date) == expected
+
+    def test_history_up_to_returns_views(self, historical_data):
+        """Test history is exposed as views matching a filtered copy."""
+        index = MarketDataIndex(historical_data)
+        target_date = datetime(2023, 1, 5)
+
+        history = index.history_up_to(target_date)
+
+        for symbol, quotes in historical_data.items():
+            expected = [q for q in quotes if q.timestamp.date() <= target_date.date()]
+            assert isinstance(history[symbol], HistoricalView)
+            assert history[symbol] == expected
+            assert list(history[symbol]) == expected
+            assert history[symbol][-3:] == expected[-3:]
+            assert history[symbol][-1] is expected[-1]
+
+    def test_history_up_to_unsorted_input_falls_back_to_filter(self):
+        """Test unordered histories still match a filtered copy."""
+        base_date = datetime(2023, 1, 1)
+        quotes = [_make_quote("AAPL", base_date + timedelta(days=d), 150 + d) for d in (3, 1, 2, 0)]
+        index = MarketDataIndex({"AAPL": quotes})
+
+        history = index.history_up_to(datetime(2023, 1, 2))
+
+        assert history["AAPL"] == [quotes[1], quotes[3]]
+
+
+class TestHistoricalView:
+    """Test zero-copy historical views."""
+
+    def test_view_behaves_like_prefix_list(self):
+        """Test indexing, slicing and length match the equivalent list."""
+        data = list(range(10))
+        view = HistoricalView(data, 6)
+        expected = data[:6]
+
+        assert len(view) == 6
+        assert view[0] == expected[0]
+        assert view[-1] == expected[-1]
+        assert view[-20:] == expected[-20:]
+        assert view[1:4] == expected[1:4]
+        assert view[::2] == expected[::2]
+        assert list(view) == expected
+
+    def test_view_index_out_of_range(self):
+        """Test indices beyond the cut-off raise IndexError."""
+        view = HistoricalView(list(range(10)), 3)
+
+        with pytest.raises(IndexError):
+            view[3]
+        with pytest.raises(IndexError):
+            view[-4]
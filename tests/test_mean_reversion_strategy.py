@@ -3,8 +3,9 @@ Unit tests for mean reversion strategy implementation.
 """
 
 import pytest
+import numpy as np
 from decimal import Decimal
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 from financial_portfolio_automation.strategy.mean_reversion import MeanReversionStrategy
@@ -13,6 +14,13 @@ from financial_portfolio_automation.models.core import Quote, Position, Portfoli
 from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
 
 
+def _mock_indicators(strategy, values):
+    """Replace shared indicator lookups with fixed values by (indicator, period), optionally per symbol."""
+    def shared_indicator(symbol, indicator, quotes, prices=None, **params):
+        return values.get(symbol, values)[(indicator, params.get('period'))]
+    strategy.shared_indicator = Mock(side_effect=shared_indicator)
+
+
 class TestMeanReversionStrategy:
     """Test cases for MeanReversionStrategy class."""
     
@@ -151,19 +159,16 @@ class TestMeanReversionStrategy:
                                     sample_quotes_stable, portfolio_snapshot):
         """Test generation of oversold (buy) signal."""
         # Mock technical analysis results for oversold condition
-        mock_ta_instance = Mock()
-        mean_reversion_strategy.technical_analysis = mock_ta_instance
-        
-        mock_ta_instance.calculate_rsi.return_value = [None] * 19 + [25.0]  # Oversold RSI
-        mock_ta_instance.calculate_bollinger_bands.return_value = (
-            [None] * 19 + [102.0],  # Upper band
-            [None] * 19 + [100.0],  # Middle band (mean)
-            [None] * 19 + [98.0]    # Lower band
-        )
-        mock_ta_instance.calculate_sma.side_effect = [
-            [None] * 9 + [99.5] * 11,   # Short SMA
-            [None] * 19 + [100.0]       # Long SMA
-        ]
+        _mock_indicators(mean_reversion_strategy, {
+            ('rsi', 14): [None] * 19 + [25.0],  # Oversold RSI
+            ('bollinger_bands', 20): {
+                'upper': [None] * 19 + [102.0],  # Upper band
+                'middle': [None] * 19 + [100.0],  # Middle band (mean)
+                'lower': [None] * 19 + [98.0]  # Lower band
+            },
+            ('sma', 10): [None] * 9 + [99.5] * 11,  # Short SMA
+            ('sma', 20): [None] * 19 + [100.0]  # Long SMA
+        })
         
         market_data = {"AAPL": oversold_quote}
         historical_data = {"AAPL": sample_quotes_stable}
@@ -198,19 +203,16 @@ class TestMeanReversionStrategy:
         mean_reversion_strategy.state.positions["AAPL"] = position
         
         # Mock technical analysis results for overbought condition
-        mock_ta_instance = Mock()
-        mean_reversion_strategy.technical_analysis = mock_ta_instance
-        
-        mock_ta_instance.calculate_rsi.return_value = [None] * 19 + [75.0]  # Overbought RSI
-        mock_ta_instance.calculate_bollinger_bands.return_value = (
-            [None] * 19 + [102.0],  # Upper band
-            [None] * 19 + [100.0],  # Middle band (mean)
-            [None] * 19 + [98.0]    # Lower band
-        )
-        mock_ta_instance.calculate_sma.side_effect = [
-            [None] * 9 + [100.5] * 11,  # Short SMA
-            [None] * 19 + [100.0]       # Long SMA
-        ]
+        _mock_indicators(mean_reversion_strategy, {
+            ('rsi', 14): [None] * 19 + [75.0],  # Overbought RSI
+            ('bollinger_bands', 20): {
+                'upper': [None] * 19 + [102.0],  # Upper band
+                'middle': [None] * 19 + [100.0],  # Middle band (mean)
+                'lower': [None] * 19 + [98.0]  # Lower band
+            },
+            ('sma', 10): [None] * 9 + [100.5] * 11,  # Short SMA
+            ('sma', 20): [None] * 19 + [100.0]  # Long SMA
+        })
         
         market_data = {"AAPL": overbought_quote}
         historical_data = {"AAPL": sample_quotes_stable}
@@ -429,4 +431,44 @@ class TestMeanReversionStrategy:
             signals = mean_reversion_strategy.generate_signals(market_data, empty_portfolio, historical_data)
             
             # Should not generate sell signal without position
-            assert len(signals) == 0
\ No newline at end of file
+            assert len(signals) == 0
+    
+    def test_signal_matrix_matches_event_analysis(self, strategy_config):
+        """Test the array signal matrix reproduces _analyze_mean_reversion on every date."""
+        strategy_config.symbols = ["AAPL"]
+        strategy_config.parameters.update({'lookback_period': 25, 'min_reversion_strength': 0.3})
+        strategy = MeanReversionStrategy(strategy_config)
+        strategy.state.positions["AAPL"] = Position(
+            symbol="AAPL",
+            quantity=10,
+            market_value=Decimal('1000'),
+            cost_basis=Decimal('1000'),
+            unrealized_pnl=Decimal('0'),
+            day_pnl=Decimal('0')
+        )
+        
+        rng = np.random.default_rng(11)
+        prices = 100 + np.cumsum(rng.normal(0, 2.0, 150))
+        base_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        quotes = [
+            Quote(
+                symbol="AAPL",
+                timestamp=base_time + timedelta(days=i),
+                close=Decimal(str(round(price, 2))),
+                volume=int(rng.integers(500000, 1500000))
+            )
+            for i, price in enumerate(prices)
+        ]
+        
+        closes = np.array([[float(q.close)] for q in quotes])
+        volumes = np.array([[float(q.volume)] for q in quotes])
+        signals = strategy.generate_signal_matrix(closes, volumes)
+        
+        for t, quote in enumerate(quotes):
+            signal = strategy._analyze_mean_reversion("AAPL", quote, quotes[:t + 1])
+            expected = 0.0
+            if signal is not None:
+                expected = signal.strength if signal.signal_type == SignalType.BUY else -signal.strength
+            assert signals[t, 0] == pytest.approx(expected)
+        
+        assert np.any(signals > 0) and np.any(signals < 0)
@@ -442,4 +442,59 @@ class TestPortfolioSnapshot:
                 day_pnl=Decimal("300"),
                 total_pnl=Decimal("1000"),
                 positions=[]
-            )
\ No newline at end of file
+            )
+
+class TestTrustedConstruction:
+    """Test cases for the from_trusted constructors."""
+    
+    def test_trusted_models_equal_validated_models(self):
+        """Test trusted construction gives the same objects as the constructor."""
+        timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        quote_fields = dict(symbol="AAPL", timestamp=timestamp, open=Decimal("150"),
+                            high=Decimal("152"), low=Decimal("149"),
+                            close=Decimal("151"), volume=1000)
+        position_fields = dict(symbol="AAPL", quantity=100, market_value=Decimal("15100"),
+                               cost_basis=Decimal("15000"), unrealized_pnl=Decimal("100"),
+                               day_pnl=Decimal("50"))
+        order_fields = dict(order_id="order_1", symbol="AAPL", quantity=100,
+                            side=OrderSide.BUY, order_type=OrderType.LIMIT,
+                            status=OrderStatus.NEW, limit_price=Decimal("150"),
+                            created_at=timestamp)
+        
+        assert Quote.from_trusted(**quote_fields) == Quote(**quote_fields)
+        assert Position.from_trusted(**position_fields) == Position(**position_fields)
+        assert Order.from_trusted(**order_fields) == Order(**order_fields)
+        snapshot = PortfolioSnapshot.from_trusted(
+            timestamp=timestamp, total_value=Decimal("20100"), buying_power=Decimal("5000"),
+            day_pnl=Decimal("50"), total_pnl=Decimal("100"),
+            positions=[Position.from_trusted(**position_fields)]
+        )
+        assert snapshot == PortfolioSnapshot(
+            timestamp=timestamp, total_value=Decimal("20100"), buying_power=Decimal("5000"),
+            day_pnl=Decimal("50"), total_pnl=Decimal("100"),
+            positions=[Position(**position_fields)]
+        )
+        assert snapshot.get_position("AAPL").current_price == Decimal("151")
+    
+    def test_trusted_construction_skips_validation(self):
+        """Test trusted construction does not run validation."""
+        quote = Quote.from_trusted(symbol="BRK.B", timestamp=datetime(2024, 1, 1),
+                                   bid=Decimal("101"), ask=Decimal("100"))
+        
+        assert quote.spread == Decimal("-1")
+        with pytest.raises(ValueError, match="Invalid symbol format"):
+            quote.validate()
+    
+    def test_trusted_order_defaults(self):
+        """Test trusted orders default their timestamps like the constructor."""
+        order = Order.from_trusted(order_id="order_1", symbol="AAPL", quantity=10,
+                                   side=OrderSide.SELL, order_type=OrderType.MARKET,
+                                   status=OrderStatus.NEW)
+        
+        assert order.created_at is not None
+        assert order.updated_at == order.created_at
+        assert order.filled_quantity == 0 and order.time_in_force == "day"
+        assert PortfolioSnapshot.from_trusted(
+            timestamp=datetime(2024, 1, 1), total_value=Decimal("0"),
+            buying_power=Decimal("0"), day_pnl=Decimal("0"), total_pnl=Decimal("0")
+        ).positions == []
@@ -3,8 +3,9 @@ Unit tests for momentum strategy implementation.
 """
 
 import pytest
+import numpy as np
 from decimal import Decimal
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 from financial_portfolio_automation.strategy.momentum import MomentumStrategy
@@ -13,6 +14,13 @@ from financial_portfolio_automation.models.core import Quote, Position, Portfoli
 from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
 
 
+def _mock_indicators(strategy, values):
+    """Replace shared indicator lookups with fixed values by (indicator, period), optionally per symbol."""
+    def shared_indicator(symbol, indicator, quotes, prices=None, **params):
+        return values.get(symbol, values)[(indicator, params.get('period'))]
+    strategy.shared_indicator = Mock(side_effect=shared_indicator)
+
+
 class TestMomentumStrategy:
     """Test cases for MomentumStrategy class."""
     
@@ -132,19 +140,16 @@ class TestMomentumStrategy:
                                             sample_quotes, portfolio_snapshot):
         """Test generation of bullish momentum signal."""
         # Mock technical analysis results for bullish momentum
-        mock_ta_instance = Mock()
-        momentum_strategy.technical_analysis = mock_ta_instance
-        
-        mock_ta_instance.calculate_rsi.return_value = [None] * 19 + [60.0]  # Bullish RSI with enough history
-        mock_ta_instance.calculate_macd.return_value = (
-            [None] * 18 + [0.3, 0.5],  # MACD line with bullish crossover
-            [None] * 18 + [0.4, 0.3],  # Signal line 
-            [None] * 18 + [-0.1, 0.2]  # Histogram
-        )
-        mock_ta_instance.calculate_sma.side_effect = [
-            [None] * 9 + [110.0] * 11,   # Short SMA with enough history
-            [None] * 19 + [108.0]        # Long SMA (short > long = bullish)
-        ]
+        _mock_indicators(momentum_strategy, {
+            ('rsi', 14): [None] * 19 + [60.0],  # Bullish RSI with enough history
+            ('macd', None): {
+                'macd': [None] * 18 + [0.3, 0.5],  # MACD line with bullish crossover
+                'signal': [None] * 18 + [0.4, 0.3],  # Signal line
+                'histogram': [None] * 18 + [-0.1, 0.2]  # Histogram
+            },
+            ('sma', 10): [None] * 9 + [110.0] * 11,  # Short SMA with enough history
+            ('sma', 20): [None] * 19 + [108.0]  # Long SMA (short > long = bullish)
+        })
         
         market_data = {"AAPL": current_quote}
         historical_data = {"AAPL": sample_quotes}
@@ -162,19 +167,16 @@ class TestMomentumStrategy:
                                             sample_quotes, portfolio_snapshot):
         """Test generation of bearish momentum signal."""
         # Mock technical analysis results for bearish momentum
-        mock_ta_instance = Mock()
-        momentum_strategy.technical_analysis = mock_ta_instance
-        
-        mock_ta_instance.calculate_rsi.return_value = [None] * 19 + [75.0]  # Overbought RSI with enough history
-        mock_ta_instance.calculate_macd.return_value = (
-            [None] * 18 + [-0.3, -0.5],  # MACD line with bearish crossover
-            [None] * 18 + [-0.2, -0.3],  # Signal line 
-            [None] * 18 + [-0.1, -0.2]   # Histogram
-        )
-        mock_ta_instance.calculate_sma.side_effect = [
-            [None] * 9 + [108.0] * 11,   # Short SMA with enough history
-            [None] * 19 + [110.0]        # Long SMA (short < long = bearish)
-        ]
+        _mock_indicators(momentum_strategy, {
+            ('rsi', 14): [None] * 19 + [75.0],  # Overbought RSI with enough history
+            ('macd', None): {
+                'macd': [None] * 18 + [-0.3, -0.5],  # MACD line with bearish crossover
+                'signal': [None] * 18 + [-0.2, -0.3],  # Signal line
+                'histogram': [None] * 18 + [-0.1, -0.2]  # Histogram
+            },
+            ('sma', 10): [None] * 9 + [108.0] * 11,  # Short SMA with enough history
+            ('sma', 20): [None] * 19 + [110.0]  # Long SMA (short < long = bearish)
+        })
         
         # Create a quote with negative price change
         bearish_quote = Quote(
@@ -337,26 +339,76 @@ class TestMomentumStrategy:
         }
         
         # Mock technical analysis results for bullish momentum
-        mock_ta_instance = Mock()
-        momentum_strategy.technical_analysis = mock_ta_instance
-        
         # Strong bullish signals for both symbols
-        mock_ta_instance.calculate_rsi.return_value = [None] * 19 + [65.0]
-        mock_ta_instance.calculate_macd.return_value = (
-            [None] * 18 + [0.5, 0.8],  # MACD line with bullish crossover
-            [None] * 18 + [0.6, 0.5],  # Signal line 
-            [None] * 18 + [-0.1, 0.3]  # Histogram
-        )
-        mock_ta_instance.calculate_sma.side_effect = [
-            [None] * 9 + [112.0] * 11,   # AAPL Short SMA
-            [None] * 19 + [110.0],       # AAPL Long SMA
-            [None] * 9 + [1125.0] * 11,  # GOOGL Short SMA
-            [None] * 19 + [1120.0]       # GOOGL Long SMA
-        ]
+        shared = {
+            ('rsi', 14): [None] * 19 + [65.0],
+            ('macd', None): {
+                'macd': [None] * 18 + [0.5, 0.8],  # MACD line with bullish crossover
+                'signal': [None] * 18 + [0.6, 0.5],  # Signal line
+                'histogram': [None] * 18 + [-0.1, 0.3]  # Histogram
+            }
+        }
+        _mock_indicators(momentum_strategy, {
+            'AAPL': {**shared, ('sma', 10): [None] * 9 + [112.0] * 11, ('sma', 20): [None] * 19 + [110.0]},
+            'GOOGL': {**shared, ('sma', 10): [None] * 9 + [1125.0] * 11, ('sma', 20): [None] * 19 + [1120.0]}
+        })
         
         signals = momentum_strategy.generate_signals(current_quotes, portfolio_snapshot, historical_data)
         
         # Should generate signals for both symbols
         assert len(signals) == 2
         symbols = {signal.symbol for signal in signals}
-        assert symbols == {"AAPL", "GOOGL"}
\ No newline at end of file
+        assert symbols == {"AAPL", "GOOGL"}
+    
+    def test_signal_matrix_matches_event_analysis(self, strategy_config):
+        """Test the array signal matrix reproduces _analyze_momentum on every date."""
+        strategy_config.symbols = ["AAPL"]
+        strategy_config.parameters.update({'lookback_period': 40, 'min_momentum_strength': 0.4})
+        strategy = MomentumStrategy(strategy_config)
+        # Backtests compute each window on its own, without the shared cache
+        strategy.use_shared_indicator_cache = False
+        strategy.state.positions["AAPL"] = Position(
+            symbol="AAPL",
+            quantity=10,
+            market_value=Decimal('1000'),
+            cost_basis=Decimal('1000'),
+            unrealized_pnl=Decimal('0'),
+            day_pnl=Decimal('0')
+        )
+        
+        rng = np.random.default_rng(7)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 150)))
+        base_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        quotes = [
+            Quote(
+                symbol="AAPL",
+                timestamp=base_time + timedelta(days=i),
+                close=Decimal(str(round(price, 2))),
+                volume=int(rng.integers(500000, 1500000))
+            )
+            for i, price in enumerate(prices)
+        ]
+        
+        closes = np.array([[float(q.close)] for q in quotes])
+        volumes = np.array([[float(q.volume)] for q in quotes])
+        signals = strategy.generate_signal_matrix(closes, volumes)
+        
+        for t, quote in enumerate(quotes):
+            signal = strategy._analyze_momentum("AAPL", quote, quotes[:t + 1])
+            expected = 0.0
+            if signal is not None:
+                expected = signal.strength if signal.signal_type == SignalType.BUY else -signal.strength
+            assert signals[t, 0] == pytest.approx(expected)
+        
+        assert np.any(signals > 0) and np.any(signals < 0)
+    
+    def test_signal_matrix_short_lookback_is_empty(self, momentum_strategy):
+        """Test lookbacks too short for the MACD crossover never signal."""
+        closes = np.linspace(100, 150, 60).reshape(-1, 1)
+        volumes = np.full(closes.shape, 1000000.0)
+        
+        signals = momentum_strategy.generate_signal_matrix(closes, volumes)
+        
+        assert signals.shape == closes.shape
+        assert not signals.any()
+        assert momentum_strategy.supports_vectorized
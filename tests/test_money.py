@@ -0,0 +1,91 @@
+"""
+Unit tests for fixed-point money arithmetic.
+"""
+
+import pytest
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
+
+from financial_portfolio_automation.models.money import (
+    MICROS_PER_UNIT, from_micros, mul_micros, mul_ratio, scaled_div, to_micros, to_ratio
+)
+
+
+class TestMoney:
+    """Test cases for micro-unit conversions and arithmetic."""
+    
+    @pytest.mark.parametrize('value, micros', [
+        (Decimal('150.05'), 150_050_000),
+        (Decimal('-0.000001'), -1),
+        ('0.0005', 500),
+        (0.1, 100_000),
+        (12, 12_000_000),
+        (Decimal('1.0000005'), 1_000_000),
+        (Decimal('1.0000015'), 1_000_002),
+        (Decimal('-2.5000005'), -2_500_000),
+    ])
+    def test_to_micros(self, value, micros):
+        """Test conversion rounds half to even below a micro-unit."""
+        assert to_micros(value) == micros
+    
+    def test_to_micros_rounding_mode(self):
+        """Test an explicit rounding mode is honoured."""
+        assert to_micros(Decimal('1.0000019'), rounding=ROUND_DOWN) == 1_000_001
+    
+    def test_to_micros_rejects_non_finite(self):
+        """Test NaN and infinity cannot be converted."""
+        with pytest.raises(ValueError):
+            to_micros(Decimal('NaN'))
+        with pytest.raises(ValueError):
+            to_micros(float('inf'))
+    
+    def test_from_micros_is_exact(self):
+        """Test conversion back to Decimal is exact and drops trailing zeros."""
+        assert from_micros(150_050_000) == Decimal('150.05')
+        assert str(from_micros(1_500_000)) == '1.5'
+        assert from_micros(-1) == Decimal('-0.000001')
+        for value in ('0', '99999999.999999', '-1234.5678', '0.000123'):
+            assert from_micros(to_micros(Decimal(value))) == Decimal(value)
+    
+    @pytest.mark.parametrize('numerator, denominator', [
+        (5, 2), (7, 2), (-5, 2), (-7, 2), (1, 3), (-1, 3), (2, 3), (10**20 + 1, 10**9), (0, 7)
+    ])
+    def test_scaled_div_half_even(self, numerator, denominator):
+        """Test division matches Decimal half-even rounding."""
+        expected = (Decimal(numerator) / Decimal(denominator)).to_integral_value(ROUND_HALF_EVEN)
+        
+        assert scaled_div(numerator, denominator) == int(expected)
+    
+    def test_scaled_div_rejects_non_positive_denominator(self):
+        """Test the denominator must be positive."""
+        with pytest.raises(ValueError):
+            scaled_div(1, 0)
+    
+    def test_mul_micros(self):
+        """Test products of scaled amounts are rounded once."""
+        price = to_micros(Decimal('150.05'))
+        rate = to_micros(Decimal('0.001'))
+        
+        assert mul_micros(price, rate) == to_micros(Decimal('150.05') * Decimal('0.001'))
+        assert mul_micros(3, 500_000) == 2  # 1.5 micro-units round to even
+        assert mul_micros(MICROS_PER_UNIT, MICROS_PER_UNIT) == MICROS_PER_UNIT
+    
+    def test_to_ratio_is_exact(self):
+        """Test rates finer than a micro-unit keep their exact value."""
+        assert to_ratio(Decimal('0.00000025')) == (1, 4_000_000)
+        assert to_ratio('0.5') == (1, 2)
+        assert to_ratio(0.1) == (1, 10)
+        assert to_ratio(3) == (3, 1)
+        with pytest.raises(ValueError):
+            to_ratio(Decimal('NaN'))
+    
+    def test_mul_ratio(self):
+        """Test an amount times an exact rate is rounded once."""
+        price = to_micros(Decimal('150.05'))
+        
+        assert mul_ratio(price, to_ratio(Decimal('0.001'))) == mul_micros(price, to_micros(Decimal('0.001')))
+        assert mul_ratio(1000 * price, to_ratio(Decimal('0.00000025'))) == to_micros(
+            Decimal('150050') * Decimal('0.00000025')
+        )
+        # A rate below a micro-unit would round to zero with mul_micros
+        assert mul_micros(1000 * price, to_micros(Decimal('0.00000025'))) == 0
+        assert mul_ratio(3, (1, 2)) == 2  # 1.5 micro-units round to even
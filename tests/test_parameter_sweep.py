@@ -0,0 +1,257 @@
+"""
+Unit tests for the parameter sweep engine and indicator cache.
+"""
+
+import pytest
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from financial_portfolio_automation.strategy.parameter_sweep import (
+    ParameterSweep, expand_parameter_grid, parameter_grid_from_ranges
+)
+from financial_portfolio_automation.strategy.backtester import Backtester
+from financial_portfolio_automation.strategy.indicator_cache import IndicatorCache
+from financial_portfolio_automation.strategy.vectorized_backtester import VectorizedBacktester
+from financial_portfolio_automation.strategy.base import Strategy, StrategySignal, SignalType
+from financial_portfolio_automation.strategy.momentum import MomentumStrategy
+from financial_portfolio_automation.models.core import Quote
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+
+
+BASE_DATE = datetime(2023, 1, 2)
+
+
+class FixedBuyStrategy(Strategy):
+    """Event-only strategy that buys a configurable quantity on the first day."""
+
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        if portfolio.positions or "AAPL" not in market_data:
+            return []
+        return [StrategySignal(
+            symbol="AAPL",
+            signal_type=SignalType.BUY,
+            strength=1.0,
+            quantity=self.config.parameters['quantity']
+        )]
+
+    def update_state(self, market_data, portfolio):
+        pass
+
+
+@pytest.fixture
+def strategy_config():
+    """Create a momentum strategy configuration."""
+    return StrategyConfig(
+        strategy_id="sweep_momentum",
+        strategy_type=StrategyType.MOMENTUM,
+        name="Sweep Momentum",
+        description="Momentum strategy for parameter sweeps",
+        symbols=["AAPL", "GOOGL"],
+        risk_limits=RiskLimits(
+            max_position_size=Decimal('10000'),
+            max_portfolio_concentration=0.2,
+            max_daily_loss=Decimal('1000'),
+            max_drawdown=0.1,
+            stop_loss_percentage=0.05
+        ),
+        parameters={
+            'lookback_period': 35,
+            'momentum_threshold': 0.02,
+            'min_signal_strength': 0.3
+        }
+    )
+
+
+@pytest.fixture
+def historical_data():
+    """Create 200 days of quotes with closes and volumes."""
+    rng = np.random.default_rng(5)
+    data = {}
+    for i, symbol in enumerate(["AAPL", "GOOGL"]):
+        prices = (100.0 + i * 50) * np.exp(np.cumsum(rng.normal(0, 0.02, 200)))
+        data[symbol] = [
+            Quote(
+                symbol=symbol,
+                timestamp=BASE_DATE + timedelta(days=day),
+                bid=Decimal(str(round(price - 0.05, 2))),
+                ask=Decimal(str(round(price + 0.05, 2))),
+                bid_size=1000,
+                ask_size=1000,
+                close=Decimal(str(round(price, 2))),
+                volume=int(rng.integers(500000, 1500000))
+            )
+            for day, price in enumerate(prices)
+        ]
+    return data
+
+
+@pytest.fixture
+def parameter_grid():
+    """Create a grid over momentum thresholds."""
+    return {
+        'min_momentum_strength': [0.3, 0.4, 0.5],
+        'price_change_threshold': [0.01, 0.02]
+    }
+
+
+class TestParameterGrid:
+    """Test parameter grid helpers."""
+
+    def test_expand_parameter_grid(self):
+        """Test every combination is produced."""
+        combinations = expand_parameter_grid({'a': [1, 2], 'b': ['x', 'y', 'z']})
+
+        assert len(combinations) == 6
+        assert combinations[0] == {'a': 1, 'b': 'x'}
+        assert combinations[-1] == {'a': 2, 'b': 'z'}
+
+    def test_grid_from_ranges(self):
+        """Test ranges are inclusive and keep integer parameters integral."""
+        grid = parameter_grid_from_ranges({
+            'lookback_period': {'min': 10, 'max': 50, 'step': 10},
+            'threshold': {'min': 0.01, 'max': 0.03, 'step': 0.01}
+        })
+
+        assert grid['lookback_period'] == [10, 20, 30, 40, 50]
+        assert all(isinstance(v, int) for v in grid['lookback_period'])
+        assert grid['threshold'] == [0.01, 0.02, 0.03]
+
+    def test_grid_from_ranges_invalid_step(self):
+        """Test non-positive steps are rejected."""
+        with pytest.raises(ValueError):
+            parameter_grid_from_ranges({'threshold': {'min': 0.1, 'max': 0.2, 'step': -0.1}})
+
+
+class TestParameterSweep:
+    """Test cases for ParameterSweep class."""
+
+    def test_results_ranked_and_match_individual_backtests(self, strategy_config, historical_data,
+                                                           parameter_grid):
+        """Test ranking and that shared indicators do not change results."""
+        start_date, end_date = BASE_DATE + timedelta(days=40), BASE_DATE + timedelta(days=199)
+        sweep = ParameterSweep(strategy_config, MomentumStrategy, max_workers=4)
+
+        results = sweep.run(historical_data, start_date, end_date, parameter_grid)
+
+        assert results.total_combinations == 6
+        scores = [r.score for r in results.results]
+        assert scores == sorted(scores, reverse=True)
+        assert all(r.status == 'completed' for r in results.results)
+
+        for result in results.results:
+            config = StrategyConfig(**{**strategy_config.__dict__,
+                                       'parameters': {**strategy_config.parameters, **result.parameters}})
+            expected = VectorizedBacktester().run_backtest(
+                MomentumStrategy(config), historical_data, start_date, end_date
+            )
+            assert result.metrics['sharpe_ratio'] == pytest.approx(expected.sharpe_ratio)
+            assert result.metrics['total_trades'] == expected.total_trades
+
+        assert results.best_parameters == results.results[0].parameters
+
+    def test_indicators_computed_once(self, strategy_config, historical_data, parameter_grid):
+        """Test indicator series are shared across combinations."""
+        sweep = ParameterSweep(strategy_config, MomentumStrategy, max_workers=1)
+
+        results = sweep.run(
+            historical_data, BASE_DATE + timedelta(days=40), BASE_DATE + timedelta(days=199), parameter_grid
+        )
+
+        # RSI, two SMAs, volume SMA, MACD crossover and window completeness
+        assert results.cache_stats['misses'] == 6
+        assert results.cache_stats['hits'] == 6 * 5
+        assert results.cache_stats['cached_series'] == 6 * 2
+
+    def test_pruning(self, strategy_config, historical_data, parameter_grid):
+        """Test screening prunes the weakest combinations before the full run."""
+        progress = []
+        sweep = ParameterSweep(strategy_config, MomentumStrategy, max_workers=2)
+
+        results = sweep.run(
+            historical_data, BASE_DATE + timedelta(days=40), BASE_DATE + timedelta(days=199),
+            parameter_grid, prune_fraction=0.5, prune_keep=0.5, progress_callback=progress.append
+        )
+
+        statuses = [r.status for r in results.results]
+        assert statuses.count('completed') == 3
+        assert statuses.count('pruned') == 3
+        # Completed combinations are ranked ahead of pruned ones
+        assert statuses == ['completed'] * 3 + ['pruned'] * 3
+        assert progress[-1] == 6
+        assert [row['rank'] for row in results.to_table()] == [1, 2, 3, 4, 5, 6]
+
+    def test_event_strategy_and_failures(self, strategy_config, historical_data):
+        """Test strategies without the array API run on the event engine."""
+        sweep = ParameterSweep(strategy_config, FixedBuyStrategy, objective='return', max_workers=2)
+
+        results = sweep.run(
+            historical_data, BASE_DATE, BASE_DATE + timedelta(days=60),
+            {'quantity': [10, 50, -5]}
+        )
+
+        # Invalid combinations are reported as failed and ranked last
+        assert [r.status for r in results.results] == ['completed', 'completed', 'failed']
+        assert results.results[-1].parameters == {'quantity': -5}
+        assert results.cache_stats['misses'] == 0
+        table = results.to_dataframe()
+        assert len(table) == 3
+        assert table['error'].iloc[-1] == "Quantity must be positive"
+
+    def test_event_strategy_runs_on_process_pool(self, strategy_config, historical_data):
+        """Test event-driven combinations run in worker processes, not GIL-bound threads."""
+        sweep = ParameterSweep(strategy_config, FixedBuyStrategy, objective='return', max_workers=4)
+
+        with patch('financial_portfolio_automation.strategy.parameter_sweep.ProcessPoolExecutor',
+                   wraps=ProcessPoolExecutor) as pool:
+            results = sweep.run(
+                historical_data, BASE_DATE, BASE_DATE + timedelta(days=60),
+                {'quantity': [10, 50]}
+            )
+
+        assert pool.call_args.kwargs['max_workers'] == 2
+        assert len(results.completed) == 2
+        for result in results.completed:
+            strategy = FixedBuyStrategy(replace(
+                strategy_config, parameters={**strategy_config.parameters, **result.parameters}
+            ))
+            expected = Backtester().run_backtest(
+                strategy, historical_data, BASE_DATE, BASE_DATE + timedelta(days=60)
+            )
+            assert result.metrics['final_value'] == pytest.approx(float(expected.final_value))
+
+    def test_invalid_objective(self, strategy_config):
+        """Test unknown objectives are rejected."""
+        with pytest.raises(ValueError, match="Unsupported optimization objective"):
+            ParameterSweep(strategy_config, MomentumStrategy, objective='alpha')
+
+
+class TestIndicatorCache:
+    """Test cases for IndicatorCache class."""
+
+    def test_get_or_compute_caches_per_symbol(self):
+        """Test series are computed once and stored per symbol."""
+        cache = IndicatorCache(["AAPL", "GOOGL"])
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.arange(6.0).reshape(3, 2)
+
+        first = cache.get_or_compute('sma', 10, compute)
+        second = cache.get_or_compute('sma', 10, compute)
+
+        assert len(calls) == 1
+        np.testing.assert_array_equal(first, second)
+        assert not second.flags.writeable
+        assert cache.get_stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'cached_series': 2}
+
+    def test_column_mismatch(self):
+        """Test matrices must have one column per symbol."""
+        cache = IndicatorCache(["AAPL", "GOOGL"])
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute('sma', 10, lambda: np.zeros((3, 3)))
@@ -11,6 +11,7 @@ from decimal import Decimal
 from financial_portfolio_automation.monitoring.portfolio_monitor import (
     PortfolioMonitor, MonitoringThresholds, MonitoringAlert, AlertSeverity
 )
+from financial_portfolio_automation.monitoring.price_buffer import PriceRingBuffer
 from financial_portfolio_automation.models.core import Position, Quote, PortfolioSnapshot
 from financial_portfolio_automation.exceptions import MonitoringError
 
@@ -312,12 +313,35 @@ class TestPortfolioMonitor:
         assert call_args[1]['alert_type'] == 'price_movement'
         assert call_args[1]['symbol'] == 'AAPL'
     
+    @pytest.mark.asyncio
+    async def test_monitor_price_movement_uses_close_of_bars(self, portfolio_monitor):
+        """Test cached OHLC bars without bid and ask are priced at their close."""
+        portfolio_monitor._price_baselines = {'AAPL': Decimal('150.00')}
+        portfolio_monitor._get_latest_quote = AsyncMock(return_value=Quote(
+            symbol='AAPL',
+            timestamp=datetime.now(),
+            open=Decimal('150.00'),
+            high=Decimal('166.00'),
+            low=Decimal('149.00'),
+            close=Decimal('165.00'),
+            volume=1000
+        ))
+        portfolio_monitor._generate_alert = AsyncMock()
+        
+        await portfolio_monitor._monitor_price_movement('AAPL')
+        await portfolio_monitor._monitor_volatility('AAPL')
+        
+        call_args = portfolio_monitor._generate_alert.call_args
+        assert call_args[1]['alert_type'] == 'price_movement'
+        assert call_args[1]['data']['current_price'] == 165.0
+        assert call_args[1]['data']['bid'] is None
+        assert portfolio_monitor.get_recent_prices('AAPL') == [165.0]
+    
     @pytest.mark.asyncio
     async def test_monitor_volatility(self, portfolio_monitor):
         """Test volatility monitoring."""
-        # Mock historical data and high volatility
-        portfolio_monitor._get_historical_prices = AsyncMock(return_value=[150.0] * 20)
-        portfolio_monitor.technical_analysis.calculate_volatility.return_value = 0.35  # Above threshold
+        # Seed a volatile price history
+        portfolio_monitor.seed_prices('AAPL', [150.0, 160.0] * 10)
         
         # Mock alert generation
         portfolio_monitor._generate_alert = AsyncMock()
@@ -329,6 +353,67 @@ class TestPortfolioMonitor:
         call_args = portfolio_monitor._generate_alert.call_args
         assert call_args[1]['alert_type'] == 'high_volatility'
         assert call_args[1]['symbol'] == 'AAPL'
+        assert call_args[1]['data']['volatility'] > 0.3
+    
+    @pytest.mark.asyncio
+    async def test_monitor_volatility_insufficient_history(self, portfolio_monitor):
+        """Test no volatility alert is generated before the window fills."""
+        portfolio_monitor._generate_alert = AsyncMock()
+        
+        await portfolio_monitor._monitor_volatility('AAPL')
+        await portfolio_monitor._monitor_volatility('AAPL')
+        
+        portfolio_monitor._generate_alert.assert_not_called()
+        # The same cached quote is only recorded once
+        assert portfolio_monitor.get_recent_prices('AAPL') == [150.025]
+    
+    def test_record_price_from_quotes(self, portfolio_monitor):
+        """Test websocket quotes fill a fixed-size price history."""
+        start = datetime(2024, 1, 2, 15, 0)
+        for i in range(25):
+            portfolio_monitor.on_quote(Quote(
+                symbol='AAPL',
+                timestamp=start + timedelta(minutes=i),
+                bid=Decimal('150.00') + i,
+                ask=Decimal('150.10') + i,
+                bid_size=100,
+                ask_size=100
+            ))
+        
+        prices = portfolio_monitor.get_recent_prices('AAPL')
+        assert len(prices) == portfolio_monitor.thresholds.volatility_window
+        assert prices[0] == pytest.approx(155.05) and prices[-1] == pytest.approx(174.05)
+        assert portfolio_monitor.get_recent_prices('AAPL', 2) == pytest.approx([173.05, 174.05])
+        assert portfolio_monitor._volatility_estimators['AAPL'].value is not None
+    
+    def test_record_price_samples_at_fixed_interval(self, portfolio_monitor):
+        """Test ticks and cycle quotes within one interval give a single sample."""
+        start = datetime(2024, 1, 2, 15, 0)
+        
+        portfolio_monitor.record_price('AAPL', 150.0, start)
+        portfolio_monitor.record_price('AAPL', 151.0, start + timedelta(seconds=5))
+        portfolio_monitor.record_price('AAPL', 152.0, start + timedelta(seconds=59))
+        portfolio_monitor.record_price('AAPL', 153.0, start + timedelta(seconds=61))
+        portfolio_monitor.record_price('AAPL', 154.0, start + timedelta(minutes=3, seconds=30))
+        
+        assert portfolio_monitor.get_recent_prices('AAPL') == [150.0, 153.0, 154.0]
+    
+    def test_volatility_annualized_from_sample_interval(self, mock_portfolio_analyzer,
+                                                        mock_technical_analysis, mock_data_cache):
+        """Test the annualization factor follows the sampling interval."""
+        prices = [100.0, 101.0] * 10
+        volatilities = {}
+        for interval in (60.0, 300.0):
+            monitor = PortfolioMonitor(
+                portfolio_analyzer=mock_portfolio_analyzer,
+                technical_analysis=mock_technical_analysis,
+                data_cache=mock_data_cache,
+                thresholds=MonitoringThresholds(volatility_sample_interval=interval)
+            )
+            volatilities[interval] = monitor.seed_prices('AAPL', prices)
+        
+        assert MonitoringThresholds().volatility_periods_per_year == 252 * 6.5 * 60
+        assert volatilities[60.0] == pytest.approx(volatilities[300.0] * 5 ** 0.5)
     
     @pytest.mark.asyncio
     async def test_generate_alert(self, portfolio_monitor):
@@ -405,6 +490,33 @@ class TestPortfolioMonitor:
         assert 'thresholds' in status
 
 
+class TestPriceRingBuffer:
+    """Test cases for PriceRingBuffer class."""
+    
+    def test_wraps_around(self):
+        """Test the oldest prices are overwritten once full."""
+        buffer = PriceRingBuffer(3)
+        assert len(buffer) == 0 and buffer.last_price is None
+        
+        for price in [1.0, 2.0, 3.0, 4.0, 5.0]:
+            buffer.append(price)
+        
+        assert buffer.is_full and len(buffer) == 3
+        assert buffer.latest().tolist() == [3.0, 4.0, 5.0]
+        assert buffer.latest(2).tolist() == [4.0, 5.0]
+        assert buffer.last_price == 5.0
+    
+    def test_clear(self):
+        """Test clearing the buffer."""
+        buffer = PriceRingBuffer(2)
+        buffer.append(1.0, datetime.now())
+        buffer.clear()
+        
+        assert len(buffer) == 0 and buffer.last_timestamp is None
+        with pytest.raises(ValueError):
+            PriceRingBuffer(0)
+
+
 class TestMonitoringThresholds:
     """Test cases for MonitoringThresholds class."""
     
@@ -434,6 +546,14 @@ class TestMonitoringThresholds:
         assert thresholds.daily_pnl_threshold == Decimal('2000')
         assert thresholds.monitoring_interval == 10
 
+    
+    def test_volatility_window_too_small(self):
+        """Test a volatility window without two returns is rejected up front."""
+        with pytest.raises(ValueError, match="volatility_window must be at least 3"):
+            MonitoringThresholds(volatility_window=2)
+        
+        assert MonitoringThresholds(volatility_window=3).volatility_window == 3
+
 
 class TestMonitoringAlert:
     """Test cases for MonitoringAlert class."""
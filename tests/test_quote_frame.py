@@ -0,0 +1,176 @@
+"""
+Unit tests for the columnar market data containers.
+"""
+
+import pickle
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from financial_portfolio_automation.models.core import Quote
+from financial_portfolio_automation.models.quote_frame import BarArray, QuoteFrame
+from financial_portfolio_automation.strategy.market_data_index import MarketDataIndex
+from financial_portfolio_automation.strategy.result_cache import fingerprint_historical_data
+
+
+def _bars(symbol, days, start_price, tzinfo=None):
+    """Daily OHLCV quotes."""
+    start = datetime(2024, 1, 2, 16, 0, tzinfo=tzinfo)
+    return [
+        Quote(
+            symbol=symbol,
+            timestamp=start + timedelta(days=day),
+            open=Decimal(str(start_price + day)),
+            high=Decimal(str(start_price + day + 1.25)),
+            low=Decimal(str(start_price + day - 0.75)),
+            close=Decimal(str(start_price + day + 0.5)),
+            volume=1000 + day
+        )
+        for day in range(days)
+    ]
+
+
+@pytest.fixture
+def historical_data():
+    """Quotes for two symbols of different lengths."""
+    return {'AAPL': _bars('AAPL', 20, 150.0), 'MSFT': _bars('MSFT', 12, 300.0)}
+
+
+class TestBarArray:
+    """Test cases for BarArray."""
+    
+    def test_round_trip(self, historical_data):
+        """Test quotes convert to columns and back unchanged."""
+        quotes = historical_data['AAPL']
+        bars = BarArray.from_quotes('AAPL', quotes)
+        
+        assert bars.to_quotes() == quotes
+        assert bars[-1] == quotes[-1]
+        assert list(reversed(bars)) == quotes[::-1]
+        assert bars.close.dtype == np.float64 and bars.volume.dtype == np.int64
+    
+    def test_missing_fields_and_timezone(self):
+        """Test missing prices and sizes survive the round trip, as do aware timestamps."""
+        quote = Quote(symbol='AAPL', timestamp=datetime(2024, 1, 2, 9, 30, tzinfo=timezone.utc),
+                      bid=Decimal('150.25'), ask=Decimal('150.30'), bid_size=100, ask_size=200)
+        
+        bars = BarArray.from_quotes('AAPL', [quote])
+        
+        assert np.isnan(bars.close[0]) and bars.volume[0] == -1
+        assert bars[0] == quote
+        assert bars[0].timestamp.tzinfo is timezone.utc
+    
+    def test_mixed_timezones_rejected(self):
+        """Test quotes with different timezones cannot share an array."""
+        quotes = _bars('AAPL', 1, 150.0) + _bars('AAPL', 1, 150.0, tzinfo=timezone.utc)
+        
+        with pytest.raises(ValueError, match="single timezone"):
+            BarArray.from_quotes('AAPL', quotes)
+    
+    def test_slices_are_views(self, historical_data):
+        """Test slicing shares memory with the original columns."""
+        bars = BarArray.from_quotes('AAPL', historical_data['AAPL'])
+        
+        window = bars[5:10]
+        
+        assert isinstance(window, BarArray) and len(window) == 5
+        assert np.shares_memory(window.close, bars.close)
+        assert window.to_quotes() == historical_data['AAPL'][5:10]
+        assert bars[::2].to_quotes() == historical_data['AAPL'][::2]
+        with pytest.raises(IndexError):
+            bars[20]
+    
+    def test_dates_and_between(self, historical_data):
+        """Test date helpers use the wall-clock date of each bar."""
+        bars = BarArray.from_quotes('AAPL', historical_data['AAPL'])
+        
+        window = bars.between(datetime(2024, 1, 5), datetime(2024, 1, 8, 23, 59))
+        
+        assert bars.dates()[0] == datetime(2024, 1, 2).date()
+        assert bars.date_range() == (datetime(2024, 1, 2).date(), datetime(2024, 1, 21).date())
+        assert [quote.timestamp.day for quote in window] == [5, 6, 7, 8]
+    
+    def test_from_records(self):
+        """Test market data client rows are packed with missing fields filled."""
+        bars = BarArray.from_records('AAPL', [
+            {'timestamp': '2024-01-02T14:30:00Z', 'open': 150.0, 'close': 151.0, 'volume': 10},
+            {'timestamp': '2024-01-02T14:31:00Z', 'open': 151.0, 'close': None, 'volume': 20},
+        ])
+        
+        assert bars[0].timestamp == datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+        assert bars[1].close is None and bars[1].open == Decimal('151.0')
+        assert np.isnan(bars.high).all()
+    
+    def test_invalid_columns(self):
+        """Test unknown or misaligned columns are rejected."""
+        with pytest.raises(ValueError, match="Unknown"):
+            BarArray('AAPL', [1, 2], vwap=[1.0, 2.0])
+        with pytest.raises(ValueError, match="expected 2"):
+            BarArray('AAPL', [1, 2], close=[1.0])
+
+
+class TestQuoteFrame:
+    """Test cases for QuoteFrame."""
+    
+    def test_groups_symbols_in_shared_columns(self, historical_data):
+        """Test symbol lookup returns views of the shared columns."""
+        frame = QuoteFrame.from_quotes(historical_data)
+        
+        assert list(frame) == ['AAPL', 'MSFT']
+        assert frame.total_bars == 32
+        assert np.shares_memory(frame['MSFT'].close, frame.column('close'))
+        assert frame.to_quotes() == historical_data
+        with pytest.raises(KeyError):
+            frame['GOOGL']
+    
+    def test_between_drops_empty_symbols(self, historical_data):
+        """Test date filtering keeps only symbols with bars in the range."""
+        frame = QuoteFrame.from_quotes(historical_data)
+        
+        window = frame.between(datetime(2024, 1, 15), datetime(2024, 1, 31))
+        
+        assert list(window) == ['AAPL']
+        assert len(window['AAPL']) == 7
+    
+    def test_duplicate_symbols_rejected(self, historical_data):
+        """Test a symbol can only appear once."""
+        bars = BarArray.from_quotes('AAPL', historical_data['AAPL'])
+        
+        with pytest.raises(ValueError, match="Duplicate"):
+            QuoteFrame([bars, bars])
+    
+    def test_pickle(self, historical_data):
+        """Test frames and arrays can be sent to worker processes."""
+        frame = QuoteFrame.from_quotes(historical_data)
+        
+        restored = pickle.loads(pickle.dumps(frame))
+        
+        assert restored.to_quotes() == historical_data
+        assert pickle.loads(pickle.dumps(frame['MSFT'][2:5])).to_quotes() == historical_data['MSFT'][2:5]
+    
+    def test_market_data_index(self, historical_data):
+        """Test the backtest index gives the same lookups for frames and quote lists."""
+        frame_index = MarketDataIndex(QuoteFrame.from_quotes(historical_data))
+        list_index = MarketDataIndex(historical_data)
+        start, end = datetime(2024, 1, 1), datetime(2024, 2, 1)
+        
+        assert frame_index.trading_dates(start, end) == list_index.trading_dates(start, end)
+        for target in (datetime(2024, 1, 2), datetime(2024, 1, 14), datetime(2024, 1, 20)):
+            assert frame_index.market_data_for_date(target) == list_index.market_data_for_date(target)
+            history = frame_index.history_up_to(target)
+            assert {symbol: bars.to_quotes() for symbol, bars in history.items()} == {
+                symbol: list(quotes) for symbol, quotes in list_index.history_up_to(target).items()
+            }
+    
+    def test_fingerprint_tracks_columns(self, historical_data):
+        """Test the backtest cache fingerprint changes when a bar changes."""
+        frame = QuoteFrame.from_quotes(historical_data)
+        changed = dict(historical_data, MSFT=historical_data['MSFT'][:-1])
+        
+        assert fingerprint_historical_data(frame) == fingerprint_historical_data(
+            QuoteFrame.from_quotes(historical_data)
+        )
+        assert fingerprint_historical_data(frame) != fingerprint_historical_data(
+            QuoteFrame.from_quotes(changed)
+        )
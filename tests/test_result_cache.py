@@ -0,0 +1,205 @@
+"""
+Unit tests for the backtest result cache.
+"""
+
+import dataclasses
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.result_cache import (
+    BacktestResultCache, stable_hash, fingerprint_historical_data
+)
+from financial_portfolio_automation.strategy.backtester import Backtester, TransactionCosts
+from financial_portfolio_automation.strategy.base import Strategy, StrategySignal, SignalType
+from financial_portfolio_automation.models.core import Quote
+from financial_portfolio_automation.models.quote_frame import BarArray
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+
+
+class BuyOnceStrategy(Strategy):
+    """Strategy that buys a configured quantity of its first symbol once."""
+
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        symbol = self.symbols[0]
+        if self.state.signals_generated or symbol not in market_data:
+            return []
+        self.state.increment_signals()
+        return [StrategySignal(
+            symbol=symbol,
+            signal_type=SignalType.BUY,
+            strength=1.0,
+            quantity=self.config.parameters['quantity']
+        )]
+
+    def update_state(self, market_data, portfolio):
+        pass
+
+
+@pytest.fixture
+def strategy_config():
+    """Create a strategy configuration."""
+    return StrategyConfig(
+        strategy_id="cached_strategy",
+        strategy_type=StrategyType.MOMENTUM,
+        name="Cached Strategy",
+        description="Strategy for result cache tests",
+        symbols=["AAPL"],
+        risk_limits=RiskLimits(
+            max_position_size=Decimal('10000'),
+            max_portfolio_concentration=0.2,
+            max_daily_loss=Decimal('1000'),
+            max_drawdown=0.1,
+            stop_loss_percentage=0.05
+        ),
+        parameters={'lookback_period': 20, 'momentum_threshold': 0.02, 'quantity': 10}
+    )
+
+
+@pytest.fixture
+def historical_data():
+    """Create 20 days of AAPL quotes."""
+    base_date = datetime(2023, 1, 2)
+    return {
+        "AAPL": [
+            Quote(
+                symbol="AAPL",
+                timestamp=base_date + timedelta(days=day),
+                bid=Decimal('150') + day,
+                ask=Decimal('150.10') + day,
+                bid_size=100,
+                ask_size=100
+            )
+            for day in range(20)
+        ]
+    }
+
+
+def _run(backtester, strategy_config, historical_data):
+    return backtester.run_backtest(
+        BuyOnceStrategy(strategy_config), historical_data, datetime(2023, 1, 2), datetime(2023, 1, 21)
+    )
+
+
+class TestKeys:
+    """Test cache key helpers."""
+
+    def test_stable_hash_ignores_key_order_and_decimal_scale(self):
+        """Test equivalent values hash the same."""
+        assert stable_hash({'a': 1, 'b': Decimal('1.0')}) == stable_hash({'b': Decimal('1.00'), 'a': 1})
+        assert stable_hash({'a': 1}) != stable_hash({'a': 2})
+
+    def test_fingerprint_summarizes_quote_lists(self, historical_data):
+        """Test quote lists are fingerprinted by their length and end bars."""
+        quotes = historical_data["AAPL"]
+        fingerprint = fingerprint_historical_data(historical_data)
+
+        assert fingerprint_historical_data({"AAPL": list(quotes)}) == fingerprint
+        assert fingerprint_historical_data({"AAPL": quotes[:-1]}) != fingerprint
+        assert fingerprint_historical_data({"AAPL": quotes[1:]}) != fingerprint
+        assert fingerprint_historical_data(
+            {"AAPL": quotes[:-1] + [dataclasses.replace(quotes[-1], bid=Decimal('1'))]}
+        ) != fingerprint
+        assert fingerprint_historical_data({"MSFT": quotes}) != fingerprint
+
+    def test_fingerprint_tracks_bar_array_content(self, historical_data):
+        """Test any changed bar in columnar data changes the fingerprint."""
+        quotes = list(historical_data["AAPL"])
+        fingerprint = fingerprint_historical_data({"AAPL": BarArray.from_quotes("AAPL", quotes)})
+        quotes[5] = dataclasses.replace(quotes[5], bid=Decimal('1'))
+
+        assert fingerprint_historical_data({"AAPL": BarArray.from_quotes("AAPL", quotes)}) != fingerprint
+
+
+class TestBacktestResultCache:
+    """Test cases for BacktestResultCache class."""
+
+    def test_identical_backtest_hits(self, strategy_config, historical_data):
+        """Test identical requests return the stored results."""
+        cache = BacktestResultCache()
+        backtester = Backtester(result_cache=cache)
+
+        first = _run(backtester, strategy_config, historical_data)
+        assert not backtester.last_run_cached
+
+        strategy = BuyOnceStrategy(strategy_config)
+        second = backtester.run_backtest(
+            strategy, historical_data, datetime(2023, 1, 2), datetime(2023, 1, 21)
+        )
+
+        assert backtester.last_run_cached
+        assert second.trades == first.trades
+        assert second.final_value == first.final_value
+        assert second is not first
+        # The strategy ends in the same state as after a real run
+        assert strategy.state.signals_generated == 1
+        assert backtester.get_checkpoint() is not None
+        assert cache.get_stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'memory_entries': 1}
+
+    def test_changes_invalidate(self, strategy_config, historical_data):
+        """Test config, cost, capital and data changes miss the cache."""
+        cache = BacktestResultCache()
+        _run(Backtester(result_cache=cache), strategy_config, historical_data)
+
+        changed_config = dataclasses.replace(
+            strategy_config, parameters={**strategy_config.parameters, 'quantity': 20}
+        )
+        changed_data = {"AAPL": historical_data["AAPL"][:-1] + [
+            dataclasses.replace(historical_data["AAPL"][-1], ask=Decimal('200'))
+        ]}
+
+        runs = [
+            (Backtester(result_cache=cache), changed_config, historical_data),
+            (Backtester(TransactionCosts(commission_minimum=Decimal('2')), result_cache=cache),
+             strategy_config, historical_data),
+            (Backtester(initial_capital=Decimal('50000'), result_cache=cache), strategy_config, historical_data),
+            (Backtester(result_cache=cache), strategy_config, changed_data)
+        ]
+        for backtester, config, data in runs:
+            _run(backtester, config, data)
+            assert not backtester.last_run_cached
+
+        assert cache.get_stats()['misses'] == 5
+        assert cache.get_stats()['hits'] == 0
+
+    def test_starting_state_is_part_of_key(self, strategy_config, historical_data):
+        """Test a strategy starting from a different state misses the cache."""
+        cache = BacktestResultCache()
+        _run(Backtester(result_cache=cache), strategy_config, historical_data)
+
+        strategy = BuyOnceStrategy(strategy_config)
+        strategy.state.increment_signals()
+        backtester = Backtester(result_cache=cache)
+        results = backtester.run_backtest(
+            strategy, historical_data, datetime(2023, 1, 2), datetime(2023, 1, 21)
+        )
+
+        assert not backtester.last_run_cached
+        # The strategy had already signalled, so it never buys
+        assert results.trades == []
+
+    def test_persists_across_instances(self, tmp_path, strategy_config, historical_data):
+        """Test entries written to disk are found by a new cache."""
+        first = _run(Backtester(result_cache=BacktestResultCache(str(tmp_path))), strategy_config, historical_data)
+
+        cache = BacktestResultCache(str(tmp_path))
+        backtester = Backtester(result_cache=cache)
+        second = _run(backtester, strategy_config, historical_data)
+
+        assert backtester.last_run_cached
+        assert second.final_value == first.final_value
+        assert cache.get_stats()['persisted_entries'] == 1
+
+        cache.clear()
+        assert cache.get_stats() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0,
+                                     'memory_entries': 0, 'persisted_entries': 0}
+
+    def test_memory_limit(self):
+        """Test the oldest in-memory entries are evicted."""
+        cache = BacktestResultCache(max_memory_entries=2)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, key.upper())
+
+        assert cache.get('a') is None
+        assert cache.get('c') == 'C'
+        assert cache.get_stats()['memory_entries'] == 2
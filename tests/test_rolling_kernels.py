@@ -0,0 +1,133 @@
+"""
+Unit tests for the rolling-window statistics kernels.
+"""
+
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from financial_portfolio_automation.analysis import rolling_kernels as rk
+
+
+def _max_drawdown(values):
+    peaks = np.maximum.accumulate(values)
+    return (1 - values / peaks).max()
+
+
+@pytest.fixture
+def prices():
+    """Positive random walk."""
+    rng = np.random.default_rng(7)
+    return 100 + np.cumsum(rng.normal(0, 1, 300))
+
+
+class TestRollingKernels:
+    """Test array kernels against direct per-window computations."""
+
+    @pytest.mark.parametrize('window', [1, 2, 14, 40, 97, 300])
+    def test_extrema_and_moments(self, prices, window):
+        """Test rolling min/max/mean/var match reductions over each window."""
+        windows = sliding_window_view(prices, window)
+
+        np.testing.assert_allclose(rk.rolling_max(prices, window), windows.max(axis=-1))
+        np.testing.assert_allclose(rk.rolling_min(prices, window), windows.min(axis=-1))
+        means, variances = rk.rolling_mean_var(prices, window)
+        np.testing.assert_allclose(means, windows.mean(axis=-1))
+        np.testing.assert_allclose(variances, windows.var(axis=-1), atol=1e-9)
+        if window > 1:
+            _, sample = rk.rolling_mean_var(prices, window, ddof=1)
+            np.testing.assert_allclose(sample, windows.var(axis=-1, ddof=1), atol=1e-9)
+
+    @pytest.mark.parametrize('window', [2, 5, 14, 50, 300])
+    def test_max_drawdown(self, prices, window):
+        """Test rolling drawdown matches the drawdown of each window."""
+        expected = [_max_drawdown(values) for values in sliding_window_view(prices, window)]
+
+        np.testing.assert_allclose(rk.rolling_max_drawdown(prices, window), expected)
+
+    @pytest.mark.parametrize('q', [0.0, 0.01, 0.05, 0.5, 1.0])
+    def test_quantile(self, prices, q):
+        """Test rolling quantiles interpolate like np.quantile."""
+        expected = np.quantile(sliding_window_view(prices, 20), q, axis=-1)
+
+        np.testing.assert_allclose(rk.rolling_quantile(prices, 20, q), expected)
+
+    def test_quantile_skips_nan(self):
+        """Test NaN values are left out of the quantile."""
+        values = [1.0, np.nan, 3.0, np.nan, np.nan, 2.0]
+
+        result = rk.rolling_quantile(values, 2, 0.5)
+
+        np.testing.assert_allclose(result, [1.0, 3.0, 3.0, np.nan, 2.0])
+
+    def test_matrix_rows_with_padding(self, prices):
+        """Test kernels work per row and give NaN for windows reaching into NaN padding."""
+        matrix = np.vstack([prices, np.concatenate([np.full(100, np.nan), prices[:200]])])
+        windows = sliding_window_view(matrix, 20, axis=-1)
+
+        _, variances = rk.rolling_mean_var(matrix, 20)
+
+        np.testing.assert_allclose(variances, windows.var(axis=-1), atol=1e-9)
+        np.testing.assert_allclose(rk.rolling_max(matrix, 50), sliding_window_view(matrix, 50, axis=-1).max(axis=-1))
+        assert np.isnan(variances[1, :100]).all() and not np.isnan(variances[1, 100:]).any()
+
+    def test_variance_stays_accurate_on_long_series(self):
+        """Test small variances around a large mean do not drift on long series."""
+        rng = np.random.default_rng(3)
+        values = 10000 + np.cumsum(rng.normal(0, 0.01, 200000))
+
+        _, variances = rk.rolling_mean_var(values, 20)
+
+        np.testing.assert_allclose(variances, sliding_window_view(values, 20).var(axis=-1), rtol=1e-6)
+
+    def test_invalid_windows(self, prices):
+        """Test windows that are not positive or longer than the data are rejected."""
+        with pytest.raises(ValueError):
+            rk.rolling_max(prices, 0)
+        with pytest.raises(ValueError):
+            rk.rolling_min(prices[:5], 6)
+        with pytest.raises(ValueError):
+            rk.rolling_mean_var(prices, 1, ddof=1)
+        with pytest.raises(ValueError):
+            rk.rolling_quantile(prices, 5, 1.5)
+
+
+class TestIncrementalKernels:
+    """Test the one-value-at-a-time kernels."""
+
+    @pytest.mark.parametrize('maximum', [True, False])
+    def test_rolling_extremum(self, prices, maximum):
+        """Test the monotonic deque tracks the window extremum."""
+        extremum = rk.RollingExtremum(10, maximum=maximum)
+
+        values = [extremum.update(price) for price in prices]
+
+        windows = sliding_window_view(prices, 10)
+        expected = windows.max(axis=-1) if maximum else windows.min(axis=-1)
+        np.testing.assert_allclose(values[9:], expected)
+        assert values[0] == prices[0] and extremum.is_ready
+
+    def test_rolling_moments_with_missing_values(self, prices):
+        """Test Welford updates match the statistics of the window's values."""
+        moments = rk.RollingMoments(8)
+
+        for index, price in enumerate(prices[:100]):
+            moments.update(None if index % 5 == 0 else float(price))
+            window = [
+                prices[position] for position in range(max(index - 7, 0), index + 1) if position % 5
+            ]
+
+            assert moments.count == len(window)
+            if len(window) > 1:
+                assert moments.mean == pytest.approx(np.mean(window))
+                assert moments.variance(ddof=1) == pytest.approx(np.var(window, ddof=1))
+                assert moments.std() == pytest.approx(np.std(window))
+
+    def test_rolling_moments_insufficient_values(self):
+        """Test variance is None until there are more values than ddof."""
+        moments = rk.RollingMoments(3)
+        moments.update(1.0)
+
+        assert moments.variance() == 0.0
+        assert moments.variance(ddof=1) is None
+        assert moments.std(ddof=1) is None
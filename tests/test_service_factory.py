@@ -0,0 +1,45 @@
+"""
+Unit tests for the MCP ServiceFactory.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from financial_portfolio_automation.data.async_store import AsyncDataStore
+from financial_portfolio_automation.data.store import DataStore
+from financial_portfolio_automation.mcp.service_factory import ServiceFactory
+
+
+class TestServiceFactory:
+    """Test cases for ServiceFactory data store accessors."""
+    
+    @pytest.fixture
+    def service_factory(self):
+        """Create a service factory without loading the system configuration."""
+        return ServiceFactory(config=Mock())
+    
+    @pytest.mark.asyncio
+    async def test_get_async_data_store(self, service_factory):
+        """Test the async facade wraps the shared data store and is created once."""
+        data_store = Mock(spec=DataStore)
+        data_store.get_latest_portfolio_snapshot.return_value = None
+        
+        with patch('financial_portfolio_automation.mcp.service_factory.DataStore',
+                   return_value=data_store) as data_store_class:
+            async_data_store = service_factory.get_async_data_store()
+            
+            assert isinstance(async_data_store, AsyncDataStore)
+            assert async_data_store.data_store is service_factory.get_data_store() is data_store
+            assert service_factory.get_async_data_store() is async_data_store
+            data_store_class.assert_called_once_with()
+        
+        assert await async_data_store.get_latest_portfolio_snapshot() is None
+        data_store.get_latest_portfolio_snapshot.assert_called_once_with()
+        await async_data_store.close()
+    
+    def test_get_async_data_store_without_data_store(self, service_factory):
+        """Test no async facade is created when the data store cannot be."""
+        with patch('financial_portfolio_automation.mcp.service_factory.DataStore',
+                   side_effect=OSError("disk unavailable")):
+            assert service_factory.get_async_data_store() is None
+            assert service_factory._async_data_store is None
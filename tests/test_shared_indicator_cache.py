@@ -0,0 +1,286 @@
+"""
+Unit tests for the shared indicator memoization cache.
+"""
+
+import numpy as np
+import pytest
+from decimal import Decimal
+from unittest.mock import patch
+
+from financial_portfolio_automation.analysis import vectorized_indicators as vi
+from financial_portfolio_automation.analysis.shared_indicator_cache import (
+    SharedIndicatorCache, compute_indicator, get_shared_indicator_cache
+)
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+from financial_portfolio_automation.models.quote_frame import BarArray
+from financial_portfolio_automation.strategy.momentum import MomentumStrategy
+
+
+@pytest.fixture
+def bars():
+    """(timestamps, highs, lows, closes) of a random walk."""
+    rng = np.random.default_rng(11)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 200))
+    highs = closes + np.abs(rng.normal(0, 0.5, 200))
+    lows = closes - np.abs(rng.normal(0, 0.5, 200))
+    return list(range(200)), highs, lows, closes
+
+
+class TestSharedIndicatorCache:
+    """Test caching, incremental extension and eviction."""
+
+    def test_hit_returns_same_series(self, bars):
+        """Test a second lookup for the same bars is served from the cache."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+
+        first = cache.get('AAPL', 'rsi', timestamps, closes, period=14)
+        second = cache.get('AAPL', 'rsi', timestamps, closes, period=14)
+
+        np.testing.assert_allclose(first, vi.rsi(closes, 14), equal_nan=True)
+        np.testing.assert_array_equal(first, second)
+        assert not second.flags.writeable
+        stats = cache.get_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+
+    def test_keys_separate_params_symbols_and_timeframes(self, bars):
+        """Test different parameters, symbols or timeframes are not shared."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+
+        cache.get('AAPL', 'sma', timestamps, closes, period=10)
+        cache.get('AAPL', 'sma', timestamps, closes, period=20)
+        cache.get('MSFT', 'sma', timestamps, closes, period=10)
+        cache.get('AAPL', 'sma', timestamps, closes, timeframe='1Min', period=10)
+
+        assert cache.get_stats()['misses'] == 4
+        assert cache.get_stats()['entries'] == 4
+
+    @pytest.mark.parametrize('indicator, params', [
+        ('sma', {'period': 20}),
+        ('ema', {'period': 12}),
+        ('rsi', {}),
+        ('macd', {}),
+        ('bollinger_bands', {}),
+        ('stochastic', {}),
+        ('atr', {})
+    ])
+    def test_extension_matches_full_computation(self, bars, indicator, params):
+        """Test series extended with new bars match a full recomputation."""
+        timestamps, highs, lows, closes = bars
+        cache = SharedIndicatorCache()
+
+        cache.get('AAPL', indicator, timestamps[:150], closes[:150],
+                  highs=highs[:150], lows=lows[:150], **params)
+        for end in (151, 160, 200):
+            extended = cache.get('AAPL', indicator, timestamps[:end], closes[:end],
+                                 highs=highs[:end], lows=lows[:end], **params)
+        full = SharedIndicatorCache().get('AAPL', indicator, timestamps, closes,
+                                          highs=highs, lows=lows, **params)
+
+        if isinstance(full, dict):
+            for name in full:
+                np.testing.assert_allclose(extended[name], full[name], equal_nan=True)
+        else:
+            np.testing.assert_allclose(extended, full, equal_nan=True)
+        assert cache.get_stats()['extensions'] == 3
+
+    def test_window_within_cached_bars_is_a_hit(self, bars):
+        """Test bars inside a cached series are served from it without replacing it."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+
+        cache.get('AAPL', 'sma', timestamps[:100], closes[:100], period=5)
+        shorter = cache.get('AAPL', 'sma', timestamps[:50], closes[:50], period=5)
+        inner = cache.get('AAPL', 'sma', timestamps[40:100], closes[40:100], period=5)
+
+        np.testing.assert_allclose(shorter, vi.sma(closes[:50], 5), equal_nan=True)
+        # Windows starting after the first cached bar use the bars before them
+        np.testing.assert_allclose(inner, vi.sma(closes[:100], 5)[40:])
+        stats = cache.get_stats()
+        assert stats['misses'] == 1 and stats['hits'] == 2
+        cache.get('AAPL', 'sma', timestamps[:100], closes[:100], period=5)
+        assert cache.get_stats()['hits'] == 3
+
+    def test_different_history_is_recomputed(self, bars):
+        """Test bars not in the cached series are recomputed and do not replace a longer one."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+        other = [timestamp + 1000 for timestamp in timestamps[:50]]
+
+        cache.get('AAPL', 'sma', timestamps[:100], closes[:100], period=5)
+        result = cache.get('AAPL', 'sma', other, closes[:50], period=5)
+
+        np.testing.assert_allclose(result, vi.sma(closes[:50], 5), equal_nan=True)
+        assert cache.get_stats()['misses'] == 2
+        cache.get('AAPL', 'sma', timestamps[:100], closes[:100], period=5)
+        assert cache.get_stats()['hits'] == 1
+
+    def test_different_prices_same_timestamps_are_recomputed(self, bars):
+        """Test a series is not reused for other prices over the same bars."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+        rising = np.arange(1.0, 31.0)
+        falling = rising[::-1].copy()
+
+        cache.get('AAPL', 'rsi', timestamps[:30], rising, period=14)
+        result = cache.get('AAPL', 'rsi', timestamps[:30], falling, period=14)
+
+        assert result[-1] == 0.0
+        assert cache.get_stats()['misses'] == 2
+
+    def test_revised_last_bar_is_recomputed(self, bars):
+        """Test a last bar whose close changed keeps its timestamp but not its series."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+        revised = closes.copy()
+        revised[-1] += 5.0
+
+        cache.get('AAPL', 'sma', timestamps, closes, period=5)
+        result = cache.get('AAPL', 'sma', timestamps, revised, period=5)
+
+        np.testing.assert_allclose(result, vi.sma(revised, 5), equal_nan=True)
+        assert cache.get_stats()['hits'] == 0
+
+    def test_extension_of_different_prefix_is_recomputed(self, bars):
+        """Test new bars are not appended to a series computed from other prices."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+        shifted = closes + 1.0
+
+        cache.get('AAPL', 'ema', timestamps[:150], closes[:150], period=12)
+        result = cache.get('AAPL', 'ema', timestamps, shifted, period=12)
+
+        np.testing.assert_allclose(result, vi.ema(shifted, 12), equal_nan=True)
+        assert cache.get_stats()['extensions'] == 0
+
+    @pytest.mark.parametrize('indicator, params', [
+        ('rsi', {'period': 14}),
+        ('bollinger_bands', {'period': 20}),
+        ('atr', {'period': 14})
+    ])
+    def test_sliding_windows_extend_and_trim(self, bars, indicator, params):
+        """Test fixed-length windows sliding one bar at a time extend one series."""
+        timestamps, highs, lows, closes = bars
+        cache = SharedIndicatorCache()
+
+        for end in range(30, 201):
+            start = end - 30
+            result = cache.get('AAPL', indicator, timestamps[start:end], closes[start:end],
+                               highs=highs[start:end], lows=lows[start:end], **params)
+        full = compute_indicator(indicator, closes, highs=highs, lows=lows, **params)
+
+        if isinstance(full, dict):
+            for name in full:
+                np.testing.assert_allclose(result[name], full[name][-30:])
+        else:
+            np.testing.assert_allclose(result, full[-30:])
+        stats = cache.get_stats()
+        assert stats['misses'] == 1 and stats['extensions'] == 170
+        # Bars older than twice the window are dropped
+        whole = SharedIndicatorCache()
+        whole.get('AAPL', indicator, timestamps, closes, highs=highs, lows=lows, **params)
+        assert stats['memory_mb'] < whole.get_stats()['memory_mb']
+
+    def test_strategy_stepping_through_bars_reuses_series(self, bars):
+        """Test a strategy's sliding lookback windows hit and extend the cached series."""
+        timestamps, highs, lows, closes = bars
+        history = BarArray(
+            'AAPL',
+            timestamps=[1_700_000_000_000_000_000 + day * 86_400_000_000_000 for day in timestamps],
+            open=closes, high=highs, low=lows, close=closes, volume=[1_000_000] * len(closes)
+        )
+        strategy = MomentumStrategy(StrategyConfig(
+            strategy_id="cached_momentum",
+            strategy_type=StrategyType.MOMENTUM,
+            name="Cached Momentum",
+            description="Momentum strategy sharing indicator series",
+            symbols=["AAPL"],
+            parameters={'lookback_period': 40, 'momentum_threshold': 0.02},
+            risk_limits=RiskLimits(
+                max_position_size=Decimal('10000'),
+                max_portfolio_concentration=0.2,
+                max_daily_loss=Decimal('1000'),
+                max_drawdown=0.1,
+                stop_loss_percentage=0.05
+            )
+        ))
+        cache = SharedIndicatorCache()
+
+        with patch('financial_portfolio_automation.strategy.base.get_shared_indicator_cache',
+                   return_value=cache):
+            for end in range(40, 70):
+                window = history[:end]
+                strategy._analyze_momentum('AAPL', window[-1], window)
+                # A second caller over the same bars is served from the cache
+                strategy.shared_indicator('AAPL', 'rsi', window[-30:], period=14)
+
+        stats = cache.get_stats()
+        # rsi, macd, sma(10) and sma(20) are computed once, then extended bar by bar
+        assert stats['misses'] == 4
+        assert stats['extensions'] == 4 * 29
+        assert stats['hits'] == 30
+        assert stats['entries'] == 4
+
+    def test_compute_indicator_matches_cache(self, bars):
+        """Test uncached computation gives the cached series."""
+        timestamps, highs, lows, closes = bars
+
+        np.testing.assert_allclose(
+            compute_indicator('atr', closes, highs=highs, lows=lows, period=14),
+            SharedIndicatorCache().get('AAPL', 'atr', timestamps, closes, highs=highs, lows=lows, period=14),
+            equal_nan=True
+        )
+        bands = compute_indicator('bollinger_bands', closes)
+        assert set(bands) == {'upper', 'middle', 'lower'}
+        with pytest.raises(ValueError):
+            compute_indicator('stochastic', closes)
+
+    def test_get_many_matches_single_lookups(self, bars):
+        """Test batched lookups of different lengths match per-symbol results."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+
+        results = cache.get_many(
+            ['AAPL', 'MSFT'], 'macd', [timestamps, timestamps[:80]], [closes, closes[:80]]
+        )
+
+        for name, values in vi.macd(closes[:80]).items():
+            np.testing.assert_allclose(results[1][name], values, equal_nan=True)
+        assert len(results[0]['macd']) == 200
+
+    def test_lru_eviction_within_budget(self, bars):
+        """Test least recently used entries are evicted to stay within the budget."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache(max_memory_mb=0.035)
+
+        cache.get('AAPL', 'sma', timestamps, closes, period=5)
+        cache.get('MSFT', 'sma', timestamps, closes, period=5)
+        cache.get('AAPL', 'sma', timestamps, closes, period=5)
+        cache.get('GOOGL', 'sma', timestamps, closes, period=5)
+
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1 and stats['entries'] == 2
+        assert stats['memory_mb'] <= stats['max_memory_mb']
+        cache.get('AAPL', 'sma', timestamps, closes, period=5)
+        assert cache.get_stats()['hits'] == 2
+
+    def test_invalid_requests(self, bars):
+        """Test unsupported indicators, parameters and missing inputs are rejected."""
+        timestamps, _, _, closes = bars
+        cache = SharedIndicatorCache()
+
+        with pytest.raises(ValueError):
+            cache.get('AAPL', 'vwap', timestamps, closes)
+        with pytest.raises(ValueError):
+            cache.get('AAPL', 'sma', timestamps, closes)
+        with pytest.raises(ValueError):
+            cache.get('AAPL', 'rsi', timestamps, closes, window=14)
+        with pytest.raises(ValueError):
+            cache.get('AAPL', 'atr', timestamps, closes)
+        with pytest.raises(ValueError):
+            SharedIndicatorCache(max_memory_mb=0)
+
+    def test_process_wide_instance(self):
+        """Test the shared cache is a single instance."""
+        assert get_shared_indicator_cache() is get_shared_indicator_cache()
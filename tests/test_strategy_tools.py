@@ -0,0 +1,92 @@
+"""
+Unit tests for the MCP strategy tools.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from financial_portfolio_automation.mcp.strategy_tools import StrategyTools
+from financial_portfolio_automation.strategy.base import Strategy, StrategySignal, SignalType
+from financial_portfolio_automation.strategy.result_cache import BacktestResultCache
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+
+
+class RoundTripStrategy(Strategy):
+    """Strategy that buys its first symbol on the first bar and sells on the tenth."""
+
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        symbol = self.symbols[0]
+        if symbol not in market_data:
+            return []
+        self.state.increment_signals()
+        if self.state.signals_generated == 1:
+            signal_type = SignalType.BUY
+        elif self.state.signals_generated == 10:
+            signal_type = SignalType.SELL
+        else:
+            return []
+        return [StrategySignal(symbol=symbol, signal_type=signal_type, strength=1.0, quantity=10)]
+
+    def update_state(self, market_data, portfolio):
+        pass
+
+
+@pytest.fixture
+def strategy():
+    """Create a round-trip strategy."""
+    return RoundTripStrategy(StrategyConfig(
+        strategy_id="round_trip",
+        strategy_type=StrategyType.CUSTOM,
+        name="Round Trip",
+        description="Strategy for strategy tool tests",
+        symbols=["AAPL"],
+        risk_limits=RiskLimits(
+            max_position_size=Decimal('10000'),
+            max_portfolio_concentration=0.2,
+            max_daily_loss=Decimal('1000'),
+            max_drawdown=0.1,
+            stop_loss_percentage=0.05
+        ),
+        parameters={}
+    ))
+
+
+@pytest.fixture
+def market_data_client():
+    """Mock market data client returning 20 daily OHLCV bars without bid/ask."""
+    base_date = datetime(2023, 1, 2)
+    client = Mock()
+    client.get_historical_bars.return_value = [
+        {
+            'timestamp': (base_date + timedelta(days=day)).isoformat(),
+            'open': 150.0 + day,
+            'high': 151.0 + day,
+            'low': 149.0 + day,
+            'close': 150.5 + day,
+            'volume': 1000000
+        }
+        for day in range(20)
+    ]
+    return client
+
+
+class TestStrategyToolsBacktest:
+    """Test backtests run through the strategy tools."""
+
+    def test_run_backtest_trades_on_loaded_bars(self, strategy, market_data_client):
+        """Test bars loaded from the market data client are filled at their close."""
+        tools = StrategyTools({
+            'market_data_client': market_data_client,
+            'backtest_result_cache': BacktestResultCache()
+        })
+
+        with patch('financial_portfolio_automation.mcp.strategy_tools.get_global_registry') as registry:
+            registry.return_value.get_strategy.return_value = strategy
+            result = tools.run_backtest('round_trip', start_date='2023-01-02', end_date='2023-01-21')
+
+        market_data_client.get_historical_bars.assert_called_once()
+        assert result['trading_stats']['total_trades'] == 2
+        # Bought at 150.5 and sold at 159.5 less costs
+        assert result['final_value'] > result['initial_capital']
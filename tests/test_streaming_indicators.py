@@ -0,0 +1,204 @@
+"""
+Unit tests for the streaming technical indicators.
+"""
+
+import json
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from financial_portfolio_automation.analysis import vectorized_indicators as vi
+from financial_portfolio_automation.analysis.streaming_indicators import (
+    StreamingIndicator, StreamingIndicatorEngine, StreamingSMA, StreamingEMA, StreamingRSI,
+    StreamingMACD, StreamingBollingerBands, StreamingATR, StreamingStochastic, StreamingVolatility
+)
+from financial_portfolio_automation.analysis.technical_analysis import TechnicalAnalysis
+from financial_portfolio_automation.api.websocket_handler import WebSocketHandler
+from financial_portfolio_automation.models.core import Quote
+
+
+@pytest.fixture
+def bars():
+    """Random walk (high, low, close) bars."""
+    rng = np.random.default_rng(11)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 400))
+    highs = closes + np.abs(rng.normal(0, 0.5, 400))
+    lows = closes - np.abs(rng.normal(0, 0.5, 400))
+    return highs, lows, closes
+
+
+def _feed(indicator, bars):
+    highs, lows, closes = bars
+    return [indicator.update_bar(h, l, c) for h, l, c in zip(highs.tolist(), lows.tolist(), closes.tolist())]
+
+
+class TestStreamingIndicators:
+    """Test streaming indicators against the batch kernels."""
+
+    def test_moving_averages_match_batch(self, bars):
+        """Test SMA and EMA track the batch series at every step."""
+        closes = bars[2]
+        sma = _feed(StreamingSMA(20), bars)
+        ema = _feed(StreamingEMA(12), bars)
+
+        assert sma[:19] == [None] * 19
+        np.testing.assert_allclose(sma[19:], vi.sma(closes, 20)[19:], rtol=1e-12)
+        assert ema[:11] == [None] * 11
+        np.testing.assert_allclose(ema[11:], vi.ema(closes, 12)[11:], rtol=1e-12)
+
+    def test_macd_bollinger_atr_stochastic_match_batch(self, bars):
+        """Test composite indicators match the batch values at the end of the series."""
+        highs, lows, closes = bars
+        macd = _feed(StreamingMACD(), bars)[-1]
+        bands = _feed(StreamingBollingerBands(20, 2.0), bars)[-1]
+        atr = _feed(StreamingATR(14), bars)[-1]
+        stochastic = _feed(StreamingStochastic(14, 3), bars)
+
+        batch_macd = vi.macd(closes)
+        batch_bands = vi.bollinger_bands(closes, 20, 2.0)
+        batch_stochastic = vi.stochastic(highs, lows, closes, 14, 3)
+
+        for name in ('macd', 'signal', 'histogram'):
+            assert macd[name] == pytest.approx(batch_macd[name][-1], rel=1e-9)
+        for name in ('upper', 'middle', 'lower'):
+            assert bands[name] == pytest.approx(batch_bands[name][-1], rel=1e-9)
+        assert atr == pytest.approx(vi.average_true_range(highs, lows, closes, 14)[-1], rel=1e-9)
+        np.testing.assert_allclose([v['%K'] for v in stochastic[13:]], batch_stochastic['%K'][13:])
+        assert stochastic[-1]['%D'] == pytest.approx(batch_stochastic['%D'][-1])
+
+    def test_wilder_rsi(self, bars):
+        """Test RSI applies Wilder smoothing after the initial simple averages."""
+        closes = bars[2].tolist()
+        values = [StreamingRSI(14).seed(closes[:n]) for n in (14, 15, len(closes))]
+
+        changes = np.diff(closes)
+        gains, losses = np.clip(changes, 0, None), np.clip(-changes, 0, None)
+        avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+        for gain, loss in zip(gains[14:], losses[14:]):
+            avg_gain = (avg_gain * 13 + gain) / 14
+            avg_loss = (avg_loss * 13 + loss) / 14
+
+        assert values[0] is None
+        assert values[1] == pytest.approx(100 - 100 / (1 + gains[:14].mean() / losses[:14].mean()))
+        assert values[2] == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss))
+        assert StreamingRSI(3).seed([1.0, 2.0, 3.0, 4.0]) == 100.0
+
+    def test_volatility(self, bars):
+        """Test volatility is the annualized sample deviation of the last period log returns."""
+        closes = bars[2]
+        values = _feed(StreamingVolatility(20, periods_per_year=252), bars)
+
+        returns = np.diff(np.log(closes))
+        expected = [returns[end - 20:end].std(ddof=1) * np.sqrt(252) for end in range(20, len(returns) + 1)]
+        assert values[:20] == [None] * 20
+        np.testing.assert_allclose(values[20:], expected, rtol=1e-9)
+        assert StreamingVolatility(2).seed([100.0, 0.0, 100.0, 101.0]) is None
+
+    def test_serialization_round_trip(self, bars):
+        """Test restored indicators continue exactly like the originals."""
+        highs, lows, closes = bars
+        indicators = [
+            StreamingSMA(20), StreamingEMA(12), StreamingRSI(14), StreamingMACD(),
+            StreamingBollingerBands(), StreamingATR(), StreamingStochastic(), StreamingVolatility()
+        ]
+        for indicator in indicators:
+            _feed(indicator, (highs[:200], lows[:200], closes[:200]))
+            restored = StreamingIndicator.from_dict(json.loads(json.dumps(indicator.to_dict())))
+
+            rest = (highs[200:], lows[200:], closes[200:])
+            expected = _feed(indicator, rest)
+            actual = _feed(restored, rest)
+            if isinstance(expected[-1], dict):
+                assert actual[-1] == pytest.approx(expected[-1], rel=1e-9)
+            else:
+                assert actual == pytest.approx(expected, rel=1e-9)
+
+        with pytest.raises(ValueError):
+            StreamingSMA.from_dict(StreamingEMA(3).to_dict())
+
+
+class TestStreamingIndicatorEngine:
+    """Test cases for StreamingIndicatorEngine class."""
+
+    def _quote(self, symbol, minute, bid, ask):
+        return Quote(
+            symbol=symbol,
+            timestamp=datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc) + timedelta(minutes=minute),
+            bid=Decimal(str(bid)), ask=Decimal(str(ask)), bid_size=100, ask_size=100
+        )
+
+    def test_ticks_update_per_symbol(self):
+        """Test each tick updates only its own symbol."""
+        engine = StreamingIndicatorEngine({'sma': lambda: StreamingSMA(2)})
+
+        engine.on_quote(self._quote("AAPL", 0, 100.0, 100.2))
+        engine.on_trade({'symbol': "AAPL", 'price': Decimal('101.1'), 'timestamp': None})
+        engine.on_quote(self._quote("MSFT", 0, 300.0, 300.2))
+
+        assert engine.get_values("AAPL")['sma'] == pytest.approx(100.6)
+        assert engine.get_values("MSFT")['sma'] is None
+        assert engine.get_values("GOOGL") == {'sma': None}
+        assert engine.ticks_processed == 3
+
+    def test_bar_aggregation(self):
+        """Test ticks are combined into bars and indicators update when a bar completes."""
+        updates = []
+        engine = StreamingIndicatorEngine(
+            {'atr': lambda: StreamingATR(1)}, bar_interval=timedelta(minutes=1),
+            on_update=lambda symbol, values: updates.append(values)
+        )
+
+        for minute, price in [(0, 10), (0.2, 12), (0.5, 9), (1, 11), (1.5, 15), (2, 14)]:
+            engine.on_trade({
+                'symbol': "AAPL", 'price': price,
+                'timestamp': datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc) + timedelta(minutes=minute)
+            })
+
+        # Bars: (12, 9, 9) then (15, 11, 15); the true range of the second is 15 - 9
+        assert updates == [{'atr': None}, {'atr': 6.0}]
+
+    def test_seed_and_persist(self, tmp_path, bars):
+        """Test seeded state survives a save and load."""
+        highs, lows, closes = bars
+        quotes = [
+            Quote(symbol="AAPL", timestamp=datetime(2024, 1, 2) + timedelta(minutes=i),
+                  high=Decimal(repr(h)), low=Decimal(repr(l)), close=Decimal(repr(c)))
+            for i, (h, l, c) in enumerate(zip(highs.tolist(), lows.tolist(), closes.tolist()))
+        ]
+        engine = TechnicalAnalysis().create_streaming_engine()
+        values = engine.seed("AAPL", quotes)
+
+        assert values['sma_50'] == pytest.approx(vi.sma(closes, 50)[-1])
+        assert values['stochastic']['%D'] is not None
+
+        path = str(tmp_path / "indicators.json")
+        engine.save_state(path)
+        restored = StreamingIndicatorEngine()
+        restored.load_state(path)
+
+        assert restored.update_bar("AAPL", 101.0, 99.0, 100.0) == engine.update_bar("AAPL", 101.0, 99.0, 100.0)
+
+    @pytest.mark.asyncio
+    async def test_fed_from_websocket_handler(self):
+        """Test the WebSocket handler updates the engine before the user callback."""
+        config = Mock()
+        config.alpaca.base_url = "https://paper-api.alpaca.markets"
+        engine = StreamingIndicatorEngine({'sma': lambda: StreamingSMA(1)})
+        seen = []
+
+        with patch('financial_portfolio_automation.api.websocket_handler.get_config', return_value=config):
+            handler = WebSocketHandler(
+                on_quote=lambda quote: seen.append(engine.get_values(quote.symbol)['sma']),
+                indicator_engine=engine
+            )
+
+        await handler._handle_quote({
+            "T": "q", "S": "AAPL", "t": 1640995200000000000,
+            "bp": 150.50, "ap": 150.60, "bs": 100, "as": 200
+        })
+        await handler._handle_trade({"T": "t", "S": "AAPL", "t": 1640995200000000000, "p": 151.0, "s": 10})
+
+        assert seen == [pytest.approx(150.55)]
+        assert engine.get_values("AAPL")['sma'] == 151.0
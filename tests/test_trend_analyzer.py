@@ -0,0 +1,65 @@
+"""
+Unit tests for TrendAnalyzer volatility trends.
+"""
+
+import math
+from decimal import Decimal
+from statistics import stdev
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from financial_portfolio_automation.analytics.trend_analyzer import TrendAnalyzer
+
+
+def _reference_rolling_volatilities(snapshots):
+    """Annualized rolling volatility in percent, recomputing every window."""
+    window_size = min(10, len(snapshots) // 3)
+    rolling_volatilities = []
+    for i in range(window_size, len(snapshots)):
+        window_snapshots = snapshots[i-window_size:i]
+        window_returns = []
+        for j in range(1, len(window_snapshots)):
+            prev_val = float(window_snapshots[j-1].total_value)
+            curr_val = float(window_snapshots[j].total_value)
+            if prev_val > 0:
+                window_returns.append((curr_val - prev_val) / prev_val)
+        if len(window_returns) > 1:
+            rolling_volatilities.append(stdev(window_returns) * math.sqrt(252) * 100)
+    return rolling_volatilities
+
+
+class TestTrendAnalyzerVolatility:
+    """Test volatility trends against per-window computations."""
+    
+    @pytest.fixture
+    def trend_analyzer(self):
+        """Create a trend analyzer with a mock data store."""
+        return TrendAnalyzer(Mock())
+    
+    def _snapshots(self, values):
+        return [Mock(total_value=Decimal(str(round(value, 2)))) for value in values]
+    
+    @pytest.mark.parametrize('num_snapshots', [10, 12, 29, 30, 90])
+    def test_volatility_trends_match_per_window(self, trend_analyzer, num_snapshots):
+        """Test rolling volatility statistics match recomputing each window."""
+        rng = np.random.default_rng(num_snapshots)
+        values = 100_000 * np.cumprod(1 + rng.normal(0.0005, 0.015, num_snapshots))
+        values[num_snapshots // 2] = 0.0
+        snapshots = self._snapshots(values)
+        
+        result = trend_analyzer._analyze_volatility_trends(snapshots)
+        
+        rolling_volatilities = _reference_rolling_volatilities(snapshots)
+        assert result['average_volatility_pct'] == pytest.approx(np.mean(rolling_volatilities), rel=1e-9)
+        assert result['min_volatility_pct'] == pytest.approx(min(rolling_volatilities), rel=1e-9)
+        assert result['max_volatility_pct'] == pytest.approx(max(rolling_volatilities), rel=1e-9)
+        assert result['current_volatility_pct'] == pytest.approx(rolling_volatilities[-1], rel=1e-9)
+        assert result['volatility_trend_slope'] == pytest.approx(
+            trend_analyzer._calculate_trend_slope(rolling_volatilities), rel=1e-6, abs=1e-9
+        )
+    
+    def test_volatility_trends_insufficient_data(self, trend_analyzer):
+        """Test no volatility trends are calculated for fewer than 10 snapshots."""
+        assert trend_analyzer._analyze_volatility_trends(self._snapshots([100.0] * 9)) == {}
@@ -0,0 +1,276 @@
+"""
+Unit tests for the vectorized backtesting engine.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from financial_portfolio_automation.strategy.backtester import Backtester, TransactionCosts
+from financial_portfolio_automation.strategy.vectorized_backtester import MarketDataMatrices, VectorizedBacktester
+from financial_portfolio_automation.strategy.base import Strategy, StrategySignal, SignalType
+from financial_portfolio_automation.strategy.momentum import MomentumStrategy
+from financial_portfolio_automation.strategy.mean_reversion import MeanReversionStrategy
+from financial_portfolio_automation.strategy.signal_matrix import signals_to_positions
+from financial_portfolio_automation.models.core import Quote, OrderSide
+from financial_portfolio_automation.models.config import StrategyConfig, StrategyType, RiskLimits
+
+
+BASE_DATE = datetime(2023, 1, 2)
+
+
+class TargetPositionStrategy(Strategy):
+    """Strategy that trades towards a predefined target position matrix."""
+
+    def __init__(self, config: StrategyConfig, targets: np.ndarray):
+        super().__init__(config)
+        self.targets = targets
+        self.held = {}
+
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        """Emit explicit-quantity signals that reach the day's targets."""
+        signals = []
+        for column, symbol in enumerate(self.symbols):
+            quote = market_data.get(symbol)
+            if quote is None:
+                continue
+
+            target = int(self.targets[(quote.timestamp - BASE_DATE).days, column])
+            delta = target - self.held.get(symbol, 0)
+            if delta:
+                signals.append(StrategySignal(
+                    symbol=symbol,
+                    signal_type=SignalType.BUY if delta > 0 else SignalType.SELL,
+                    strength=1.0,
+                    quantity=abs(delta)
+                ))
+                self.held[symbol] = target
+        return signals
+
+    def update_state(self, market_data, portfolio):
+        """Update strategy state."""
+        pass
+
+    def generate_position_matrix(self, closes, volumes, capital, start_index=0):
+        """Return the predefined targets."""
+        return self.targets.copy()
+
+
+class EventOnlyStrategy(Strategy):
+    """Strategy without the signal-matrix API."""
+
+    def generate_signals(self, market_data, portfolio, historical_data=None):
+        return []
+
+    def update_state(self, market_data, portfolio):
+        pass
+
+
+def _strategy_config(parameters=None):
+    return StrategyConfig(
+        strategy_id="test_vectorized",
+        strategy_type=StrategyType.MOMENTUM,
+        name="Test Vectorized Strategy",
+        description="A test strategy for vectorized backtesting",
+        symbols=["AAPL", "GOOGL"],
+        risk_limits=RiskLimits(
+            max_position_size=Decimal('10000'),
+            max_portfolio_concentration=0.2,
+            max_daily_loss=Decimal('1000'),
+            max_drawdown=0.1,
+            stop_loss_percentage=0.05
+        ),
+        parameters={'lookback_period': 20, 'momentum_threshold': 0.02, **(parameters or {})}
+    )
+
+
+def _make_history(days, seed=3):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i, symbol in enumerate(["AAPL", "GOOGL"]):
+        prices = (150.0 + i * 50) * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+        data[symbol] = [
+            Quote(
+                symbol=symbol,
+                timestamp=BASE_DATE + timedelta(days=day),
+                bid=Decimal(str(round(price - 0.05, 2))),
+                ask=Decimal(str(round(price + 0.05, 2))),
+                bid_size=1000,
+                ask_size=1000,
+                close=Decimal(str(round(price, 2))),
+                volume=int(rng.integers(500000, 1500000))
+            )
+            for day, price in enumerate(prices)
+        ]
+    return data
+
+
+@pytest.fixture
+def transaction_costs():
+    """Create transaction costs configuration."""
+    return TransactionCosts()
+
+
+@pytest.fixture
+def target_positions():
+    """Create target positions that open, resize and close positions."""
+    targets = np.zeros((60, 2))
+    targets[10:25, 0] = 50
+    targets[25:40, 0] = 80
+    targets[45:52, 0] = 20
+    targets[5:45, 1] = 30
+    return targets
+
+
+class TestVectorizedBacktester:
+    """Test cases for VectorizedBacktester class."""
+
+    def test_matches_event_engine(self, transaction_costs, target_positions):
+        """Test fills, costs and equity match the event-driven engine."""
+        historical_data = _make_history(60)
+        start_date, end_date = BASE_DATE, BASE_DATE + timedelta(days=59)
+
+        event_results = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            TargetPositionStrategy(_strategy_config(), target_positions),
+            historical_data, start_date, end_date
+        )
+        vector_results = VectorizedBacktester(transaction_costs, Decimal('100000')).run_backtest(
+            TargetPositionStrategy(_strategy_config(), target_positions),
+            historical_data, start_date, end_date
+        )
+
+        assert vector_results.total_trades == event_results.total_trades == 7
+        for vector_trade, event_trade in zip(vector_results.trades, event_results.trades):
+            assert vector_trade.timestamp.date() == event_trade.timestamp.date()
+            assert vector_trade.symbol == event_trade.symbol
+            assert vector_trade.side == event_trade.side
+            assert vector_trade.quantity == event_trade.quantity
+            assert float(vector_trade.price) == pytest.approx(float(event_trade.price))
+            assert float(vector_trade.commission) == pytest.approx(float(event_trade.commission))
+            assert float(vector_trade.slippage) == pytest.approx(float(event_trade.slippage))
+            assert float(vector_trade.market_impact) == pytest.approx(float(event_trade.market_impact))
+
+        event_equity = [float(s.total_value) for s in event_results.portfolio_history]
+        np.testing.assert_allclose(vector_results.performance_metrics['equity_curve'], event_equity)
+        assert float(vector_results.final_value) == pytest.approx(float(event_results.final_value))
+        assert vector_results.sharpe_ratio == pytest.approx(event_results.sharpe_ratio)
+        assert vector_results.max_drawdown == pytest.approx(event_results.max_drawdown)
+        assert vector_results.win_rate == pytest.approx(event_results.win_rate)
+        assert vector_results.profit_factor == pytest.approx(float(event_results.profit_factor))
+
+    @pytest.mark.parametrize('strategy_class, parameters', [
+        (MomentumStrategy, {'lookback_period': 35, 'min_momentum_strength': 0.4, 'min_signal_strength': 0.4}),
+        (MeanReversionStrategy, {'lookback_period': 25, 'min_reversion_strength': 0.3, 'min_signal_strength': 0.3})
+    ])
+    def test_indicator_strategy_matches_event_engine(self, transaction_costs, strategy_class, parameters):
+        """Test a strategy's vectorized run matches the event engine trading its positions."""
+        historical_data = _make_history(200)
+        start_date, end_date = BASE_DATE + timedelta(days=40), BASE_DATE + timedelta(days=199)
+        config = _strategy_config(parameters)
+        market_data = MarketDataMatrices.from_quotes(historical_data, config.symbols, end_date)
+        targets = strategy_class(config).generate_position_matrix(
+            market_data.close, market_data.volume, 100000.0, start_index=40
+        )
+
+        vector_results = VectorizedBacktester(transaction_costs, Decimal('100000')).run_backtest(
+            strategy_class(config), historical_data, start_date, end_date
+        )
+        event_results = Backtester(transaction_costs, Decimal('100000')).run_backtest(
+            TargetPositionStrategy(config, targets), historical_data, start_date, end_date
+        )
+
+        assert vector_results.total_trades == event_results.total_trades > 0
+        for vector_trade, event_trade in zip(vector_results.trades, event_results.trades):
+            assert vector_trade.timestamp.date() == event_trade.timestamp.date()
+            assert vector_trade.symbol == event_trade.symbol
+            assert vector_trade.side == event_trade.side
+            assert vector_trade.quantity == event_trade.quantity
+            assert float(vector_trade.price) == pytest.approx(float(event_trade.price))
+
+        event_equity = [float(s.total_value) for s in event_results.portfolio_history]
+        np.testing.assert_allclose(vector_results.performance_metrics['equity_curve'], event_equity)
+        assert float(vector_results.final_value) == pytest.approx(float(event_results.final_value))
+
+    def test_trading_starts_at_start_date(self, transaction_costs, target_positions):
+        """Test warm-up rows before the start date never trade."""
+        historical_data = _make_history(60)
+        start_date = BASE_DATE + timedelta(days=20)
+
+        results = VectorizedBacktester(transaction_costs).run_backtest(
+            TargetPositionStrategy(_strategy_config(), target_positions),
+            historical_data, start_date, BASE_DATE + timedelta(days=59)
+        )
+
+        assert len(results.performance_metrics['equity_curve']) == 40
+        assert all(t.timestamp.date() >= start_date.date() for t in results.trades)
+        # Targets held on the start date are entered on that day
+        assert {(t.symbol, t.quantity) for t in results.trades if t.timestamp.date() == start_date.date()} == {
+            ("AAPL", 50), ("GOOGL", 30)
+        }
+
+    def test_orders_wait_for_quotes(self, transaction_costs, target_positions):
+        """Test position changes on days without a quote are filled on the next quote."""
+        historical_data = _make_history(60)
+        historical_data["AAPL"] = [
+            q for q in historical_data["AAPL"] if (q.timestamp - BASE_DATE).days not in (10, 11)
+        ]
+
+        results = VectorizedBacktester(transaction_costs).run_backtest(
+            TargetPositionStrategy(_strategy_config(), target_positions),
+            historical_data, BASE_DATE, BASE_DATE + timedelta(days=59)
+        )
+
+        first_aapl = next(t for t in results.trades if t.symbol == "AAPL")
+        assert first_aapl.timestamp.date() == (BASE_DATE + timedelta(days=12)).date()
+        assert first_aapl.quantity == 50
+
+    def test_runs_momentum_strategy(self, transaction_costs):
+        """Test a signal-matrix strategy runs end to end."""
+        historical_data = _make_history(200)
+        strategy = MomentumStrategy(_strategy_config(parameters={
+            'lookback_period': 35,
+            'min_momentum_strength': 0.4,
+            'min_signal_strength': 0.4
+        }))
+
+        results = VectorizedBacktester(transaction_costs).run_backtest(
+            strategy, historical_data, BASE_DATE + timedelta(days=40), BASE_DATE + timedelta(days=199)
+        )
+
+        assert results.total_trades > 0
+        for symbol in ["AAPL", "GOOGL"]:
+            sides = [t.side for t in results.trades if t.symbol == symbol]
+            # Long-only: entries and exits alternate, starting with a buy
+            assert all(side == (OrderSide.BUY if i % 2 == 0 else OrderSide.SELL) for i, side in enumerate(sides))
+        assert results.total_commission > 0
+
+    def test_rejects_strategy_without_array_api(self, transaction_costs):
+        """Test strategies without the signal-matrix API are rejected."""
+        with pytest.raises(ValueError, match="signal-matrix API"):
+            VectorizedBacktester(transaction_costs).run_backtest(
+                EventOnlyStrategy(_strategy_config()),
+                _make_history(30), BASE_DATE, BASE_DATE + timedelta(days=29)
+            )
+
+
+class TestSignalsToPositions:
+    """Test conversion of signal matrices to positions."""
+
+    def test_entries_sized_and_held_until_exit(self):
+        """Test buys open sized positions that are held until a sell."""
+        signals = np.array([[0.0], [0.8], [1.0], [0.0], [-0.6], [-0.9], [0.5]])
+        prices = np.full(signals.shape, 100.0)
+
+        positions = signals_to_positions(signals, prices, 100000, position_fraction=0.1, min_strength=0.5)
+
+        np.testing.assert_array_equal(positions[:, 0], [0, 80, 80, 80, 0, 0, 50])
+
+    def test_weak_and_early_signals_ignored(self):
+        """Test signals below the threshold or before the start index are ignored."""
+        signals = np.array([[0.9], [0.0], [0.4], [0.7]])
+        prices = np.full(signals.shape, 10.0)
+
+        positions = signals_to_positions(signals, prices, 1000, min_strength=0.5, start_index=1)
+
+        np.testing.assert_array_equal(positions[:, 0], [0, 0, 0, 7])
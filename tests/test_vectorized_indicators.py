@@ -0,0 +1,123 @@
+"""
+Unit tests for the vectorized technical indicator kernels.
+"""
+
+import numpy as np
+import pytest
+
+from financial_portfolio_automation.analysis import vectorized_indicators as vi
+from financial_portfolio_automation.analysis.technical_analysis import TechnicalAnalysis
+
+
+@pytest.fixture
+def prices():
+    """Random walk closes with highs and lows around them."""
+    rng = np.random.default_rng(3)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 300))
+    highs = closes + np.abs(rng.normal(0, 0.5, 300))
+    lows = closes - np.abs(rng.normal(0, 0.5, 300))
+    return highs, lows, closes
+
+
+def _windows(values, period):
+    return np.array([values[i - period + 1:i + 1] for i in range(period - 1, len(values))])
+
+
+class TestKernels:
+    """Test kernels against direct window computations."""
+
+    def test_sma(self, prices):
+        """Test the cumulative-sum SMA matches window means."""
+        closes = prices[2]
+        result = vi.sma(closes, 10)
+
+        assert np.isnan(result[:9]).all()
+        np.testing.assert_allclose(result[9:], _windows(closes, 10).mean(axis=1), rtol=1e-12)
+
+    def test_ema_recurrence(self, prices):
+        """Test the EMA follows the SMA-seeded recurrence."""
+        closes = prices[2]
+        result = vi.ema(closes, 12)
+
+        expected = [closes[:12].mean()]
+        for price in closes[12:]:
+            expected.append(price * 2 / 13 + expected[-1] * 11 / 13)
+
+        assert np.isnan(result[:11]).all()
+        np.testing.assert_allclose(result[11:], expected, rtol=1e-12)
+
+    def test_rsi(self, prices):
+        """Test RSI uses simple averages of gains and losses."""
+        closes = prices[2]
+        result = vi.rsi(closes, 14)
+
+        changes = _windows(np.diff(closes), 14)
+        gains = np.where(changes > 0, changes, 0).mean(axis=1)
+        losses = np.where(changes < 0, -changes, 0).mean(axis=1)
+
+        assert np.isnan(result[:14]).all()
+        np.testing.assert_allclose(result[14:], 100 - 100 / (1 + gains / losses), rtol=1e-9)
+
+    def test_rsi_without_losses(self):
+        """Test windows without losses are 100."""
+        assert vi.rsi(np.arange(20.0), 14)[-1] == 100.0
+
+    def test_bollinger_and_stochastic(self, prices):
+        """Test band widths and oscillator ranges against window statistics."""
+        highs, lows, closes = prices
+        bands = vi.bollinger_bands(closes, 20, 2.0)
+        np.testing.assert_allclose(
+            (bands['upper'] - bands['lower'])[19:], 4 * _windows(closes, 20).std(axis=1), rtol=1e-9
+        )
+
+        stoch = vi.stochastic(highs, lows, closes, 14, 3)
+        highest, lowest = _windows(highs, 14).max(axis=1), _windows(lows, 14).min(axis=1)
+        np.testing.assert_allclose(stoch['%K'][13:], (closes[13:] - lowest) / (highest - lowest) * 100)
+        np.testing.assert_allclose(stoch['%D'][15:], _windows(stoch['%K'][13:], 3).mean(axis=1))
+        assert np.isnan(stoch['%D'][:15]).all()
+
+    def test_average_true_range(self, prices):
+        """Test ATR averages true ranges after the first bar."""
+        highs, lows, closes = prices
+        ranges = np.maximum.reduce([
+            highs[1:] - lows[1:], np.abs(highs[1:] - closes[:-1]), np.abs(lows[1:] - closes[:-1])
+        ])
+        result = vi.average_true_range(highs, lows, closes, 14)
+
+        assert np.isnan(result[:14]).all()
+        np.testing.assert_allclose(result[14:], _windows(ranges, 14).mean(axis=1), rtol=1e-12)
+
+    def test_invalid_inputs(self):
+        """Test invalid periods and mismatched lengths are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            vi.sma([1.0, 2.0], 0)
+        with pytest.raises(ValueError, match="same length"):
+            vi.average_true_range([1.0, 2.0], [1.0], [1.0, 2.0])
+
+
+class TestListWrappers:
+    """Test the TechnicalAnalysis list API on top of the kernels."""
+
+    def test_outputs_are_lists_with_none(self, prices):
+        """Test wrappers return plain floats and None for undefined points."""
+        highs, lows, closes = (values.tolist() for values in prices)
+        ta = TechnicalAnalysis()
+
+        sma = ta.simple_moving_average(closes, 5)
+        macd = ta.macd(closes)
+        stoch = ta.stochastic_oscillator(highs, lows, closes)
+
+        assert sma[:4] == [None] * 4 and type(sma[4]) is float
+        assert macd['signal'][:33] == [None] * 33 and macd['signal'][33] is not None
+        assert macd['histogram'][33] == pytest.approx(macd['macd'][33] - macd['signal'][33])
+        assert stoch['%D'][:15] == [None] * 15
+        assert ta.relative_strength_index(closes[:14]) == [None] * 14
+
+    def test_flat_prices(self):
+        """Test flat windows keep the midpoint and zero-width bands."""
+        ta = TechnicalAnalysis()
+        flat = [50.0] * 30
+
+        assert ta.stochastic_oscillator(flat, flat, flat)['%K'][-1] == 50
+        bands = ta.bollinger_bands(flat)
+        assert bands['upper'][-1] == bands['middle'][-1] == bands['lower'][-1] == 50.0
@@ -7,6 +7,7 @@ including connection management, message processing, and error handling.
 
 import asyncio
 import json
+import threading
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
@@ -15,6 +16,8 @@ from decimal import Decimal
 from financial_portfolio_automation.api.websocket_handler import (
     WebSocketHandler, ConnectionState
 )
+from financial_portfolio_automation.data.async_store import AsyncDataStore
+from financial_portfolio_automation.data.store import DataStore
 from financial_portfolio_automation.models.core import Quote
 from financial_portfolio_automation.exceptions import APIError, DataError
 
@@ -305,6 +308,81 @@ class TestWebSocketHandler:
         error = mock_error_callback.call_args[0][0]
         assert isinstance(error, DataError)
     
+    @pytest.mark.asyncio
+    async def test_handle_quote_persists_in_batches(self, mock_config):
+        """Test that quotes are written to the data store in batches on its own pool."""
+        writer_threads = []
+        data_store = Mock(spec=DataStore)
+        data_store.save_quotes_batch.side_effect = (
+            lambda quotes: writer_threads.append(threading.current_thread().name)
+        )
+        with patch('financial_portfolio_automation.api.websocket_handler.get_config', return_value=mock_config):
+            with patch('financial_portfolio_automation.api.websocket_handler.get_logger'):
+                websocket_handler = WebSocketHandler(data_store=data_store, quote_batch_size=3)
+        
+        assert isinstance(websocket_handler._data_store, AsyncDataStore)
+
+        for i in range(4):
+            await websocket_handler._handle_quote({
+                "T": "q",
+                "S": "AAPL",
+                "t": 1640995200000000000 + i,
+                "bp": 150.50,
+                "ap": 150.55,
+                "bs": 100,
+                "as": 200
+            })
+
+        data_store.save_quotes_batch.assert_called_once()
+        assert len(data_store.save_quotes_batch.call_args[0][0]) == 3
+
+        await websocket_handler.flush_quotes()
+
+        assert data_store.save_quotes_batch.call_count == 2
+        assert len(data_store.save_quotes_batch.call_args[0][0]) == 1
+        assert websocket_handler.get_statistics()["quotes_persisted"] == 4
+        assert all(name.startswith("datastore") for name in writer_threads)
+    
+    @pytest.mark.asyncio
+    async def test_partial_quote_batch_is_flushed_after_interval(self, mock_config):
+        """Test buffered quotes are written once they are older than the flush interval."""
+        data_store = Mock(spec=DataStore)
+        with patch('financial_portfolio_automation.api.websocket_handler.get_config', return_value=mock_config):
+            with patch('financial_portfolio_automation.api.websocket_handler.get_logger'):
+                websocket_handler = WebSocketHandler(
+                    data_store=data_store, quote_batch_size=500, quote_flush_interval=0.05
+                )
+        quote_data = {
+            "T": "q",
+            "S": "AAPL",
+            "t": 1640995200000000000,
+            "bp": 150.50,
+            "ap": 150.55,
+            "bs": 100,
+            "as": 200
+        }
+        
+        # A quote arriving after the interval flushes the batch with it
+        await websocket_handler._handle_quote(quote_data)
+        data_store.save_quotes_batch.assert_not_called()
+        websocket_handler._pending_since -= 0.1
+        await websocket_handler._handle_quote({**quote_data, "t": quote_data["t"] + 1})
+        
+        data_store.save_quotes_batch.assert_called_once()
+        assert len(data_store.save_quotes_batch.call_args[0][0]) == 2
+        
+        # Without further quotes, the periodic task writes the partial batch
+        await websocket_handler._handle_quote({**quote_data, "t": quote_data["t"] + 2})
+        websocket_handler._state = ConnectionState.AUTHENTICATED
+        flush_task = asyncio.create_task(websocket_handler._quote_flush_loop())
+        await asyncio.sleep(0.2)
+        websocket_handler._state = ConnectionState.DISCONNECTED
+        await flush_task
+        
+        assert data_store.save_quotes_batch.call_count == 2
+        assert len(data_store.save_quotes_batch.call_args[0][0]) == 1
+        assert websocket_handler.get_statistics()["quotes_persisted"] == 3
+    
     @pytest.mark.asyncio
     async def test_handle_trade_valid(self, websocket_handler):
         """Test handling valid trade message."""